@@ -43,6 +43,7 @@ import os
 import socket
 import sys
 import threading
+import time
 from argparse import ArgumentParser
 from multiprocessing import Process
 from pathlib import Path
@@ -52,11 +53,23 @@ import yaml
 from werkzeug.serving import BaseWSGIServer
 
 import ieee_2030_5.hrefs as hrefs
+from ieee_2030_5.adapters import count_adapter_resources
+from ieee_2030_5.adapters.timeadapter import start_time_adapter
 from ieee_2030_5.certs import TLSRepository
+from ieee_2030_5.clock import create_clock, set_clock
 from ieee_2030_5.config import InvalidConfigFile, ServerConfiguration
-from ieee_2030_5.data.indexer import add_href
+from ieee_2030_5.data.indexer import (add_href, configure_max_resident,
+                                      configure_write_behind, count_hrefs,
+                                      rehydrate_hrefs)
+from ieee_2030_5.data.state import (configure_snapshots, has_snapshot,
+                                    load_state)
 from ieee_2030_5.flask_server import run_server
+from ieee_2030_5.persistance.points import configure_point_store
+from ieee_2030_5.server.protocol_capture import configure_capture
+from ieee_2030_5.utils.response_cache import configure_response_cache
 from ieee_2030_5.server.server_constructs import initialize_2030_5
+from ieee_2030_5.startup import prewarm
+from ieee_2030_5.workers import run_workers
 
 _log = logging.getLogger()
 
@@ -83,10 +96,12 @@ def get_tls_repository(cfg: ServerConfiguration,
                             cfg.server_hostname,
                             cfg.proxy_hostname,
                             clear=create_certificates_for_devices,
-                            generate_admin_cert=cfg.generate_admin_cert)
+                            generate_admin_cert=cfg.generate_admin_cert,
+                            tls_backend=cfg.tls_backend)
 
     if create_certificates_for_devices:
         already_represented = set()
+        device_ids = []
 
         # registers the devices, but doesn't initialize_device the end devices here.
         for k in cfg.devices:
@@ -94,9 +109,15 @@ def get_tls_repository(cfg: ServerConfiguration,
                 _log.error(f"Already have {k.id} represented by {k.device_category_type}")
             else:
                 already_represented.add(k)
-                tlsrepo.create_cert(k.id)
-                _log.debug(
-                    f"for {k.id}\nlfdi -> {tlsrepo.lfdi(k.id)}\nsfdi -> {tlsrepo.sfdi(k.id)}")
+                device_ids.append(k.id)
+
+        start = time.perf_counter()
+        tlsrepo.create_certs(device_ids, max_workers=cfg.tls_create_workers)
+        _log.info(f"Created {len(device_ids)} device certificates in "
+                  f"{time.perf_counter() - start:.2f}s using {cfg.tls_backend}")
+        for device_id in device_ids:
+            _log.debug(
+                f"for {device_id}\nlfdi -> {tlsrepo.lfdi(device_id)}\nsfdi -> {tlsrepo.sfdi(device_id)}")
     return tlsrepo
 
 
@@ -141,8 +162,13 @@ def _main():
     parser.add_argument("--production",
                         action="store_true",
                         default=False,
-                        help="Run the server in a threaded environment.")
+                        help="Run the server in multiple worker processes.")
+    parser.add_argument("--workers",
+                        type=int,
+                        help="Number of worker processes in production mode, defaults to "
+                        "worker_processes in the config file or the number of cpus.")
     opts = parser.parse_args()
+    startup_begin = time.perf_counter()
 
     # logging_level = logging.DEBUG if opts.debug else logging.INFO  # COMMENTED!!! June 27
     logging_level = logging.INFO # ADDED!!! June 24
@@ -163,6 +189,25 @@ def _main():
     assert len(config.devices) > 0
     assert config.server_hostname
 
+    configure_point_store(config.storage_backend, config.storage_path)
+    if config.warm_restart:
+        config.storage_write_behind = True
+        configure_snapshots(True, config.warm_restart_snapshot_interval)
+    if config.storage_write_behind:
+        configure_write_behind(True,
+                               flush_interval=config.storage_flush_interval,
+                               max_dirty=config.storage_max_dirty)
+    if config.storage_max_resident is not None:
+        configure_max_resident(config.storage_max_resident)
+
+    configure_capture(config.protocol_capture,
+                      sample_rate=config.protocol_capture_sample_rate,
+                      devices=config.protocol_capture_devices,
+                      path_prefixes=config.protocol_capture_paths,
+                      buffer_size=config.protocol_capture_buffer_size,
+                      capture_file=config.protocol_capture_file)
+    configure_response_cache(config.response_cache, config.response_cache_max_bytes)
+
     add_href(hrefs.get_server_config_href(), config)
     unknown = []
     # Only check for resolvability if not passed --no-validate
@@ -188,13 +233,36 @@ def _main():
             _log.error(host)
         sys.exit(1)
 
-    create_certs = not opts.no_create_certs
+    set_clock(create_clock(config.clock, config.clock_speed, config.clock_start))
+
+    warm = config.warm_restart and has_snapshot()
+
+    create_certs = not opts.no_create_certs and not warm
     tls_repo = get_tls_repository(config, create_certs)
 
+    if warm:
+        # Hrefs are only registered here, each is read from the store on first use.
+        rehydrate_hrefs()
+        load_state()
+
     # Initialize the repository of 2030.5 devices.
-    end_devices = initialize_2030_5(config, tls_repo)
+    end_devices = initialize_2030_5(config, tls_repo, warm=warm)
+
+    if config.prewarm:
+        prewarm()
+    start_time_adapter()
+
+    startup_seconds = time.perf_counter() - startup_begin
+    _log.info(f"{'Warm' if warm else 'Cold'} startup took {startup_seconds:.2f}s, "
+              f"{count_hrefs()} hrefs and {count_adapter_resources()} adapter resources loaded")
+
+    if opts.production:
+        run_workers(config,
+                    tls_repo,
+                    workers=opts.workers or config.worker_processes,
+                    should_stop=should_stop)
+        return
 
-    #if not opts.production:
     try:
         # p = Process(target = _run_ui)
         # p.daemon = True
@@ -210,22 +278,6 @@ def _main():
                     threaded=False)
     except KeyboardInterrupt:
         _log.info("Shutting down server")
-    # else:
-    #     server = build_server(config, tls_repo, enddevices=end_devices)
-
-    #     thread = None
-    #     try:
-    #         remove_stop_file()
-    #         thread = ServerThread(server)
-    #         thread.start()
-    #         while not should_stop():
-    #             sleep(0.5)
-    #     except KeyboardInterrupt as ex:
-    #         _log.info("Exiting program.")
-    #     finally:
-    #         if thread:
-    #             thread.shutdown()
-    #             thread.join()
 
 
 if __name__ == '__main__':
@@ -1,10 +1,16 @@
+import bisect
+import functools
 import inspect
+import io
 import logging
+import pickle
+import threading
 import typing
+from contextlib import contextmanager
 from dataclasses import dataclass, fields, is_dataclass
 from enum import Enum
-from typing import (Any, Dict, Generic, List, Optional, Protocol, Type,
-                    TypeVar, get_args, get_origin)
+from typing import (Any, Dict, Generic, List, Optional, Protocol, Set, Tuple,
+                    Type, TypeVar, get_args, get_origin)
 
 from blinker import Signal
 
@@ -12,6 +18,9 @@ import ieee_2030_5.config as cfg
 import ieee_2030_5.hrefs as hrefs
 import ieee_2030_5.models as m
 from ieee_2030_5.certs import TLSRepository
+from ieee_2030_5.data.state import (mark_changed, read_state, register_state,
+                                    state_lock)
+from ieee_2030_5.data.versions import add_dependent, record_version, record_versions
 from ieee_2030_5.models.sep import List_type
 
 _log = logging.getLogger(__name__)
@@ -62,12 +71,96 @@ class AdapterListProtocol(AdapterIndexProtocol):
 
 ready_signal = Signal("ready-signal")
 
+# Sent by an Adapter, as sender, when a child list of one of its items changes, with the
+# parent, the name of the child list and the child added, replaced or removed (None when
+# removed by mRID).
+child_changed = Signal("child-changed")
+# Sent by an Adapter at the end of Adapter.batch instead of child_changed, with changes the
+# (parent, name, children added, replaced or removed) of each child list changed.
+children_changed = Signal("children-changed")
+
+
+def _changed(*hrefs_changed: Optional[str]):
+    """
+    Record a new version of the resources at hrefs_changed, which lets listeners such as the
+    response cache know they changed.
+    """
+    for href in hrefs_changed:
+        if href:
+            record_version(href)
+
 T = TypeVar('T')
 C = TypeVar('C')
 D = TypeVar('D')
 
+DEFAULT_INDEXED_PROPERTIES = ("href", "mRID", "lFDI", "sFDI")
+
+# Name the adapter records are registered under, see ieee_2030_5.data.state.
+ADAPTER_STATE = "adapters"
+
+# Every Adapter instance keyed by its href prefix, used to resolve adapters and their items
+# when records are loaded.
+__adapters__: Dict[str, "Adapter"] = {}
+# id(item) -> (adapter, index) of every loaded item, so the record of an item refers to the
+# items of other adapters it holds rather than holding copies of them.
+__owners__: Dict[int, Tuple["Adapter", int]] = {}
+
+
+def _adapter_for_prefix(url_prefix: str, generic_type: Type) -> "Adapter":
+    """
+    Return the registered adapter for url_prefix, creating it if it doesn't exist.  Used
+    when unpickling so module level adapters are referred to rather than copied.
+    """
+    adapter = __adapters__.get(url_prefix)
+    if adapter is None:
+        adapter = Adapter(url_prefix, generic_type=generic_type)
+    return adapter
+
+
+def _item_reference(root: Any, obj: Any) -> Optional[Tuple[str, int]]:
+    # persistent_id of the pickler of the record of root.
+    if obj is root:
+        return None
+    owner = __owners__.get(id(obj))
+    if owner is None:
+        return None
+    adapter, index = owner
+    if adapter._item_list.get(index) is not obj:
+        return None
+    return adapter._href_prefix, index
+
+
+def _load_reference(reference: Tuple[str, int]) -> Any:
+    prefix, index = reference
+    return __adapters__[prefix]._item(index)
+
+
+def _writes(method):
+    """ Run an Adapter method changing the adapter under the adapter's lock. """
+
+    @functools.wraps(method)
+    def locked(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return locked
+
 
 class Adapter(Generic[T]):
+    """
+    Container of 2030.5 resources of a single type with named lists of children per item.
+
+    Items are indexed by identity and by the values of indexed_properties (href, mRID, lFDI
+    and sFDI by default) so lookups don't have to scan the items.  The indexes are maintained
+    by add, add_replace_child, replace_child and the remove methods.  If an indexed property
+    of an item is changed in place after it was added, call reindex with that item, any other
+    change made in place is recorded with item_changed.
+
+    Each item is persisted as a record of its own holding the item and its children (see
+    ieee_2030_5.data.state), records loaded by load_state are read the first time their item
+    is used.  Changes are made under the adapter's own lock, write_lock(), other adapters
+    aren't locked.
+    """
     
     def __init__(self, url_prefix: str, **kwargs):
         if "generic_type" not in kwargs:
@@ -75,10 +168,196 @@ class Adapter(Generic[T]):
         self._generic_type: Type = kwargs['generic_type']
         self._href_prefix: str = url_prefix
         self._current_index: int  = -1
+        # The loaded items.
         self._item_list: Dict[int, T] = {}
+        # Index of an item whose record isn't loaded -> the pickled record, None when it is
+        # read from the point store.
+        self._stored: Dict[int, Optional[bytes]] = {}
+        # Item indexes in list order, loaded or not, used to serve pages without copying the
+        # items.
+        self._order: List[int] = []
         self._child_prefix: Dict[Type, str] = {}
         self._child_map: Dict[int, Dict[str, List[C]]] = {}
-        
+        self._indexed_properties: Tuple[str, ...] = tuple(
+            kwargs.get("indexed_properties", DEFAULT_INDEXED_PROPERTIES))
+        self._lock = state_lock()
+        self._build_indexes()
+        # Notifications deferred by batch, by parent and child list name.
+        self._batch: Optional[Dict[Tuple[int, str], Tuple[T, str, List[Any], Set[str]]]] = None
+        __adapters__[url_prefix] = self
+        self._record_changed(None)
+
+    def __reduce__(self):
+        # Adapters are pickled as a reference to the registered adapter, the items are records
+        # of their own.
+        return _adapter_for_prefix, (self._href_prefix, self._generic_type)
+
+    def write_lock(self) -> threading.RLock:
+        """ The lock held while the adapter is changed, reentrant. """
+        return self._lock
+
+    def _build_indexes(self):
+        # id(item) -> index of the item in _item_list.
+        self._identity_index: Dict[int, int] = {}
+        # property name -> property value -> index of the first item with that value.
+        self._property_index: Dict[str, Dict[Any, int]] = {p: {} for p in self._indexed_properties}
+        # index of an item -> the (property name, value) entries of _property_index it holds.
+        self._indexed_values: Dict[int, List[Tuple[str, Any]]] = {}
+        # parent index -> child list name -> property name -> value -> position in the list.
+        self._child_index: Dict[int, Dict[str, Dict[str, Dict[Any, int]]]] = {}
+
+        for index, item in self._item_list.items():
+            self._index_item(index, item)
+        for parent_index, children_by_name in self._child_map.items():
+            for name in children_by_name:
+                self._reindex_children(parent_index, name)
+
+    def _index_item(self, index: int, item: T):
+        self._identity_index[id(item)] = index
+        __owners__[id(item)] = (self, index)
+        held = self._indexed_values.setdefault(index, [])
+        for prop, values in self._property_index.items():
+            value = getattr(item, prop, None)
+            if value is not None and values.setdefault(value, index) == index:
+                held.append((prop, value))
+
+    def _unindex_item(self, index: int, item: T):
+        self._identity_index.pop(id(item), None)
+        __owners__.pop(id(item), None)
+        for prop, value in self._indexed_values.pop(index, ()):
+            values = self._property_index[prop]
+            if values.get(value) == index:
+                del values[value]
+
+    def _record_key(self, index: Optional[int]) -> str:
+        # The adapter's own record, its type and child prefixes, is keyed by the prefix alone.
+        return self._href_prefix if index is None else f"{self._href_prefix}#{index}"
+
+    def _record_changed(self, index: Optional[int]):
+        mark_changed(ADAPTER_STATE, self._record_key(index))
+
+    def _dump_record(self, index: Optional[int]) -> bytes:
+        with self._lock:
+            if index is None:
+                return pickle.dumps((self._generic_type, self._child_prefix))
+            item = self._item(index)
+            buffer = io.BytesIO()
+            pickler = pickle.Pickler(buffer, pickle.HIGHEST_PROTOCOL)
+            pickler.persistent_id = functools.partial(_item_reference, item)
+            pickler.dump((item, self._child_map.get(index, {})))
+            return buffer.getvalue()
+
+    def _install(self, index: int, data: Optional[bytes]):
+        """
+        Make the record of the item at index known, loaded the next time the item is used.
+        data is the pickled record, None when it is read from the point store.
+        """
+        with self._lock:
+            if index not in self._item_list and index not in self._stored:
+                bisect.insort(self._order, index)
+                self._current_index = max(self._current_index, index)
+            self._stored[index] = data
+
+    def _load(self, index: int):
+        with self._lock:
+            if index not in self._stored:
+                return
+            data = self._stored.pop(index)
+            try:
+                if data is None:
+                    data = read_state(ADAPTER_STATE, self._record_key(index))
+                    if data is None:
+                        raise KeyError(f"No record of {self._record_key(index)}")
+                unpickler = pickle.Unpickler(io.BytesIO(data))
+                unpickler.persistent_load = _load_reference
+                item, children = unpickler.load()
+            except Exception:
+                self._stored[index] = data
+                raise
+            current = self._item_list.get(index)
+            if current is not None:
+                # Updated in place, the records of other adapters refer to the item.
+                self._unindex_item(index, current)
+                vars(current).update(vars(item))
+                item = current
+            self._item_list[index] = item
+            self._index_item(index, item)
+            self._child_map.pop(index, None)
+            self._child_index.pop(index, None)
+            if children:
+                self._child_map[index] = children
+                for name in children:
+                    self._reindex_children(index, name)
+
+    def _item(self, index: int) -> T:
+        if index in self._stored:
+            self._load(index)
+        return self._item_list[index]
+
+    def _load_all(self):
+        if self._stored:
+            for index in list(self._stored):
+                self._load(index)
+
+    @_writes
+    def reindex(self, item: T):
+        """
+        Update the indexes of item after one of its indexed properties was changed in place.
+        """
+        index = self.fetch_index(item)
+        self._unindex_item(index, item)
+        self._index_item(index, item)
+        self._record_changed(index)
+
+    def item_changed(self, item: T):
+        """
+        Record that item, or one of its children, was changed in place.
+        """
+        index = self.fetch_index(item)
+        self._record_changed(index)
+        changed = [self._href_prefix, getattr(item, 'href', None)]
+        for name, children in self._child_map.get(index, {}).items():
+            changed.append(hrefs.SEP.join([item.href, name]))
+            changed.extend(getattr(child, 'href', None) for child in children)
+        _changed(*changed)
+
+    def _children_index(self, parent_index: int, name: str) -> Dict[str, Dict[Any, int]]:
+        by_name = self._child_index.setdefault(parent_index, {})
+        if name not in by_name:
+            by_name[name] = {"href": {}, "mRID": {}}
+        return by_name[name]
+
+    def _index_child(self, parent_index: int, name: str, position: int, child: Any):
+        for prop, values in self._children_index(parent_index, name).items():
+            value = getattr(child, prop, None)
+            if value is not None:
+                values.setdefault(value, position)
+
+    def _reindex_children(self, parent_index: int, name: str):
+        index = self._children_index(parent_index, name)
+        for values in index.values():
+            values.clear()
+        for position, child in enumerate(self._child_map[parent_index][name]):
+            self._index_child(parent_index, name, position, child)
+
+    def _child_position(self, parent_index: int, name: str, prop: str, value: Any,
+                        rescan: bool = True) -> int:
+        """
+        Position of the child in the list name of the parent whose prop is value, -1 if not
+        found.  With rescan a miss refreshes the index in case a child was changed in place.
+        """
+        children = self._child_map.get(parent_index, {}).get(name)
+        if children is None:
+            return -1
+        position = self._children_index(parent_index, name)[prop].get(value, -1)
+        if position >= 0 and position < len(children) \
+                and getattr(children[position], prop, None) == value:
+            return position
+        if position < 0 and not rescan:
+            return -1
+        self._reindex_children(parent_index, name)
+        return self._children_index(parent_index, name)[prop].get(value, -1)
+
     @property
     def href_prefix(self) -> str:
         return self._href_prefix
@@ -92,20 +371,83 @@ class Adapter(Generic[T]):
         self._href_prefix = value
     
     def fetch_by_property(self, prop: str, prop_value: Any) -> Optional[T]:
-        for obj in self._item_list.values():
+        # Only loaded items are indexed.
+        self._load_all()
+        values = self._property_index.get(prop)
+        if values is not None:
+            index = values.get(prop_value)
+            if index is not None:
+                obj = self._item_list.get(index)
+                if obj is not None and getattr(obj, prop) == prop_value:
+                    return obj
+                del values[prop_value]
+
+        # Not indexed or changed in place without reindex, the index is repaired on a hit.
+        for index, obj in self._item_list.items():
             if getattr(obj, prop) == prop_value:
+                if values is not None:
+                    values[prop_value] = index
+                    self._indexed_values.setdefault(index, []).append((prop, prop_value))
                 return obj
             
     def fetch_child_names(self) -> List[str]:
         return list(self._child_prefix.keys())
     
+    @_writes
     def add_container(self, child_type: Type, href_prefix: str):
         self._child_prefix[child_type] = href_prefix
+        self._record_changed(None)
         
+    def _child_list_changed(self, parent_index: int, parent: T, name: str, child: Any,
+                            child_href: str = None):
+        self._record_changed(parent_index)
+        list_href = hrefs.SEP.join([parent.href, name])
+        if child_href:
+            # The list holds the child, possibly an item of another adapter changed there.
+            add_dependent(child_href, list_href)
+        if self._batch is not None:
+            _, _, children, changed = self._batch.setdefault((id(parent), name),
+                                                             (parent, name, [], set()))
+            if child is not None:
+                children.append(child)
+            changed.update((parent.href, list_href, child_href))
+            return
+        _changed(parent.href, list_href, child_href)
+        child_changed.send(self, parent=parent, name=name, child=child)
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer the notifications of add_replace_child, replace_child and the remove methods
+        until the block exits, then send resources_changed and children_changed once, so
+        listeners such as the control scheduler and the response cache do their work once for
+        the whole block.  Nested blocks are part of the outermost one.  The adapter's lock is
+        held for the whole block.
+        """
+        with self._lock:
+            if self._batch is not None:
+                yield self
+                return
+            self._batch = {}
+            try:
+                yield self
+            finally:
+                batched, self._batch = self._batch, None
+                if batched:
+                    changed = set().union(*(changed for _, _, _, changed in batched.values()))
+                    changed.discard(None)
+                    record_versions(changed, sender=self)
+                    children_changed.send(self, changes=[(parent, name, children)
+                                                         for parent, name, children, _ in batched.values()])
+
+    @_writes
     def remove_child(self, parent: T, name: str, child: Any):
         found_index = self.fetch_index(parent)
         self._child_map[found_index][name].remove(child)
+        self._reindex_children(found_index, name)
+        self._child_list_changed(found_index, parent, name, child, child.href)
         
+    @_writes
     def remove_child_by_mrid(self, parent: T, name: str, mRID: str):
         
         found_index = self.fetch_index(parent)
@@ -113,7 +455,10 @@ class Adapter(Generic[T]):
         indexes = [index for index, x in enumerate(self._child_map[found_index][name]) if x.mRID == mRID]
         for index in sorted(indexes, reverse=True):
             self._child_map[found_index][name].pop(index)
+        self._reindex_children(found_index, name)
+        self._child_list_changed(found_index, parent, name, None)
         
+    @_writes
     def add_replace_child(self, parent: T, name: str, child: Any, href: str = None):
         
         # Make sure parent is in the Adapter by looking for it's index.
@@ -134,17 +479,22 @@ class Adapter(Generic[T]):
                 child.href = href
             else:
                 child.href = hrefs.SEP.join([parent.href, name, str(len(self._child_map[found_index][name]))])
-        
+
         # Replace based upon resource href
-        for index, c in enumerate(self._child_map[found_index][name]):
-            if c.href == child.href:
-                _log.debug(f"Replacing child {child.href}")
-                self._child_map[found_index][name][index] = child
-                return
+        position = self._child_position(found_index, name, "href", child.href, rescan=False)
+        if position >= 0:
+            _log.debug(f"Replacing child {child.href}")
+            self._child_map[found_index][name][position] = child
+            self._reindex_children(found_index, name)
+            self._child_list_changed(found_index, parent, name, child, child.href)
+            return
             
         self._child_map[found_index][name].append(child)
+        self._index_child(found_index, name, len(self._child_map[found_index][name]) - 1, child)
+        self._child_list_changed(found_index, parent, name, child, child.href)
         
     def fetch_children_by_parent_index(self, parent_index: int, child_type: Type) -> List[Type]:
+        self._item(parent_index)
         if child_type not in self._child_map[parent_index]:
             raise KeyError(f"No child object of type {child_type}")
         
@@ -176,6 +526,7 @@ class Adapter(Generic[T]):
     def fetch_child(self, parent: T, name: str, index: int = 0) -> Type:
         return self.fetch_children(parent, name)[index]
             
+    @_writes
     def add(self, item: T):
         if not isinstance(item, self._generic_type):
             raise ValueError(f"Item {item} is not of type {self._generic_type}")
@@ -185,39 +536,62 @@ class Adapter(Generic[T]):
             setattr(item, 'href', hrefs.SEP.join([self._href_prefix, str(self._current_index + 1)]))
         self._current_index += 1
         self._item_list[self._current_index] = item
+        self._order.append(self._current_index)
+        self._index_item(self._current_index, item)
+        self._record_changed(self._current_index)
+        if getattr(item, 'href', None):
+            # The list of the adapter's items holds the item.
+            add_dependent(item.href, self._href_prefix)
+        _changed(self._href_prefix, getattr(item, 'href', None))
     
-    def fetch_all(self, container: Optional[D] = None, start: int = 0, after: int = 0, limit: int = 1) -> D:
+    def fetch_page(self, start: int = 0, after: Optional[int] = None, limit: int = 1) -> List[T]:
+        """
+        Items of the page selected by the 2030.5 list query parameters s (start), a (after)
+        and l (limit).  When after is given the page starts start items past the position
+        after, as in MirrorUsagePointAdapter.get_list.  A limit of 0 returns the rest of the
+        list.  Only the items on the page are touched.
+        """
+        offset = start if after is None else after + 1 + start
+        if offset < 0 or offset >= len(self._order):
+            return []
+        end = len(self._order) if limit == 0 else offset + limit
+        return [self._item(index) for index in self._order[offset:end]]
+
+    def fetch_all(self, container: Optional[D] = None, start: int = 0, after: Optional[int] = None,
+                  limit: int = 1) -> D:
 
         if container is not None:
             if not container.__class__.__name__.endswith("List"):
                 raise ValueError("Must have List as the last portion of the name for instance")
         
             prop_found = container.__class__.__name__[:container.__class__.__name__.find("List")]
-        
-            items = list(self._item_list.values())
-            all_len = len(items)
-            all_results = len(items)
-            all_items = items
+            page = self.fetch_page(start=start, after=after, limit=limit)
                 
-            if start > len(items):
-                all_items = []
-                all_results = 0
-            else:
-                if limit == 0:
-                    all_items = items[start:]
-                else:
-                    all_items = items[start: start + limit]
-                all_results = len(all_items)
-                
-            setattr(container, prop_found, all_items)
-            setattr(container, "all", all_len)
-            setattr(container, "results", all_results)
+            setattr(container, prop_found, page)
+            setattr(container, "all", len(self._order))
+            setattr(container, "results", len(page))
         else:
-            container = list(self._item_list.values())
+            container = [self._item(index) for index in self._order]
             
         return container
     
     def fetch_index(self, obj: T, using_prop: str = None) -> int:
+        if using_prop is None:
+            found_index = self._identity_index.get(id(obj))
+            if found_index is not None and self._item_list.get(found_index) is obj:
+                # A record installed for the item since is loaded into it.
+                self._item(found_index)
+                return found_index
+        elif using_prop in self._property_index:
+            self._load_all()
+            value = getattr(obj, using_prop)
+            found_index = self._property_index[using_prop].get(value)
+            if found_index is not None and getattr(self._item_list[found_index],
+                                                   using_prop) == value:
+                return found_index
+
+        # Not indexed, for example an equal copy of an item rather than the item itself.
+        self._load_all()
         found_index = -1
         for index, obj1 in self._item_list.items():
             if using_prop is None:    
@@ -233,30 +607,43 @@ class Adapter(Generic[T]):
         return found_index
     
     def fetch(self, index: int):
-        return self._item_list[index]
+        return self._item(index)
     
     def fetch_by_mrid(self, mRID: str):
-        for item in self._item_list:
-            if not hasattr(item, 'mRID'):
-                raise ValueError(f"Item of {type(T)} does not have mRID property")
-            if item.mRID == mRID:
-                return item
-            
-        raise KeyError()
+        if not hasattr(self._generic_type, 'mRID'):
+            raise ValueError(f"Item of {self._generic_type} does not have mRID property")
+        item = self.fetch_by_property("mRID", mRID)
+        if item is None:
+            raise KeyError()
+        return item
     
     def size(self) -> int:
-        return len(self._item_list)
+        return len(self._order)
     
     def size_children(self, parent: T, name: str) -> int:
         return len(self.fetch_children(parent, name))
     
     def fetch_child_index_by_mrid(self, parent: T, name: str, mRID: str) -> int:
-        for index, child in enumerate(self.fetch_children(parent, name)):
-            if child.mRID == mRID:
-                return index
+        position = self._child_position(self.fetch_index(parent), name, "mRID", mRID)
+        if position >= 0:
+            return position
         
         raise KeyError("mRID not found")
-    
+
+    def has_child(self, parent: T, name: str, child: Any) -> bool:
+        """
+        Whether child itself, not an equal copy, is in the list name of parent.  Found
+        through the indexes, an unknown parent or child list is False.
+        """
+        parent_index = self._identity_index.get(id(parent))
+        if parent_index is None or self._item_list.get(parent_index) is not parent:
+            return False
+        self._item(parent_index)
+        position = self._child_position(parent_index, name, "href", getattr(child, "href", None),
+                                        rescan=False)
+        return position >= 0 and self._child_map[parent_index][name][position] is child
+
+    @_writes
     def replace_child(self, parent: T, name: str, index: int, child: Any):
         children = self.fetch_children(parent, name)
         if not type(child) == type(children[index]):
@@ -265,6 +652,46 @@ class Adapter(Generic[T]):
         if not child.href:
             child.href = children[index].href
         self._child_map[parent_index][name][index] = child
+        self._reindex_children(parent_index, name)
+        self._child_list_changed(parent_index, parent, name, child, child.href)
+
+    def size_all_children(self) -> int:
+        """ Children of the loaded items, records that aren't loaded aren't read to count them. """
+        return sum(len(children) for by_name in self._child_map.values()
+                   for children in by_name.values())
+
+
+def count_adapter_resources() -> int:
+    """
+    Number of items held by all adapters and of the children of the items loaded.
+    """
+    return sum(adapter.size() + adapter.size_all_children() for adapter in __adapters__.values())
+
+
+def _dump_record(key: str) -> bytes:
+    prefix, _, index = key.rpartition("#")
+    if not prefix:
+        return __adapters__[key]._dump_record(None)
+    return __adapters__[prefix]._dump_record(int(index))
+
+
+def _load_record(key: str, data: Optional[bytes]):
+    prefix, _, index = key.rpartition("#")
+    if not prefix:
+        # The adapter's own record, written when it was created so it comes before its items.
+        if data is None:
+            data = read_state(ADAPTER_STATE, key)
+        generic_type, child_prefix = pickle.loads(data)
+        _adapter_for_prefix(key, generic_type)._child_prefix.update(child_prefix)
+        return
+    adapter = __adapters__.get(prefix)
+    if adapter is None:
+        _log.warning(f"No adapter for the record {key}")
+        return
+    adapter._install(int(index), data)
+
+
+register_state(ADAPTER_STATE, _dump_record, _load_record)
     
     
     
@@ -321,7 +748,8 @@ class BaseAdapter:
         return BaseAdapter.__device_configurations__ is not None and BaseAdapter.__tls_repository__ is not None
 
     @staticmethod
-    def initialize(server_config: cfg.ServerConfiguration, tlsrepo: TLSRepository):
+    def initialize(server_config: cfg.ServerConfiguration, tlsrepo: TLSRepository,
+                   send_ready: bool = True):
         """Initialize all of the adapters
         
         The initialization means that there are concrete object backing the storage system based upon
@@ -330,6 +758,9 @@ class BaseAdapter:
         having to get it through an object.  
         
         The adapters are responsible for storing data into the object store using add_href function.
+
+        When send_ready is False the adapters are expected to have been restored from a warm
+        restart snapshot, so only the configuration and tls repository are set.
         """
         BaseAdapter.__server_configuration__ = server_config
         BaseAdapter.__lfdi__mapped_configuration__ = {}
@@ -341,7 +772,8 @@ class BaseAdapter:
             BaseAdapter.__lfdi__mapped_configuration__[lfdi] = cfg
 
         #BaseAdapter.after_initialized.send(BaseAdapter)
-        ready_signal.send(BaseAdapter)
+        if send_ready:
+            ready_signal.send(BaseAdapter)
         # BaseAdapter.ready().send(BaseAdapter)
         # Find subclasses of us and initialize them calling _initalize method
         # TODO make this non static
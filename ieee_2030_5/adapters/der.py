@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
+import threading
 from dataclasses import fields
 from enum import Enum
-from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
 
 from blinker import Signal
 
 import ieee_2030_5.hrefs as hrefs
 import ieee_2030_5.models as m
 from ieee_2030_5.adapters import (Adapter, AdapterListProtocol, BaseAdapter,
+                                  child_changed, children_changed,
                                   ready_signal)
 from ieee_2030_5.adapters.timeadapter import TimeAdapter
+import ieee_2030_5.clock as clock
+from ieee_2030_5.clock import add_event_source
 from ieee_2030_5.config import InvalidConfigFile
 from ieee_2030_5.data.indexer import add_href, get_href_filtered
 from ieee_2030_5.models.sep import DERProgram
@@ -22,6 +28,8 @@ _log = logging.getLogger(__name__)
 __all__: List[str] = [
     "DERControlAdapter",
     "DERProgramAdapter",
+    "ControlScheduler",
+    "DERControlScheduler",
     "DERCurveAdapter",
     "DERAdapter"
 ]
@@ -83,52 +91,158 @@ ready_signal.connect(initialize_der_control_adapter, DERCurveAdapter)
 
 DERProgramAdapter = Adapter[DERProgram](hrefs.der_program_href(), generic_type=m.DERProgram)
 
-def time_updated(timestamp):
-    
-    for derp_index, derp in enumerate(DERProgramAdapter.fetch_all()):
-        try:            
-            controls = DERProgramAdapter.fetch_children(derp, hrefs.DERC)
-        except KeyError:
-            # If controls aren't defined in the program then no need to continue
-            continue
-        
-        try:
-            current_active = DERProgramAdapter.fetch_children(derp, hrefs.DER_CONTROL_ACTIVE)
-        except KeyError:
-            current_active = []
-            
-        for ctrl_index, ctrl in enumerate(controls):
-            if not ctrl.EventStatus:
-                if ctrl.interval is not None:
-                    _log.debug(f"Setting up event for ctrl {ctrl_index} current_time: {timestamp} start_time: {ctrl.interval.start}")
-                    if timestamp > ctrl.interval.start and timestamp < ctrl.interval.start + ctrl.interval.duration:
-                        ctrl.EventStatus = m.EventStatus(currentStatus=1, dateTime=timestamp, potentiallySuperseded=False, reason="Active") 
-                    else:
-                        ctrl.EventStatus = m.EventStatus(currentStatus=0, dateTime=timestamp, potentiallySuperseded=False, reason="Scheduled") 
-                    _log.debug(f"ctrl.EventStatus is {ctrl.EventStatus}")
+class ControlScheduler:
+    """
+    Keeps the EventStatus of the DERControls of every DERProgram, and the active control
+    list (derca) of the program, up to date as time passes.
+
+    Rather than checking every control on every tick, each control is kept in a heap by the
+    next time its status can change: the first tick after its start, then the first tick
+    after its end.  A tick with nothing due costs one comparison, a transition the log of the
+    number of controls queued.  Controls added to or replaced in a program are picked up
+    through child_changed and evaluated on the next tick, or when next_transition is asked
+    for before it, controls removed or replaced are dropped when they come due.
+    """
+
+    def __init__(self, adapter: Adapter):
+        self._adapter = adapter
+        # (when, sequence, program, control), the sequence keeps ties from comparing
+        # controls.
+        self._heap: List[Tuple[int, int, m.DERProgram, m.DERControl]] = []
+        self._sequence = itertools.count()
+        # (id(control), when) of the heap entries, so a control is only queued once a time.
+        self._queued: Set[Tuple[int, int]] = set()
+        # Controls evaluated on the next tick, added from the request threads.
+        self._pending: List[Tuple[m.DERProgram, m.DERControl]] = []
+        self._lock = threading.Lock()
+        self._scanned = False
+        child_changed.connect(self._child_changed, sender=adapter)
+        children_changed.connect(self._children_changed, sender=adapter)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _child_changed(self, sender: Adapter, parent: m.DERProgram, name: str, child: Any):
+        if name == hrefs.DERC and child is not None:
+            with self._lock:
+                self._pending.append((parent, child))
+
+    def _children_changed(self, sender: Adapter, changes: List[Tuple[m.DERProgram, str, List[Any]]]):
+        with self._lock:
+            for parent, name, children in changes:
+                if name == hrefs.DERC:
+                    self._pending.extend((parent, ctrl) for ctrl in children)
+
+    def _controls(self):
+        for program in self._adapter.fetch_all():
+            try:
+                controls = self._adapter.fetch_children(program, hrefs.DERC)
+            except KeyError:
+                # If controls aren't defined in the program then no need to continue
+                continue
+            for ctrl in controls:
+                yield program, ctrl
+
+    def next_transition(self) -> Optional[int]:
+        """
+        The first tick at which a control can change status, None if none is queued.
+        Controls added since the last tick are evaluated at the time of the clock first, so
+        their transitions are queued too.
+        """
+        if self._scanned and self._pending:
+            self._drain(clock.timestamp())
+        return self._heap[0][0] if self._heap else None
+
+    def _drain(self, timestamp: int):
+        with self._adapter.write_lock():
+            with self._lock:
+                pending, self._pending = self._pending, []
+            for program, ctrl in pending:
+                self._evaluate(program, ctrl, timestamp)
+
+    def tick(self, timestamp: int):
+        with self._adapter.write_lock():
+            if not self._scanned:
+                # The first tick evaluates every control, including those of programs restored
+                # by a warm restart rather than added, so what was pending is covered.
+                with self._lock:
+                    self._pending = []
+                self._scanned = True
+                for program, ctrl in self._controls():
+                    self._evaluate(program, ctrl, timestamp, current=True)
+            else:
+                self._drain(timestamp)
+
+            heap = self._heap
+            while heap and heap[0][0] <= timestamp:
+                when, _, program, ctrl = heapq.heappop(heap)
+                self._queued.discard((id(ctrl), when))
+                self._evaluate(program, ctrl, timestamp)
+
+    def _queue(self, when: int, program: m.DERProgram, ctrl: m.DERControl):
+        key = (id(ctrl), when)
+        if key not in self._queued:
+            self._queued.add(key)
+            heapq.heappush(self._heap, (when, next(self._sequence), program, ctrl))
+
+    def _evaluate(self, program: m.DERProgram, ctrl: m.DERControl, timestamp: int,
+                  current: bool = False):
+        if not current and not self._adapter.has_child(program, hrefs.DERC, ctrl):
+            # Removed or replaced since it was queued.
+            return
+
+        if not ctrl.EventStatus:
+            if ctrl.interval is not None:
+                if timestamp > ctrl.interval.start and timestamp < ctrl.interval.start + ctrl.interval.duration:
+                    ctrl.EventStatus = m.EventStatus(currentStatus=1, dateTime=timestamp, potentiallySuperseded=False, reason="Active")
                 else:
-                    ctrl.EventStatus = m.EventStatus(currentStatus=0, dateTime=timestamp, potentiallySuperseded=False, reason="Scheduled") 
-                
-            if ctrl.EventStatus:
-                if ctrl.interval:
-                    # Active control
-                    if ctrl.interval.start < timestamp and timestamp < ctrl.interval.start + ctrl.interval.duration:
-                        if ctrl.EventStatus.currentStatus == 0:
-                            _log.debug(f"Activating control {ctrl_index}")
-                            ctrl.EventStatus.currentStatus = 1 # Active
-                            ctrl.EventStatus.dateTime = timestamp
-                            ctrl.EventStatus.reason = f"Control event active {ctrl.mRID}"
-
-                        if ctrl.mRID not in [x.mRID for x in current_active]:
-                            DERProgramAdapter.add_replace_child(derp, hrefs.DER_CONTROL_ACTIVE, ctrl)
-                            
-                    elif timestamp > ctrl.interval.start + ctrl.interval.duration:
-                        if ctrl.EventStatus.currentStatus == 1:
-                            _log.debug(f"Deactivating control {ctrl_index}")
-                            
-                            ctrl.EventStatus.currentStatus = -1 # for me this means complete
-                            DERProgramAdapter.remove_child(derp, hrefs.DER_CONTROL_ACTIVE, ctrl)
-                
+                    ctrl.EventStatus = m.EventStatus(currentStatus=0, dateTime=timestamp, potentiallySuperseded=False, reason="Scheduled")
+                # Lazily formatted, this runs for every control when the server starts.
+                _log.debug("Set up event for ctrl %s current_time: %s start_time: %s status: %s",
+                           ctrl.href, timestamp, ctrl.interval.start, ctrl.EventStatus.reason)
+            else:
+                ctrl.EventStatus = m.EventStatus(currentStatus=0, dateTime=timestamp, potentiallySuperseded=False, reason="Scheduled")
+            # Changed in place, snapshots and the workers of production mode must see it.
+            self._adapter.item_changed(program)
+
+        if not ctrl.interval:
+            return
+
+        start = ctrl.interval.start
+        end = start + ctrl.interval.duration
+        # Active control
+        if start < timestamp and timestamp < end:
+            if ctrl.EventStatus.currentStatus == 0:
+                _log.debug(f"Activating control {ctrl.href}")
+                ctrl.EventStatus.currentStatus = 1 # Active
+                ctrl.EventStatus.dateTime = timestamp
+                ctrl.EventStatus.reason = f"Control event active {ctrl.mRID}"
+                self._adapter.item_changed(program)
+
+            if not self._adapter.has_child(program, hrefs.DER_CONTROL_ACTIVE, ctrl):
+                self._adapter.add_replace_child(program, hrefs.DER_CONTROL_ACTIVE, ctrl)
+            self._queue(end + 1, program, ctrl)
+
+        elif timestamp > end:
+            if ctrl.EventStatus.currentStatus == 1:
+                _log.debug(f"Deactivating control {ctrl.href}")
+
+                ctrl.EventStatus.currentStatus = -1 # for me this means complete
+                self._adapter.item_changed(program)
+                if self._adapter.has_child(program, hrefs.DER_CONTROL_ACTIVE, ctrl):
+                    self._adapter.remove_child(program, hrefs.DER_CONTROL_ACTIVE, ctrl)
+
+        else:
+            # At or before the start, or at the end, where nothing changes yet.
+            self._queue(start + 1 if timestamp <= start else end + 1, program, ctrl)
+
+
+# Connected at import so programs restored by a warm restart are also kept up to date.
+DERControlScheduler = ControlScheduler(DERProgramAdapter)
+TimeAdapter.tick.connect(DERControlScheduler.tick)
+# So a DiscreteEventClock jumps to the next control transition.
+add_event_source(DERControlScheduler.next_transition)
+
 
 def initialize_der_program_adapter(sender):
     
@@ -197,7 +311,6 @@ def initialize_der_program_adapter(sender):
                     DERProgramAdapter.add_replace_child(program, "dc", curve)
         
         ready_signal.send(DERProgramAdapter)
-        TimeAdapter.tick.connect(time_updated)
         # else:
         #     default_ctl: m.DefaultDERControl = BaseAdapter.build_instance(
         #         m.DefaultDERControl, der_cfg.__dict__)
@@ -376,21 +489,88 @@ ready_signal.connect(initialize_der_program_adapter, DERControlAdapter)
 
 
 if __name__ == '__main__':
-    from pathlib import Path
-
-    import yaml
-
-    from ieee_2030_5.__main__ import get_tls_repository
-    from ieee_2030_5.config import ServerConfiguration
-    
-    cfg_pth = Path("/home/os2004/repos/gridappsd-2030_5/config.yml")
-    cfg_dict = yaml.safe_load(cfg_pth.read_text())
-
-    config = ServerConfiguration(**cfg_dict)
-
-    tls_repo = get_tls_repository(config, False)
-
-    BaseAdapter.initialize(config, tls_repo)    
-
-    print(DERCurveAdapter.fetch_edev_all())
-    print(DERCurveAdapter.fetch_list())
\ No newline at end of file
+    import random
+    import time
+
+    programs, per_program = 500, 100
+    t0 = 1700000000
+
+    def scheduled(prefix: str) -> Adapter:
+        # 50k controls starting over an hour, the same ones for every adapter.
+        rnd = random.Random(2030)
+        adapter = Adapter[DERProgram](prefix, generic_type=m.DERProgram)
+        for p in range(programs):
+            program = m.DERProgram(href=f"{prefix}_{p}", mRID=f"{p:032X}")
+            adapter.add(program)
+            for c in range(per_program):
+                adapter.add_replace_child(program, hrefs.DERC, m.DERControl(
+                    mRID=f"{p:016X}{c:016X}",
+                    interval=m.DateTimeInterval(start=t0 + rnd.randrange(3600),
+                                                duration=rnd.randrange(60, 900))))
+        return adapter
+
+    def full_scan(adapter: Adapter, timestamp: int):
+        # What time_updated did on every tick before the scheduler, less the logging.
+        for derp in adapter.fetch_all():
+            try:
+                controls = adapter.fetch_children(derp, hrefs.DERC)
+            except KeyError:
+                continue
+            try:
+                current_active = adapter.fetch_children(derp, hrefs.DER_CONTROL_ACTIVE)
+            except KeyError:
+                current_active = []
+            for ctrl in controls:
+                if not ctrl.EventStatus:
+                    if timestamp > ctrl.interval.start and timestamp < ctrl.interval.start + ctrl.interval.duration:
+                        ctrl.EventStatus = m.EventStatus(currentStatus=1, dateTime=timestamp, potentiallySuperseded=False, reason="Active")
+                    else:
+                        ctrl.EventStatus = m.EventStatus(currentStatus=0, dateTime=timestamp, potentiallySuperseded=False, reason="Scheduled")
+                if ctrl.interval.start < timestamp and timestamp < ctrl.interval.start + ctrl.interval.duration:
+                    if ctrl.EventStatus.currentStatus == 0:
+                        ctrl.EventStatus.currentStatus = 1
+                        ctrl.EventStatus.dateTime = timestamp
+                        ctrl.EventStatus.reason = f"Control event active {ctrl.mRID}"
+                    if ctrl.mRID not in [x.mRID for x in current_active]:
+                        adapter.add_replace_child(derp, hrefs.DER_CONTROL_ACTIVE, ctrl)
+                elif timestamp > ctrl.interval.start + ctrl.interval.duration:
+                    if ctrl.EventStatus.currentStatus == 1:
+                        ctrl.EventStatus.currentStatus = -1
+                        adapter.remove_child(derp, hrefs.DER_CONTROL_ACTIVE, ctrl)
+
+    def state(adapter: Adapter) -> List[Tuple[str, int, List[str]]]:
+        result = []
+        for derp in adapter.fetch_all():
+            try:
+                active = [c.mRID for c in adapter.fetch_children(derp, hrefs.DER_CONTROL_ACTIVE)]
+            except KeyError:
+                active = []
+            result.extend((c.mRID, c.EventStatus.currentStatus, sorted(active))
+                          for c in adapter.fetch_children(derp, hrefs.DERC))
+        return result
+
+    scanned = scheduled("/scan")
+    heaped = scheduled("/heap")
+    scheduler = ControlScheduler(heaped)
+    window = range(t0 + 600, t0 + 720)
+
+    print(f"{programs * per_program} controls, {len(window)} ticks while ~14 start a second")
+    for label, run in (("full scan", lambda t: full_scan(scanned, t)), ("scheduler", scheduler.tick)):
+        start = time.perf_counter()
+        run(window[0] - 1)
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        for timestamp in window:
+            run(timestamp)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<10} first tick {first * 1000:8.1f}ms, then {elapsed / len(window) * 1000:8.3f}ms/tick")
+    assert state(scanned) == state(heaped)
+
+    start = time.perf_counter()
+    for timestamp in range(window[-1] + 1, t0 + 86400):
+        scheduler.tick(timestamp)
+    elapsed = time.perf_counter() - start
+    print(f"scheduler  rest of the day {elapsed:.2f}s for {t0 + 86400 - window[-1]} ticks, "
+          f"{len(scheduler)} queued")
+    # Controls that ended before the first tick are never activated, so stay scheduled.
+    assert all(status != 1 and not active for _, status, active in state(heaped))
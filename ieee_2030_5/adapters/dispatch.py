@@ -0,0 +1,277 @@
+"""
+Dispatch of one DER control to a fleet of devices at once.
+
+A dispatch takes a DERControl template and targets, programs, end devices by lFDI, group
+levels or named groups (ieee_2030_5.server.server_constructs), and writes one control, a
+copy of the template, to each DERProgram the targets resolve to.  A device is reached
+through the program of its FunctionSetAssignments with the lowest primacy value, the one
+that wins when the control resolution runs, and devices sharing that program share the
+control.
+
+The controls of a program are identified by the mRID of the template and the program href,
+so dispatching the same template again updates them.  Templates without an mRID are given
+one, returned as the dispatch_id of the report.
+
+Every control is written in one DERProgramAdapter.batch, so however many targets there are
+the control scheduler and the effective control resolution hear of it once per program,
+each changed href is reported to the response cache once and the state is written once.
+"""
+from __future__ import annotations
+
+import copy
+import hashlib
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import ieee_2030_5.clock as clock
+import ieee_2030_5.hrefs as hrefs
+import ieee_2030_5.models as m
+from ieee_2030_5.adapters.der import DERProgramAdapter
+from ieee_2030_5.adapters.enddevices import EndDeviceAdapter
+from ieee_2030_5.adapters.resolution import EffectiveControls
+from ieee_2030_5.data.state import flush_state
+from ieee_2030_5.utils import uuid_2030_5
+
+_log = logging.getLogger(__name__)
+
+__all__: List[str] = [
+    "DispatchResult",
+    "DispatchReport",
+    "dispatch"
+]
+
+# Dispatches are applied one at a time.
+__dispatch_lock__ = threading.Lock()
+
+
+@dataclass
+class DispatchResult:
+    """
+    What happened for one target: 201 when its control was created, 204 when updated and
+    404 when the target wasn't found or has no program.
+    """
+    target: str
+    status: int
+    program: Optional[str] = None
+    control: Optional[str] = None
+    message: Optional[str] = None
+
+
+@dataclass
+class DispatchReport:
+    dispatch_id: str
+    results: List[DispatchResult] = field(default_factory=list)
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+
+
+def _control_mrid(dispatch_id: str, program: m.DERProgram) -> str:
+    return hashlib.md5(f"{dispatch_id}{program.href}".encode()).hexdigest().upper()
+
+
+def _copy(obj: Any) -> Any:
+    # copy.copy goes through __reduce_ex__, several times slower for these dataclasses.
+    if obj is None:
+        return None
+    if not hasattr(obj, "__dict__"):
+        # The slotted ieee_2030_5.models.compact variants.
+        return copy.copy(obj)
+    clone = object.__new__(type(obj))
+    clone.__dict__.update(obj.__dict__)
+    return clone
+
+
+def _from_template(template: m.DERControl, mrid: str, created: int) -> m.DERControl:
+    control = _copy(template)
+    control.href = None
+    control.mRID = mrid
+    control.EventStatus = None
+    control.creationTime = template.creationTime if template.creationTime is not None else created
+    # Not shared, controls can be changed one at a time later.
+    control.interval = _copy(template.interval)
+    control.DERControlBase = _copy(template.DERControlBase)
+    return control
+
+
+def _program(target: Union[int, str]) -> Optional[m.DERProgram]:
+    if isinstance(target, int):
+        try:
+            return DERProgramAdapter.fetch(target)
+        except KeyError:
+            return None
+    return DERProgramAdapter.fetch_by_property("href", target)
+
+
+def _device_program(end_device: m.EndDevice) -> Optional[m.DERProgram]:
+    programs = EffectiveControls.programs_of(end_device)
+    if not programs:
+        return None
+    return min(programs, key=lambda p: (p.primacy is None, p.primacy or 0))
+
+
+def _group_devices(level: Optional[str] = None, name: Optional[str] = None) -> List[m.EndDevice]:
+    from ieee_2030_5.server.server_constructs import GroupLevel, get_group
+
+    if level is not None:
+        return get_group(level=GroupLevel[level]).get_devices()
+    return get_group(name=name).get_devices()
+
+
+def _targets(programs: Iterable[Union[int, str]], lfdis: Iterable[Any],
+             group_levels: Iterable[str], groups: Iterable[str],
+             failed: List[DispatchResult]) -> List[Tuple[str, m.DERProgram]]:
+    """ Each target, as reported, with the program its control goes to. """
+    resolved: List[Tuple[str, m.DERProgram]] = []
+
+    for target in programs:
+        program = _program(target)
+        if program is None:
+            failed.append(DispatchResult(str(target), 404, message="Program not found"))
+        else:
+            resolved.append((str(target), program))
+
+    def add_device(target: str, end_device: Optional[m.EndDevice]):
+        if end_device is None:
+            failed.append(DispatchResult(target, 404, message="End device not found"))
+            return
+        program = _device_program(end_device)
+        if program is None:
+            failed.append(DispatchResult(target, 404, message="No program assigned"))
+        else:
+            resolved.append((target, program))
+
+    for lfdi in lfdis:
+        add_device(str(lfdi), EndDeviceAdapter.fetch_by_property("lFDI", lfdi))
+
+    for kind, values in (("level", group_levels), ("name", groups)):
+        for value in values:
+            try:
+                devices = _group_devices(**{kind: value})
+            except (KeyError, ValueError):
+                failed.append(DispatchResult(value, 404, message="Group not found"))
+                continue
+            if not devices:
+                failed.append(DispatchResult(value, 404, message="No devices in group"))
+            for end_device in devices:
+                add_device(f"{value}/{end_device.lFDI}", end_device)
+
+    return resolved
+
+
+def dispatch(template: m.DERControl,
+             programs: Iterable[Union[int, str]] = (),
+             lfdis: Iterable[Any] = (),
+             group_levels: Iterable[str] = (),
+             groups: Iterable[str] = (),
+             flush: bool = True) -> DispatchReport:
+    """
+    Create or update a copy of template in the program of every target.  programs are
+    program hrefs or indexes, group_levels the names of GroupLevel members.  With flush the
+    state snapshot, when snapshots are enabled, is written before returning.
+    """
+    start = time.perf_counter()
+    dispatch_id = template.mRID or uuid_2030_5()
+    if isinstance(dispatch_id, bytes):
+        # hexBinary parsed from xml.
+        dispatch_id = dispatch_id.hex().upper()
+    report = DispatchReport(dispatch_id)
+
+    with __dispatch_lock__:
+        failed: List[DispatchResult] = []
+        resolved = _targets(programs, lfdis, group_levels, groups, failed)
+        created = clock.timestamp()
+        # Targets sharing a program share its control.
+        written: Dict[int, Tuple[int, m.DERControl]] = {}
+
+        with DERProgramAdapter.batch():
+            for target, program in resolved:
+                outcome = written.get(id(program))
+                if outcome is None:
+                    mrid = _control_mrid(dispatch_id, program)
+                    control = _from_template(template, mrid, created)
+                    try:
+                        index = DERProgramAdapter.fetch_child_index_by_mrid(program, hrefs.DERC, mrid)
+                    except KeyError:
+                        DERProgramAdapter.add_replace_child(program, hrefs.DERC, control)
+                        outcome = (201, control)
+                        report.created += 1
+                    else:
+                        DERProgramAdapter.replace_child(program, hrefs.DERC, index, control)
+                        outcome = (204, control)
+                        report.updated += 1
+                    written[id(program)] = outcome
+                status, control = outcome
+                report.results.append(DispatchResult(target, status, program.href, control.href))
+
+        report.results.extend(failed)
+        report.failed = len(failed)
+        if flush and written:
+            flush_state()
+
+    report.seconds = time.perf_counter() - start
+    _log.info(f"Dispatched {dispatch_id} to {len(report.results)} targets, {report.created} "
+              f"controls created, {report.updated} updated and {report.failed} failed in "
+              f"{report.seconds:.3f}s")
+    return report
+
+
+if __name__ == '__main__':
+    import ieee_2030_5.data.versions as versions
+    from ieee_2030_5.adapters import Adapter
+    from ieee_2030_5.adapters.der import DERControlScheduler
+    from ieee_2030_5.adapters.fsa import FSAAdapter
+
+    fleet = 10_000
+    t0 = 1700000000
+
+    # Devices each following their own program through their own FSA.
+    lfdis = []
+    for i in range(fleet):
+        program = m.DERProgram(href=f"/derp_{i}", mRID=f"{i:032X}", primacy=i % 100)
+        DERProgramAdapter.add(program)
+        fsa = m.FunctionSetAssignments(href=f"/fsa_{i}")
+        FSAAdapter.add(fsa)
+        FSAAdapter.add_replace_child(fsa, hrefs.FSA, program)
+        end_device = m.EndDevice(href=f"/edev_{i}", lFDI=f"{i:040X}")
+        EndDeviceAdapter.add(end_device)
+        EndDeviceAdapter.add_replace_child(end_device, hrefs.FSA, fsa)
+        lfdis.append(end_device.lFDI)
+
+    notifications = []
+    versions.resource_changed.connect(lambda href, **kwargs: notifications.append(href), weak=False)
+    versions.resources_changed.connect(lambda sender, keys: notifications.append(keys), weak=False)
+
+    template = m.DERControl(mRID="5509D69F8B35359500000000000091A2", description="Curtail",
+                            interval=m.DateTimeInterval(start=t0 + 60, duration=900),
+                            DERControlBase=m.DERControlBase(opModMaxLimW=m.ActivePower(multiplier=0, value=5000)))
+
+    report = dispatch(template, lfdis=lfdis)
+    assert report.created == fleet and report.failed == 0
+    print(f"Dispatched to {fleet} DERs in {report.seconds * 1000:.0f}ms, "
+          f"{len(notifications)} change notifications")
+    assert report.seconds < 1.0, "Over the one second target"
+
+    again = dispatch(template, lfdis=lfdis + ["FF" * 20], group_levels=["Feeder"])
+    assert again.updated == fleet and again.created == 0 and again.failed == 2
+    print(f"Dispatched again, updated in {again.seconds * 1000:.0f}ms")
+
+    DERControlScheduler.tick(t0 + 61)
+    active = sum(1 for p in DERProgramAdapter.fetch_all()
+                 if DERProgramAdapter.has_child(p, hrefs.DER_CONTROL_ACTIVE,
+                                                DERProgramAdapter.fetch_children(p, hrefs.DERC)[0]))
+    assert active == fleet, active
+    assert EffectiveControls.for_lfdi(lfdis[7], t0 + 100).control.mRID == \
+        _control_mrid(template.mRID, DERProgramAdapter.fetch(7))
+
+    # The same controls added one at a time, as the admin derc endpoint does.
+    notifications.clear()
+    start = time.perf_counter()
+    for i, program in enumerate(DERProgramAdapter.fetch_all()):
+        DERProgramAdapter.add_replace_child(program, hrefs.DERC, _from_template(template, f"{i:032X}", t0))
+    elapsed = time.perf_counter() - start
+    print(f"One at a time: {elapsed * 1000:.0f}ms, {len(notifications)} change notifications")
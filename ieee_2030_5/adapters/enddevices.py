@@ -139,6 +139,10 @@ def initialize_end_device_adapter(sender):
                 
                 deradapter.add(der)
     
+    # The mRIDs of the programs were changed in place above.
+    for program in programs:
+        DERProgramAdapter.reindex(program)
+
     ready_signal.send(EndDeviceAdapter)
         #self._end_devices.append(edev)
                         
@@ -214,3 +218,30 @@ def initialize_end_device_adapter(sender):
         # edev_list.EndDevice.append(edev)
 ready_signal.connect(initialize_end_device_adapter, DERProgramAdapter)
 
+
+if __name__ == '__main__':
+    import time
+
+    # Build 10k EndDevices each with a Registration and a DER adapter holding two DERs, then
+    # look devices up by lFDI the way the server does for each request.
+    count = 10000
+    bench = Adapter[m.EndDevice]("/bench_edev", generic_type=m.EndDevice)
+    start = time.perf_counter()
+    for i in range(count):
+        edev = m.EndDevice(lFDI=f"{i:040X}", sFDI=i)
+        bench.add(edev)
+        bench.add_replace_child(edev, hrefs.END_DEVICE_REGISTRATION, m.Registration(pIN=i))
+        ders = Adapter[m.DER](hrefs.SEP.join([edev.href, hrefs.DER]), generic_type=m.DER)
+        bench.add_replace_child(edev, hrefs.DER, ders)
+        for _ in range(2):
+            ders.add(m.DER())
+    elapsed = time.perf_counter() - start
+    print(f"Built {count} end devices in {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    for i in range(count):
+        edev = bench.fetch_by_property("lFDI", f"{i:040X}")
+        bench.fetch_index(edev)
+        bench.fetch_children(edev, hrefs.DER)
+    elapsed = time.perf_counter() - start
+    print(f"{count} lookups by lFDI in {elapsed * 1000:.1f}ms")
@@ -1,11 +1,15 @@
+import functools
 import logging
+import pickle
 from dataclasses import dataclass, field
-from typing import Container, List, Optional, Sized, Tuple
+from typing import Container, Dict, List, Optional, Sized, Tuple
 
 import ieee_2030_5.hrefs as hrefs
 import ieee_2030_5.models as m
 from ieee_2030_5.adapters import BaseAdapter, ReturnCode
 from ieee_2030_5.data.indexer import add_href, get_href
+from ieee_2030_5.data.state import mark_changed, read_state, register_state, state_lock
+from ieee_2030_5.models.compact import compact
 
 _log = logging.getLogger(__name__)
 
@@ -13,10 +17,37 @@ __all__: List[str] = [
     "MirrorUsagePointAdapter"
 ]
 
+# Name the usage point and mirror usage point records are registered under, each is a record
+# keyed by its href (see ieee_2030_5.data.state).
+MIRROR_STATE = "mirror_usage_points"
+
+# Held while the usage points and mirror usage points are changed and while one is pickled.
+__write_lock__ = state_lock()
+# href -> pickled record, None when it is read from the point store, of the records not
+# loaded yet.
+__stored__: Dict[str, Optional[bytes]] = {}
+
+
+def _writes(func):
+    """ Run func, changing the usage points or mirror usage points, under __write_lock__. """
+
+    @functools.wraps(func)
+    def locked(*args, **kwargs):
+        with __write_lock__:
+            return func(*args, **kwargs)
+
+    return locked
+
+
+def _record_changed(href: str):
+    mark_changed(MIRROR_STATE, href)
+
+
 @dataclass
 class _UsagePointWrapper:
     usage_point: m.UsagePoint   
     meter_readings: List[m.MeterReading] = field(default_factory=list)
+    # Retained as the slotted variants from ieee_2030_5.models.compact.
     mirror_meter_readings: List[m.MirrorMeterReading] = field(default_factory=list)
     
     def fetch_reading_by_mRID(self, mRID) -> m.MeterReading:
@@ -36,8 +67,14 @@ class _UsagePointWrapper:
     
 @dataclass
 class _UsagePointContainer(Container, Sized):
-    __usage_points__: List[_UsagePointWrapper] = field(default_factory=list)
+    _usage_points: List[_UsagePointWrapper] = field(default_factory=list)
+
+    @property
+    def __usage_points__(self) -> List[_UsagePointWrapper]:
+        _load_stored()
+        return self._usage_points
     
+    @_writes
     def create_or_replace_reading(self, usage_point: m.UsagePoint, mirror_meter_reading: m.MirrorMeterReading) -> Tuple[ReturnCode, str]:
         
         assert usage_point in self, "Passed usage_point not contained within container"
@@ -51,7 +88,8 @@ class _UsagePointContainer(Container, Sized):
                 mmr_index = wrapper.fetch_mirror_meter_reading_index(mirror_meter_reading.mRID)
                 
                 mirror_meter_reading.href = wrapper.mirror_meter_readings[mmr_index].href
-                wrapper.mirror_meter_readings[mmr_index] = mirror_meter_reading                        
+                wrapper.mirror_meter_readings[mmr_index] = compact(mirror_meter_reading)
+                _record_changed(wrapper.usage_point.href)
                 return ReturnCode.NO_CONTENT, mirror_meter_reading.href
                 
             except StopIteration:
@@ -72,11 +110,13 @@ class _UsagePointContainer(Container, Sized):
                 mirror_meter_reading.href = mr_reading_href
                 
                 wrapper.meter_readings.append(meter_reading)                
-                wrapper.mirror_meter_readings.append(mirror_meter_reading)
+                wrapper.mirror_meter_readings.append(compact(mirror_meter_reading))
+                _record_changed(wrapper.usage_point.href)
                 
                 return ReturnCode.CREATED.value, mr_reading_href
                 
     
+    @_writes
     def create_or_replace(self, mirror_usage_point: m.MirrorUsagePoint) -> m.UsagePoint:
         
         if mirror_usage_point in self:
@@ -186,7 +226,12 @@ class _MirrorUsagePointAdapter:
     
     def __init__(self):
         self.__upt_container__: _UsagePointContainer = UsagePointContainer
-        self.__mirror_usage_points__: List[m.MirrorUsagePoint] = []
+        self._mirror_usage_points: List[m.MirrorUsagePoint] = []
+
+    @property
+    def __mirror_usage_points__(self) -> List[m.MirrorUsagePoint]:
+        _load_stored()
+        return self._mirror_usage_points
     
     def fetch_usage_point_by_href(self, href: str) -> m.UsagePoint:
         return self.__upt_container__.fetch_by_href(href)
@@ -220,6 +265,7 @@ class _MirrorUsagePointAdapter:
         return get_href(href=hrefs.mirror_usage_point_href(index))
 
     
+    @_writes
     def create(self, mup: m.MirrorUsagePoint) -> Tuple[ReturnCode, str]:
         """Creates a MirrorUsagePoint and its associated usage point
         
@@ -229,18 +275,21 @@ class _MirrorUsagePointAdapter:
         
         before = len(self.__upt_container__)
         upt = self.__upt_container__.create_or_replace(mup)
+        _record_changed(upt.href)
         after = len(self.__upt_container__)
         if after > before:
             # TODO: Don't hard code here.
             mup.href = upt.href.replace('upt', 'mup')
             mup.postRate = BaseAdapter.server_config().usage_point_post_rate
             self.__mirror_usage_points__.append(mup)
+            _record_changed(mup.href)
             return ReturnCode.CREATED.value, mup.href
         else:
             for i, o in enumerate(self.__mirror_usage_points__):
                 if o.mRID == mup.mRID:
                     mup.href = o.href
                     self.__mirror_usage_points__[i] = mup
+                    _record_changed(mup.href)
                     break
             return ReturnCode.NO_CONTENT.value, mup.href
         
@@ -388,6 +437,55 @@ class _MirrorUsagePointAdapter:
 MirrorUsagePointAdapter = _MirrorUsagePointAdapter()
 
 
+def _position(href: str) -> int:
+    return int(href.rsplit(hrefs.SEP, 1)[-1])
+
+
+def _href_of(record) -> str:
+    return record.usage_point.href if isinstance(record, _UsagePointWrapper) else record.href
+
+
+def _load_stored():
+    """
+    Load the records not loaded yet, the usage points are only ever used all together.
+    """
+    if not __stored__:
+        return
+    with __write_lock__:
+        for href in sorted(__stored__, key=_position):
+            data = __stored__[href]
+            if data is None:
+                data = read_state(MIRROR_STATE, href)
+            record = pickle.loads(data)
+            del __stored__[href]
+            records = UsagePointContainer._usage_points \
+                if isinstance(record, _UsagePointWrapper) \
+                else MirrorUsagePointAdapter._mirror_usage_points
+            for i, loaded in enumerate(records):
+                if _href_of(loaded) == href:
+                    records[i] = record
+                    break
+            else:
+                records.append(record)
+                records.sort(key=lambda loaded: _position(_href_of(loaded)))
+
+
+def _dump_record(href: str) -> bytes:
+    with __write_lock__:
+        for record in UsagePointContainer.__usage_points__ + \
+                MirrorUsagePointAdapter.__mirror_usage_points__:
+            if _href_of(record) == href:
+                return pickle.dumps(record)
+    raise KeyError(f"No usage point or mirror usage point {href}")
+
+
+def _load_record(href: str, data: Optional[bytes]):
+    with __write_lock__:
+        __stored__[href] = data
+
+
+register_state(MIRROR_STATE, _dump_record, _load_record)
+
 
 if __name__ == '__main__':
     
@@ -0,0 +1,363 @@
+"""
+Which DER control is in effect for an EndDevice, computed by the server rather than by each
+client from every program it can reach.
+
+The programs of a device are those of the FunctionSetAssignments it links to.  Among their
+controls active at a time (start < time < start + duration, as the control scheduler
+activates them) the one of the program with the lowest primacy value wins, and between
+controls of the same primacy the one created last, as 2030.5 resolves overlapping events.
+Cancelled and superseded controls are left out.  When no control is active the
+DefaultDERControl of the program with the lowest primacy value that has one applies.
+
+The controls of a set of programs are swept once into a timeline, the sorted instants at
+which some control starts or ends with the winner at and after each of them, so the control
+in effect at any time is a bisect away.  Timelines are cached by their set of programs and
+dropped when a control or default control of one of the programs changes.  The programs of
+each device are cached until an FSA changes.  The answer for the current time is kept until
+the clock passes the next start or end.
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import ieee_2030_5.clock as clock
+import ieee_2030_5.hrefs as hrefs
+import ieee_2030_5.models as m
+from ieee_2030_5.adapters import Adapter, child_changed, children_changed
+from ieee_2030_5.adapters.der import DERProgramAdapter
+from ieee_2030_5.adapters.enddevices import EndDeviceAdapter
+from ieee_2030_5.adapters.fsa import FSAAdapter
+from ieee_2030_5.data.state import state_restored
+
+_log = logging.getLogger(__name__)
+
+__all__: List[str] = [
+    "EffectiveControl",
+    "ControlResolver",
+    "EffectiveControls"
+]
+
+# EventStatus currentStatus of controls that no longer apply: Cancelled, Cancelled with
+# Randomization and Superseded.
+EXCLUDED_STATUSES = (2, 3, 4)
+
+# Programs without a primacy rank after every program that has one.
+_NO_PRIMACY = 1 << 16
+
+_Winner = Optional[Tuple[m.DERProgram, m.DERControl]]
+
+
+@dataclass
+class EffectiveControl:
+    """
+    The control in effect at time, and the program it is from.  control is the
+    DefaultDERControl of the program when default is set, None when no program has a control
+    or default.  valid_until is the next time a control starts or ends, None if none does.
+    """
+    time: int
+    program: Optional[m.DERProgram]
+    control: Union[m.DERControl, m.DefaultDERControl, None]
+    default: bool = False
+    valid_until: Optional[int] = None
+
+
+class _Timeline:
+    """
+    The winning control of a set of programs at (breaks[i]) and after (up to breaks[i + 1])
+    each instant a control starts or ends.
+    """
+
+    def __init__(self, programs: Sequence[m.DERProgram], adapter: Adapter):
+        ranked = sorted(enumerate(programs),
+                        key=lambda p: (_primacy(p[1]), p[0]))
+        entries = []
+        self.default: Optional[Tuple[m.DERProgram, m.DefaultDERControl]] = None
+        for position, (_, program) in enumerate(ranked):
+            if self.default is None:
+                default = _children(adapter, program, hrefs.DDERC)
+                if default:
+                    self.default = (program, default[0])
+            for ctrl in _children(adapter, program, hrefs.DERC):
+                if not ctrl.interval or not ctrl.interval.duration:
+                    continue
+                if ctrl.EventStatus and ctrl.EventStatus.currentStatus in EXCLUDED_STATUSES:
+                    continue
+                start = ctrl.interval.start
+                # Lowest primacy first, then the control created last.
+                rank = (_primacy(program), -(ctrl.creationTime or 0), position)
+                entries.append((start, start + ctrl.interval.duration, rank, program, ctrl))
+        entries.sort(key=lambda e: e[0])
+
+        self.breaks: List[int] = sorted({e[0] for e in entries} | {e[1] for e in entries})
+        self.at: List[_Winner] = []
+        self.after: List[_Winner] = []
+        # (rank, sequence, end, program, control) of the controls started so far, those that
+        # ended are dropped when they reach the top.
+        active: List[Tuple[Any, int, int, m.DERProgram, m.DERControl]] = []
+        sequence = itertools.count()
+        next_entry = 0
+        for instant in self.breaks:
+            while active and active[0][2] <= instant:
+                heapq.heappop(active)
+            self.at.append(active[0][3:] if active else None)
+            while next_entry < len(entries) and entries[next_entry][0] == instant:
+                start, end, rank, program, ctrl = entries[next_entry]
+                heapq.heappush(active, (rank, next(sequence), end, program, ctrl))
+                next_entry += 1
+            self.after.append(active[0][3:] if active else None)
+
+    def lookup(self, time: int) -> Tuple[_Winner, Optional[int], Optional[int]]:
+        """
+        The winner at time, with the instants after which and up to which it holds (None
+        when unbounded).
+        """
+        i = bisect_right(self.breaks, time) - 1
+        following = self.breaks[i + 1] if i + 1 < len(self.breaks) else None
+        if i < 0:
+            return None, None, following
+        if self.breaks[i] == time:
+            return self.at[i], None, time
+        return self.after[i], self.breaks[i], following
+
+
+def _primacy(program: m.DERProgram) -> int:
+    return _NO_PRIMACY if program.primacy is None else program.primacy
+
+
+def _children(adapter: Adapter, parent: Any, name: str) -> List[Any]:
+    try:
+        return adapter.fetch_children(parent, name)
+    except (KeyError, ValueError, IndexError):
+        return []
+
+
+class ControlResolver:
+    """
+    Resolves and caches the control in effect for EndDevices and groups of them, see the
+    module documentation for the rules.
+    """
+
+    def __init__(self, programs: Adapter = DERProgramAdapter, end_devices: Adapter = EndDeviceAdapter,
+                 fsas: Adapter = FSAAdapter):
+        self._programs = programs
+        self._end_devices = end_devices
+        self._fsas = fsas
+        self._lock = threading.RLock()
+        # Sorted program hrefs -> timeline of those programs.
+        self._timelines: Dict[Tuple[str, ...], _Timeline] = {}
+        # Program href -> keys of the timelines including it.
+        self._by_program: Dict[str, Set[Tuple[str, ...]]] = {}
+        # lFDI -> programs of the device.
+        self._device_programs: Dict[Any, List[m.DERProgram]] = {}
+        # Timeline key -> (after, until, answer) for the current time.
+        self._current: Dict[Tuple[str, ...], Tuple[Optional[int], Optional[int], EffectiveControl]] = {}
+        child_changed.connect(self._program_changed, sender=programs)
+        children_changed.connect(self._programs_changed, sender=programs)
+        for adapter in (fsas, end_devices):
+            child_changed.connect(self._assignments_changed, sender=adapter)
+            children_changed.connect(self._assignments_changed, sender=adapter)
+        state_restored.connect(self._state_restored)
+
+    def _state_restored(self, sender: Any, **kwargs):
+        self.invalidate()
+
+    def _program_changed(self, sender: Adapter, parent: m.DERProgram, name: str, child: Any):
+        if name in (hrefs.DERC, hrefs.DDERC):
+            self.invalidate(parent)
+
+    def _programs_changed(self, sender: Adapter, changes: List[Tuple[m.DERProgram, str, List[Any]]]):
+        with self._lock:
+            for parent, name, _ in changes:
+                if name in (hrefs.DERC, hrefs.DDERC):
+                    self.invalidate(parent)
+
+    def _assignments_changed(self, sender: Adapter, parent: Any = None, name: str = None,
+                             **kwargs):
+        if sender is self._fsas or name == hrefs.FSA or "changes" in kwargs:
+            with self._lock:
+                self._device_programs.clear()
+
+    def invalidate(self, program: Optional[m.DERProgram] = None):
+        """
+        Drop what was resolved with program, or everything.  Call after changing a program,
+        e.g. its primacy, in place.
+        """
+        with self._lock:
+            if program is None:
+                self._timelines.clear()
+                self._by_program.clear()
+                self._device_programs.clear()
+                self._current.clear()
+                return
+            for key in self._by_program.pop(program.href, ()):
+                self._timelines.pop(key, None)
+                self._current.pop(key, None)
+
+    def programs_of(self, end_device: m.EndDevice) -> List[m.DERProgram]:
+        """ The programs of the FunctionSetAssignments of end_device. """
+        programs = self._device_programs.get(end_device.lFDI)
+        if programs is not None:
+            return programs
+        programs = []
+        seen = set()
+        for assignments in _children(self._end_devices, end_device, hrefs.FSA):
+            # The FSA child of a device is the adapter of its assignments.
+            fsas = assignments.fetch_all() if isinstance(assignments, Adapter) else [assignments]
+            for fsa in fsas:
+                for program in _children(self._fsas, fsa, hrefs.FSA):
+                    if program.href not in seen:
+                        seen.add(program.href)
+                        programs.append(program)
+        with self._lock:
+            self._device_programs[end_device.lFDI] = programs
+        return programs
+
+    def _timeline(self, programs: Sequence[m.DERProgram]) -> Tuple[Tuple[str, ...], _Timeline]:
+        key = tuple(sorted(program.href for program in programs))
+        timeline = self._timelines.get(key)
+        if timeline is None:
+            timeline = _Timeline(programs, self._programs)
+            with self._lock:
+                self._timelines[key] = timeline
+                for href in key:
+                    self._by_program.setdefault(href, set()).add(key)
+        return key, timeline
+
+    def resolve(self, programs: Sequence[m.DERProgram], time: Optional[int] = None) -> EffectiveControl:
+        """ The control in effect at time (now by default) among programs. """
+        now = time is None
+        if now:
+            time = clock.timestamp()
+        key, timeline = self._timeline(programs)
+        if now:
+            current = self._current.get(key)
+            if current is not None:
+                after, until, answer = current
+                if (after is None or after < time) and (until is None or time < until):
+                    return answer
+        winner, after, until = timeline.lookup(time)
+        if winner is not None:
+            answer = EffectiveControl(time, winner[0], winner[1], False, until)
+        elif timeline.default is not None:
+            answer = EffectiveControl(time, timeline.default[0], timeline.default[1], True, until)
+        else:
+            answer = EffectiveControl(time, None, None, False, until)
+        if now and until != time:
+            with self._lock:
+                self._current[key] = (after, until, answer)
+        return answer
+
+    def for_end_device(self, end_device: m.EndDevice, time: Optional[int] = None) -> EffectiveControl:
+        """ The control in effect for end_device, and each of its DERs, at time. """
+        return self.resolve(self.programs_of(end_device), time)
+
+    def for_lfdi(self, lfdi: Any, time: Optional[int] = None) -> EffectiveControl:
+        end_device = self._end_devices.fetch_by_property("lFDI", lfdi)
+        if end_device is None:
+            raise KeyError(f"No end device with lfdi {lfdi}")
+        return self.for_end_device(end_device, time)
+
+    def for_group(self, group: Any, time: Optional[int] = None) -> Dict[Any, EffectiveControl]:
+        """
+        The control in effect for each device of group (see
+        ieee_2030_5.server.server_constructs.Group), by lFDI.
+        """
+        return {device.lFDI: self.for_end_device(device, time) for device in group.get_devices()}
+
+
+EffectiveControls = ControlResolver()
+
+
+if __name__ == '__main__':
+    import random
+    import time as _time
+
+    t0 = 1700000000
+    programs = [
+        m.DERProgram(href="/res/0", mRID="A0" * 16, primacy=10),
+        m.DERProgram(href="/res/1", mRID="A1" * 16, primacy=20),
+    ]
+    adapter = Adapter[m.DERProgram]("/res", generic_type=m.DERProgram)
+    for program in programs:
+        adapter.add(program)
+    devices = Adapter[m.EndDevice]("/resedev", generic_type=m.EndDevice)
+    fsas = Adapter[m.FunctionSetAssignments]("/resfsa", generic_type=m.FunctionSetAssignments)
+    resolver = ControlResolver(adapter, devices, fsas)
+
+    def control(name: str, start: int, duration: int, created: int = 0) -> m.DERControl:
+        return m.DERControl(mRID=name, creationTime=created,
+                            interval=m.DateTimeInterval(start=t0 + start, duration=duration))
+
+    adapter.add_replace_child(programs[0], hrefs.DDERC, m.DefaultDERControl(mRID="D0"))
+    adapter.add_replace_child(programs[1], hrefs.DERC, control("low", 0, 100))
+    adapter.add_replace_child(programs[0], hrefs.DERC, control("high", 50, 20))
+    adapter.add_replace_child(programs[1], hrefs.DERC, control("newer", 80, 40, created=5))
+
+    def winner(at: int) -> Optional[str]:
+        answer = resolver.resolve(programs, t0 + at)
+        return answer.control.mRID if answer.control else None
+
+    assert [winner(t) for t in (0, 1, 50, 51, 69, 70, 71, 80, 81, 100, 119, 120, 121)] == \
+        ["D0", "low", "low", "high", "high", "low", "low", "low", "newer", "newer", "newer",
+         "D0", "D0"]
+    cancelled = control("high", 50, 20)
+    cancelled.EventStatus = m.EventStatus(currentStatus=2, dateTime=t0, potentiallySuperseded=False)
+    adapter.replace_child(programs[0], hrefs.DERC, 0, cancelled)
+    assert winner(60) == "low", "Cancelled controls are dropped when replaced"
+
+    # Devices assigned the same programs through their FSAs share one timeline.
+    edev = m.EndDevice(lFDI=b"\x01" * 20)
+    devices.add(edev)
+    fsa = m.FunctionSetAssignments()
+    fsas.add(fsa)
+    for program in programs:
+        fsas.add_replace_child(fsa, hrefs.FSA, program)
+    devices.add_replace_child(edev, hrefs.FSA, fsas)
+    assert resolver.for_lfdi(edev.lFDI, t0 + 90).control.mRID == "newer"
+
+    # Resolution time with many programs and controls.
+    rnd = random.Random(2030)
+    fleet = []
+    big = Adapter[m.DERProgram]("/resbig", generic_type=m.DERProgram)
+    for p in range(50):
+        program = m.DERProgram(href=f"/resbig/{p}", primacy=rnd.randrange(100))
+        big.add(program)
+        fleet.append(program)
+        for c in range(1000):
+            big.add_replace_child(program, hrefs.DERC,
+                                  control(f"{p}-{c}", rnd.randrange(7 * 86400), rnd.randrange(60, 7200),
+                                          created=rnd.randrange(1000)))
+    resolver = ControlResolver(big, devices, fsas)
+    start = _time.perf_counter()
+    resolver.resolve(fleet, t0)
+    built = _time.perf_counter() - start
+    instants = [t0 + rnd.randrange(7 * 86400) for _ in range(100000)]
+    start = _time.perf_counter()
+    for instant in instants:
+        resolver.resolve(fleet, instant)
+    elapsed = _time.perf_counter() - start
+    print(f"50 programs, 50000 controls: timeline built in {built * 1000:.0f}ms, "
+          f"{elapsed / len(instants) * 1e6:.1f}us per resolution")
+
+    def scan(at: int):
+        best = None
+        for program in fleet:
+            for ctrl in big.fetch_children(program, hrefs.DERC):
+                if ctrl.interval.start < at < ctrl.interval.start + ctrl.interval.duration:
+                    rank = (program.primacy, -ctrl.creationTime)
+                    if best is None or rank < best[0]:
+                        best = (rank, ctrl)
+        return best[1] if best else None
+
+    start = _time.perf_counter()
+    for instant in instants[:200]:
+        found = resolver.resolve(fleet, instant)
+        expected = scan(instant)
+        assert (found.control if not found.default else None) is expected
+    print(f"scanning every control: {(_time.perf_counter() - start) / 200 * 1000:.1f}ms per resolution")
@@ -2,17 +2,23 @@ import argparse
 import hashlib
 import logging
 import os
+import subprocess
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
 
-__all__ = ['TLSRepository']
+__all__ = ['TLSRepository', 'PeerIdentity', 'PeerIdentityCache']
 
 from ieee_2030_5.types_ import Lfdi, PathStr
-from ieee_2030_5.utils.tls_wrapper import OpensslWrapper, TLSWrap
+from ieee_2030_5.utils.tls_wrapper import TLS_BACKENDS, OpensslWrapper, TLSWrap
 
 _log = logging.getLogger(__name__)
 
@@ -32,7 +38,30 @@ def sfdi_from_lfdi(lfdi: Lfdi) -> int:
     return int(hex_str + str(check_bit))
 
 
+def _create_cert_files(tls_backend: str, common_name: str, ca_key: Path, ca_cert: Path,
+                       key_file: Path, cert_file: Path, combined_file: Path):
+    """
+    Create the key, certificate and combined file of common_name, run in the worker processes
+    of TLSRepository.create_certs.
+    """
+    tls = TLS_BACKENDS[tls_backend]
+    if not key_file.exists():
+        tls.tls_create_private_key(key_file)
+    tls.tls_create_signed_certificate(common_name, ca_key, ca_cert, key_file, cert_file)
+    tls.tls_create_pkcs23_pem_and_cert(key_file, cert_file, combined_file)
+
+
 class TLSRepository:
+    """
+    Certificate authority, server and client certificates stored under repo_dir.
+
+    The LFDI and SFDI of every certificate in the certs directory are kept in an in memory
+    index keyed by device id, LFDI and SFDI so that looking up the device of a peer doesn't
+    require running openssl.  The index is built when the repository is created and updated
+    by create_cert.  Certificates added to the certs directory by other processes are picked up
+    by refresh, which find_device_id_from_sfdi calls on a miss at most every refresh_interval
+    seconds.  version is incremented every time the index changes.
+    """
 
     def __init__(self,
                  repo_dir: PathStr,
@@ -97,9 +126,21 @@ class TLSRepository:
         self._serverhost = serverhost
         self._proxyhost = proxyhost
 
-        self._tls: TLSWrap = OpensslWrapper(self._openssl_cnf_file)
+        self._tls_backend = kwargs.pop('tls_backend', "openssl")
+        if self._tls_backend not in TLS_BACKENDS:
+            raise ValueError(f"Unknown tls backend {self._tls_backend}")
+        self._tls: TLSWrap = TLS_BACKENDS[self._tls_backend](self._openssl_cnf_file)
         self._cert_paths: List[Path] = []
 
+        # device id -> (lfdi, sfdi, modification time of the cert file when indexed)
+        self._identities: Dict[str, Tuple[Lfdi, int, int]] = {}
+        self._lfdi_index: Dict[Lfdi, str] = {}
+        self._sfdi_index: Dict[int, str] = {}
+        self._index_lock = threading.RLock()
+        self._version: int = 0
+        self._refresh_interval: float = kwargs.pop('refresh_interval', 5.0)
+        self._last_refresh: float = 0.0
+
         # Create a new ca key if not exists.
         if not Path(self._ca_key).exists():
             self.__create_ca__()
@@ -130,6 +171,8 @@ class TLSRepository:
                 self._tls.tls_create_private_key(admin_key)
                 self.create_cert(admin_cert.stem)
 
+        self.refresh()
+
         for d in self._cert_paths:
             lfdi_from_stem = self.lfdi(d.stem)
             from_stem = self.sfdi(d.stem)
@@ -159,6 +202,108 @@ class TLSRepository:
 
         self._common_names[common_name] = common_name
         self._cert_paths.append(self.__get_cert_file__(common_name=common_name))
+        self._index_cert(self.__get_cert_file__(common_name))
+
+    def create_certs(self, common_names: List[str], max_workers: Optional[int] = None):
+        """
+        Create certificates for all of common_names.  The cryptography backend creates them in
+        a pool of max_workers processes, os.cpu_count() by default.  The openssl backend shares
+        temporary files and the openssl ca database between calls so it creates them one at a
+        time.
+        """
+        if self._tls_backend == "openssl" or len(common_names) < 2 or max_workers == 1:
+            for common_name in common_names:
+                self.create_cert(common_name)
+            return
+
+        jobs = [(self._tls_backend, cn, self._ca_key, self._ca_cert, self.__get_key_file__(cn),
+                 self.__get_cert_file__(cn), self.__get_combined_file__(cn))
+                for cn in common_names]
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Results are only waited on so the first error is raised here.
+            list(pool.map(_create_cert_files, *zip(*jobs),
+                          chunksize=max(1, len(jobs) // (workers * 4))))
+
+        for common_name in common_names:
+            self._common_names[common_name] = common_name
+            self._cert_paths.append(self.__get_cert_file__(common_name))
+            self._index_cert(self.__get_cert_file__(common_name))
+
+    @property
+    def version(self) -> int:
+        """
+        Incremented whenever a certificate is added, replaced or removed from the index.
+        """
+        return self._version
+
+    def refresh(self) -> int:
+        """
+        Bring the index up to date with the certs directory.  Only certificates that are new
+        or were modified since they were indexed are fingerprinted.  Returns the number of
+        device ids added, updated or removed.
+        """
+        with self._index_lock:
+            self._last_refresh = time.monotonic()
+            found = set()
+            changed = 0
+            for cert_file in self._certs_dir.glob("*.pem"):
+                found.add(cert_file.stem)
+                if self._index_cert(cert_file):
+                    changed += 1
+            for device_id in [d for d in self._identities if d not in found]:
+                self._unindex(device_id)
+                changed += 1
+        if changed:
+            _log.debug(f"Certificate index refreshed, {changed} changed, version {self._version}")
+        return changed
+
+    def _index_cert(self, cert_file: Path) -> bool:
+        device_id = cert_file.stem
+        try:
+            mtime = cert_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return self._unindex(device_id)
+
+        with self._index_lock:
+            current = self._identities.get(device_id)
+            if current is not None and current[2] == mtime:
+                return False
+            try:
+                lfdi_ = lfdi_from_fingerprint(self.fingerprint(device_id, True))
+            except (FileNotFoundError, subprocess.CalledProcessError) as ex:
+                _log.warning(f"Unable to fingerprint {cert_file} {ex}")
+                return False
+            sfdi_ = sfdi_from_lfdi(lfdi_)
+
+            self._unindex(device_id)
+            self._identities[device_id] = (lfdi_, sfdi_, mtime)
+            self._lfdi_index[lfdi_] = device_id
+            self._sfdi_index[sfdi_] = device_id
+            self._version += 1
+        return True
+
+    def _unindex(self, device_id: str) -> bool:
+        with self._index_lock:
+            identity = self._identities.pop(device_id, None)
+            if identity is None:
+                return False
+            lfdi_, sfdi_, _ = identity
+            if self._lfdi_index.get(lfdi_) == device_id:
+                del self._lfdi_index[lfdi_]
+            if self._sfdi_index.get(sfdi_) == device_id:
+                del self._sfdi_index[sfdi_]
+            self._version += 1
+        return True
+
+    def _identity(self, device_id: str) -> Tuple[Lfdi, int, int]:
+        identity = self._identities.get(device_id)
+        if identity is None:
+            self._index_cert(self.__get_cert_file__(device_id))
+            identity = self._identities.get(device_id)
+            if identity is None:
+                raise FileNotFoundError(f"No certificate for {device_id}")
+        return identity
 
     def lfdi(self, device_id: str) -> Lfdi:
         """
@@ -171,12 +316,10 @@ class TLSRepository:
             as an integer.
         """
         # 160 / 4 == 40
-        fp = self.fingerprint(device_id, True)
-        return Lfdi(lfdi_from_fingerprint(fp))
+        return self._identity(device_id)[0]
 
     def sfdi(self, device_id: str) -> int:
-        lfdi_ = self.lfdi(device_id)
-        return sfdi_from_lfdi(lfdi_)
+        return self._identity(device_id)[1]
 
     def fingerprint(self, device_id: str, without_colan: bool = True) -> str:
         if os.environ.get('IEEE_2030_5_CERT_FROM_COMBINED_FILE'):
@@ -236,22 +379,25 @@ class TLSRepository:
 
     def find_device_id_from_sfdi(self, sfdi: int) -> Optional[str]:
         """
-        Searches the certificate paths for a device id that maps to the sfdi passed into the method.
+        Find the device id whose certificate maps to the sfdi passed into the method.
         Args:
             sfdi:
 
         Returns:
-
+            The device id or None if no certificate has that sfdi.
         """
-        device_id = None
-        _log.debug(f"Attempting to find sfid: {sfdi}")
-        for d in self._certs_dir.glob("*.pem"):
-            try:
-                if sfdi == self.sfdi(d.stem):
-                    device_id = d.stem
-                    break
-            except FileNotFoundError:
-                pass
+        return self._find_device_id(self._sfdi_index, sfdi)
+
+    def find_device_id_from_lfdi(self, lfdi: Lfdi) -> Optional[str]:
+        return self._find_device_id(self._lfdi_index, lfdi)
+
+    def _find_device_id(self, index: Dict, key) -> Optional[str]:
+        device_id = index.get(key)
+        if device_id is None and time.monotonic() - self._last_refresh >= self._refresh_interval:
+            # The certificate may have been added out of band.
+            _log.debug(f"Attempting to find {key} in refreshed certificates")
+            self.refresh()
+            device_id = index.get(key)
         return device_id
 
     def __get_cert_file__(self, common_name: str) -> Path:
@@ -264,6 +410,91 @@ class TLSRepository:
         return self._combined_dir.joinpath(f"{common_name}-combined.pem")
 
 
+@dataclass(frozen=True)
+class PeerIdentity:
+    """
+    Identity of a client resolved from its certificate.
+    """
+    x509: Any
+    serial_number: int
+    lfdi: Lfdi
+    sfdi: int
+    device_id: Optional[str]
+
+
+class PeerIdentityCache:
+    """
+    Bounded LRU of PeerIdentity keyed by the digest of the peer's DER certificate.
+
+    The cache is cleared whenever the version of tlsrepo changes so identities resolved
+    against certificates that were since replaced or removed are never returned.
+    """
+
+    def __init__(self, tlsrepo: TLSRepository, maxsize: int = 1024):
+        self._tlsrepo = tlsrepo
+        self._maxsize = maxsize
+        self._items: OrderedDict[bytes, PeerIdentity] = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = tlsrepo.version
+        self.hits = 0
+        self.connection_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Version of the TLSRepository the cached identities were resolved against.
+        """
+        return self._version
+
+    def _check_version(self):
+        if self._tlsrepo.version != self._version:
+            self._items.clear()
+            self._version = self._tlsrepo.version
+            self.invalidations += 1
+
+    def get(self, digest: bytes) -> Optional[PeerIdentity]:
+        with self._lock:
+            self._check_version()
+            identity = self._items.get(digest)
+            if identity is None:
+                self.misses += 1
+            else:
+                self._items.move_to_end(digest)
+                self.hits += 1
+            return identity
+
+    def put(self, digest: bytes, identity: PeerIdentity):
+        with self._lock:
+            self._check_version()
+            self._items[digest] = identity
+            self._items.move_to_end(digest)
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def record_connection_hit(self):
+        """
+        Count a request served from the identity already resolved for its connection.
+        """
+        with self._lock:
+            self.connection_hits += 1
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.connection_hits + self.misses
+        return dict(size=len(self._items),
+                    maxsize=self._maxsize,
+                    hits=self.hits,
+                    connection_hits=self.connection_hits,
+                    misses=self.misses,
+                    invalidations=self.invalidations,
+                    hit_rate=(self.hits + self.connection_hits) / lookups if lookups else 0.0)
+
+
 def _main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--dir", help="Directory of certificates determine lfdi and sfdi from.")
@@ -323,6 +554,34 @@ if __name__ == '__main__':
     print(f"lfdi: {lfdi}")
     print(f"sfdi: {sfdi}")
 
+    # Compare creating device certificates with the openssl command line against the
+    # cryptography backend, one at a time and in a process pool.
+    import re
+    import tempfile
+
+    count = int(os.environ.get("IEEE_2030_5_CERT_BENCH_COUNT", 50))
+    with tempfile.TemporaryDirectory() as tmp:
+        template = Path(tmp).joinpath("openssl.cnf")
+        template.write_text(
+            re.sub(r"^dir\s*=.*$", "dir             = /home/gridappsd/tls",
+                   Path(__file__).parent.parent.joinpath("openssl.cnf").read_text(),
+                   flags=re.MULTILINE))
+        names = [f"bench{i}" for i in range(count)]
+        for backend, max_workers in (("openssl", 1), ("cryptography", 1), ("cryptography", None)):
+            repo = TLSRepository(Path(tmp).joinpath(f"{backend}{max_workers}"), template,
+                                 "localhost", clear=True, tls_backend=backend)
+            start = time.perf_counter()
+            repo.create_certs(names, max_workers=max_workers)
+            elapsed = time.perf_counter() - start
+            print(f"{backend} workers={max_workers or os.cpu_count()}: {count} certs in "
+                  f"{elapsed:.2f}s ({elapsed / count * 1000:.1f}ms per cert)")
+
+        # The combined files of both backends must be identical, the lfdi can be a hash of them.
+        combined = Path(tmp).joinpath("combined.pem")
+        OpensslWrapper.tls_create_pkcs23_pem_and_cert(repo.__get_key_file__(names[0]),
+                                                      repo.__get_cert_file__(names[0]), combined)
+        assert combined.read_bytes() == repo.__get_combined_file__(names[0]).read_bytes()
+
     #
     # tlsrepo = TLSRepository(repo_dir="~/tls",
     #                         openssl_cnffile_template="../openssl.cnf",
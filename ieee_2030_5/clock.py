@@ -0,0 +1,217 @@
+"""
+The time the server runs on.
+
+Everything that depends on the current time, the ticks of the TimeAdapter, the
+EventStatus of DER controls and the Time resource, reads it through the clock set
+here rather than from the system, so control timelines can be run faster than real time:
+
+    realtime      The system time, ticked every second.
+    accelerated   Starts at start (default now) and runs speed times faster than real time.
+    discrete      Only moves when advanced, and between ticks jumps straight to the next
+                  instant an event source (e.g. the DER control scheduler) has something
+                  due, so a week of control events replays in as many ticks as it has
+                  transitions.
+
+The clock is chosen with clock, clock_speed and clock_start in the server configuration.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Union
+
+_log = logging.getLogger(__name__)
+
+__all__: List[str] = [
+    "Clock",
+    "RealTimeClock",
+    "AcceleratedClock",
+    "DiscreteEventClock",
+    "create_clock",
+    "get_clock",
+    "set_clock",
+    "add_event_source",
+    "now",
+    "timestamp",
+    "utcnow"
+]
+
+# Callables returning the next timestamp at which something is due, or None.
+__event_sources__: List[Callable[[], Optional[int]]] = []
+
+
+def add_event_source(source: Callable[[], Optional[int]]):
+    """
+    Register a callable returning the next timestamp at which the source has something
+    due, None when nothing is.  DiscreteEventClock jumps to the earliest of them.
+    """
+    __event_sources__.append(source)
+
+
+def _next_event(after: int) -> Optional[int]:
+    due = [when for when in (source() for source in __event_sources__)
+           if when is not None and when > after]
+    return min(due) if due else None
+
+
+class Clock:
+    """
+    Base of the clocks, now() is seconds since the epoch in UTC.
+    """
+
+    def __init__(self):
+        self._woken = threading.Event()
+
+    def now(self) -> float:
+        raise NotImplementedError()
+
+    def timestamp(self) -> int:
+        return int(self.now())
+
+    def utcnow(self) -> datetime:
+        return datetime.fromtimestamp(self.now(), tz=timezone.utc)
+
+    def wait(self, last: int) -> int:
+        """
+        Block until the tick after the one at last is due and return its timestamp.
+        """
+        raise NotImplementedError()
+
+    def wake(self):
+        """ Return from a wait early, e.g. after the clock was moved. """
+        self._woken.set()
+
+    def _sleep(self, seconds: float):
+        self._woken.wait(seconds)
+        self._woken.clear()
+
+
+class RealTimeClock(Clock):
+
+    def now(self) -> float:
+        return time.time()
+
+    def wait(self, last: int) -> int:
+        self._sleep(1)
+        return self.timestamp()
+
+
+class AcceleratedClock(Clock):
+    """
+    Starts at start and runs speed times faster than real time.  Ticks are at least
+    min_interval wall seconds apart, so at high speeds a tick can skip several seconds.
+    """
+
+    def __init__(self, speed: float, start: Optional[float] = None, min_interval: float = 0.01):
+        super().__init__()
+        if speed <= 0:
+            raise ValueError(f"Clock speed must be positive, not {speed}")
+        self.speed = speed
+        self.min_interval = min_interval
+        self._start = time.time() if start is None else start
+        self._origin = time.monotonic()
+
+    def now(self) -> float:
+        return self._start + (time.monotonic() - self._origin) * self.speed
+
+    def wait(self, last: int) -> int:
+        self._sleep(max(1 / self.speed, self.min_interval))
+        return self.timestamp()
+
+
+class DiscreteEventClock(Clock):
+    """
+    A clock that only moves when advanced.  wait jumps to the next instant an event source
+    has something due, and when none has waits up to idle_wait wall seconds, without
+    moving, for something to be scheduled.
+    """
+
+    def __init__(self, start: Optional[float] = None, idle_wait: float = 1.0):
+        super().__init__()
+        self.idle_wait = idle_wait
+        self._now = int(time.time() if start is None else start)
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        return float(self._now)
+
+    def timestamp(self) -> int:
+        return self._now
+
+    def advance(self, seconds: int):
+        self.advance_to(self._now + seconds)
+
+    def advance_to(self, timestamp: int):
+        with self._lock:
+            if timestamp < self._now:
+                raise ValueError(f"Can't move the clock back from {self._now} to {timestamp}")
+            self._now = int(timestamp)
+        self.wake()
+
+    def next_event(self) -> Optional[int]:
+        """ The earliest instant after now an event source has something due. """
+        return _next_event(self._now)
+
+    def wait(self, last: int) -> int:
+        following = self.next_event()
+        if following is None:
+            self._sleep(self.idle_wait)
+        else:
+            with self._lock:
+                self._now = max(self._now, following)
+        return self._now
+
+
+def _parse_start(start: Union[None, int, float, str]) -> Optional[float]:
+    if start is None or isinstance(start, (int, float)):
+        return start
+    parsed = datetime.fromisoformat(start)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def create_clock(mode: str = "realtime",
+                 speed: float = 1.0,
+                 start: Union[None, int, float, str] = None) -> Clock:
+    """
+    The clock for the mode, realtime, accelerated or discrete.  start is seconds since the
+    epoch or an ISO 8601 time, UTC when it has no offset.
+    """
+    if mode == "realtime":
+        return RealTimeClock()
+    if mode == "accelerated":
+        return AcceleratedClock(speed, _parse_start(start))
+    if mode == "discrete":
+        return DiscreteEventClock(_parse_start(start))
+    raise ValueError(f"Unknown clock mode {mode}, expected realtime, accelerated or discrete")
+
+
+__clock__: Clock = RealTimeClock()
+
+
+def get_clock() -> Clock:
+    return __clock__
+
+
+def set_clock(clock: Clock) -> Clock:
+    """ Use clock from now on, returns the clock it replaces. """
+    global __clock__
+    previous, __clock__ = __clock__, clock
+    previous.wake()
+    _log.info(f"Using {type(clock).__name__}")
+    return previous
+
+
+def now() -> float:
+    return __clock__.now()
+
+
+def timestamp() -> int:
+    return __clock__.timestamp()
+
+
+def utcnow() -> datetime:
+    return __clock__.utcnow()
@@ -195,6 +195,84 @@ class ServerConfiguration:
 
     proxy_hostname: Optional[str] = None
     gridappsd: Optional[GridappsdConfiguration] = None
+
+    # Point store used to persist hrefs, either "filesystem" (one file per href) or
+    # "sqlite" (single database file in WAL mode).  storage_path defaults to
+    # ~/.ieee_2030_5_data or ~/.ieee_2030_5_data.sqlite respectively.
+    storage_backend: Union[Literal["filesystem"], Literal["sqlite"]] = "filesystem"
+    storage_path: Optional[str] = None
+
+    # Write-behind persistence of the href indexer.  When enabled dirty hrefs are
+    # coalesced in memory and written to the point store by a background writer
+    # every storage_flush_interval seconds or once storage_max_dirty hrefs are pending.
+    storage_write_behind: bool = False
+    storage_flush_interval: float = 1.0
+    storage_max_dirty: int = 1000
+    # Number of hrefs kept in memory by the indexer, least recently used hrefs beyond
+    # this are evicted and read back from the point store on demand.  None keeps all.
+    storage_max_resident: Optional[int] = None
+
+    # Warm restart reloads hrefs and adapter state from the point store instead of
+    # rebuilding them from this configuration and regenerating certificates.  Requires
+    # write-behind persistence, which is turned on when warm_restart is set.  Adapter
+    # state is snapshotted at most every warm_restart_snapshot_interval seconds and on exit.
+    warm_restart: bool = False
+    warm_restart_snapshot_interval: float = 30.0
+
+    # Implementation used to create keys and certificates, "openssl" runs the openssl
+    # command line tool and "cryptography" works in process and creates device
+    # certificates in parallel using up to tls_create_workers processes.
+    tls_backend: Union[Literal["openssl"], Literal["cryptography"]] = "openssl"
+    tls_create_workers: Optional[int] = None
+
+    # Number of client identities (LFDI, SFDI and device id resolved from a certificate)
+    # kept across connections.
+    peer_identity_cache_size: int = 1024
+
+    # Worker processes used when the server is started with --production, defaults to the
+    # number of cpus.  See ieee_2030_5.workers.
+    worker_processes: Optional[int] = None
+
+    # Capture of requests and responses served at /admin/protocol.  Exchanges are only
+    # rendered when protocol_capture is True, limited to the listed device lfdis and path
+    # prefixes (all when empty) and sampled at protocol_capture_sample_rate.  Captures are
+    # also appended to protocol_capture_file as json lines when it is set.
+    protocol_capture: bool = False
+    protocol_capture_sample_rate: float = 1.0
+    protocol_capture_devices: List[str] = field(default_factory=list)
+    protocol_capture_paths: List[str] = field(default_factory=list)
+    protocol_capture_buffer_size: int = 1000
+    protocol_capture_file: Optional[str] = None
+
+    # Send an ETag and Last-Modified with GET responses and answer matching If-None-Match
+    # and If-Modified-Since requests with 304 Not Modified.
+    conditional_get: bool = True
+
+    # Rendered response bodies are cached by href and resource version, up to
+    # response_cache_max_bytes, so unchanged resources aren't rendered again on each poll.
+    response_cache: bool = True
+    response_cache_max_bytes: int = 32 * 1024 * 1024
+
+    # Responses are pretty printed xml unless xml_compact is True, a request can ask for
+    # either with a "Prefer: compact" or "Prefer: pretty" header.  Bodies are encoded with
+    # the one of compress_encodings the Accept-Encoding of the request prefers, an empty list
+    # sends every body uncompressed.
+    xml_compact: bool = False
+    compress_encodings: List[str] = field(default_factory=lambda: ["gzip", "deflate"])
+
+    # Build the xml metadata of the classes the server routes at startup rather than on the
+    # first request for each of them.
+    prewarm: bool = True
+
+    # The clock the server runs on (see ieee_2030_5.clock), "realtime", "accelerated" to run
+    # clock_speed times faster than real time or "discrete" to jump from one DER control
+    # transition to the next.  clock_start is where the accelerated and discrete clocks start,
+    # seconds since the epoch or an ISO 8601 time, now by default.  The discrete clock isn't
+    # shared between worker processes, use it with a single process.
+    clock: Union[Literal["realtime"], Literal["accelerated"],
+                 Literal["discrete"]] = "realtime"
+    clock_speed: float = 1.0
+    clock_start: Optional[Union[int, str]] = None
     # DefaultDERControl: Optional[DefaultDERControl] = None
     # DERControlList: Optional[DERControl] = field(default=list)
     
@@ -1,20 +1,38 @@
 from __future__ import annotations
 
+import atexit
+import bisect
+import os
 import pickle
+import threading
+import time
+from collections import OrderedDict
 from copy import deepcopy
 from dataclasses import dataclass, field
 import logging
 
 from datetime import datetime
 from email.utils import format_datetime
-from typing import Dict, Optional, List
-from ieee_2030_5.persistance.points import set_point, get_point
+from typing import Callable, Dict, Optional, List, Tuple
+from ieee_2030_5.persistance.points import get_hrefs, set_point, set_points, get_point
+from ieee_2030_5.data.versions import digest_bytes, next_version, record_version
 
 __all__: List[str] = [
     "get_href",
     "add_href",
     "get_href_all_names",
-    "get_href_filtered"
+    "get_href_filtered",
+    "get_href_names",
+    "count_hrefs",
+    "configure_write_behind",
+    "configure_max_resident",
+    "configure_persistence",
+    "add_flush_hook",
+    "add_href_listener",
+    "install_href",
+    "rehydrate_hrefs",
+    "flush",
+    "get_indexer_stats"
 ]
 
 _log = logging.getLogger(__name__)
@@ -26,13 +44,62 @@ class Index:
     item: object
     added: str  # Optional[Union[datetime | str]]
     last_written: str  # Optional[Union[datetime | str]]
-    last_hash: Optional[int]
+    # Digest of the pickled item, the same digest served as the ETag of the resource.
+    last_hash: Optional[str]
+    # True when item has been dropped from memory and must be read from the point store.
+    evicted: bool = False
+
+
+@dataclass
+class IndexerStats:
+    """
+    Counters describing the state of the write-behind queue.
+
+    Latencies are in seconds and measure the time spent writing a batch
+    to the point store.
+    """
+    queue_depth: int = 0
+    flushes: int = 0
+    items_flushed: int = 0
+    last_flush_latency: float = 0.0
+    max_flush_latency: float = 0.0
+    total_flush_latency: float = 0.0
 
 
 @dataclass
 class Indexer:
     __items__: Dict = field(default=None)
 
+    # When write_behind is True the indexer is the source of truth and dirty
+    # hrefs are written to the point store by a background writer in batches.
+    write_behind: bool = False
+    flush_interval: float = 1.0
+    max_dirty: int = 1000
+
+    # Maximum number of items kept in memory, None keeps everything resident.
+    max_resident: Optional[int] = None
+
+    # When False nothing is written to the point store and nothing is evicted, used by
+    # processes holding a replica of state that another process persists.
+    persist: bool = True
+
+    def __post_init__(self):
+        # Every known href in sorted order so prefix queries are a range of this list.
+        self.__sorted__: List[str] = []
+        self.__snapshots__: Dict[str, bytes] = {}
+        self.__resident__: OrderedDict = OrderedDict()
+        self.__dirty__: Dict[str, Index] = {}
+        self.__inflight__: Dict[str, Index] = {}
+        self.__lock__ = threading.RLock()
+        self.__flush_lock__ = threading.Lock()
+        self.__wakeup__ = threading.Event()
+        self.__writer__: Optional[threading.Thread] = None
+        self.__stats__ = IndexerStats()
+        # Callables returning extra points to write in the same batch as the dirty hrefs.
+        self.__flush_hooks__: List[Callable[[], Dict[str, bytes]]] = []
+        # Called with the href, pickled item, etag and version time of every changed href.
+        self.__listeners__: List[Callable[[str, bytes, str, datetime], None]] = []
+
     def init(self):
         if self.__items__ is None:
             self.__items__ = {}
@@ -42,40 +109,310 @@ class Indexer:
         self.init()
         return len(self.__items__)
 
+    @property
+    def stats(self) -> IndexerStats:
+        with self.__lock__:
+            self.__stats__.queue_depth = len(self.__dirty__)
+            return deepcopy(self.__stats__)
+
+    def configure(self, write_behind: bool, flush_interval: float = None, max_dirty: int = None):
+        """
+        Switch between synchronous and write-behind persistence.
+
+        Switching write-behind off flushes anything that is still pending so the
+        point store is up to date before writes become synchronous again.
+        """
+        if flush_interval is not None:
+            self.flush_interval = flush_interval
+        if max_dirty is not None:
+            self.max_dirty = max_dirty
+
+        if write_behind:
+            self.write_behind = True
+            self._start_writer()
+        else:
+            self.flush()
+            self.write_behind = False
+
     def add(self, href: str, item: dataclass):
         self.init()
 
-        cached = self.__items__.get(href)
-        if cached and cached.item == item:
-            _log.debug(f"Item already cached {href}")
-        else:
-            added = format_datetime(datetime.utcnow())
-            serialized_item = pickle.dumps(item)  # serialize_dataclass(item, serialization_type=SerializeType.JSON)
-            obj = Index(href, item, added=added, last_written=added, last_hash=hash(serialized_item))
-            # serialized_obj = serialize_dataclass(obj, serialization_type=SerializeType.JSON)
+        # The snapshot is what readers get a copy of, so later changes made to item by
+        # the caller can't leak into the cache without another add.
+        snapshot = pickle.dumps(item)
+        last_hash = digest_bytes(snapshot)
 
-            # note storing Index object.
-            set_point(href, pickle.dumps(obj))  # serialize_dataclass(obj, serialization_type=SerializeType.JSON))
+        with self.__lock__:
+            cached = self.__items__.get(href)
+            if cached and not cached.evicted and self.__snapshots__.get(href) == snapshot:
+                _log.debug(f"Item already cached {href}")
+                return
+
+            # Recorded once the listeners have the item, the supervisor of production mode
+            # must not send a version to its workers before the item it is the version of.
+            etag, modified = next_version()
+            added = format_datetime(datetime.utcnow())
+            obj = Index(href, item, added=added, last_written=added, last_hash=last_hash)
+            if cached is None:
+                bisect.insort(self.__sorted__, href)
             self.__items__[href] = obj
+            self.__snapshots__[href] = snapshot
+            self._touch(href)
+            for listener in self.__listeners__:
+                listener(href, snapshot, etag, modified)
+            record_version(href, etag, modified)
+
+            if not self.persist:
+                return
+
+            if not self.write_behind:
+                self._write(obj)
+                self._evict_overflow()
+                return
+
+            # Coalesce, only the latest version of an href is written.
+            self.__dirty__[href] = obj
+            queue_depth = len(self.__dirty__)
+
+        if queue_depth >= self.max_dirty:
+            self.__wakeup__.set()
+
+    def install(self, href: str, snapshot: bytes, etag: str, modified: datetime):
+        """
+        Store an item pickled by another process's indexer, with the version it has there.
+        Nothing is written to the point store.
+        """
+        self.init()
+        record_version(href, etag, modified)
+        with self.__lock__:
+            added = format_datetime(modified)
+            if href not in self.__items__:
+                bisect.insort(self.__sorted__, href)
+            self.__items__[href] = Index(href, pickle.loads(snapshot), added=added,
+                                         last_written=added, last_hash=digest_bytes(snapshot))
+            self.__snapshots__[href] = snapshot
+            self._touch(href)
 
     def get(self, href) -> dataclass:
+        """
+        Return a copy of the item stored at href or None if href isn't known.
+
+        Resident items are served from the in memory snapshot, the point store is
+        only read for items that have been evicted.
+        """
         self.init()
-        if href in self.__items__:
-            index = pickle.loads(get_point(href))  # pickle.loads(get_point(href))
-            # index = pickle.loads(self.__items__.get(href))
-            # index = deserialize_dataclass(data, SerializeType.JSON)
-            data = index.item
-        else:
-            data = None
+        with self.__lock__:
+            index = self.__items__.get(href)
+            if index is None:
+                return None
+            resident = not index.evicted
+            if resident:
+                self._touch(href)
+                snapshot = self.__snapshots__[href]
+        if resident:
+            return pickle.loads(snapshot)
 
-        return data
+        return self._load(href).item
 
     def get_all(self) -> List:
-        return deepcopy([x.item for x in self.__items__.values()])
+        return [self.get(href) for href in list(self.__items__.keys())]
+
+    def names(self, href_prefix: str = "", start: int = 0, limit: Optional[int] = None) -> List[str]:
+        """
+        Return the sorted hrefs that start with href_prefix.
+
+        Locating the prefix is a binary search so the cost is O(log n + k) where k is
+        the number of hrefs returned.  start and limit page through the matches.
+        """
+        with self.__lock__:
+            lo, hi = self._prefix_range(href_prefix)
+            lo = min(lo + max(start, 0), hi)
+            if limit is not None:
+                hi = min(lo + limit, hi)
+            return self.__sorted__[lo:hi]
+
+    def count(self, href_prefix: str = "") -> int:
+        with self.__lock__:
+            lo, hi = self._prefix_range(href_prefix)
+            return hi - lo
+
+    def _prefix_range(self, href_prefix: str) -> Tuple[int, int]:
+        if not href_prefix:
+            return 0, len(self.__sorted__)
+        lo = bisect.bisect_left(self.__sorted__, href_prefix)
+        # Smallest string greater than every string that starts with href_prefix.
+        upper = href_prefix[:-1] + chr(ord(href_prefix[-1]) + 1)
+        hi = bisect.bisect_left(self.__sorted__, upper, lo)
+        return lo, hi
+
+    def evict(self, href: str) -> bool:
+        """
+        Drop the in memory copy of href.  Only items that have been written to the point
+        store can be evicted, the Index entry is kept so href is still known.
+        """
+        with self.__lock__:
+            index = self.__items__.get(href)
+            if not self.persist or index is None or index.evicted or href in self.__dirty__ \
+                    or href in self.__inflight__:
+                return False
+            index.item = None
+            index.evicted = True
+            self.__snapshots__.pop(href, None)
+            self.__resident__.pop(href, None)
+        return True
+
+    def rehydrate(self) -> int:
+        """
+        Make every href in the point store known to the indexer without loading it.  Items are
+        read from the point store the first time they are requested.  Returns the number of
+        hrefs found.
+        """
+        self.init()
+        found = [href for href in get_hrefs("/")]
+        with self.__lock__:
+            added = 0
+            for href in found:
+                if href not in self.__items__:
+                    self.__items__[href] = Index(href, None, added=None, last_written=None,
+                                                 last_hash=None, evicted=True)
+                    added += 1
+            if added:
+                self.__sorted__ = sorted(self.__items__.keys())
+        return len(found)
+
+    def set_max_resident(self, max_resident: Optional[int]):
+        self.init()
+        with self.__lock__:
+            self.max_resident = max_resident
+            self.__resident__.clear()
+            if max_resident is not None:
+                for href, index in self.__items__.items():
+                    if not index.evicted:
+                        self._touch(href)
+            self._evict_overflow()
+
+    def _load(self, href: str) -> Index:
+        stored: Index = pickle.loads(get_point(href))
+        with self.__lock__:
+            index = self.__items__.get(href)
+            if index is not None and index.evicted:
+                index.item = stored.item
+                index.evicted = False
+                self.__snapshots__[href] = pickle.dumps(stored.item)
+                self._touch(href)
+                self._evict_overflow()
+        return stored
+
+    def _touch(self, href: str):
+        if self.max_resident is not None:
+            self.__resident__[href] = None
+            self.__resident__.move_to_end(href)
+
+    def _evict_overflow(self):
+        if self.max_resident is None:
+            return
+        # Least recently used first, items that aren't written yet are skipped.
+        attempts = len(self.__resident__)
+        while len(self.__resident__) > self.max_resident and attempts > 0:
+            attempts -= 1
+            href = next(iter(self.__resident__))
+            if not self.evict(href):
+                self.__resident__.move_to_end(href)
+
+    def flush(self):
+        """
+        Write all dirty hrefs to the point store.
+        """
+        if not self.persist:
+            return
+        # Outside the flush lock, hooks take the state write lock which a fork takes first.
+        extra: Dict[str, bytes] = {}
+        for hook in self.__flush_hooks__:
+            extra.update(hook())
+        with self.__flush_lock__:
+            with self.__lock__:
+                if not self.__dirty__ and not extra:
+                    return
+                # Requests keep adding to a fresh dirty map while the batch is written,
+                # reads of the batch are served from __inflight__ until it is on disk.
+                batch = self.__dirty__
+                self.__dirty__ = {}
+                self.__inflight__ = batch
+
+            start = time.perf_counter()
+            try:
+                points = {href: self._serialize(obj) for href, obj in batch.items()}
+                points.update(extra)
+                set_points(points)
+            except Exception:
+                with self.__lock__:
+                    # Requeue the batch without clobbering anything newer.
+                    for href, obj in batch.items():
+                        self.__dirty__.setdefault(href, obj)
+                raise
+            finally:
+                with self.__lock__:
+                    self.__inflight__ = {}
+            latency = time.perf_counter() - start
+
+            with self.__lock__:
+                self._evict_overflow()
+                self.__stats__.flushes += 1
+                self.__stats__.items_flushed += len(batch)
+                self.__stats__.last_flush_latency = latency
+                self.__stats__.total_flush_latency += latency
+                self.__stats__.max_flush_latency = max(self.__stats__.max_flush_latency,
+                                                       latency)
+        _log.debug(f"Flushed {len(batch)} hrefs in {latency:.4f}s")
+
+    def _write(self, obj: Index):
+        set_point(obj.href, self._serialize(obj))
+
+    @staticmethod
+    def _serialize(obj: Index) -> bytes:
+        obj.last_written = format_datetime(datetime.utcnow())
+        # note storing Index object.
+        return pickle.dumps(obj)
+
+    def _start_writer(self):
+        if self.__writer__ is not None and self.__writer__.is_alive():
+            return
+        self.__writer__ = threading.Thread(target=self._run_writer,
+                                           name="indexer-writer",
+                                           daemon=True)
+        self.__writer__.start()
+
+    def _run_writer(self):
+        while self.write_behind:
+            self.__wakeup__.wait(self.flush_interval)
+            self.__wakeup__.clear()
+            try:
+                self.flush()
+            except Exception as ex:
+                _log.exception(f"Write-behind flush failed: {ex}")
 
 
 __indexer__ = Indexer()
 
+# Make sure pending writes reach the point store when the process exits.
+atexit.register(__indexer__.flush)
+
+
+def _acquire_locks_before_fork():
+    __indexer__.__flush_lock__.acquire()
+    __indexer__.__lock__.acquire()
+
+
+def _release_locks_after_fork():
+    __indexer__.__lock__.release()
+    __indexer__.__flush_lock__.release()
+
+
+# A forked child must not inherit the locks held by another thread mid-update.
+os.register_at_fork(before=_acquire_locks_before_fork,
+                    after_in_parent=_release_locks_after_fork,
+                    after_in_child=_release_locks_after_fork)
+
 
 def add_href(href: str, item: dataclass):
     __indexer__.add(href, item)
@@ -86,13 +423,103 @@ def get_href(href: str) -> dataclass:
 
 
 def get_href_filtered(href_prefix: str) -> List[dataclass] | []:
-    if __indexer__.__items__ is None:
-        return []
-    
-    return [v.item for k, v in __indexer__.__items__.items()
-            if k.startswith(href_prefix) and v.item is not None]
+    items = [__indexer__.get(k) for k in __indexer__.names(href_prefix)]
+    return [item for item in items if item is not None]
+
+
+def get_href_all_names() -> List[str]:
+    """
+    Return all hrefs in sorted order.
+    """
+    return __indexer__.names()
+
+
+def get_href_names(href_prefix: str = "", start: int = 0, limit: Optional[int] = None) -> List[str]:
+    return __indexer__.names(href_prefix, start=start, limit=limit)
+
+
+def count_hrefs(href_prefix: str = "") -> int:
+    return __indexer__.count(href_prefix)
+
+
+def configure_max_resident(max_resident: Optional[int]):
+    __indexer__.set_max_resident(max_resident)
+
+
+def add_flush_hook(hook: Callable[[], Dict[str, bytes]]):
+    __indexer__.__flush_hooks__.append(hook)
+
+
+def add_href_listener(listener: Callable[[str, bytes, str, datetime], None]):
+    """
+    Call listener with the href, pickled item, etag and version time of every href added
+    or changed from now on.  Called with the indexer's lock held, listeners must be quick.
+    """
+    __indexer__.__listeners__.append(listener)
+
+
+def install_href(href: str, snapshot: bytes, etag: str, modified: datetime):
+    __indexer__.install(href, snapshot, etag, modified)
+
+
+def rehydrate_hrefs() -> int:
+    return __indexer__.rehydrate()
+
+
+def configure_persistence(enabled: bool):
+    """
+    Turn writing to the point store on or off.  Turning it off drops any pending writes.
+    """
+    with __indexer__.__lock__:
+        __indexer__.persist = enabled
+        if not enabled:
+            __indexer__.__dirty__.clear()
+
+
+def configure_write_behind(enabled: bool, flush_interval: float = None, max_dirty: int = None):
+    __indexer__.configure(enabled, flush_interval=flush_interval, max_dirty=max_dirty)
+
+
+def flush():
+    __indexer__.flush()
+
+
+def get_indexer_stats() -> IndexerStats:
+    return __indexer__.stats
+
+
+if __name__ == '__main__':
+    import sys
+    import tempfile
+    import timeit
+
+    import ieee_2030_5.models as m
+    from ieee_2030_5.persistance.points import configure_point_store
+
+    # A store of its own so the benchmark leaves the configured one alone.
+    bench_dir = tempfile.TemporaryDirectory()
+    configure_point_store("filesystem", bench_dir.name)
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    bench_hrefs = [f"/bench_edev_{i}" for i in range(count)]
+    for i, href in enumerate(bench_hrefs):
+        add_href(href, m.EndDevice(href=href, sFDI=i, lFDI=f"{i:040d}".encode(), enabled=True))
+
+    def read_from_store():
+        for href in bench_hrefs:
+            pickle.loads(get_point(href)).item
+
+    def read_from_memory():
+        for href in bench_hrefs:
+            get_href(href)
 
+    store_time = min(timeit.repeat(read_from_store, number=1, repeat=3))
+    memory_time = min(timeit.repeat(read_from_memory, number=1, repeat=3))
+    print(f"{count} hrefs")
+    print(f"point store read: {store_time:.4f}s ({store_time / count * 1e6:.1f}us per get)")
+    print(f"in memory read:   {memory_time:.4f}s ({memory_time / count * 1e6:.1f}us per get)")
+    print(f"speedup:          {store_time / memory_time:.1f}x")
 
-def get_href_all_names():
-    return [x for x in __indexer__.__items__.keys()
-            if __indexer__.__items__[x] is not None]
+    flush()
+    configure_persistence(False)
+    bench_dir.cleanup()
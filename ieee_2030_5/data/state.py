@@ -0,0 +1,270 @@
+"""
+Persistence of the in memory server state that isn't stored through add_href, used for warm
+restarts.
+
+Modules holding such state (the Adapter instances and the mirror usage point containers)
+register it with register_state as records, each with a key of its own: an Adapter has a
+record per item, holding the item and its children.  Code changing a record calls
+mark_changed with its key, and only the records changed since the last write are pickled and
+written to the point store, each under a point of its own, through the indexer's write-behind
+flush at most every snapshot_interval seconds and always when the process exits.
+
+Each module locks its own state with a lock from state_lock, an Adapter only itself, and
+pickles a record under that lock so it never sees a change half made.  The locks are held
+across a fork so processes are forked between changes.
+
+load_state doesn't read any record, it tells each module which of its records are stored and
+the module reads a record with read_state the first time it is used.
+
+dump_changes and restore_changes move the records changed since a generation between
+processes, the supervisor of production mode ships them to its workers
+(ieee_2030_5.workers).
+"""
+from __future__ import annotations
+
+import atexit
+import itertools
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from blinker import Signal
+
+from ieee_2030_5.data.indexer import add_flush_hook
+from ieee_2030_5.persistance.points import get_hrefs, get_point, set_points
+
+__all__: List[str] = [
+    "register_state",
+    "state_lock",
+    "mark_changed",
+    "generation",
+    "state_restored",
+    "configure_snapshots",
+    "has_snapshot",
+    "load_state",
+    "read_state",
+    "dump_changes",
+    "restore_changes",
+    "store_state",
+    "flush_state"
+]
+
+_log = logging.getLogger(__name__)
+
+# Keys that don't start with / are never treated as hrefs by the indexer.
+STATE_KEY = "__state__"
+
+# name -> (dump, load), see register_state.
+__providers__: Dict[str, Tuple[Callable[[str], bytes], Callable[[str, Optional[bytes]], None]]] = {}
+__lock__ = threading.Lock()
+# Held while changed records are pickled and, by store_state, written.
+__snapshot_lock__ = threading.RLock()
+# The locks handed out by state_lock, in the order they were created.
+__state_locks__: "weakref.WeakValueDictionary[int, threading.RLock]" = weakref.WeakValueDictionary()
+__lock_ids__ = itertools.count()
+__enabled__: bool = False
+# (name, key) of every record changed -> generation of its last change, oldest first.
+__changes__: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+# Counts the changes marked with mark_changed, never reset.
+__generation__: int = 0
+# Generation of the last records written to the point store.
+__persisted__: int = 0
+__snapshot_interval__: float = 30.0
+__last_snapshot__: float = 0.0
+
+
+def register_state(name: str, dump: Callable[[str], bytes],
+                   load: Callable[[str, Optional[bytes]], None]):
+    """
+    Register state made of records to persist.  dump returns the pickled record with a key,
+    taking the lock of the state while it does.  load is given the key of a record with its
+    pickled data, when another process sent it, or with None when it is in the point store,
+    where read_state reads it from.
+    """
+    __providers__[name] = (dump, load)
+
+
+def state_lock() -> threading.RLock:
+    """
+    A reentrant lock for registered state, held while the state is changed and while a record
+    of it is pickled.  Every such lock is taken before a fork.
+    """
+    lock = threading.RLock()
+    with __lock__:
+        __state_locks__[next(__lock_ids__)] = lock
+    return lock
+
+
+# Sent after restore_changes or load_state replaced registered state, so caches derived from
+# the replaced objects can be dropped.
+state_restored = Signal("state-restored")
+
+
+def _point_key(name: str, key: str) -> str:
+    return f"{STATE_KEY}.{name}.{key}"
+
+
+def mark_changed(name: str, key: str):
+    """
+    Record that the record key of the state registered as name changed.
+    """
+    global __generation__
+    with __lock__:
+        __generation__ += 1
+        __changes__[(name, key)] = __generation__
+        __changes__.move_to_end((name, key))
+
+
+def generation() -> int:
+    """ Changes every time a record is marked changed. """
+    return __generation__
+
+
+def configure_snapshots(enabled: bool, snapshot_interval: float = None):
+    global __enabled__, __snapshot_interval__
+    __enabled__ = enabled
+    if snapshot_interval is not None:
+        __snapshot_interval__ = snapshot_interval
+
+
+def has_snapshot() -> bool:
+    return next(iter(get_hrefs(f"{STATE_KEY}.")), None) is not None
+
+
+def _changed_since(since: int) -> Tuple[int, List[Tuple[str, str]]]:
+    with __lock__:
+        changed = []
+        # Newest first, only the records changed after since are looked at.
+        for record, changed_at in reversed(__changes__.items()):
+            if changed_at <= since:
+                break
+            changed.append(record)
+        return __generation__, changed[::-1]
+
+
+def dump_changes(since: int = 0) -> Tuple[int, Dict[Tuple[str, str], bytes]]:
+    """
+    The records changed after the generation since, pickled, by (name, key) in the order they
+    were changed, with the generation they are current to.  A record changed while they are
+    pickled may already hold the change, it is included again after that generation.
+    """
+    current, changed = _changed_since(since)
+    records = {}
+    for name, key in changed:
+        records[(name, key)] = __providers__[name][0](key)
+    return current, records
+
+
+def restore_changes(records: Dict[Tuple[str, str], bytes]):
+    """
+    Hand each record pickled by dump_changes to the load function of its state.
+    """
+    for (name, key), data in records.items():
+        if name not in __providers__:
+            _log.warning(f"No provider registered for state {name}")
+            continue
+        __providers__[name][1](key, data)
+    state_restored.send()
+
+
+def _snapshot() -> Dict[str, bytes]:
+    global __persisted__, __last_snapshot__
+    with __snapshot_lock__:
+        try:
+            current, records = dump_changes(__persisted__)
+        except Exception as ex:
+            # Skipped rather than letting the flush thread die, tried again at the next flush.
+            _log.exception(f"Snapshot skipped {ex}")
+            return {}
+        __persisted__ = current
+        __last_snapshot__ = time.monotonic()
+    return {_point_key(name, key): data for (name, key), data in records.items()}
+
+
+def _flush_hook() -> Dict[str, bytes]:
+    if not __enabled__ or __generation__ == __persisted__:
+        return {}
+    if time.monotonic() - __last_snapshot__ < __snapshot_interval__:
+        return {}
+    return _snapshot()
+
+
+def store_state():
+    """
+    Write the records changed since the last write to the point store now.
+    """
+    with __snapshot_lock__:
+        points = _snapshot()
+        if points:
+            set_points(points)
+
+
+def flush_state() -> bool:
+    """
+    Write the changed records now, rather than at the next write-behind flush, when snapshots
+    are enabled and a record changed since the last write.  Returns whether any were written.
+    """
+    if not __enabled__ or __generation__ == __persisted__:
+        return False
+    store_state()
+    return True
+
+
+def read_state(name: str, key: str) -> Optional[bytes]:
+    """ The record key of the state registered as name in the point store. """
+    return get_point(_point_key(name, key))
+
+
+def load_state() -> bool:
+    """
+    Tell the state registered under each name which of its records are in the point store,
+    without reading them.  Returns False when there are none.
+    """
+    found = False
+    for name, (_, load) in __providers__.items():
+        prefix = _point_key(name, "")
+        for point in get_hrefs(prefix):
+            load(point[len(prefix):], None)
+            found = True
+    if found:
+        state_restored.send()
+    return found
+
+
+def _store_on_exit():
+    if __enabled__:
+        store_state()
+
+
+add_flush_hook(_flush_hook)
+atexit.register(_store_on_exit)
+os.register_at_fork(before=__lock__.acquire,
+                    after_in_parent=__lock__.release,
+                    after_in_child=__lock__.release)
+
+# The state locks held by the forking thread, in the order taken.
+__forking__: List[threading.RLock] = []
+
+
+def _acquire_state_locks():
+    with __lock__:
+        __forking__[:] = [lock for _, lock in sorted(__state_locks__.items())]
+    for lock in __forking__:
+        lock.acquire()
+
+
+def _release_state_locks():
+    for lock in reversed(__forking__):
+        lock.release()
+    __forking__.clear()
+
+
+# Registered last so they are taken first, a thread holding one of them takes __lock__ to
+# mark a change.
+os.register_at_fork(before=_acquire_state_locks,
+                    after_in_parent=_release_state_locks,
+                    after_in_child=_release_state_locks)
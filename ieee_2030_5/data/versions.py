@@ -0,0 +1,248 @@
+"""
+Versions of the resources served to clients, used for conditional GET.
+
+The version of a resource is counted: every change made through the indexer (add_href) or
+an Adapter records a new version of the hrefs it changed, so answering a GET doesn't look
+at the body.  The etag of a version is the counter prefixed by a token of the server run,
+a restarted server never hands out an etag a client may still hold from the previous run,
+and forked workers share it with the supervisor that records the versions they install.
+A change recorded for an href is also recorded for the hrefs registered as depending on it
+with add_dependent, e.g. the lists of other resources holding it.
+
+The time a version was recorded is its Last-Modified.  The same path can serve a different
+body to each device (or a page of a list), such a body is kept under a key of its own with
+the version of its href.  A body served at an href no change was ever recorded for is
+versioned by a digest of its pickled state instead.
+"""
+from __future__ import annotations
+
+import hashlib
+import itertools
+import pickle
+import secrets
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from blinker import Signal
+
+__all__: List[str] = [
+    "ConditionalStats",
+    "resource_changed",
+    "resources_changed",
+    "digest",
+    "digest_bytes",
+    "next_version",
+    "record_version",
+    "record_versions",
+    "add_dependent",
+    "get_version",
+    "resource_version",
+    "record_response",
+    "is_versioned",
+    "get_conditional_stats"
+]
+
+# Resources that change on every request aren't worth versioning.
+UNVERSIONED_PREFIXES = ("/tm", )
+MAX_VERSIONS = 50000
+
+# Sent with the key, new etag and its modified time whenever the version of a resource
+# changes.
+resource_changed = Signal("resource-changed")
+# Sent once with the keys of resources changed together, e.g. in an Adapter.batch, instead
+# of resource_changed for each of them.
+resources_changed = Signal("resources-changed")
+
+
+@dataclass
+class ConditionalStats:
+    """
+    Counts of versioned GET responses.  bytes_saved is the size of the bodies that weren't
+    sent because a 304 was returned.
+    """
+    responses: int = 0
+    conditional_requests: int = 0
+    not_modified: int = 0
+    bytes_sent: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def not_modified_ratio(self) -> float:
+        return self.not_modified / self.responses if self.responses else 0.0
+
+
+@dataclass
+class _Version:
+    etag: str
+    last_modified: datetime
+    size: int = 0
+    # False for a version that is a digest of the body served.
+    counted: bool = True
+
+
+__versions__: OrderedDict[str, _Version] = OrderedDict()
+# href -> the hrefs whose version changes with it.
+__dependents__: Dict[str, Set[str]] = {}
+__lock__ = threading.Lock()
+__stats__ = ConditionalStats()
+__epoch__ = secrets.token_hex(4)
+__counter__ = itertools.count(1)
+
+
+def digest_bytes(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def digest(obj: Any) -> str:
+    return digest_bytes(pickle.dumps(obj))
+
+
+def is_versioned(path: str) -> bool:
+    return not path.startswith(UNVERSIONED_PREFIXES)
+
+
+def _store(key: str, etag: str, modified: Optional[datetime], counted: bool = True) -> _Version:
+    # HTTP dates have a resolution of a second.
+    version = _Version(etag, (modified or datetime.now(timezone.utc)).replace(microsecond=0),
+                       counted=counted)
+    __versions__[key] = version
+    __versions__.move_to_end(key)
+    while len(__versions__) > MAX_VERSIONS:
+        __versions__.popitem(last=False)
+    return version
+
+
+def next_version() -> Tuple[str, datetime]:
+    """ A new etag of the counter and the current time, to record with record_version. """
+    with __lock__:
+        etag = f"{__epoch__}-{next(__counter__):x}"
+    # HTTP dates have a resolution of a second.
+    return etag, datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def _record(key: str, etag: Optional[str], modified: Optional[datetime]) -> List[Tuple[str, _Version]]:
+    # The versions recorded for key and, when the version is counted here, its dependents.
+    with __lock__:
+        version = __versions__.get(key)
+        if etag is not None:
+            if version is not None and version.etag == etag:
+                __versions__.move_to_end(key)
+                return []
+            return [(key, _store(key, etag, modified))]
+        recorded = []
+        pending, seen = [key], {key}
+        while pending:
+            changed = pending.pop()
+            recorded.append((changed, _store(changed, f"{__epoch__}-{next(__counter__):x}",
+                                             None)))
+            for dependent in __dependents__.get(changed, ()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    pending.append(dependent)
+        return recorded
+
+
+def record_version(key: str, etag: Optional[str] = None,
+                   modified: Optional[datetime] = None) -> Tuple[str, datetime]:
+    """
+    Record a new version of key, and of the keys depending on it, and send resource_changed
+    for each.  The version is the next etag of the counter as of now, unless etag and
+    modified are given, from next_version or by another process, then they are recorded for
+    key alone.  Returns the etag of key and the time it became current.
+    """
+    recorded = _record(key, etag, modified)
+    for changed, version in recorded:
+        resource_changed.send(changed, etag=version.etag, modified=version.last_modified)
+    if not recorded:
+        # Already the current version.
+        return get_version(key) or (etag, modified)
+    return recorded[0][1].etag, recorded[0][1].last_modified
+
+
+def record_versions(keys: Iterable[str], sender: Any = None):
+    """
+    Record a new version of each of keys, changed together, and send resources_changed once
+    for all of them and their dependents.
+    """
+    changed = []
+    for key in keys:
+        changed.extend(changed_key for changed_key, _ in _record(key, None, None))
+    if changed:
+        resources_changed.send(sender, keys=changed)
+
+
+def add_dependent(href: str, dependent: str):
+    """
+    Record a new version of dependent whenever one is counted for href.
+    """
+    if href != dependent:
+        with __lock__:
+            __dependents__.setdefault(href, set()).add(dependent)
+
+
+def get_version(key: str) -> Optional[Tuple[str, datetime]]:
+    """ The etag and last modified time of the current version of key. """
+    with __lock__:
+        version = __versions__.get(key)
+    return None if version is None else (version.etag, version.last_modified)
+
+
+def resource_version(href: str, obj: Any, variant_key: Optional[str] = None) -> Tuple[str, str, datetime]:
+    """
+    The key the body obj served at href is kept under, its etag and last modified time.  A
+    body particular to the request, e.g. to the device asking, is kept under variant_key.
+    The counted version of href is used when there is one, obj is only digested when no
+    change of href was ever recorded.
+    """
+    key = variant_key or href
+    with __lock__:
+        version = __versions__.get(href)
+        if version is not None and version.counted:
+            __versions__.move_to_end(href)
+            if key != href:
+                # Kept to account for the size of the body sent under key.
+                variant = __versions__.get(key)
+                if variant is None or variant.etag != version.etag:
+                    _store(key, version.etag, version.last_modified)
+                else:
+                    __versions__.move_to_end(key)
+            return key, version.etag, version.last_modified
+
+    etag = digest(obj)
+    with __lock__:
+        version = __versions__.get(key)
+        if version is not None and version.etag == etag:
+            __versions__.move_to_end(key)
+            return key, version.etag, version.last_modified
+        version = _store(key, etag, None, counted=False)
+    return key, version.etag, version.last_modified
+
+
+def record_response(key: str, not_modified: bool, conditional: bool, size: int = 0):
+    """
+    Account for a versioned response.  size is the length of the body sent, for a 304 the
+    length of the body last sent for key is counted as saved.
+    """
+    with __lock__:
+        __stats__.responses += 1
+        if conditional:
+            __stats__.conditional_requests += 1
+        version = __versions__.get(key)
+        if not_modified:
+            __stats__.not_modified += 1
+            __stats__.bytes_saved += version.size if version else 0
+        else:
+            __stats__.bytes_sent += size
+            if version is not None:
+                version.size = size
+
+
+def get_conditional_stats() -> Dict[str, Any]:
+    with __lock__:
+        stats = asdict(__stats__)
+        stats["not_modified_ratio"] = __stats__.not_modified_ratio
+        stats["versions"] = len(__versions__)
+    return stats
@@ -6,10 +6,11 @@ import os
 import ssl
 import threading
 import time
-from dataclasses import fields
+from dataclasses import asdict, fields
 from functools import lru_cache
 from pathlib import Path
 from queue import Queue
+from typing import Optional
 
 import OpenSSL
 import werkzeug.exceptions
@@ -18,19 +19,23 @@ from flask import Flask, Response, redirect, render_template, request, url_for
 from werkzeug.serving import BaseWSGIServer, make_server
 
 from ieee_2030_5.utils import dataclass_to_xml
+from ieee_2030_5.utils.response_cache import get_response_cache_stats
 
-__all__ = ["build_server"]
+__all__ = ["build_server", "build_app"]
 
 import ieee_2030_5.adapters as adpt
 import ieee_2030_5.hrefs as hrefs
 import ieee_2030_5.models as m
-from ieee_2030_5.certs import (TLSRepository, lfdi_from_fingerprint,
-                               sfdi_from_lfdi)
+from ieee_2030_5.certs import (PeerIdentity, PeerIdentityCache, TLSRepository,
+                               lfdi_from_fingerprint, sfdi_from_lfdi)
 # templates = Jinja2Templates(directory="templates")
 from ieee_2030_5.config import ServerConfiguration
-from ieee_2030_5.data.indexer import get_href, get_href_all_names
+from ieee_2030_5.data.indexer import count_hrefs, get_href, get_href_names, get_indexer_stats
+from ieee_2030_5.data.versions import get_conditional_stats
 from ieee_2030_5.models import DeviceCategoryType
 from ieee_2030_5.server.admin_endpoints import AdminEndpoints
+from ieee_2030_5.server.protocol_capture import (capture_exchange, get_capture_stats,
+                                                 get_captures)
 from ieee_2030_5.server.server_constructs import EndDevices, get_groups
 from ieee_2030_5.server.server_endpoints import ServerEndpoints
 
@@ -63,8 +68,13 @@ class PeerCertWSGIRequestHandler(werkzeug.serving.WSGIRequestHandler):
     """
     config: ServerConfiguration
     tlsrepo: TLSRepository
+    identity_cache: PeerIdentityCache
     reqresponse: Queue()
 
+    # Identity of the peer on this handler's connection, see _peer_identity.
+    _identity: Optional[PeerIdentity] = None
+    _identity_version: int = -1
+
     @staticmethod
     @lru_cache
     def is_admin(path_info) -> bool:
@@ -99,28 +109,17 @@ class PeerCertWSGIRequestHandler(werkzeug.serving.WSGIRequestHandler):
             if PeerCertWSGIRequestHandler.is_admin(environ['PATH_INFO']):
                 cert, key = self.tlsrepo.get_file_pair("admin")
                 x509 = OpenSSL.crypto.load_certificate(OpenSSL.crypto.FILETYPE_PEM, cert)
+                identity = self._identity_from_x509(x509)
             else:
-                x509_binary = self.connection.getpeercert(True)
-                x509 = OpenSSL.crypto.load_certificate(OpenSSL.crypto.FILETYPE_ASN1, x509_binary)
-            environ['ieee_2030_5_peercert'] = x509
-            environ['ieee_2030_5_serial_number'] = x509.get_serial_number()
-            if PeerCertWSGIRequestHandler.config.lfdi_mode == "lfdi_mode_from_file":
-                _log.debug("Using hash from combined file.")
-                pth = PeerCertWSGIRequestHandler.tlsrepo.__get_combined_file__(x509.get_subject().CN)
-                sha256hash = hashlib.sha256(pth.read_text().encode('utf-8')).hexdigest()
-                environ['ieee_2030_5_lfdi'] = lfdi_from_fingerprint(sha256hash)
-            else:
-                environ['ieee_2030_5_lfdi'] = lfdi_from_fingerprint(
-                    x509.digest("sha256").decode('ascii'))
-            environ['ieee_2030_5_sfdi'] = sfdi_from_lfdi(environ['ieee_2030_5_lfdi'])
+                identity = self._peer_identity()
+            environ['ieee_2030_5_peercert'] = identity.x509
+            environ['ieee_2030_5_serial_number'] = identity.serial_number
+            environ['ieee_2030_5_lfdi'] = identity.lfdi
+            environ['ieee_2030_5_sfdi'] = identity.sfdi
 
             _log.debug(
                 f"Environment lfdi: {environ['ieee_2030_5_lfdi']} sfdi: {environ['ieee_2030_5_sfdi']}"
             )
-            if not PeerCertWSGIRequestHandler.is_admin(environ['PATH_INFO']):
-                found_device_id = self.tlsrepo.find_device_id_from_sfdi(
-                    environ['ieee_2030_5_sfdi'])
-                assert found_device_id, "Unknown device found."
         except OpenSSL.crypto.Error:
             # Only if we have a debug_device do we want to expose this device through the admin page.
             # if self.debug_device:
@@ -134,6 +133,47 @@ class PeerCertWSGIRequestHandler(werkzeug.serving.WSGIRequestHandler):
 
         return environ
 
+    def _identity_from_x509(self, x509) -> PeerIdentity:
+        if PeerCertWSGIRequestHandler.config.lfdi_mode == "lfdi_mode_from_file":
+            _log.debug("Using hash from combined file.")
+            pth = PeerCertWSGIRequestHandler.tlsrepo.__get_combined_file__(x509.get_subject().CN)
+            sha256hash = hashlib.sha256(pth.read_text().encode('utf-8')).hexdigest()
+            lfdi = lfdi_from_fingerprint(sha256hash)
+        else:
+            lfdi = lfdi_from_fingerprint(x509.digest("sha256").decode('ascii'))
+        sfdi = sfdi_from_lfdi(lfdi)
+        return PeerIdentity(x509=x509,
+                            serial_number=x509.get_serial_number(),
+                            lfdi=lfdi,
+                            sfdi=sfdi,
+                            device_id=self.tlsrepo.find_device_id_from_sfdi(sfdi))
+
+    def _peer_identity(self) -> PeerIdentity:
+        """
+        Resolve the identity of the client on this connection.  The identity is kept on the
+        handler, which lives as long as the connection, and in identity_cache keyed by the
+        digest of the certificate so new connections from known clients skip resolving it.
+        """
+        cache = PeerCertWSGIRequestHandler.identity_cache
+        if self._identity is not None and self._identity_version == self.tlsrepo.version:
+            cache.record_connection_hit()
+            return self._identity
+
+        x509_binary = self.connection.getpeercert(True)
+        if x509_binary is None:
+            raise OpenSSL.crypto.Error("No peer certificate")
+        digest = hashlib.sha256(x509_binary).digest()
+        identity = cache.get(digest)
+        if identity is None:
+            x509 = OpenSSL.crypto.load_certificate(OpenSSL.crypto.FILETYPE_ASN1, x509_binary)
+            identity = self._identity_from_x509(x509)
+            assert identity.device_id, "Unknown device found."
+            cache.put(digest, identity)
+
+        self._identity = identity
+        self._identity_version = self.tlsrepo.version
+        return identity
+
 
 # based on
 # https://stackoverflow.com/questions/19459236/how-to-handle-413-request-entity-too-large-in-python-flask-server#:~:text=server%20MAY%20close%20the%20connection,client%20from%20continuing%20the%20request.&text=time%20the%20client%20MAY%20try,you%20the%20Broken%20pipe%20error.&text=Great%20than%20the%20application%20is%20acting%20correct.
@@ -165,9 +205,8 @@ def before_request():
 
 
 def after_request(response: Response) -> Response:
-    _log_protocol.debug(f"\nREQ: {request.path}")
-    _log_protocol.debug(f"\nRESP HEADER: {str(response.headers).strip()}")
-    _log_protocol.debug(f"\nRESP: {response.get_data().decode('utf-8')}")
+    # Only renders the exchange when protocol capture is enabled and samples it.
+    capture_exchange(request, response)
 
     # _log.debug(f"RESP HEADERS:\n{response.headers}")
     # _log.debug(f"RESP:\n{response.get_data().decode('utf-8')}")
@@ -328,15 +367,23 @@ def __build_app__(config: ServerConfiguration, tlsrepo: TLSRepository) -> Flask:
     @app.route("/admin/resources")
     def admin_resource_list():
         resource = request.args.get("rurl")
+        prefix = request.args.get("prefix", "")
+        start = int(request.args.get("s", 0))
+        limit = int(request.args.get("l", 100))
         obj = get_href(resource)
-        all_resources = sorted(get_href_all_names())
+        # Names come back sorted from the indexer, only the requested page is materialized.
+        page = dict(resource_urls=get_href_names(prefix, start=start, limit=limit),
+                    prefix=prefix,
+                    start=start,
+                    limit=limit,
+                    total=count_hrefs(prefix))
         if obj:
             return render_template("admin/resource_list.html",
-                                   resource_urls=all_resources,
                                    href_shown=resource,
-                                   object=dataclass_to_xml(obj))
+                                   object=dataclass_to_xml(obj),
+                                   **page)
         else:
-            return render_template("admin/resource_list.html", resource_urls=all_resources)
+            return render_template("admin/resource_list.html", **page)
 
     @app.route("/admin/clients")
     def admin_clients():
@@ -357,6 +404,29 @@ def __build_app__(config: ServerConfiguration, tlsrepo: TLSRepository) -> Flask:
     def admin_aggregators():
         return Response("<h1>Aggregators</h1>")
 
+    @app.route("/admin/peer-cache")
+    def admin_peer_cache():
+        return Response(json.dumps(PeerCertWSGIRequestHandler.identity_cache.stats()),
+                        mimetype="application/json")
+
+    @app.route("/admin/metrics")
+    def admin_metrics():
+        return Response(json.dumps(dict(conditional_get=get_conditional_stats(),
+                                        indexer=asdict(get_indexer_stats()),
+                                        peer_identities=PeerCertWSGIRequestHandler.identity_cache.stats(),
+                                        protocol_capture=get_capture_stats(),
+                                        response_cache=get_response_cache_stats())),
+                        mimetype="application/json")
+
+    @app.route("/admin/protocol")
+    def admin_protocol():
+        captures = get_captures(limit=int(request.args.get("l", 100)),
+                                lfdi=request.args.get("lfdi"),
+                                path_prefix=request.args.get("path"))
+        return Response(json.dumps(dict(stats=get_capture_stats(),
+                                        captures=[asdict(c) for c in captures])),
+                        mimetype="application/json")
+
     @app.route("/admin/routes")
     def admin_routes():
         routes = '<ul>'
@@ -368,6 +438,10 @@ def __build_app__(config: ServerConfiguration, tlsrepo: TLSRepository) -> Flask:
     return app
 
 
+def build_app(config: ServerConfiguration, tlsrepo: TLSRepository) -> Flask:
+    return __build_app__(config, tlsrepo)
+
+
 def run_app(app: Flask, host, ssl_context, request_handler, port, **kwargs):    
     app.run(host=host,
             ssl_context=ssl_context,
@@ -396,13 +470,20 @@ def run_server(config: ServerConfiguration, tlsrepo: TLSRepository, enddevices:
 
     PeerCertWSGIRequestHandler.config = config
     PeerCertWSGIRequestHandler.tlsrepo = tlsrepo
+    PeerCertWSGIRequestHandler.identity_cache = PeerIdentityCache(tlsrepo,
+                                                                  config.peer_identity_cache_size)
 
     run_app(app=app, host=host, ssl_context=ssl_context, port=port, request_handler=PeerCertWSGIRequestHandler, **kwargs)
 
 
-def build_server(config: ServerConfiguration, tlsrepo: TLSRepository, **kwargs) -> BaseWSGIServer:
-
-    app = __build_app__(config, tlsrepo)
+def build_server(config: ServerConfiguration, tlsrepo: TLSRepository, app=None,
+                 **kwargs) -> BaseWSGIServer:
+    """
+    Build, but don't start, a server for the 2030.5 app.  app replaces the Flask app built from
+    config, for example with the app wrapped in middleware.  kwargs are passed to make_server.
+    """
+    if app is None:
+        app = __build_app__(config, tlsrepo)
     ssl_context = __build_ssl_context__(tlsrepo)
 
     try:
@@ -414,6 +495,8 @@ def build_server(config: ServerConfiguration, tlsrepo: TLSRepository, **kwargs)
         
     PeerCertWSGIRequestHandler.config = config
     PeerCertWSGIRequestHandler.tlsrepo = tlsrepo
+    PeerCertWSGIRequestHandler.identity_cache = PeerIdentityCache(tlsrepo,
+                                                                  config.peer_identity_cache_size)
 
     return make_server(app=app,
                        host=host,
@@ -1,13 +1,6 @@
+import importlib
+
 from ieee_2030_5.models.enums import DeviceCategoryType, CurveType 
-from ieee_2030_5.models.derforecasts import (
-    DERFlexibility,
-    DERForecast,
-    DERForecastLink,
-    ForecastNumericType,
-    ForecastParameter,
-    ForecastParameterSet,
-    ForecastParameterSetList,
-)
 from ieee_2030_5.models.sep import (
     AbstractDevice,
     AccountBalance,
@@ -588,3 +581,24 @@ __all__ = [
     "WattHour",
     "loWPAN",
 ]
+
+# The DER forecast extension isn't served, its module is only imported when one of its
+# classes is first used.
+_LAZY = {
+    name: "ieee_2030_5.models.derforecasts"
+    for name in ("DERFlexibility", "DERForecast", "DERForecastLink", "ForecastNumericType",
+                 "ForecastParameter", "ForecastParameterSet", "ForecastParameterSetList")
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
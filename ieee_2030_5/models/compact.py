@@ -0,0 +1,180 @@
+"""
+Memory compact variants of the model classes created in the largest numbers.
+
+The generated classes in ieee_2030_5.models.sep keep their fields in a per instance
+__dict__, and can't be slotted themselves: their bases (Resource, IdentifiedObject) are
+shared with every other class and configuration classes are copied through __dict__.  The
+classes here have the same fields, field metadata and xml names as the class they mirror
+but are slotted dataclasses, so they render and parse with xsdata exactly like the original
+and take a fraction of the memory.  Fields holding another compact type use the compact
+variant, a MirrorMeterReading converted with compact() is compact all the way down to its
+readings.
+
+Use compact() to convert objects that are retained and expand() to get the generated
+classes back, e.g. for the specialized renderers in ieee_2030_5.models.sep_fast which only
+accept those.
+"""
+from __future__ import annotations
+
+import dataclasses
+import sys
+import typing
+from typing import Any, Dict, List, Type, Union
+
+import ieee_2030_5.models.sep as sep
+
+__all__: List[str] = [
+    "COMPACT_TYPES",
+    "compact",
+    "expand",
+    "DateTimeInterval",
+    "Reading",
+    "MirrorReadingSet",
+    "ReadingType",
+    "MirrorMeterReading",
+    "EventStatus",
+    "DERControlBase"
+]
+
+# Slotted dataclasses need python 3.10, earlier versions get plain copies.
+_SLOTS = sys.version_info >= (3, 10)
+
+# Contained types before the types containing them.
+_MIRRORED = (sep.DateTimeInterval, sep.Reading, sep.MirrorReadingSet, sep.ReadingType,
+             sep.MirrorMeterReading, sep.EventStatus, sep.DERControlBase)
+
+COMPACT_TYPES: Dict[Type, Type] = {}
+_EXPANDED: Dict[Type, Type] = {}
+
+
+def _field_type(hint: Any) -> Any:
+    if hint in COMPACT_TYPES:
+        return COMPACT_TYPES[hint]
+    args = typing.get_args(hint)
+    if not args:
+        return hint
+    origin = typing.get_origin(hint)
+    if origin is Union:
+        return Union[tuple(_field_type(arg) for arg in args)]
+    if origin is list:
+        return List[_field_type(args[0])]
+    return hint
+
+
+def _mirror(clazz: Type) -> Type:
+    hints = typing.get_type_hints(clazz)
+    fields = []
+    for f in dataclasses.fields(clazz):
+        spec = dataclasses.field(default=f.default,
+                                 default_factory=f.default_factory,
+                                 metadata=f.metadata)
+        fields.append((f.name, _field_type(hints[f.name]), spec))
+    meta = type("Meta", (), {
+        key: value
+        for key, value in vars(clazz.Meta).items() if not key.startswith("__")
+    })
+    kwargs = dict(slots=True) if _SLOTS else {}
+    mirrored = dataclasses.make_dataclass(clazz.__name__,
+                                          fields,
+                                          namespace={
+                                              "Meta": meta,
+                                              "__doc__": clazz.__doc__
+                                          },
+                                          **kwargs)
+    mirrored.__module__ = __name__
+    mirrored.__qualname__ = clazz.__name__
+    return mirrored
+
+
+for _clazz in _MIRRORED:
+    COMPACT_TYPES[_clazz] = _mirror(_clazz)
+_EXPANDED.update((mirrored, clazz) for clazz, mirrored in COMPACT_TYPES.items())
+
+DateTimeInterval = COMPACT_TYPES[sep.DateTimeInterval]
+Reading = COMPACT_TYPES[sep.Reading]
+MirrorReadingSet = COMPACT_TYPES[sep.MirrorReadingSet]
+ReadingType = COMPACT_TYPES[sep.ReadingType]
+MirrorMeterReading = COMPACT_TYPES[sep.MirrorMeterReading]
+EventStatus = COMPACT_TYPES[sep.EventStatus]
+DERControlBase = COMPACT_TYPES[sep.DERControlBase]
+
+
+def _convert(obj: Any, types: Dict[Type, Type]) -> Any:
+    if isinstance(obj, list):
+        return [_convert(value, types) for value in obj]
+    clazz = types.get(type(obj))
+    if clazz is None:
+        return obj
+    return clazz(**{f.name: _convert(getattr(obj, f.name), types)
+                    for f in dataclasses.fields(obj)})
+
+
+def compact(obj: Any) -> Any:
+    """
+    obj, and any of the values it holds, as the compact variant of its class.  Objects of
+    other classes are returned as they are.
+    """
+    return _convert(obj, COMPACT_TYPES)
+
+
+def expand(obj: Any) -> Any:
+    """
+    The generated class instance of a compact object.
+    """
+    return _convert(obj, _EXPANDED)
+
+
+if __name__ == '__main__':
+    import gc
+    import pickle
+    import time
+    import tracemalloc
+
+    from ieee_2030_5.utils import dataclass_to_xml, xml_to_dataclass
+
+    count = 1_000_000
+
+    def readings(module) -> list:
+        return [
+            module.Reading(value=1000 + i,
+                           qualityFlags=b"\x00\x01",
+                           localID=b"\x00\x01",
+                           timePeriod=module.DateTimeInterval(duration=300,
+                                                              start=1700000000 + i * 300))
+            for i in range(count)
+        ]
+
+    for label, module in (("generated", sep), ("compact", sys.modules[__name__])):
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        retained = readings(module)
+        elapsed = time.perf_counter() - start
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:<10} {size / count:6.0f} bytes/reading "
+              f"({size / 2 ** 20:.0f}MiB for {count} readings, created in {elapsed:.2f}s)")
+        del retained
+
+    mmr = sep.MirrorMeterReading(
+        mRID=b"\x55\x09" * 8,
+        description="Real Power(W) Set",
+        ReadingType=sep.ReadingType(kind=37, uom=38, powerOfTenMultiplier=0),
+        MirrorReadingSet=[
+            sep.MirrorReadingSet(mRID=b"\x01" * 16,
+                                 timePeriod=sep.DateTimeInterval(duration=300, start=1700000000),
+                                 Reading=[sep.Reading(value=v) for v in range(3)])
+        ])
+    small = compact(mmr)
+    assert type(small.MirrorReadingSet[0].Reading[0]) is Reading
+    assert not hasattr(small.MirrorReadingSet[0].Reading[0], "__dict__") or not _SLOTS
+    xml = dataclass_to_xml(mmr)
+    assert dataclass_to_xml(small) == xml
+    assert xml_to_dataclass(xml, MirrorMeterReading) == small
+    assert expand(small) == mmr
+    assert pickle.loads(pickle.dumps(small)) == small
+    control = sep.DERControlBase(opModConnect=True, opModTargetW=sep.ActivePower(multiplier=0,
+                                                                                  value=5000))
+    assert dataclass_to_xml(compact(control)) == dataclass_to_xml(control)
+    status = sep.EventStatus(currentStatus=1, dateTime=1700000000, potentiallySuperseded=False)
+    assert dataclass_to_xml(compact(status)) == dataclass_to_xml(status)
@@ -0,0 +1,4719 @@
+"""
+Specialized xml render and parse functions for the hot 2030.5 classes.
+
+Generated by ieee_2030_5.utils.codegen, do not edit.
+"""
+from __future__ import annotations
+
+import binascii
+import re
+from enum import Enum
+from typing import Any, Dict, List, Optional, Type
+from xml.etree.ElementTree import ParseError, fromstring
+from xml.sax.saxutils import escape, quoteattr
+
+import ieee_2030_5.models.sep as sep
+
+__all__: List[str] = ["Fallback", "RENDERERS", "PARSERS", "render", "parse"]
+
+
+class Fallback(Exception):
+    """ Raised when a document must be rendered or parsed by xsdata. """
+
+
+_ATTR_ENTITIES = {"\n": "&#10;", "\r": "&#13;", "\t": "&#9;"}
+_HEX = re.compile(r"^[0-9a-fA-F]*$")
+_XSI = "{http://www.w3.org/2001/XMLSchema-instance}"
+
+
+def _value(v: Any, base16: bool) -> str:
+    if isinstance(v, bool):
+        return "true" if v else "false"
+    if isinstance(v, Enum):
+        return _value(v.value, base16)
+    if isinstance(v, int):
+        return str(int(v))
+    if isinstance(v, str):
+        return str(v)
+    if isinstance(v, bytes) and base16:
+        return v.hex().upper()
+    raise Fallback()
+
+
+def _int(v: Any) -> str:
+    return str(v) if type(v) is int else _value(v, False)
+
+
+def _str(v: Any) -> str:
+    return v if type(v) is str else _value(v, False)
+
+
+def _bool(v: Any) -> str:
+    if v is True:
+        return "true"
+    if v is False:
+        return "false"
+    return _value(v, False)
+
+
+def _hex(v: Any) -> str:
+    return v.hex().upper() if type(v) is bytes else _value(v, True)
+
+
+def _leaf(out: List[str], ind: str, tag: str, text: str, nl: str):
+    if text:
+        out.append(f"{ind}<{tag}>{escape(text)}</{tag}>{nl}")
+    else:
+        out.append(f"{ind}<{tag}/>{nl}")
+
+
+def _attr(name: str, text: str) -> str:
+    return f" {name}={quoteattr(text, _ATTR_ENTITIES)}"
+
+
+def _close(out: List[str], start: int, head: str, ind: str, tag: str, nl: str):
+    if len(out) == start + 1:
+        out[start] = f"{head}/>{nl}"
+    else:
+        out[start] = f"{head}>{nl}"
+        out.append(f"{ind}</{tag}>{nl}")
+
+
+def _pint(text: Optional[str]) -> int:
+    try:
+        return int(text)
+    except (TypeError, ValueError):
+        raise Fallback()
+
+
+def _pstr(text: Optional[str]) -> str:
+    return "" if text is None else text
+
+
+def _pbool(text: Optional[str]) -> bool:
+    if text == "true" or text == "1":
+        return True
+    if text == "false" or text == "0":
+        return False
+    raise Fallback()
+
+
+def _phex(text: Optional[str]) -> bytes:
+    if text is None:
+        return b""
+    if not _HEX.match(text) or len(text) % 2:
+        raise Fallback()
+    return binascii.unhexlify(text)
+
+
+def _leaf_text(el) -> Optional[str]:
+    if len(el) or el.attrib:
+        raise Fallback()
+    return el.text
+
+
+def _parse_children(el, kw: Dict[str, Any], elements: Dict[str, tuple]):
+    for child in el:
+        entry = elements.get(child.tag)
+        if entry is None:
+            raise Fallback()
+        name, convert, many = entry
+        value = convert(child)
+        if many:
+            kw.setdefault(name, []).append(value)
+        elif name in kw:
+            raise Fallback()
+        else:
+            kw[name] = value
+
+
+def _parse_attributes(el, kw: Dict[str, Any], attributes: Dict[str, tuple]):
+    for key, text in el.attrib.items():
+        entry = attributes.get(key)
+        if entry is None:
+            if key.startswith(_XSI):
+                raise Fallback()
+            continue
+        name, convert = entry
+        kw[name] = convert(text)
+
+NAMESPACE = "urn:ieee:std:2030.5:ns"
+
+
+
+def _r_DeviceCapability(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.pollRate
+    if v is not None:
+        head += _attr("pollRate", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.CustomerAccountListLink
+    if v is not None:
+        if type(v) is not sep.CustomerAccountListLink:
+            raise Fallback()
+        _r_CustomerAccountListLink(v, "CustomerAccountListLink", out, inner, nl, "")
+    v = o.DemandResponseProgramListLink
+    if v is not None:
+        if type(v) is not sep.DemandResponseProgramListLink:
+            raise Fallback()
+        _r_DemandResponseProgramListLink(v, "DemandResponseProgramListLink", out, inner, nl, "")
+    v = o.DERProgramListLink
+    if v is not None:
+        if type(v) is not sep.DERProgramListLink:
+            raise Fallback()
+        _r_DERProgramListLink(v, "DERProgramListLink", out, inner, nl, "")
+    v = o.FileListLink
+    if v is not None:
+        if type(v) is not sep.FileListLink:
+            raise Fallback()
+        _r_FileListLink(v, "FileListLink", out, inner, nl, "")
+    v = o.MessagingProgramListLink
+    if v is not None:
+        if type(v) is not sep.MessagingProgramListLink:
+            raise Fallback()
+        _r_MessagingProgramListLink(v, "MessagingProgramListLink", out, inner, nl, "")
+    v = o.PrepaymentListLink
+    if v is not None:
+        if type(v) is not sep.PrepaymentListLink:
+            raise Fallback()
+        _r_PrepaymentListLink(v, "PrepaymentListLink", out, inner, nl, "")
+    v = o.ResponseSetListLink
+    if v is not None:
+        if type(v) is not sep.ResponseSetListLink:
+            raise Fallback()
+        _r_ResponseSetListLink(v, "ResponseSetListLink", out, inner, nl, "")
+    v = o.TariffProfileListLink
+    if v is not None:
+        if type(v) is not sep.TariffProfileListLink:
+            raise Fallback()
+        _r_TariffProfileListLink(v, "TariffProfileListLink", out, inner, nl, "")
+    v = o.TimeLink
+    if v is not None:
+        if type(v) is not sep.TimeLink:
+            raise Fallback()
+        _r_TimeLink(v, "TimeLink", out, inner, nl, "")
+    v = o.UsagePointListLink
+    if v is not None:
+        if type(v) is not sep.UsagePointListLink:
+            raise Fallback()
+        _r_UsagePointListLink(v, "UsagePointListLink", out, inner, nl, "")
+    v = o.EndDeviceListLink
+    if v is not None:
+        if type(v) is not sep.EndDeviceListLink:
+            raise Fallback()
+        _r_EndDeviceListLink(v, "EndDeviceListLink", out, inner, nl, "")
+    v = o.MirrorUsagePointListLink
+    if v is not None:
+        if type(v) is not sep.MirrorUsagePointListLink:
+            raise Fallback()
+        _r_MirrorUsagePointListLink(v, "MirrorUsagePointListLink", out, inner, nl, "")
+    v = o.SelfDeviceLink
+    if v is not None:
+        if type(v) is not sep.SelfDeviceLink:
+            raise Fallback()
+        _r_SelfDeviceLink(v, "SelfDeviceLink", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_CustomerAccountListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_DemandResponseProgramListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_DERProgramListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_FileListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_MessagingProgramListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_PrepaymentListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_ResponseSetListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_TariffProfileListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_TimeLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_UsagePointListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_EndDeviceListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_MirrorUsagePointListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_SelfDeviceLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_EndDevice(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.ConfigurationLink
+    if v is not None:
+        if type(v) is not sep.ConfigurationLink:
+            raise Fallback()
+        _r_ConfigurationLink(v, "ConfigurationLink", out, inner, nl, "")
+    v = o.DERListLink
+    if v is not None:
+        if type(v) is not sep.DERListLink:
+            raise Fallback()
+        _r_DERListLink(v, "DERListLink", out, inner, nl, "")
+    v = o.deviceCategory
+    if v is not None:
+        _leaf(out, inner, "deviceCategory", _hex(v), nl)
+    v = o.DeviceInformationLink
+    if v is not None:
+        if type(v) is not sep.DeviceInformationLink:
+            raise Fallback()
+        _r_DeviceInformationLink(v, "DeviceInformationLink", out, inner, nl, "")
+    v = o.DeviceStatusLink
+    if v is not None:
+        if type(v) is not sep.DeviceStatusLink:
+            raise Fallback()
+        _r_DeviceStatusLink(v, "DeviceStatusLink", out, inner, nl, "")
+    v = o.FileStatusLink
+    if v is not None:
+        if type(v) is not sep.FileStatusLink:
+            raise Fallback()
+        _r_FileStatusLink(v, "FileStatusLink", out, inner, nl, "")
+    v = o.IPInterfaceListLink
+    if v is not None:
+        if type(v) is not sep.IPInterfaceListLink:
+            raise Fallback()
+        _r_IPInterfaceListLink(v, "IPInterfaceListLink", out, inner, nl, "")
+    v = o.lFDI
+    if v is not None:
+        _leaf(out, inner, "lFDI", _hex(v), nl)
+    v = o.LoadShedAvailabilityListLink
+    if v is not None:
+        if type(v) is not sep.LoadShedAvailabilityListLink:
+            raise Fallback()
+        _r_LoadShedAvailabilityListLink(v, "LoadShedAvailabilityListLink", out, inner, nl, "")
+    v = o.LogEventListLink
+    if v is not None:
+        if type(v) is not sep.LogEventListLink:
+            raise Fallback()
+        _r_LogEventListLink(v, "LogEventListLink", out, inner, nl, "")
+    v = o.PowerStatusLink
+    if v is not None:
+        if type(v) is not sep.PowerStatusLink:
+            raise Fallback()
+        _r_PowerStatusLink(v, "PowerStatusLink", out, inner, nl, "")
+    v = o.sFDI
+    if v is not None:
+        _leaf(out, inner, "sFDI", _int(v), nl)
+    v = o.changedTime
+    if v is not None:
+        _leaf(out, inner, "changedTime", _int(v), nl)
+    v = o.enabled
+    if v is not None:
+        _leaf(out, inner, "enabled", _bool(v), nl)
+    v = o.FlowReservationRequestListLink
+    if v is not None:
+        if type(v) is not sep.FlowReservationRequestListLink:
+            raise Fallback()
+        _r_FlowReservationRequestListLink(v, "FlowReservationRequestListLink", out, inner, nl, "")
+    v = o.FlowReservationResponseListLink
+    if v is not None:
+        if type(v) is not sep.FlowReservationResponseListLink:
+            raise Fallback()
+        _r_FlowReservationResponseListLink(v, "FlowReservationResponseListLink", out, inner, nl, "")
+    v = o.FunctionSetAssignmentsListLink
+    if v is not None:
+        if type(v) is not sep.FunctionSetAssignmentsListLink:
+            raise Fallback()
+        _r_FunctionSetAssignmentsListLink(v, "FunctionSetAssignmentsListLink", out, inner, nl, "")
+    v = o.postRate
+    if v is not None:
+        _leaf(out, inner, "postRate", _int(v), nl)
+    v = o.RegistrationLink
+    if v is not None:
+        if type(v) is not sep.RegistrationLink:
+            raise Fallback()
+        _r_RegistrationLink(v, "RegistrationLink", out, inner, nl, "")
+    v = o.SubscriptionListLink
+    if v is not None:
+        if type(v) is not sep.SubscriptionListLink:
+            raise Fallback()
+        _r_SubscriptionListLink(v, "SubscriptionListLink", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_ConfigurationLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_DERListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_DeviceInformationLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_DeviceStatusLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_FileStatusLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_IPInterfaceListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_LoadShedAvailabilityListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_LogEventListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_PowerStatusLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_FlowReservationRequestListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_FlowReservationResponseListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_FunctionSetAssignmentsListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_RegistrationLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_SubscriptionListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_EndDeviceList(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    v = o.results
+    if v is not None:
+        head += _attr("results", _int(v))
+    v = o.pollRate
+    if v is not None:
+        head += _attr("pollRate", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    for v in o.EndDevice or ():
+        if v is None:
+            continue
+        if type(v) is not sep.EndDevice:
+            raise Fallback()
+        _r_EndDevice(v, "EndDevice", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_Registration(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.pollRate
+    if v is not None:
+        head += _attr("pollRate", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.dateTimeRegistered
+    if v is not None:
+        _leaf(out, inner, "dateTimeRegistered", _int(v), nl)
+    v = o.pIN
+    if v is not None:
+        _leaf(out, inner, "pIN", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_FunctionSetAssignments(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.CustomerAccountListLink
+    if v is not None:
+        if type(v) is not sep.CustomerAccountListLink:
+            raise Fallback()
+        _r_CustomerAccountListLink(v, "CustomerAccountListLink", out, inner, nl, "")
+    v = o.DemandResponseProgramListLink
+    if v is not None:
+        if type(v) is not sep.DemandResponseProgramListLink:
+            raise Fallback()
+        _r_DemandResponseProgramListLink(v, "DemandResponseProgramListLink", out, inner, nl, "")
+    v = o.DERProgramListLink
+    if v is not None:
+        if type(v) is not sep.DERProgramListLink:
+            raise Fallback()
+        _r_DERProgramListLink(v, "DERProgramListLink", out, inner, nl, "")
+    v = o.FileListLink
+    if v is not None:
+        if type(v) is not sep.FileListLink:
+            raise Fallback()
+        _r_FileListLink(v, "FileListLink", out, inner, nl, "")
+    v = o.MessagingProgramListLink
+    if v is not None:
+        if type(v) is not sep.MessagingProgramListLink:
+            raise Fallback()
+        _r_MessagingProgramListLink(v, "MessagingProgramListLink", out, inner, nl, "")
+    v = o.PrepaymentListLink
+    if v is not None:
+        if type(v) is not sep.PrepaymentListLink:
+            raise Fallback()
+        _r_PrepaymentListLink(v, "PrepaymentListLink", out, inner, nl, "")
+    v = o.ResponseSetListLink
+    if v is not None:
+        if type(v) is not sep.ResponseSetListLink:
+            raise Fallback()
+        _r_ResponseSetListLink(v, "ResponseSetListLink", out, inner, nl, "")
+    v = o.TariffProfileListLink
+    if v is not None:
+        if type(v) is not sep.TariffProfileListLink:
+            raise Fallback()
+        _r_TariffProfileListLink(v, "TariffProfileListLink", out, inner, nl, "")
+    v = o.TimeLink
+    if v is not None:
+        if type(v) is not sep.TimeLink:
+            raise Fallback()
+        _r_TimeLink(v, "TimeLink", out, inner, nl, "")
+    v = o.UsagePointListLink
+    if v is not None:
+        if type(v) is not sep.UsagePointListLink:
+            raise Fallback()
+        _r_UsagePointListLink(v, "UsagePointListLink", out, inner, nl, "")
+    v = o.mRID
+    if v is not None:
+        _leaf(out, inner, "mRID", _hex(v), nl)
+    v = o.description
+    if v is not None:
+        _leaf(out, inner, "description", _str(v), nl)
+    v = o.version
+    if v is not None:
+        _leaf(out, inner, "version", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_FunctionSetAssignmentsList(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    v = o.results
+    if v is not None:
+        head += _attr("results", _int(v))
+    v = o.pollRate
+    if v is not None:
+        head += _attr("pollRate", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    for v in o.FunctionSetAssignments or ():
+        if v is None:
+            continue
+        if type(v) is not sep.FunctionSetAssignments:
+            raise Fallback()
+        _r_FunctionSetAssignments(v, "FunctionSetAssignments", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_DER(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.AssociatedDERProgramListLink
+    if v is not None:
+        if type(v) is not sep.AssociatedDERProgramListLink:
+            raise Fallback()
+        _r_AssociatedDERProgramListLink(v, "AssociatedDERProgramListLink", out, inner, nl, "")
+    v = o.AssociatedUsagePointLink
+    if v is not None:
+        if type(v) is not sep.AssociatedUsagePointLink:
+            raise Fallback()
+        _r_AssociatedUsagePointLink(v, "AssociatedUsagePointLink", out, inner, nl, "")
+    v = o.CurrentDERProgramLink
+    if v is not None:
+        if type(v) is not sep.CurrentDERProgramLink:
+            raise Fallback()
+        _r_CurrentDERProgramLink(v, "CurrentDERProgramLink", out, inner, nl, "")
+    v = o.DERAvailabilityLink
+    if v is not None:
+        if type(v) is not sep.DERAvailabilityLink:
+            raise Fallback()
+        _r_DERAvailabilityLink(v, "DERAvailabilityLink", out, inner, nl, "")
+    v = o.DERCapabilityLink
+    if v is not None:
+        if type(v) is not sep.DERCapabilityLink:
+            raise Fallback()
+        _r_DERCapabilityLink(v, "DERCapabilityLink", out, inner, nl, "")
+    v = o.DERSettingsLink
+    if v is not None:
+        if type(v) is not sep.DERSettingsLink:
+            raise Fallback()
+        _r_DERSettingsLink(v, "DERSettingsLink", out, inner, nl, "")
+    v = o.DERStatusLink
+    if v is not None:
+        if type(v) is not sep.DERStatusLink:
+            raise Fallback()
+        _r_DERStatusLink(v, "DERStatusLink", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_AssociatedDERProgramListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_AssociatedUsagePointLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_CurrentDERProgramLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_DERAvailabilityLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_DERCapabilityLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_DERSettingsLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_DERStatusLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_DERList(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    v = o.results
+    if v is not None:
+        head += _attr("results", _int(v))
+    v = o.pollRate
+    if v is not None:
+        head += _attr("pollRate", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    for v in o.DER or ():
+        if v is None:
+            continue
+        if type(v) is not sep.DER:
+            raise Fallback()
+        _r_DER(v, "DER", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_DERCapability(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.modesSupported
+    if v is not None:
+        _leaf(out, inner, "modesSupported", _hex(v), nl)
+    v = o.rtgAbnormalCategory
+    if v is not None:
+        _leaf(out, inner, "rtgAbnormalCategory", _int(v), nl)
+    v = o.rtgMaxA
+    if v is not None:
+        if type(v) is not sep.CurrentRMS:
+            raise Fallback()
+        _r_CurrentRMS(v, "rtgMaxA", out, inner, nl, "")
+    v = o.rtgMaxAh
+    if v is not None:
+        if type(v) is not sep.AmpereHour:
+            raise Fallback()
+        _r_AmpereHour(v, "rtgMaxAh", out, inner, nl, "")
+    v = o.rtgMaxChargeRateVA
+    if v is not None:
+        if type(v) is not sep.ApparentPower:
+            raise Fallback()
+        _r_ApparentPower(v, "rtgMaxChargeRateVA", out, inner, nl, "")
+    v = o.rtgMaxChargeRateW
+    if v is not None:
+        if type(v) is not sep.ActivePower:
+            raise Fallback()
+        _r_ActivePower(v, "rtgMaxChargeRateW", out, inner, nl, "")
+    v = o.rtgMaxDischargeRateVA
+    if v is not None:
+        if type(v) is not sep.ApparentPower:
+            raise Fallback()
+        _r_ApparentPower(v, "rtgMaxDischargeRateVA", out, inner, nl, "")
+    v = o.rtgMaxDischargeRateW
+    if v is not None:
+        if type(v) is not sep.ActivePower:
+            raise Fallback()
+        _r_ActivePower(v, "rtgMaxDischargeRateW", out, inner, nl, "")
+    v = o.rtgMaxV
+    if v is not None:
+        if type(v) is not sep.VoltageRMS:
+            raise Fallback()
+        _r_VoltageRMS(v, "rtgMaxV", out, inner, nl, "")
+    v = o.rtgMaxVA
+    if v is not None:
+        if type(v) is not sep.ApparentPower:
+            raise Fallback()
+        _r_ApparentPower(v, "rtgMaxVA", out, inner, nl, "")
+    v = o.rtgMaxVar
+    if v is not None:
+        if type(v) is not sep.ReactivePower:
+            raise Fallback()
+        _r_ReactivePower(v, "rtgMaxVar", out, inner, nl, "")
+    v = o.rtgMaxVarNeg
+    if v is not None:
+        if type(v) is not sep.ReactivePower:
+            raise Fallback()
+        _r_ReactivePower(v, "rtgMaxVarNeg", out, inner, nl, "")
+    v = o.rtgMaxW
+    if v is not None:
+        if type(v) is not sep.ActivePower:
+            raise Fallback()
+        _r_ActivePower(v, "rtgMaxW", out, inner, nl, "")
+    v = o.rtgMaxWh
+    if v is not None:
+        if type(v) is not sep.WattHour:
+            raise Fallback()
+        _r_WattHour(v, "rtgMaxWh", out, inner, nl, "")
+    v = o.rtgMinPFOverExcited
+    if v is not None:
+        if type(v) is not sep.PowerFactor:
+            raise Fallback()
+        _r_PowerFactor(v, "rtgMinPFOverExcited", out, inner, nl, "")
+    v = o.rtgMinPFUnderExcited
+    if v is not None:
+        if type(v) is not sep.PowerFactor:
+            raise Fallback()
+        _r_PowerFactor(v, "rtgMinPFUnderExcited", out, inner, nl, "")
+    v = o.rtgMinV
+    if v is not None:
+        if type(v) is not sep.VoltageRMS:
+            raise Fallback()
+        _r_VoltageRMS(v, "rtgMinV", out, inner, nl, "")
+    v = o.rtgNormalCategory
+    if v is not None:
+        _leaf(out, inner, "rtgNormalCategory", _int(v), nl)
+    v = o.rtgOverExcitedPF
+    if v is not None:
+        if type(v) is not sep.PowerFactor:
+            raise Fallback()
+        _r_PowerFactor(v, "rtgOverExcitedPF", out, inner, nl, "")
+    v = o.rtgOverExcitedW
+    if v is not None:
+        if type(v) is not sep.ActivePower:
+            raise Fallback()
+        _r_ActivePower(v, "rtgOverExcitedW", out, inner, nl, "")
+    v = o.rtgReactiveSusceptance
+    if v is not None:
+        if type(v) is not sep.ReactiveSusceptance:
+            raise Fallback()
+        _r_ReactiveSusceptance(v, "rtgReactiveSusceptance", out, inner, nl, "")
+    v = o.rtgUnderExcitedPF
+    if v is not None:
+        if type(v) is not sep.PowerFactor:
+            raise Fallback()
+        _r_PowerFactor(v, "rtgUnderExcitedPF", out, inner, nl, "")
+    v = o.rtgUnderExcitedW
+    if v is not None:
+        if type(v) is not sep.ActivePower:
+            raise Fallback()
+        _r_ActivePower(v, "rtgUnderExcitedW", out, inner, nl, "")
+    v = o.rtgVNom
+    if v is not None:
+        if type(v) is not sep.VoltageRMS:
+            raise Fallback()
+        _r_VoltageRMS(v, "rtgVNom", out, inner, nl, "")
+    v = o.type
+    if v is not None:
+        _leaf(out, inner, "type", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_CurrentRMS(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.multiplier
+    if v is not None:
+        _leaf(out, inner, "multiplier", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_AmpereHour(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.multiplier
+    if v is not None:
+        _leaf(out, inner, "multiplier", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_ApparentPower(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.multiplier
+    if v is not None:
+        _leaf(out, inner, "multiplier", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_ActivePower(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.multiplier
+    if v is not None:
+        _leaf(out, inner, "multiplier", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_VoltageRMS(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.multiplier
+    if v is not None:
+        _leaf(out, inner, "multiplier", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_ReactivePower(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.multiplier
+    if v is not None:
+        _leaf(out, inner, "multiplier", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_WattHour(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.multiplier
+    if v is not None:
+        _leaf(out, inner, "multiplier", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_PowerFactor(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.displacement
+    if v is not None:
+        _leaf(out, inner, "displacement", _int(v), nl)
+    v = o.multiplier
+    if v is not None:
+        _leaf(out, inner, "multiplier", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_ReactiveSusceptance(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.multiplier
+    if v is not None:
+        _leaf(out, inner, "multiplier", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_DERSettings(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.modesEnabled
+    if v is not None:
+        _leaf(out, inner, "modesEnabled", _hex(v), nl)
+    v = o.setESDelay
+    if v is not None:
+        _leaf(out, inner, "setESDelay", _int(v), nl)
+    v = o.setESHighFreq
+    if v is not None:
+        _leaf(out, inner, "setESHighFreq", _int(v), nl)
+    v = o.setESHighVolt
+    if v is not None:
+        _leaf(out, inner, "setESHighVolt", _int(v), nl)
+    v = o.setESLowFreq
+    if v is not None:
+        _leaf(out, inner, "setESLowFreq", _int(v), nl)
+    v = o.setESLowVolt
+    if v is not None:
+        _leaf(out, inner, "setESLowVolt", _int(v), nl)
+    v = o.setESRampTms
+    if v is not None:
+        _leaf(out, inner, "setESRampTms", _int(v), nl)
+    v = o.setESRandomDelay
+    if v is not None:
+        _leaf(out, inner, "setESRandomDelay", _int(v), nl)
+    v = o.setGradW
+    if v is not None:
+        _leaf(out, inner, "setGradW", _int(v), nl)
+    v = o.setMaxA
+    if v is not None:
+        if type(v) is not sep.CurrentRMS:
+            raise Fallback()
+        _r_CurrentRMS(v, "setMaxA", out, inner, nl, "")
+    v = o.setMaxAh
+    if v is not None:
+        if type(v) is not sep.AmpereHour:
+            raise Fallback()
+        _r_AmpereHour(v, "setMaxAh", out, inner, nl, "")
+    v = o.setMaxChargeRateVA
+    if v is not None:
+        if type(v) is not sep.ApparentPower:
+            raise Fallback()
+        _r_ApparentPower(v, "setMaxChargeRateVA", out, inner, nl, "")
+    v = o.setMaxChargeRateW
+    if v is not None:
+        if type(v) is not sep.ActivePower:
+            raise Fallback()
+        _r_ActivePower(v, "setMaxChargeRateW", out, inner, nl, "")
+    v = o.setMaxDischargeRateVA
+    if v is not None:
+        if type(v) is not sep.ApparentPower:
+            raise Fallback()
+        _r_ApparentPower(v, "setMaxDischargeRateVA", out, inner, nl, "")
+    v = o.setMaxDischargeRateW
+    if v is not None:
+        if type(v) is not sep.ActivePower:
+            raise Fallback()
+        _r_ActivePower(v, "setMaxDischargeRateW", out, inner, nl, "")
+    v = o.setMaxV
+    if v is not None:
+        if type(v) is not sep.VoltageRMS:
+            raise Fallback()
+        _r_VoltageRMS(v, "setMaxV", out, inner, nl, "")
+    v = o.setMaxVA
+    if v is not None:
+        if type(v) is not sep.ApparentPower:
+            raise Fallback()
+        _r_ApparentPower(v, "setMaxVA", out, inner, nl, "")
+    v = o.setMaxVar
+    if v is not None:
+        if type(v) is not sep.ReactivePower:
+            raise Fallback()
+        _r_ReactivePower(v, "setMaxVar", out, inner, nl, "")
+    v = o.setMaxVarNeg
+    if v is not None:
+        if type(v) is not sep.ReactivePower:
+            raise Fallback()
+        _r_ReactivePower(v, "setMaxVarNeg", out, inner, nl, "")
+    v = o.setMaxW
+    if v is not None:
+        if type(v) is not sep.ActivePower:
+            raise Fallback()
+        _r_ActivePower(v, "setMaxW", out, inner, nl, "")
+    v = o.setMaxWh
+    if v is not None:
+        if type(v) is not sep.WattHour:
+            raise Fallback()
+        _r_WattHour(v, "setMaxWh", out, inner, nl, "")
+    v = o.setMinPFOverExcited
+    if v is not None:
+        if type(v) is not sep.PowerFactor:
+            raise Fallback()
+        _r_PowerFactor(v, "setMinPFOverExcited", out, inner, nl, "")
+    v = o.setMinPFUnderExcited
+    if v is not None:
+        if type(v) is not sep.PowerFactor:
+            raise Fallback()
+        _r_PowerFactor(v, "setMinPFUnderExcited", out, inner, nl, "")
+    v = o.setMinV
+    if v is not None:
+        if type(v) is not sep.VoltageRMS:
+            raise Fallback()
+        _r_VoltageRMS(v, "setMinV", out, inner, nl, "")
+    v = o.setSoftGradW
+    if v is not None:
+        _leaf(out, inner, "setSoftGradW", _int(v), nl)
+    v = o.setVNom
+    if v is not None:
+        if type(v) is not sep.VoltageRMS:
+            raise Fallback()
+        _r_VoltageRMS(v, "setVNom", out, inner, nl, "")
+    v = o.setVRef
+    if v is not None:
+        if type(v) is not sep.VoltageRMS:
+            raise Fallback()
+        _r_VoltageRMS(v, "setVRef", out, inner, nl, "")
+    v = o.setVRefOfs
+    if v is not None:
+        if type(v) is not sep.VoltageRMS:
+            raise Fallback()
+        _r_VoltageRMS(v, "setVRefOfs", out, inner, nl, "")
+    v = o.updatedTime
+    if v is not None:
+        _leaf(out, inner, "updatedTime", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_DERStatus(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.alarmStatus
+    if v is not None:
+        _leaf(out, inner, "alarmStatus", _hex(v), nl)
+    v = o.genConnectStatus
+    if v is not None:
+        if type(v) is not sep.ConnectStatusType:
+            raise Fallback()
+        _r_ConnectStatusType(v, "genConnectStatus", out, inner, nl, "")
+    v = o.inverterStatus
+    if v is not None:
+        if type(v) is not sep.InverterStatusType:
+            raise Fallback()
+        _r_InverterStatusType(v, "inverterStatus", out, inner, nl, "")
+    v = o.localControlModeStatus
+    if v is not None:
+        if type(v) is not sep.LocalControlModeStatusType:
+            raise Fallback()
+        _r_LocalControlModeStatusType(v, "localControlModeStatus", out, inner, nl, "")
+    v = o.manufacturerStatus
+    if v is not None:
+        if type(v) is not sep.ManufacturerStatusType:
+            raise Fallback()
+        _r_ManufacturerStatusType(v, "manufacturerStatus", out, inner, nl, "")
+    v = o.operationalModeStatus
+    if v is not None:
+        if type(v) is not sep.OperationalModeStatusType:
+            raise Fallback()
+        _r_OperationalModeStatusType(v, "operationalModeStatus", out, inner, nl, "")
+    v = o.readingTime
+    if v is not None:
+        _leaf(out, inner, "readingTime", _int(v), nl)
+    v = o.stateOfChargeStatus
+    if v is not None:
+        if type(v) is not sep.StateOfChargeStatusType:
+            raise Fallback()
+        _r_StateOfChargeStatusType(v, "stateOfChargeStatus", out, inner, nl, "")
+    v = o.storageModeStatus
+    if v is not None:
+        if type(v) is not sep.StorageModeStatusType:
+            raise Fallback()
+        _r_StorageModeStatusType(v, "storageModeStatus", out, inner, nl, "")
+    v = o.storConnectStatus
+    if v is not None:
+        if type(v) is not sep.ConnectStatusType:
+            raise Fallback()
+        _r_ConnectStatusType(v, "storConnectStatus", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_ConnectStatusType(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.dateTime
+    if v is not None:
+        _leaf(out, inner, "dateTime", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _hex(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_InverterStatusType(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.dateTime
+    if v is not None:
+        _leaf(out, inner, "dateTime", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_LocalControlModeStatusType(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.dateTime
+    if v is not None:
+        _leaf(out, inner, "dateTime", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_ManufacturerStatusType(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.dateTime
+    if v is not None:
+        _leaf(out, inner, "dateTime", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _str(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_OperationalModeStatusType(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.dateTime
+    if v is not None:
+        _leaf(out, inner, "dateTime", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_StateOfChargeStatusType(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.dateTime
+    if v is not None:
+        _leaf(out, inner, "dateTime", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_StorageModeStatusType(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.dateTime
+    if v is not None:
+        _leaf(out, inner, "dateTime", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_DERAvailability(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.availabilityDuration
+    if v is not None:
+        _leaf(out, inner, "availabilityDuration", _int(v), nl)
+    v = o.maxChargeDuration
+    if v is not None:
+        _leaf(out, inner, "maxChargeDuration", _int(v), nl)
+    v = o.readingTime
+    if v is not None:
+        _leaf(out, inner, "readingTime", _int(v), nl)
+    v = o.reserveChargePercent
+    if v is not None:
+        _leaf(out, inner, "reserveChargePercent", _int(v), nl)
+    v = o.reservePercent
+    if v is not None:
+        _leaf(out, inner, "reservePercent", _int(v), nl)
+    v = o.statVarAvail
+    if v is not None:
+        if type(v) is not sep.ReactivePower:
+            raise Fallback()
+        _r_ReactivePower(v, "statVarAvail", out, inner, nl, "")
+    v = o.statWAvail
+    if v is not None:
+        if type(v) is not sep.ActivePower:
+            raise Fallback()
+        _r_ActivePower(v, "statWAvail", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_DERControl(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.replyTo
+    if v is not None:
+        head += _attr("replyTo", _str(v))
+    v = o.responseRequired
+    if v is not None:
+        head += _attr("responseRequired", _hex(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.mRID
+    if v is not None:
+        _leaf(out, inner, "mRID", _hex(v), nl)
+    v = o.description
+    if v is not None:
+        _leaf(out, inner, "description", _str(v), nl)
+    v = o.version
+    if v is not None:
+        _leaf(out, inner, "version", _int(v), nl)
+    v = o.creationTime
+    if v is not None:
+        _leaf(out, inner, "creationTime", _int(v), nl)
+    v = o.EventStatus
+    if v is not None:
+        if type(v) is not sep.EventStatus:
+            raise Fallback()
+        _r_EventStatus(v, "EventStatus", out, inner, nl, "")
+    v = o.interval
+    if v is not None:
+        if type(v) is not sep.DateTimeInterval:
+            raise Fallback()
+        _r_DateTimeInterval(v, "interval", out, inner, nl, "")
+    v = o.randomizeDuration
+    if v is not None:
+        _leaf(out, inner, "randomizeDuration", _int(v), nl)
+    v = o.randomizeStart
+    if v is not None:
+        _leaf(out, inner, "randomizeStart", _int(v), nl)
+    v = o.DERControlBase
+    if v is not None:
+        if type(v) is not sep.DERControlBase:
+            raise Fallback()
+        _r_DERControlBase(v, "DERControlBase", out, inner, nl, "")
+    v = o.deviceCategory
+    if v is not None:
+        _leaf(out, inner, "deviceCategory", _hex(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_EventStatus(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.currentStatus
+    if v is not None:
+        _leaf(out, inner, "currentStatus", _int(v), nl)
+    v = o.dateTime
+    if v is not None:
+        _leaf(out, inner, "dateTime", _int(v), nl)
+    v = o.potentiallySuperseded
+    if v is not None:
+        _leaf(out, inner, "potentiallySuperseded", _bool(v), nl)
+    v = o.potentiallySupersededTime
+    if v is not None:
+        _leaf(out, inner, "potentiallySupersededTime", _int(v), nl)
+    v = o.reason
+    if v is not None:
+        _leaf(out, inner, "reason", _str(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_DateTimeInterval(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.duration
+    if v is not None:
+        _leaf(out, inner, "duration", _int(v), nl)
+    v = o.start
+    if v is not None:
+        _leaf(out, inner, "start", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_DERControlBase(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.opModConnect
+    if v is not None:
+        _leaf(out, inner, "opModConnect", _bool(v), nl)
+    v = o.opModEnergize
+    if v is not None:
+        _leaf(out, inner, "opModEnergize", _bool(v), nl)
+    v = o.opModFixedPFAbsorbW
+    if v is not None:
+        if type(v) is not sep.PowerFactorWithExcitation:
+            raise Fallback()
+        _r_PowerFactorWithExcitation(v, "opModFixedPFAbsorbW", out, inner, nl, "")
+    v = o.opModFixedPFInjectW
+    if v is not None:
+        if type(v) is not sep.PowerFactorWithExcitation:
+            raise Fallback()
+        _r_PowerFactorWithExcitation(v, "opModFixedPFInjectW", out, inner, nl, "")
+    v = o.opModFixedVar
+    if v is not None:
+        if type(v) is not sep.FixedVar:
+            raise Fallback()
+        _r_FixedVar(v, "opModFixedVar", out, inner, nl, "")
+    v = o.opModFixedW
+    if v is not None:
+        _leaf(out, inner, "opModFixedW", _int(v), nl)
+    v = o.opModFreqDroop
+    if v is not None:
+        if type(v) is not sep.FreqDroopType:
+            raise Fallback()
+        _r_FreqDroopType(v, "opModFreqDroop", out, inner, nl, "")
+    v = o.opModFreqWatt
+    if v is not None:
+        if type(v) is not sep.DERCurveLink:
+            raise Fallback()
+        _r_DERCurveLink(v, "opModFreqWatt", out, inner, nl, "")
+    v = o.opModHFRTMayTrip
+    if v is not None:
+        if type(v) is not sep.DERCurveLink:
+            raise Fallback()
+        _r_DERCurveLink(v, "opModHFRTMayTrip", out, inner, nl, "")
+    v = o.opModHFRTMustTrip
+    if v is not None:
+        if type(v) is not sep.DERCurveLink:
+            raise Fallback()
+        _r_DERCurveLink(v, "opModHFRTMustTrip", out, inner, nl, "")
+    v = o.opModHVRTMayTrip
+    if v is not None:
+        if type(v) is not sep.DERCurveLink:
+            raise Fallback()
+        _r_DERCurveLink(v, "opModHVRTMayTrip", out, inner, nl, "")
+    v = o.opModHVRTMomentaryCessation
+    if v is not None:
+        if type(v) is not sep.DERCurveLink:
+            raise Fallback()
+        _r_DERCurveLink(v, "opModHVRTMomentaryCessation", out, inner, nl, "")
+    v = o.opModHVRTMustTrip
+    if v is not None:
+        if type(v) is not sep.DERCurveLink:
+            raise Fallback()
+        _r_DERCurveLink(v, "opModHVRTMustTrip", out, inner, nl, "")
+    v = o.opModLFRTMayTrip
+    if v is not None:
+        if type(v) is not sep.DERCurveLink:
+            raise Fallback()
+        _r_DERCurveLink(v, "opModLFRTMayTrip", out, inner, nl, "")
+    v = o.opModLFRTMustTrip
+    if v is not None:
+        if type(v) is not sep.DERCurveLink:
+            raise Fallback()
+        _r_DERCurveLink(v, "opModLFRTMustTrip", out, inner, nl, "")
+    v = o.opModLVRTMayTrip
+    if v is not None:
+        if type(v) is not sep.DERCurveLink:
+            raise Fallback()
+        _r_DERCurveLink(v, "opModLVRTMayTrip", out, inner, nl, "")
+    v = o.opModLVRTMomentaryCessation
+    if v is not None:
+        if type(v) is not sep.DERCurveLink:
+            raise Fallback()
+        _r_DERCurveLink(v, "opModLVRTMomentaryCessation", out, inner, nl, "")
+    v = o.opModLVRTMustTrip
+    if v is not None:
+        if type(v) is not sep.DERCurveLink:
+            raise Fallback()
+        _r_DERCurveLink(v, "opModLVRTMustTrip", out, inner, nl, "")
+    v = o.opModMaxLimW
+    if v is not None:
+        _leaf(out, inner, "opModMaxLimW", _int(v), nl)
+    v = o.opModTargetVar
+    if v is not None:
+        if type(v) is not sep.ReactivePower:
+            raise Fallback()
+        _r_ReactivePower(v, "opModTargetVar", out, inner, nl, "")
+    v = o.opModTargetW
+    if v is not None:
+        if type(v) is not sep.ActivePower:
+            raise Fallback()
+        _r_ActivePower(v, "opModTargetW", out, inner, nl, "")
+    v = o.opModVoltVar
+    if v is not None:
+        if type(v) is not sep.DERCurveLink:
+            raise Fallback()
+        _r_DERCurveLink(v, "opModVoltVar", out, inner, nl, "")
+    v = o.opModVoltWatt
+    if v is not None:
+        if type(v) is not sep.DERCurveLink:
+            raise Fallback()
+        _r_DERCurveLink(v, "opModVoltWatt", out, inner, nl, "")
+    v = o.opModWattPF
+    if v is not None:
+        if type(v) is not sep.DERCurveLink:
+            raise Fallback()
+        _r_DERCurveLink(v, "opModWattPF", out, inner, nl, "")
+    v = o.opModWattVar
+    if v is not None:
+        if type(v) is not sep.DERCurveLink:
+            raise Fallback()
+        _r_DERCurveLink(v, "opModWattVar", out, inner, nl, "")
+    v = o.rampTms
+    if v is not None:
+        _leaf(out, inner, "rampTms", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_PowerFactorWithExcitation(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.displacement
+    if v is not None:
+        _leaf(out, inner, "displacement", _int(v), nl)
+    v = o.excitation
+    if v is not None:
+        _leaf(out, inner, "excitation", _bool(v), nl)
+    v = o.multiplier
+    if v is not None:
+        _leaf(out, inner, "multiplier", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_FixedVar(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.refType
+    if v is not None:
+        _leaf(out, inner, "refType", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_FreqDroopType(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.dBOF
+    if v is not None:
+        _leaf(out, inner, "dBOF", _int(v), nl)
+    v = o.dBUF
+    if v is not None:
+        _leaf(out, inner, "dBUF", _int(v), nl)
+    v = o.kOF
+    if v is not None:
+        _leaf(out, inner, "kOF", _int(v), nl)
+    v = o.kUF
+    if v is not None:
+        _leaf(out, inner, "kUF", _int(v), nl)
+    v = o.openLoopTms
+    if v is not None:
+        _leaf(out, inner, "openLoopTms", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_DERCurveLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_DERControlList(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    v = o.results
+    if v is not None:
+        head += _attr("results", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    for v in o.DERControl or ():
+        if v is None:
+            continue
+        if type(v) is not sep.DERControl:
+            raise Fallback()
+        _r_DERControl(v, "DERControl", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_DefaultDERControl(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.mRID
+    if v is not None:
+        _leaf(out, inner, "mRID", _hex(v), nl)
+    v = o.description
+    if v is not None:
+        _leaf(out, inner, "description", _str(v), nl)
+    v = o.version
+    if v is not None:
+        _leaf(out, inner, "version", _int(v), nl)
+    v = o.DERControlBase
+    if v is not None:
+        if type(v) is not sep.DERControlBase:
+            raise Fallback()
+        _r_DERControlBase(v, "DERControlBase", out, inner, nl, "")
+    v = o.setESDelay
+    if v is not None:
+        _leaf(out, inner, "setESDelay", _int(v), nl)
+    v = o.setESHighFreq
+    if v is not None:
+        _leaf(out, inner, "setESHighFreq", _int(v), nl)
+    v = o.setESHighVolt
+    if v is not None:
+        _leaf(out, inner, "setESHighVolt", _int(v), nl)
+    v = o.setESLowFreq
+    if v is not None:
+        _leaf(out, inner, "setESLowFreq", _int(v), nl)
+    v = o.setESLowVolt
+    if v is not None:
+        _leaf(out, inner, "setESLowVolt", _int(v), nl)
+    v = o.setESRampTms
+    if v is not None:
+        _leaf(out, inner, "setESRampTms", _int(v), nl)
+    v = o.setESRandomDelay
+    if v is not None:
+        _leaf(out, inner, "setESRandomDelay", _int(v), nl)
+    v = o.setGradW
+    if v is not None:
+        _leaf(out, inner, "setGradW", _int(v), nl)
+    v = o.setSoftGradW
+    if v is not None:
+        _leaf(out, inner, "setSoftGradW", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_DERProgram(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.mRID
+    if v is not None:
+        _leaf(out, inner, "mRID", _hex(v), nl)
+    v = o.description
+    if v is not None:
+        _leaf(out, inner, "description", _str(v), nl)
+    v = o.version
+    if v is not None:
+        _leaf(out, inner, "version", _int(v), nl)
+    v = o.ActiveDERControlListLink
+    if v is not None:
+        if type(v) is not sep.ActiveDERControlListLink:
+            raise Fallback()
+        _r_ActiveDERControlListLink(v, "ActiveDERControlListLink", out, inner, nl, "")
+    v = o.DefaultDERControlLink
+    if v is not None:
+        if type(v) is not sep.DefaultDERControlLink:
+            raise Fallback()
+        _r_DefaultDERControlLink(v, "DefaultDERControlLink", out, inner, nl, "")
+    v = o.DERControlListLink
+    if v is not None:
+        if type(v) is not sep.DERControlListLink:
+            raise Fallback()
+        _r_DERControlListLink(v, "DERControlListLink", out, inner, nl, "")
+    v = o.DERCurveListLink
+    if v is not None:
+        if type(v) is not sep.DERCurveListLink:
+            raise Fallback()
+        _r_DERCurveListLink(v, "DERCurveListLink", out, inner, nl, "")
+    v = o.primacy
+    if v is not None:
+        _leaf(out, inner, "primacy", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_ActiveDERControlListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_DefaultDERControlLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_DERControlListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_DERCurveListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_DERProgramList(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    v = o.results
+    if v is not None:
+        head += _attr("results", _int(v))
+    v = o.pollRate
+    if v is not None:
+        head += _attr("pollRate", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    for v in o.DERProgram or ():
+        if v is None:
+            continue
+        if type(v) is not sep.DERProgram:
+            raise Fallback()
+        _r_DERProgram(v, "DERProgram", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_DERCurve(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.mRID
+    if v is not None:
+        _leaf(out, inner, "mRID", _hex(v), nl)
+    v = o.description
+    if v is not None:
+        _leaf(out, inner, "description", _str(v), nl)
+    v = o.version
+    if v is not None:
+        _leaf(out, inner, "version", _int(v), nl)
+    v = o.autonomousVRefEnable
+    if v is not None:
+        _leaf(out, inner, "autonomousVRefEnable", _bool(v), nl)
+    v = o.autonomousVRefTimeConstant
+    if v is not None:
+        _leaf(out, inner, "autonomousVRefTimeConstant", _int(v), nl)
+    v = o.creationTime
+    if v is not None:
+        _leaf(out, inner, "creationTime", _int(v), nl)
+    for v in o.CurveData or ():
+        if v is None:
+            continue
+        if type(v) is not sep.CurveData:
+            raise Fallback()
+        _r_CurveData(v, "CurveData", out, inner, nl, "")
+    v = o.curveType
+    if v is not None:
+        _leaf(out, inner, "curveType", _int(v), nl)
+    v = o.openLoopTms
+    if v is not None:
+        _leaf(out, inner, "openLoopTms", _int(v), nl)
+    v = o.rampDecTms
+    if v is not None:
+        _leaf(out, inner, "rampDecTms", _int(v), nl)
+    v = o.rampIncTms
+    if v is not None:
+        _leaf(out, inner, "rampIncTms", _int(v), nl)
+    v = o.rampPT1Tms
+    if v is not None:
+        _leaf(out, inner, "rampPT1Tms", _int(v), nl)
+    v = o.vRef
+    if v is not None:
+        _leaf(out, inner, "vRef", _int(v), nl)
+    v = o.xMultiplier
+    if v is not None:
+        _leaf(out, inner, "xMultiplier", _int(v), nl)
+    v = o.yMultiplier
+    if v is not None:
+        _leaf(out, inner, "yMultiplier", _int(v), nl)
+    v = o.yRefType
+    if v is not None:
+        _leaf(out, inner, "yRefType", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_CurveData(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.excitation
+    if v is not None:
+        _leaf(out, inner, "excitation", _bool(v), nl)
+    v = o.xvalue
+    if v is not None:
+        _leaf(out, inner, "xvalue", _int(v), nl)
+    v = o.yvalue
+    if v is not None:
+        _leaf(out, inner, "yvalue", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_DERCurveList(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    v = o.results
+    if v is not None:
+        head += _attr("results", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    for v in o.DERCurve or ():
+        if v is None:
+            continue
+        if type(v) is not sep.DERCurve:
+            raise Fallback()
+        _r_DERCurve(v, "DERCurve", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_MirrorUsagePoint(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.mRID
+    if v is not None:
+        _leaf(out, inner, "mRID", _hex(v), nl)
+    v = o.description
+    if v is not None:
+        _leaf(out, inner, "description", _str(v), nl)
+    v = o.version
+    if v is not None:
+        _leaf(out, inner, "version", _int(v), nl)
+    v = o.roleFlags
+    if v is not None:
+        _leaf(out, inner, "roleFlags", _hex(v), nl)
+    v = o.serviceCategoryKind
+    if v is not None:
+        _leaf(out, inner, "serviceCategoryKind", _int(v), nl)
+    v = o.status
+    if v is not None:
+        _leaf(out, inner, "status", _int(v), nl)
+    v = o.deviceLFDI
+    if v is not None:
+        _leaf(out, inner, "deviceLFDI", _hex(v), nl)
+    for v in o.MirrorMeterReading or ():
+        if v is None:
+            continue
+        if type(v) is not sep.MirrorMeterReading:
+            raise Fallback()
+        _r_MirrorMeterReading(v, "MirrorMeterReading", out, inner, nl, "")
+    v = o.postRate
+    if v is not None:
+        _leaf(out, inner, "postRate", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_MirrorMeterReading(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.mRID
+    if v is not None:
+        _leaf(out, inner, "mRID", _hex(v), nl)
+    v = o.description
+    if v is not None:
+        _leaf(out, inner, "description", _str(v), nl)
+    v = o.version
+    if v is not None:
+        _leaf(out, inner, "version", _int(v), nl)
+    v = o.lastUpdateTime
+    if v is not None:
+        _leaf(out, inner, "lastUpdateTime", _int(v), nl)
+    for v in o.MirrorReadingSet or ():
+        if v is None:
+            continue
+        if type(v) is not sep.MirrorReadingSet:
+            raise Fallback()
+        _r_MirrorReadingSet(v, "MirrorReadingSet", out, inner, nl, "")
+    v = o.nextUpdateTime
+    if v is not None:
+        _leaf(out, inner, "nextUpdateTime", _int(v), nl)
+    v = o.Reading
+    if v is not None:
+        if type(v) is not sep.Reading:
+            raise Fallback()
+        _r_Reading(v, "Reading", out, inner, nl, "")
+    v = o.ReadingType
+    if v is not None:
+        if type(v) is not sep.ReadingType:
+            raise Fallback()
+        _r_ReadingType(v, "ReadingType", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_MirrorReadingSet(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.mRID
+    if v is not None:
+        _leaf(out, inner, "mRID", _hex(v), nl)
+    v = o.description
+    if v is not None:
+        _leaf(out, inner, "description", _str(v), nl)
+    v = o.version
+    if v is not None:
+        _leaf(out, inner, "version", _int(v), nl)
+    v = o.timePeriod
+    if v is not None:
+        if type(v) is not sep.DateTimeInterval:
+            raise Fallback()
+        _r_DateTimeInterval(v, "timePeriod", out, inner, nl, "")
+    for v in o.Reading or ():
+        if v is None:
+            continue
+        if type(v) is not sep.Reading:
+            raise Fallback()
+        _r_Reading(v, "Reading", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_Reading(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.consumptionBlock
+    if v is not None:
+        _leaf(out, inner, "consumptionBlock", _int(v), nl)
+    v = o.qualityFlags
+    if v is not None:
+        _leaf(out, inner, "qualityFlags", _hex(v), nl)
+    v = o.timePeriod
+    if v is not None:
+        if type(v) is not sep.DateTimeInterval:
+            raise Fallback()
+        _r_DateTimeInterval(v, "timePeriod", out, inner, nl, "")
+    v = o.touTier
+    if v is not None:
+        _leaf(out, inner, "touTier", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _int(v), nl)
+    v = o.localID
+    if v is not None:
+        _leaf(out, inner, "localID", _hex(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_ReadingType(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.accumulationBehaviour
+    if v is not None:
+        _leaf(out, inner, "accumulationBehaviour", _int(v), nl)
+    v = o.calorificValue
+    if v is not None:
+        if type(v) is not sep.UnitValueType:
+            raise Fallback()
+        _r_UnitValueType(v, "calorificValue", out, inner, nl, "")
+    v = o.commodity
+    if v is not None:
+        _leaf(out, inner, "commodity", _int(v), nl)
+    v = o.conversionFactor
+    if v is not None:
+        if type(v) is not sep.UnitValueType:
+            raise Fallback()
+        _r_UnitValueType(v, "conversionFactor", out, inner, nl, "")
+    v = o.dataQualifier
+    if v is not None:
+        _leaf(out, inner, "dataQualifier", _int(v), nl)
+    v = o.flowDirection
+    if v is not None:
+        _leaf(out, inner, "flowDirection", _int(v), nl)
+    v = o.intervalLength
+    if v is not None:
+        _leaf(out, inner, "intervalLength", _int(v), nl)
+    v = o.kind
+    if v is not None:
+        _leaf(out, inner, "kind", _int(v), nl)
+    v = o.maxNumberOfIntervals
+    if v is not None:
+        _leaf(out, inner, "maxNumberOfIntervals", _int(v), nl)
+    v = o.numberOfConsumptionBlocks
+    if v is not None:
+        _leaf(out, inner, "numberOfConsumptionBlocks", _int(v), nl)
+    v = o.numberOfTouTiers
+    if v is not None:
+        _leaf(out, inner, "numberOfTouTiers", _int(v), nl)
+    v = o.phase
+    if v is not None:
+        _leaf(out, inner, "phase", _int(v), nl)
+    v = o.powerOfTenMultiplier
+    if v is not None:
+        _leaf(out, inner, "powerOfTenMultiplier", _int(v), nl)
+    v = o.subIntervalLength
+    if v is not None:
+        _leaf(out, inner, "subIntervalLength", _int(v), nl)
+    v = o.supplyLimit
+    if v is not None:
+        _leaf(out, inner, "supplyLimit", _int(v), nl)
+    v = o.tieredConsumptionBlocks
+    if v is not None:
+        _leaf(out, inner, "tieredConsumptionBlocks", _bool(v), nl)
+    v = o.uom
+    if v is not None:
+        _leaf(out, inner, "uom", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_UnitValueType(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.multiplier
+    if v is not None:
+        _leaf(out, inner, "multiplier", _int(v), nl)
+    v = o.unit
+    if v is not None:
+        _leaf(out, inner, "unit", _int(v), nl)
+    v = o.value
+    if v is not None:
+        _leaf(out, inner, "value", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_MirrorUsagePointList(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    v = o.results
+    if v is not None:
+        head += _attr("results", _int(v))
+    v = o.pollRate
+    if v is not None:
+        head += _attr("pollRate", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    for v in o.MirrorUsagePoint or ():
+        if v is None:
+            continue
+        if type(v) is not sep.MirrorUsagePoint:
+            raise Fallback()
+        _r_MirrorUsagePoint(v, "MirrorUsagePoint", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_MirrorMeterReadingList(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    v = o.results
+    if v is not None:
+        head += _attr("results", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    for v in o.MirrorMeterReading or ():
+        if v is None:
+            continue
+        if type(v) is not sep.MirrorMeterReading:
+            raise Fallback()
+        _r_MirrorMeterReading(v, "MirrorMeterReading", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_ReadingList(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    v = o.results
+    if v is not None:
+        head += _attr("results", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    for v in o.Reading or ():
+        if v is None:
+            continue
+        if type(v) is not sep.Reading:
+            raise Fallback()
+        _r_Reading(v, "Reading", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_ReadingSet(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.mRID
+    if v is not None:
+        _leaf(out, inner, "mRID", _hex(v), nl)
+    v = o.description
+    if v is not None:
+        _leaf(out, inner, "description", _str(v), nl)
+    v = o.version
+    if v is not None:
+        _leaf(out, inner, "version", _int(v), nl)
+    v = o.timePeriod
+    if v is not None:
+        if type(v) is not sep.DateTimeInterval:
+            raise Fallback()
+        _r_DateTimeInterval(v, "timePeriod", out, inner, nl, "")
+    v = o.ReadingListLink
+    if v is not None:
+        if type(v) is not sep.ReadingListLink:
+            raise Fallback()
+        _r_ReadingListLink(v, "ReadingListLink", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_ReadingListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_ReadingSetList(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    v = o.results
+    if v is not None:
+        head += _attr("results", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    for v in o.ReadingSet or ():
+        if v is None:
+            continue
+        if type(v) is not sep.ReadingSet:
+            raise Fallback()
+        _r_ReadingSet(v, "ReadingSet", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_MeterReading(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.mRID
+    if v is not None:
+        _leaf(out, inner, "mRID", _hex(v), nl)
+    v = o.description
+    if v is not None:
+        _leaf(out, inner, "description", _str(v), nl)
+    v = o.version
+    if v is not None:
+        _leaf(out, inner, "version", _int(v), nl)
+    v = o.RateComponentListLink
+    if v is not None:
+        if type(v) is not sep.RateComponentListLink:
+            raise Fallback()
+        _r_RateComponentListLink(v, "RateComponentListLink", out, inner, nl, "")
+    v = o.ReadingLink
+    if v is not None:
+        if type(v) is not sep.ReadingLink:
+            raise Fallback()
+        _r_ReadingLink(v, "ReadingLink", out, inner, nl, "")
+    v = o.ReadingSetListLink
+    if v is not None:
+        if type(v) is not sep.ReadingSetListLink:
+            raise Fallback()
+        _r_ReadingSetListLink(v, "ReadingSetListLink", out, inner, nl, "")
+    v = o.ReadingTypeLink
+    if v is not None:
+        if type(v) is not sep.ReadingTypeLink:
+            raise Fallback()
+        _r_ReadingTypeLink(v, "ReadingTypeLink", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_RateComponentListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_ReadingLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_ReadingSetListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_ReadingTypeLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_MeterReadingList(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    v = o.results
+    if v is not None:
+        head += _attr("results", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    for v in o.MeterReading or ():
+        if v is None:
+            continue
+        if type(v) is not sep.MeterReading:
+            raise Fallback()
+        _r_MeterReading(v, "MeterReading", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_UsagePoint(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.mRID
+    if v is not None:
+        _leaf(out, inner, "mRID", _hex(v), nl)
+    v = o.description
+    if v is not None:
+        _leaf(out, inner, "description", _str(v), nl)
+    v = o.version
+    if v is not None:
+        _leaf(out, inner, "version", _int(v), nl)
+    v = o.roleFlags
+    if v is not None:
+        _leaf(out, inner, "roleFlags", _hex(v), nl)
+    v = o.serviceCategoryKind
+    if v is not None:
+        _leaf(out, inner, "serviceCategoryKind", _int(v), nl)
+    v = o.status
+    if v is not None:
+        _leaf(out, inner, "status", _int(v), nl)
+    v = o.deviceLFDI
+    if v is not None:
+        _leaf(out, inner, "deviceLFDI", _hex(v), nl)
+    v = o.MeterReadingListLink
+    if v is not None:
+        if type(v) is not sep.MeterReadingListLink:
+            raise Fallback()
+        _r_MeterReadingListLink(v, "MeterReadingListLink", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_MeterReadingListLink(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    out.append(f"{head}/>{nl}")
+
+
+def _r_UsagePointList(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    v = o.results
+    if v is not None:
+        head += _attr("results", _int(v))
+    v = o.pollRate
+    if v is not None:
+        head += _attr("pollRate", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    for v in o.UsagePoint or ():
+        if v is None:
+            continue
+        if type(v) is not sep.UsagePoint:
+            raise Fallback()
+        _r_UsagePoint(v, "UsagePoint", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_Time(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.pollRate
+    if v is not None:
+        head += _attr("pollRate", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.currentTime
+    if v is not None:
+        _leaf(out, inner, "currentTime", _int(v), nl)
+    v = o.dstEndTime
+    if v is not None:
+        _leaf(out, inner, "dstEndTime", _int(v), nl)
+    v = o.dstOffset
+    if v is not None:
+        _leaf(out, inner, "dstOffset", _int(v), nl)
+    v = o.dstStartTime
+    if v is not None:
+        _leaf(out, inner, "dstStartTime", _int(v), nl)
+    v = o.localTime
+    if v is not None:
+        _leaf(out, inner, "localTime", _int(v), nl)
+    v = o.quality
+    if v is not None:
+        _leaf(out, inner, "quality", _int(v), nl)
+    v = o.tzOffset
+    if v is not None:
+        _leaf(out, inner, "tzOffset", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_LogEvent(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    v = o.createdDateTime
+    if v is not None:
+        _leaf(out, inner, "createdDateTime", _int(v), nl)
+    v = o.details
+    if v is not None:
+        _leaf(out, inner, "details", _str(v), nl)
+    v = o.extendedData
+    if v is not None:
+        _leaf(out, inner, "extendedData", _int(v), nl)
+    v = o.functionSet
+    if v is not None:
+        _leaf(out, inner, "functionSet", _int(v), nl)
+    v = o.logEventCode
+    if v is not None:
+        _leaf(out, inner, "logEventCode", _int(v), nl)
+    v = o.logEventID
+    if v is not None:
+        _leaf(out, inner, "logEventID", _int(v), nl)
+    v = o.logEventPEN
+    if v is not None:
+        _leaf(out, inner, "logEventPEN", _int(v), nl)
+    v = o.profileID
+    if v is not None:
+        _leaf(out, inner, "profileID", _int(v), nl)
+    _close(out, start, head, ind, tag, nl)
+
+
+def _r_LogEventList(o, tag, out, ind, nl, ns):
+    head = f"{ind}<{tag}{ns}"
+    v = o.href
+    if v is not None:
+        head += _attr("href", _str(v))
+    v = o.subscribable
+    if v is not None:
+        head += _attr("subscribable", _int(v))
+    v = o.all
+    if v is not None:
+        head += _attr("all", _int(v))
+    v = o.results
+    if v is not None:
+        head += _attr("results", _int(v))
+    v = o.pollRate
+    if v is not None:
+        head += _attr("pollRate", _int(v))
+    start = len(out)
+    out.append(head)
+    inner = ind + "  " if nl else ""
+    for v in o.LogEvent or ():
+        if v is None:
+            continue
+        if type(v) is not sep.LogEvent:
+            raise Fallback()
+        _r_LogEvent(v, "LogEvent", out, inner, nl, "")
+    _close(out, start, head, ind, tag, nl)
+
+
+def _p_DeviceCapability(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DeviceCapability)
+    _parse_children(el, kw, _E_DeviceCapability)
+    return sep.DeviceCapability(**kw)
+
+
+def _p_CustomerAccountListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_CustomerAccountListLink)
+    _parse_children(el, kw, _E_CustomerAccountListLink)
+    return sep.CustomerAccountListLink(**kw)
+
+
+def _p_DemandResponseProgramListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DemandResponseProgramListLink)
+    _parse_children(el, kw, _E_DemandResponseProgramListLink)
+    return sep.DemandResponseProgramListLink(**kw)
+
+
+def _p_DERProgramListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERProgramListLink)
+    _parse_children(el, kw, _E_DERProgramListLink)
+    return sep.DERProgramListLink(**kw)
+
+
+def _p_FileListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_FileListLink)
+    _parse_children(el, kw, _E_FileListLink)
+    return sep.FileListLink(**kw)
+
+
+def _p_MessagingProgramListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_MessagingProgramListLink)
+    _parse_children(el, kw, _E_MessagingProgramListLink)
+    return sep.MessagingProgramListLink(**kw)
+
+
+def _p_PrepaymentListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_PrepaymentListLink)
+    _parse_children(el, kw, _E_PrepaymentListLink)
+    return sep.PrepaymentListLink(**kw)
+
+
+def _p_ResponseSetListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_ResponseSetListLink)
+    _parse_children(el, kw, _E_ResponseSetListLink)
+    return sep.ResponseSetListLink(**kw)
+
+
+def _p_TariffProfileListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_TariffProfileListLink)
+    _parse_children(el, kw, _E_TariffProfileListLink)
+    return sep.TariffProfileListLink(**kw)
+
+
+def _p_TimeLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_TimeLink)
+    _parse_children(el, kw, _E_TimeLink)
+    return sep.TimeLink(**kw)
+
+
+def _p_UsagePointListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_UsagePointListLink)
+    _parse_children(el, kw, _E_UsagePointListLink)
+    return sep.UsagePointListLink(**kw)
+
+
+def _p_EndDeviceListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_EndDeviceListLink)
+    _parse_children(el, kw, _E_EndDeviceListLink)
+    return sep.EndDeviceListLink(**kw)
+
+
+def _p_MirrorUsagePointListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_MirrorUsagePointListLink)
+    _parse_children(el, kw, _E_MirrorUsagePointListLink)
+    return sep.MirrorUsagePointListLink(**kw)
+
+
+def _p_SelfDeviceLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_SelfDeviceLink)
+    _parse_children(el, kw, _E_SelfDeviceLink)
+    return sep.SelfDeviceLink(**kw)
+
+
+def _p_EndDevice(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_EndDevice)
+    _parse_children(el, kw, _E_EndDevice)
+    return sep.EndDevice(**kw)
+
+
+def _p_ConfigurationLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_ConfigurationLink)
+    _parse_children(el, kw, _E_ConfigurationLink)
+    return sep.ConfigurationLink(**kw)
+
+
+def _p_DERListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERListLink)
+    _parse_children(el, kw, _E_DERListLink)
+    return sep.DERListLink(**kw)
+
+
+def _p_DeviceInformationLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DeviceInformationLink)
+    _parse_children(el, kw, _E_DeviceInformationLink)
+    return sep.DeviceInformationLink(**kw)
+
+
+def _p_DeviceStatusLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DeviceStatusLink)
+    _parse_children(el, kw, _E_DeviceStatusLink)
+    return sep.DeviceStatusLink(**kw)
+
+
+def _p_FileStatusLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_FileStatusLink)
+    _parse_children(el, kw, _E_FileStatusLink)
+    return sep.FileStatusLink(**kw)
+
+
+def _p_IPInterfaceListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_IPInterfaceListLink)
+    _parse_children(el, kw, _E_IPInterfaceListLink)
+    return sep.IPInterfaceListLink(**kw)
+
+
+def _p_LoadShedAvailabilityListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_LoadShedAvailabilityListLink)
+    _parse_children(el, kw, _E_LoadShedAvailabilityListLink)
+    return sep.LoadShedAvailabilityListLink(**kw)
+
+
+def _p_LogEventListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_LogEventListLink)
+    _parse_children(el, kw, _E_LogEventListLink)
+    return sep.LogEventListLink(**kw)
+
+
+def _p_PowerStatusLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_PowerStatusLink)
+    _parse_children(el, kw, _E_PowerStatusLink)
+    return sep.PowerStatusLink(**kw)
+
+
+def _p_FlowReservationRequestListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_FlowReservationRequestListLink)
+    _parse_children(el, kw, _E_FlowReservationRequestListLink)
+    return sep.FlowReservationRequestListLink(**kw)
+
+
+def _p_FlowReservationResponseListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_FlowReservationResponseListLink)
+    _parse_children(el, kw, _E_FlowReservationResponseListLink)
+    return sep.FlowReservationResponseListLink(**kw)
+
+
+def _p_FunctionSetAssignmentsListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_FunctionSetAssignmentsListLink)
+    _parse_children(el, kw, _E_FunctionSetAssignmentsListLink)
+    return sep.FunctionSetAssignmentsListLink(**kw)
+
+
+def _p_RegistrationLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_RegistrationLink)
+    _parse_children(el, kw, _E_RegistrationLink)
+    return sep.RegistrationLink(**kw)
+
+
+def _p_SubscriptionListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_SubscriptionListLink)
+    _parse_children(el, kw, _E_SubscriptionListLink)
+    return sep.SubscriptionListLink(**kw)
+
+
+def _p_EndDeviceList(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_EndDeviceList)
+    _parse_children(el, kw, _E_EndDeviceList)
+    return sep.EndDeviceList(**kw)
+
+
+def _p_Registration(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_Registration)
+    _parse_children(el, kw, _E_Registration)
+    return sep.Registration(**kw)
+
+
+def _p_FunctionSetAssignments(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_FunctionSetAssignments)
+    _parse_children(el, kw, _E_FunctionSetAssignments)
+    return sep.FunctionSetAssignments(**kw)
+
+
+def _p_FunctionSetAssignmentsList(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_FunctionSetAssignmentsList)
+    _parse_children(el, kw, _E_FunctionSetAssignmentsList)
+    return sep.FunctionSetAssignmentsList(**kw)
+
+
+def _p_DER(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DER)
+    _parse_children(el, kw, _E_DER)
+    return sep.DER(**kw)
+
+
+def _p_AssociatedDERProgramListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_AssociatedDERProgramListLink)
+    _parse_children(el, kw, _E_AssociatedDERProgramListLink)
+    return sep.AssociatedDERProgramListLink(**kw)
+
+
+def _p_AssociatedUsagePointLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_AssociatedUsagePointLink)
+    _parse_children(el, kw, _E_AssociatedUsagePointLink)
+    return sep.AssociatedUsagePointLink(**kw)
+
+
+def _p_CurrentDERProgramLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_CurrentDERProgramLink)
+    _parse_children(el, kw, _E_CurrentDERProgramLink)
+    return sep.CurrentDERProgramLink(**kw)
+
+
+def _p_DERAvailabilityLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERAvailabilityLink)
+    _parse_children(el, kw, _E_DERAvailabilityLink)
+    return sep.DERAvailabilityLink(**kw)
+
+
+def _p_DERCapabilityLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERCapabilityLink)
+    _parse_children(el, kw, _E_DERCapabilityLink)
+    return sep.DERCapabilityLink(**kw)
+
+
+def _p_DERSettingsLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERSettingsLink)
+    _parse_children(el, kw, _E_DERSettingsLink)
+    return sep.DERSettingsLink(**kw)
+
+
+def _p_DERStatusLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERStatusLink)
+    _parse_children(el, kw, _E_DERStatusLink)
+    return sep.DERStatusLink(**kw)
+
+
+def _p_DERList(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERList)
+    _parse_children(el, kw, _E_DERList)
+    return sep.DERList(**kw)
+
+
+def _p_DERCapability(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERCapability)
+    _parse_children(el, kw, _E_DERCapability)
+    return sep.DERCapability(**kw)
+
+
+def _p_CurrentRMS(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_CurrentRMS)
+    _parse_children(el, kw, _E_CurrentRMS)
+    return sep.CurrentRMS(**kw)
+
+
+def _p_AmpereHour(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_AmpereHour)
+    _parse_children(el, kw, _E_AmpereHour)
+    return sep.AmpereHour(**kw)
+
+
+def _p_ApparentPower(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_ApparentPower)
+    _parse_children(el, kw, _E_ApparentPower)
+    return sep.ApparentPower(**kw)
+
+
+def _p_ActivePower(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_ActivePower)
+    _parse_children(el, kw, _E_ActivePower)
+    return sep.ActivePower(**kw)
+
+
+def _p_VoltageRMS(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_VoltageRMS)
+    _parse_children(el, kw, _E_VoltageRMS)
+    return sep.VoltageRMS(**kw)
+
+
+def _p_ReactivePower(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_ReactivePower)
+    _parse_children(el, kw, _E_ReactivePower)
+    return sep.ReactivePower(**kw)
+
+
+def _p_WattHour(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_WattHour)
+    _parse_children(el, kw, _E_WattHour)
+    return sep.WattHour(**kw)
+
+
+def _p_PowerFactor(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_PowerFactor)
+    _parse_children(el, kw, _E_PowerFactor)
+    return sep.PowerFactor(**kw)
+
+
+def _p_ReactiveSusceptance(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_ReactiveSusceptance)
+    _parse_children(el, kw, _E_ReactiveSusceptance)
+    return sep.ReactiveSusceptance(**kw)
+
+
+def _p_DERSettings(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERSettings)
+    _parse_children(el, kw, _E_DERSettings)
+    return sep.DERSettings(**kw)
+
+
+def _p_DERStatus(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERStatus)
+    _parse_children(el, kw, _E_DERStatus)
+    return sep.DERStatus(**kw)
+
+
+def _p_ConnectStatusType(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_ConnectStatusType)
+    _parse_children(el, kw, _E_ConnectStatusType)
+    return sep.ConnectStatusType(**kw)
+
+
+def _p_InverterStatusType(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_InverterStatusType)
+    _parse_children(el, kw, _E_InverterStatusType)
+    return sep.InverterStatusType(**kw)
+
+
+def _p_LocalControlModeStatusType(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_LocalControlModeStatusType)
+    _parse_children(el, kw, _E_LocalControlModeStatusType)
+    return sep.LocalControlModeStatusType(**kw)
+
+
+def _p_ManufacturerStatusType(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_ManufacturerStatusType)
+    _parse_children(el, kw, _E_ManufacturerStatusType)
+    return sep.ManufacturerStatusType(**kw)
+
+
+def _p_OperationalModeStatusType(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_OperationalModeStatusType)
+    _parse_children(el, kw, _E_OperationalModeStatusType)
+    return sep.OperationalModeStatusType(**kw)
+
+
+def _p_StateOfChargeStatusType(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_StateOfChargeStatusType)
+    _parse_children(el, kw, _E_StateOfChargeStatusType)
+    return sep.StateOfChargeStatusType(**kw)
+
+
+def _p_StorageModeStatusType(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_StorageModeStatusType)
+    _parse_children(el, kw, _E_StorageModeStatusType)
+    return sep.StorageModeStatusType(**kw)
+
+
+def _p_DERAvailability(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERAvailability)
+    _parse_children(el, kw, _E_DERAvailability)
+    return sep.DERAvailability(**kw)
+
+
+def _p_DERControl(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERControl)
+    _parse_children(el, kw, _E_DERControl)
+    return sep.DERControl(**kw)
+
+
+def _p_EventStatus(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_EventStatus)
+    _parse_children(el, kw, _E_EventStatus)
+    return sep.EventStatus(**kw)
+
+
+def _p_DateTimeInterval(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DateTimeInterval)
+    _parse_children(el, kw, _E_DateTimeInterval)
+    return sep.DateTimeInterval(**kw)
+
+
+def _p_DERControlBase(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERControlBase)
+    _parse_children(el, kw, _E_DERControlBase)
+    return sep.DERControlBase(**kw)
+
+
+def _p_PowerFactorWithExcitation(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_PowerFactorWithExcitation)
+    _parse_children(el, kw, _E_PowerFactorWithExcitation)
+    return sep.PowerFactorWithExcitation(**kw)
+
+
+def _p_FixedVar(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_FixedVar)
+    _parse_children(el, kw, _E_FixedVar)
+    return sep.FixedVar(**kw)
+
+
+def _p_FreqDroopType(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_FreqDroopType)
+    _parse_children(el, kw, _E_FreqDroopType)
+    return sep.FreqDroopType(**kw)
+
+
+def _p_DERCurveLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERCurveLink)
+    _parse_children(el, kw, _E_DERCurveLink)
+    return sep.DERCurveLink(**kw)
+
+
+def _p_DERControlList(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERControlList)
+    _parse_children(el, kw, _E_DERControlList)
+    return sep.DERControlList(**kw)
+
+
+def _p_DefaultDERControl(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DefaultDERControl)
+    _parse_children(el, kw, _E_DefaultDERControl)
+    return sep.DefaultDERControl(**kw)
+
+
+def _p_DERProgram(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERProgram)
+    _parse_children(el, kw, _E_DERProgram)
+    return sep.DERProgram(**kw)
+
+
+def _p_ActiveDERControlListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_ActiveDERControlListLink)
+    _parse_children(el, kw, _E_ActiveDERControlListLink)
+    return sep.ActiveDERControlListLink(**kw)
+
+
+def _p_DefaultDERControlLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DefaultDERControlLink)
+    _parse_children(el, kw, _E_DefaultDERControlLink)
+    return sep.DefaultDERControlLink(**kw)
+
+
+def _p_DERControlListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERControlListLink)
+    _parse_children(el, kw, _E_DERControlListLink)
+    return sep.DERControlListLink(**kw)
+
+
+def _p_DERCurveListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERCurveListLink)
+    _parse_children(el, kw, _E_DERCurveListLink)
+    return sep.DERCurveListLink(**kw)
+
+
+def _p_DERProgramList(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERProgramList)
+    _parse_children(el, kw, _E_DERProgramList)
+    return sep.DERProgramList(**kw)
+
+
+def _p_DERCurve(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERCurve)
+    _parse_children(el, kw, _E_DERCurve)
+    return sep.DERCurve(**kw)
+
+
+def _p_CurveData(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_CurveData)
+    _parse_children(el, kw, _E_CurveData)
+    return sep.CurveData(**kw)
+
+
+def _p_DERCurveList(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_DERCurveList)
+    _parse_children(el, kw, _E_DERCurveList)
+    return sep.DERCurveList(**kw)
+
+
+def _p_MirrorUsagePoint(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_MirrorUsagePoint)
+    _parse_children(el, kw, _E_MirrorUsagePoint)
+    return sep.MirrorUsagePoint(**kw)
+
+
+def _p_MirrorMeterReading(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_MirrorMeterReading)
+    _parse_children(el, kw, _E_MirrorMeterReading)
+    return sep.MirrorMeterReading(**kw)
+
+
+def _p_MirrorReadingSet(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_MirrorReadingSet)
+    _parse_children(el, kw, _E_MirrorReadingSet)
+    return sep.MirrorReadingSet(**kw)
+
+
+def _p_Reading(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_Reading)
+    _parse_children(el, kw, _E_Reading)
+    return sep.Reading(**kw)
+
+
+def _p_ReadingType(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_ReadingType)
+    _parse_children(el, kw, _E_ReadingType)
+    return sep.ReadingType(**kw)
+
+
+def _p_UnitValueType(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_UnitValueType)
+    _parse_children(el, kw, _E_UnitValueType)
+    return sep.UnitValueType(**kw)
+
+
+def _p_MirrorUsagePointList(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_MirrorUsagePointList)
+    _parse_children(el, kw, _E_MirrorUsagePointList)
+    return sep.MirrorUsagePointList(**kw)
+
+
+def _p_MirrorMeterReadingList(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_MirrorMeterReadingList)
+    _parse_children(el, kw, _E_MirrorMeterReadingList)
+    return sep.MirrorMeterReadingList(**kw)
+
+
+def _p_ReadingList(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_ReadingList)
+    _parse_children(el, kw, _E_ReadingList)
+    return sep.ReadingList(**kw)
+
+
+def _p_ReadingSet(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_ReadingSet)
+    _parse_children(el, kw, _E_ReadingSet)
+    return sep.ReadingSet(**kw)
+
+
+def _p_ReadingListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_ReadingListLink)
+    _parse_children(el, kw, _E_ReadingListLink)
+    return sep.ReadingListLink(**kw)
+
+
+def _p_ReadingSetList(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_ReadingSetList)
+    _parse_children(el, kw, _E_ReadingSetList)
+    return sep.ReadingSetList(**kw)
+
+
+def _p_MeterReading(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_MeterReading)
+    _parse_children(el, kw, _E_MeterReading)
+    return sep.MeterReading(**kw)
+
+
+def _p_RateComponentListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_RateComponentListLink)
+    _parse_children(el, kw, _E_RateComponentListLink)
+    return sep.RateComponentListLink(**kw)
+
+
+def _p_ReadingLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_ReadingLink)
+    _parse_children(el, kw, _E_ReadingLink)
+    return sep.ReadingLink(**kw)
+
+
+def _p_ReadingSetListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_ReadingSetListLink)
+    _parse_children(el, kw, _E_ReadingSetListLink)
+    return sep.ReadingSetListLink(**kw)
+
+
+def _p_ReadingTypeLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_ReadingTypeLink)
+    _parse_children(el, kw, _E_ReadingTypeLink)
+    return sep.ReadingTypeLink(**kw)
+
+
+def _p_MeterReadingList(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_MeterReadingList)
+    _parse_children(el, kw, _E_MeterReadingList)
+    return sep.MeterReadingList(**kw)
+
+
+def _p_UsagePoint(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_UsagePoint)
+    _parse_children(el, kw, _E_UsagePoint)
+    return sep.UsagePoint(**kw)
+
+
+def _p_MeterReadingListLink(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_MeterReadingListLink)
+    _parse_children(el, kw, _E_MeterReadingListLink)
+    return sep.MeterReadingListLink(**kw)
+
+
+def _p_UsagePointList(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_UsagePointList)
+    _parse_children(el, kw, _E_UsagePointList)
+    return sep.UsagePointList(**kw)
+
+
+def _p_Time(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_Time)
+    _parse_children(el, kw, _E_Time)
+    return sep.Time(**kw)
+
+
+def _p_LogEvent(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_LogEvent)
+    _parse_children(el, kw, _E_LogEvent)
+    return sep.LogEvent(**kw)
+
+
+def _p_LogEventList(el):
+    kw = {}
+    _parse_attributes(el, kw, _A_LogEventList)
+    _parse_children(el, kw, _E_LogEventList)
+    return sep.LogEventList(**kw)
+
+_A_DeviceCapability = {
+    "href": ("href", _pstr),
+    "pollRate": ("pollRate", _pint),
+}
+_E_DeviceCapability = {
+    "{urn:ieee:std:2030.5:ns}CustomerAccountListLink": ("CustomerAccountListLink", _p_CustomerAccountListLink, False),
+    "{urn:ieee:std:2030.5:ns}DemandResponseProgramListLink": ("DemandResponseProgramListLink", _p_DemandResponseProgramListLink, False),
+    "{urn:ieee:std:2030.5:ns}DERProgramListLink": ("DERProgramListLink", _p_DERProgramListLink, False),
+    "{urn:ieee:std:2030.5:ns}FileListLink": ("FileListLink", _p_FileListLink, False),
+    "{urn:ieee:std:2030.5:ns}MessagingProgramListLink": ("MessagingProgramListLink", _p_MessagingProgramListLink, False),
+    "{urn:ieee:std:2030.5:ns}PrepaymentListLink": ("PrepaymentListLink", _p_PrepaymentListLink, False),
+    "{urn:ieee:std:2030.5:ns}ResponseSetListLink": ("ResponseSetListLink", _p_ResponseSetListLink, False),
+    "{urn:ieee:std:2030.5:ns}TariffProfileListLink": ("TariffProfileListLink", _p_TariffProfileListLink, False),
+    "{urn:ieee:std:2030.5:ns}TimeLink": ("TimeLink", _p_TimeLink, False),
+    "{urn:ieee:std:2030.5:ns}UsagePointListLink": ("UsagePointListLink", _p_UsagePointListLink, False),
+    "{urn:ieee:std:2030.5:ns}EndDeviceListLink": ("EndDeviceListLink", _p_EndDeviceListLink, False),
+    "{urn:ieee:std:2030.5:ns}MirrorUsagePointListLink": ("MirrorUsagePointListLink", _p_MirrorUsagePointListLink, False),
+    "{urn:ieee:std:2030.5:ns}SelfDeviceLink": ("SelfDeviceLink", _p_SelfDeviceLink, False),
+}
+
+_A_CustomerAccountListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_CustomerAccountListLink = {
+}
+
+_A_DemandResponseProgramListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_DemandResponseProgramListLink = {
+}
+
+_A_DERProgramListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_DERProgramListLink = {
+}
+
+_A_FileListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_FileListLink = {
+}
+
+_A_MessagingProgramListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_MessagingProgramListLink = {
+}
+
+_A_PrepaymentListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_PrepaymentListLink = {
+}
+
+_A_ResponseSetListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_ResponseSetListLink = {
+}
+
+_A_TariffProfileListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_TariffProfileListLink = {
+}
+
+_A_TimeLink = {
+    "href": ("href", _pstr),
+}
+_E_TimeLink = {
+}
+
+_A_UsagePointListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_UsagePointListLink = {
+}
+
+_A_EndDeviceListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_EndDeviceListLink = {
+}
+
+_A_MirrorUsagePointListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_MirrorUsagePointListLink = {
+}
+
+_A_SelfDeviceLink = {
+    "href": ("href", _pstr),
+}
+_E_SelfDeviceLink = {
+}
+
+_A_EndDevice = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+}
+_E_EndDevice = {
+    "{urn:ieee:std:2030.5:ns}ConfigurationLink": ("ConfigurationLink", _p_ConfigurationLink, False),
+    "{urn:ieee:std:2030.5:ns}DERListLink": ("DERListLink", _p_DERListLink, False),
+    "{urn:ieee:std:2030.5:ns}deviceCategory": ("deviceCategory", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}DeviceInformationLink": ("DeviceInformationLink", _p_DeviceInformationLink, False),
+    "{urn:ieee:std:2030.5:ns}DeviceStatusLink": ("DeviceStatusLink", _p_DeviceStatusLink, False),
+    "{urn:ieee:std:2030.5:ns}FileStatusLink": ("FileStatusLink", _p_FileStatusLink, False),
+    "{urn:ieee:std:2030.5:ns}IPInterfaceListLink": ("IPInterfaceListLink", _p_IPInterfaceListLink, False),
+    "{urn:ieee:std:2030.5:ns}lFDI": ("lFDI", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}LoadShedAvailabilityListLink": ("LoadShedAvailabilityListLink", _p_LoadShedAvailabilityListLink, False),
+    "{urn:ieee:std:2030.5:ns}LogEventListLink": ("LogEventListLink", _p_LogEventListLink, False),
+    "{urn:ieee:std:2030.5:ns}PowerStatusLink": ("PowerStatusLink", _p_PowerStatusLink, False),
+    "{urn:ieee:std:2030.5:ns}sFDI": ("sFDI", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}changedTime": ("changedTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}enabled": ("enabled", lambda el: _pbool(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}FlowReservationRequestListLink": ("FlowReservationRequestListLink", _p_FlowReservationRequestListLink, False),
+    "{urn:ieee:std:2030.5:ns}FlowReservationResponseListLink": ("FlowReservationResponseListLink", _p_FlowReservationResponseListLink, False),
+    "{urn:ieee:std:2030.5:ns}FunctionSetAssignmentsListLink": ("FunctionSetAssignmentsListLink", _p_FunctionSetAssignmentsListLink, False),
+    "{urn:ieee:std:2030.5:ns}postRate": ("postRate", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}RegistrationLink": ("RegistrationLink", _p_RegistrationLink, False),
+    "{urn:ieee:std:2030.5:ns}SubscriptionListLink": ("SubscriptionListLink", _p_SubscriptionListLink, False),
+}
+
+_A_ConfigurationLink = {
+    "href": ("href", _pstr),
+}
+_E_ConfigurationLink = {
+}
+
+_A_DERListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_DERListLink = {
+}
+
+_A_DeviceInformationLink = {
+    "href": ("href", _pstr),
+}
+_E_DeviceInformationLink = {
+}
+
+_A_DeviceStatusLink = {
+    "href": ("href", _pstr),
+}
+_E_DeviceStatusLink = {
+}
+
+_A_FileStatusLink = {
+    "href": ("href", _pstr),
+}
+_E_FileStatusLink = {
+}
+
+_A_IPInterfaceListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_IPInterfaceListLink = {
+}
+
+_A_LoadShedAvailabilityListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_LoadShedAvailabilityListLink = {
+}
+
+_A_LogEventListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_LogEventListLink = {
+}
+
+_A_PowerStatusLink = {
+    "href": ("href", _pstr),
+}
+_E_PowerStatusLink = {
+}
+
+_A_FlowReservationRequestListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_FlowReservationRequestListLink = {
+}
+
+_A_FlowReservationResponseListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_FlowReservationResponseListLink = {
+}
+
+_A_FunctionSetAssignmentsListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_FunctionSetAssignmentsListLink = {
+}
+
+_A_RegistrationLink = {
+    "href": ("href", _pstr),
+}
+_E_RegistrationLink = {
+}
+
+_A_SubscriptionListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_SubscriptionListLink = {
+}
+
+_A_EndDeviceList = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+    "all": ("all", _pint),
+    "results": ("results", _pint),
+    "pollRate": ("pollRate", _pint),
+}
+_E_EndDeviceList = {
+    "{urn:ieee:std:2030.5:ns}EndDevice": ("EndDevice", _p_EndDevice, True),
+}
+
+_A_Registration = {
+    "href": ("href", _pstr),
+    "pollRate": ("pollRate", _pint),
+}
+_E_Registration = {
+    "{urn:ieee:std:2030.5:ns}dateTimeRegistered": ("dateTimeRegistered", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}pIN": ("pIN", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_FunctionSetAssignments = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+}
+_E_FunctionSetAssignments = {
+    "{urn:ieee:std:2030.5:ns}CustomerAccountListLink": ("CustomerAccountListLink", _p_CustomerAccountListLink, False),
+    "{urn:ieee:std:2030.5:ns}DemandResponseProgramListLink": ("DemandResponseProgramListLink", _p_DemandResponseProgramListLink, False),
+    "{urn:ieee:std:2030.5:ns}DERProgramListLink": ("DERProgramListLink", _p_DERProgramListLink, False),
+    "{urn:ieee:std:2030.5:ns}FileListLink": ("FileListLink", _p_FileListLink, False),
+    "{urn:ieee:std:2030.5:ns}MessagingProgramListLink": ("MessagingProgramListLink", _p_MessagingProgramListLink, False),
+    "{urn:ieee:std:2030.5:ns}PrepaymentListLink": ("PrepaymentListLink", _p_PrepaymentListLink, False),
+    "{urn:ieee:std:2030.5:ns}ResponseSetListLink": ("ResponseSetListLink", _p_ResponseSetListLink, False),
+    "{urn:ieee:std:2030.5:ns}TariffProfileListLink": ("TariffProfileListLink", _p_TariffProfileListLink, False),
+    "{urn:ieee:std:2030.5:ns}TimeLink": ("TimeLink", _p_TimeLink, False),
+    "{urn:ieee:std:2030.5:ns}UsagePointListLink": ("UsagePointListLink", _p_UsagePointListLink, False),
+    "{urn:ieee:std:2030.5:ns}mRID": ("mRID", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}description": ("description", lambda el: _pstr(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}version": ("version", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_FunctionSetAssignmentsList = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+    "all": ("all", _pint),
+    "results": ("results", _pint),
+    "pollRate": ("pollRate", _pint),
+}
+_E_FunctionSetAssignmentsList = {
+    "{urn:ieee:std:2030.5:ns}FunctionSetAssignments": ("FunctionSetAssignments", _p_FunctionSetAssignments, True),
+}
+
+_A_DER = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+}
+_E_DER = {
+    "{urn:ieee:std:2030.5:ns}AssociatedDERProgramListLink": ("AssociatedDERProgramListLink", _p_AssociatedDERProgramListLink, False),
+    "{urn:ieee:std:2030.5:ns}AssociatedUsagePointLink": ("AssociatedUsagePointLink", _p_AssociatedUsagePointLink, False),
+    "{urn:ieee:std:2030.5:ns}CurrentDERProgramLink": ("CurrentDERProgramLink", _p_CurrentDERProgramLink, False),
+    "{urn:ieee:std:2030.5:ns}DERAvailabilityLink": ("DERAvailabilityLink", _p_DERAvailabilityLink, False),
+    "{urn:ieee:std:2030.5:ns}DERCapabilityLink": ("DERCapabilityLink", _p_DERCapabilityLink, False),
+    "{urn:ieee:std:2030.5:ns}DERSettingsLink": ("DERSettingsLink", _p_DERSettingsLink, False),
+    "{urn:ieee:std:2030.5:ns}DERStatusLink": ("DERStatusLink", _p_DERStatusLink, False),
+}
+
+_A_AssociatedDERProgramListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_AssociatedDERProgramListLink = {
+}
+
+_A_AssociatedUsagePointLink = {
+    "href": ("href", _pstr),
+}
+_E_AssociatedUsagePointLink = {
+}
+
+_A_CurrentDERProgramLink = {
+    "href": ("href", _pstr),
+}
+_E_CurrentDERProgramLink = {
+}
+
+_A_DERAvailabilityLink = {
+    "href": ("href", _pstr),
+}
+_E_DERAvailabilityLink = {
+}
+
+_A_DERCapabilityLink = {
+    "href": ("href", _pstr),
+}
+_E_DERCapabilityLink = {
+}
+
+_A_DERSettingsLink = {
+    "href": ("href", _pstr),
+}
+_E_DERSettingsLink = {
+}
+
+_A_DERStatusLink = {
+    "href": ("href", _pstr),
+}
+_E_DERStatusLink = {
+}
+
+_A_DERList = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+    "results": ("results", _pint),
+    "pollRate": ("pollRate", _pint),
+}
+_E_DERList = {
+    "{urn:ieee:std:2030.5:ns}DER": ("DER", _p_DER, True),
+}
+
+_A_DERCapability = {
+    "href": ("href", _pstr),
+}
+_E_DERCapability = {
+    "{urn:ieee:std:2030.5:ns}modesSupported": ("modesSupported", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}rtgAbnormalCategory": ("rtgAbnormalCategory", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}rtgMaxA": ("rtgMaxA", _p_CurrentRMS, False),
+    "{urn:ieee:std:2030.5:ns}rtgMaxAh": ("rtgMaxAh", _p_AmpereHour, False),
+    "{urn:ieee:std:2030.5:ns}rtgMaxChargeRateVA": ("rtgMaxChargeRateVA", _p_ApparentPower, False),
+    "{urn:ieee:std:2030.5:ns}rtgMaxChargeRateW": ("rtgMaxChargeRateW", _p_ActivePower, False),
+    "{urn:ieee:std:2030.5:ns}rtgMaxDischargeRateVA": ("rtgMaxDischargeRateVA", _p_ApparentPower, False),
+    "{urn:ieee:std:2030.5:ns}rtgMaxDischargeRateW": ("rtgMaxDischargeRateW", _p_ActivePower, False),
+    "{urn:ieee:std:2030.5:ns}rtgMaxV": ("rtgMaxV", _p_VoltageRMS, False),
+    "{urn:ieee:std:2030.5:ns}rtgMaxVA": ("rtgMaxVA", _p_ApparentPower, False),
+    "{urn:ieee:std:2030.5:ns}rtgMaxVar": ("rtgMaxVar", _p_ReactivePower, False),
+    "{urn:ieee:std:2030.5:ns}rtgMaxVarNeg": ("rtgMaxVarNeg", _p_ReactivePower, False),
+    "{urn:ieee:std:2030.5:ns}rtgMaxW": ("rtgMaxW", _p_ActivePower, False),
+    "{urn:ieee:std:2030.5:ns}rtgMaxWh": ("rtgMaxWh", _p_WattHour, False),
+    "{urn:ieee:std:2030.5:ns}rtgMinPFOverExcited": ("rtgMinPFOverExcited", _p_PowerFactor, False),
+    "{urn:ieee:std:2030.5:ns}rtgMinPFUnderExcited": ("rtgMinPFUnderExcited", _p_PowerFactor, False),
+    "{urn:ieee:std:2030.5:ns}rtgMinV": ("rtgMinV", _p_VoltageRMS, False),
+    "{urn:ieee:std:2030.5:ns}rtgNormalCategory": ("rtgNormalCategory", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}rtgOverExcitedPF": ("rtgOverExcitedPF", _p_PowerFactor, False),
+    "{urn:ieee:std:2030.5:ns}rtgOverExcitedW": ("rtgOverExcitedW", _p_ActivePower, False),
+    "{urn:ieee:std:2030.5:ns}rtgReactiveSusceptance": ("rtgReactiveSusceptance", _p_ReactiveSusceptance, False),
+    "{urn:ieee:std:2030.5:ns}rtgUnderExcitedPF": ("rtgUnderExcitedPF", _p_PowerFactor, False),
+    "{urn:ieee:std:2030.5:ns}rtgUnderExcitedW": ("rtgUnderExcitedW", _p_ActivePower, False),
+    "{urn:ieee:std:2030.5:ns}rtgVNom": ("rtgVNom", _p_VoltageRMS, False),
+    "{urn:ieee:std:2030.5:ns}type": ("type", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_CurrentRMS = {
+}
+_E_CurrentRMS = {
+    "{urn:ieee:std:2030.5:ns}multiplier": ("multiplier", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_AmpereHour = {
+}
+_E_AmpereHour = {
+    "{urn:ieee:std:2030.5:ns}multiplier": ("multiplier", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_ApparentPower = {
+}
+_E_ApparentPower = {
+    "{urn:ieee:std:2030.5:ns}multiplier": ("multiplier", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_ActivePower = {
+}
+_E_ActivePower = {
+    "{urn:ieee:std:2030.5:ns}multiplier": ("multiplier", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_VoltageRMS = {
+}
+_E_VoltageRMS = {
+    "{urn:ieee:std:2030.5:ns}multiplier": ("multiplier", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_ReactivePower = {
+}
+_E_ReactivePower = {
+    "{urn:ieee:std:2030.5:ns}multiplier": ("multiplier", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_WattHour = {
+}
+_E_WattHour = {
+    "{urn:ieee:std:2030.5:ns}multiplier": ("multiplier", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_PowerFactor = {
+}
+_E_PowerFactor = {
+    "{urn:ieee:std:2030.5:ns}displacement": ("displacement", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}multiplier": ("multiplier", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_ReactiveSusceptance = {
+}
+_E_ReactiveSusceptance = {
+    "{urn:ieee:std:2030.5:ns}multiplier": ("multiplier", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_DERSettings = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+}
+_E_DERSettings = {
+    "{urn:ieee:std:2030.5:ns}modesEnabled": ("modesEnabled", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setESDelay": ("setESDelay", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setESHighFreq": ("setESHighFreq", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setESHighVolt": ("setESHighVolt", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setESLowFreq": ("setESLowFreq", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setESLowVolt": ("setESLowVolt", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setESRampTms": ("setESRampTms", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setESRandomDelay": ("setESRandomDelay", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setGradW": ("setGradW", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setMaxA": ("setMaxA", _p_CurrentRMS, False),
+    "{urn:ieee:std:2030.5:ns}setMaxAh": ("setMaxAh", _p_AmpereHour, False),
+    "{urn:ieee:std:2030.5:ns}setMaxChargeRateVA": ("setMaxChargeRateVA", _p_ApparentPower, False),
+    "{urn:ieee:std:2030.5:ns}setMaxChargeRateW": ("setMaxChargeRateW", _p_ActivePower, False),
+    "{urn:ieee:std:2030.5:ns}setMaxDischargeRateVA": ("setMaxDischargeRateVA", _p_ApparentPower, False),
+    "{urn:ieee:std:2030.5:ns}setMaxDischargeRateW": ("setMaxDischargeRateW", _p_ActivePower, False),
+    "{urn:ieee:std:2030.5:ns}setMaxV": ("setMaxV", _p_VoltageRMS, False),
+    "{urn:ieee:std:2030.5:ns}setMaxVA": ("setMaxVA", _p_ApparentPower, False),
+    "{urn:ieee:std:2030.5:ns}setMaxVar": ("setMaxVar", _p_ReactivePower, False),
+    "{urn:ieee:std:2030.5:ns}setMaxVarNeg": ("setMaxVarNeg", _p_ReactivePower, False),
+    "{urn:ieee:std:2030.5:ns}setMaxW": ("setMaxW", _p_ActivePower, False),
+    "{urn:ieee:std:2030.5:ns}setMaxWh": ("setMaxWh", _p_WattHour, False),
+    "{urn:ieee:std:2030.5:ns}setMinPFOverExcited": ("setMinPFOverExcited", _p_PowerFactor, False),
+    "{urn:ieee:std:2030.5:ns}setMinPFUnderExcited": ("setMinPFUnderExcited", _p_PowerFactor, False),
+    "{urn:ieee:std:2030.5:ns}setMinV": ("setMinV", _p_VoltageRMS, False),
+    "{urn:ieee:std:2030.5:ns}setSoftGradW": ("setSoftGradW", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setVNom": ("setVNom", _p_VoltageRMS, False),
+    "{urn:ieee:std:2030.5:ns}setVRef": ("setVRef", _p_VoltageRMS, False),
+    "{urn:ieee:std:2030.5:ns}setVRefOfs": ("setVRefOfs", _p_VoltageRMS, False),
+    "{urn:ieee:std:2030.5:ns}updatedTime": ("updatedTime", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_DERStatus = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+}
+_E_DERStatus = {
+    "{urn:ieee:std:2030.5:ns}alarmStatus": ("alarmStatus", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}genConnectStatus": ("genConnectStatus", _p_ConnectStatusType, False),
+    "{urn:ieee:std:2030.5:ns}inverterStatus": ("inverterStatus", _p_InverterStatusType, False),
+    "{urn:ieee:std:2030.5:ns}localControlModeStatus": ("localControlModeStatus", _p_LocalControlModeStatusType, False),
+    "{urn:ieee:std:2030.5:ns}manufacturerStatus": ("manufacturerStatus", _p_ManufacturerStatusType, False),
+    "{urn:ieee:std:2030.5:ns}operationalModeStatus": ("operationalModeStatus", _p_OperationalModeStatusType, False),
+    "{urn:ieee:std:2030.5:ns}readingTime": ("readingTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}stateOfChargeStatus": ("stateOfChargeStatus", _p_StateOfChargeStatusType, False),
+    "{urn:ieee:std:2030.5:ns}storageModeStatus": ("storageModeStatus", _p_StorageModeStatusType, False),
+    "{urn:ieee:std:2030.5:ns}storConnectStatus": ("storConnectStatus", _p_ConnectStatusType, False),
+}
+
+_A_ConnectStatusType = {
+}
+_E_ConnectStatusType = {
+    "{urn:ieee:std:2030.5:ns}dateTime": ("dateTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _phex(_leaf_text(el)), False),
+}
+
+_A_InverterStatusType = {
+}
+_E_InverterStatusType = {
+    "{urn:ieee:std:2030.5:ns}dateTime": ("dateTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_LocalControlModeStatusType = {
+}
+_E_LocalControlModeStatusType = {
+    "{urn:ieee:std:2030.5:ns}dateTime": ("dateTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_ManufacturerStatusType = {
+}
+_E_ManufacturerStatusType = {
+    "{urn:ieee:std:2030.5:ns}dateTime": ("dateTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _pstr(_leaf_text(el)), False),
+}
+
+_A_OperationalModeStatusType = {
+}
+_E_OperationalModeStatusType = {
+    "{urn:ieee:std:2030.5:ns}dateTime": ("dateTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_StateOfChargeStatusType = {
+}
+_E_StateOfChargeStatusType = {
+    "{urn:ieee:std:2030.5:ns}dateTime": ("dateTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_StorageModeStatusType = {
+}
+_E_StorageModeStatusType = {
+    "{urn:ieee:std:2030.5:ns}dateTime": ("dateTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_DERAvailability = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+}
+_E_DERAvailability = {
+    "{urn:ieee:std:2030.5:ns}availabilityDuration": ("availabilityDuration", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}maxChargeDuration": ("maxChargeDuration", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}readingTime": ("readingTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}reserveChargePercent": ("reserveChargePercent", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}reservePercent": ("reservePercent", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}statVarAvail": ("statVarAvail", _p_ReactivePower, False),
+    "{urn:ieee:std:2030.5:ns}statWAvail": ("statWAvail", _p_ActivePower, False),
+}
+
+_A_DERControl = {
+    "href": ("href", _pstr),
+    "replyTo": ("replyTo", _pstr),
+    "responseRequired": ("responseRequired", _phex),
+    "subscribable": ("subscribable", _pint),
+}
+_E_DERControl = {
+    "{urn:ieee:std:2030.5:ns}mRID": ("mRID", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}description": ("description", lambda el: _pstr(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}version": ("version", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}creationTime": ("creationTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}EventStatus": ("EventStatus", _p_EventStatus, False),
+    "{urn:ieee:std:2030.5:ns}interval": ("interval", _p_DateTimeInterval, False),
+    "{urn:ieee:std:2030.5:ns}randomizeDuration": ("randomizeDuration", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}randomizeStart": ("randomizeStart", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}DERControlBase": ("DERControlBase", _p_DERControlBase, False),
+    "{urn:ieee:std:2030.5:ns}deviceCategory": ("deviceCategory", lambda el: _phex(_leaf_text(el)), False),
+}
+
+_A_EventStatus = {
+}
+_E_EventStatus = {
+    "{urn:ieee:std:2030.5:ns}currentStatus": ("currentStatus", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}dateTime": ("dateTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}potentiallySuperseded": ("potentiallySuperseded", lambda el: _pbool(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}potentiallySupersededTime": ("potentiallySupersededTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}reason": ("reason", lambda el: _pstr(_leaf_text(el)), False),
+}
+
+_A_DateTimeInterval = {
+}
+_E_DateTimeInterval = {
+    "{urn:ieee:std:2030.5:ns}duration": ("duration", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}start": ("start", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_DERControlBase = {
+}
+_E_DERControlBase = {
+    "{urn:ieee:std:2030.5:ns}opModConnect": ("opModConnect", lambda el: _pbool(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}opModEnergize": ("opModEnergize", lambda el: _pbool(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}opModFixedPFAbsorbW": ("opModFixedPFAbsorbW", _p_PowerFactorWithExcitation, False),
+    "{urn:ieee:std:2030.5:ns}opModFixedPFInjectW": ("opModFixedPFInjectW", _p_PowerFactorWithExcitation, False),
+    "{urn:ieee:std:2030.5:ns}opModFixedVar": ("opModFixedVar", _p_FixedVar, False),
+    "{urn:ieee:std:2030.5:ns}opModFixedW": ("opModFixedW", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}opModFreqDroop": ("opModFreqDroop", _p_FreqDroopType, False),
+    "{urn:ieee:std:2030.5:ns}opModFreqWatt": ("opModFreqWatt", _p_DERCurveLink, False),
+    "{urn:ieee:std:2030.5:ns}opModHFRTMayTrip": ("opModHFRTMayTrip", _p_DERCurveLink, False),
+    "{urn:ieee:std:2030.5:ns}opModHFRTMustTrip": ("opModHFRTMustTrip", _p_DERCurveLink, False),
+    "{urn:ieee:std:2030.5:ns}opModHVRTMayTrip": ("opModHVRTMayTrip", _p_DERCurveLink, False),
+    "{urn:ieee:std:2030.5:ns}opModHVRTMomentaryCessation": ("opModHVRTMomentaryCessation", _p_DERCurveLink, False),
+    "{urn:ieee:std:2030.5:ns}opModHVRTMustTrip": ("opModHVRTMustTrip", _p_DERCurveLink, False),
+    "{urn:ieee:std:2030.5:ns}opModLFRTMayTrip": ("opModLFRTMayTrip", _p_DERCurveLink, False),
+    "{urn:ieee:std:2030.5:ns}opModLFRTMustTrip": ("opModLFRTMustTrip", _p_DERCurveLink, False),
+    "{urn:ieee:std:2030.5:ns}opModLVRTMayTrip": ("opModLVRTMayTrip", _p_DERCurveLink, False),
+    "{urn:ieee:std:2030.5:ns}opModLVRTMomentaryCessation": ("opModLVRTMomentaryCessation", _p_DERCurveLink, False),
+    "{urn:ieee:std:2030.5:ns}opModLVRTMustTrip": ("opModLVRTMustTrip", _p_DERCurveLink, False),
+    "{urn:ieee:std:2030.5:ns}opModMaxLimW": ("opModMaxLimW", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}opModTargetVar": ("opModTargetVar", _p_ReactivePower, False),
+    "{urn:ieee:std:2030.5:ns}opModTargetW": ("opModTargetW", _p_ActivePower, False),
+    "{urn:ieee:std:2030.5:ns}opModVoltVar": ("opModVoltVar", _p_DERCurveLink, False),
+    "{urn:ieee:std:2030.5:ns}opModVoltWatt": ("opModVoltWatt", _p_DERCurveLink, False),
+    "{urn:ieee:std:2030.5:ns}opModWattPF": ("opModWattPF", _p_DERCurveLink, False),
+    "{urn:ieee:std:2030.5:ns}opModWattVar": ("opModWattVar", _p_DERCurveLink, False),
+    "{urn:ieee:std:2030.5:ns}rampTms": ("rampTms", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_PowerFactorWithExcitation = {
+}
+_E_PowerFactorWithExcitation = {
+    "{urn:ieee:std:2030.5:ns}displacement": ("displacement", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}excitation": ("excitation", lambda el: _pbool(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}multiplier": ("multiplier", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_FixedVar = {
+}
+_E_FixedVar = {
+    "{urn:ieee:std:2030.5:ns}refType": ("refType", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_FreqDroopType = {
+}
+_E_FreqDroopType = {
+    "{urn:ieee:std:2030.5:ns}dBOF": ("dBOF", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}dBUF": ("dBUF", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}kOF": ("kOF", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}kUF": ("kUF", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}openLoopTms": ("openLoopTms", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_DERCurveLink = {
+    "href": ("href", _pstr),
+}
+_E_DERCurveLink = {
+}
+
+_A_DERControlList = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+    "all": ("all", _pint),
+    "results": ("results", _pint),
+}
+_E_DERControlList = {
+    "{urn:ieee:std:2030.5:ns}DERControl": ("DERControl", _p_DERControl, True),
+}
+
+_A_DefaultDERControl = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+}
+_E_DefaultDERControl = {
+    "{urn:ieee:std:2030.5:ns}mRID": ("mRID", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}description": ("description", lambda el: _pstr(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}version": ("version", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}DERControlBase": ("DERControlBase", _p_DERControlBase, False),
+    "{urn:ieee:std:2030.5:ns}setESDelay": ("setESDelay", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setESHighFreq": ("setESHighFreq", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setESHighVolt": ("setESHighVolt", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setESLowFreq": ("setESLowFreq", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setESLowVolt": ("setESLowVolt", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setESRampTms": ("setESRampTms", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setESRandomDelay": ("setESRandomDelay", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setGradW": ("setGradW", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}setSoftGradW": ("setSoftGradW", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_DERProgram = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+}
+_E_DERProgram = {
+    "{urn:ieee:std:2030.5:ns}mRID": ("mRID", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}description": ("description", lambda el: _pstr(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}version": ("version", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}ActiveDERControlListLink": ("ActiveDERControlListLink", _p_ActiveDERControlListLink, False),
+    "{urn:ieee:std:2030.5:ns}DefaultDERControlLink": ("DefaultDERControlLink", _p_DefaultDERControlLink, False),
+    "{urn:ieee:std:2030.5:ns}DERControlListLink": ("DERControlListLink", _p_DERControlListLink, False),
+    "{urn:ieee:std:2030.5:ns}DERCurveListLink": ("DERCurveListLink", _p_DERCurveListLink, False),
+    "{urn:ieee:std:2030.5:ns}primacy": ("primacy", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_ActiveDERControlListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_ActiveDERControlListLink = {
+}
+
+_A_DefaultDERControlLink = {
+    "href": ("href", _pstr),
+}
+_E_DefaultDERControlLink = {
+}
+
+_A_DERControlListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_DERControlListLink = {
+}
+
+_A_DERCurveListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_DERCurveListLink = {
+}
+
+_A_DERProgramList = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+    "all": ("all", _pint),
+    "results": ("results", _pint),
+    "pollRate": ("pollRate", _pint),
+}
+_E_DERProgramList = {
+    "{urn:ieee:std:2030.5:ns}DERProgram": ("DERProgram", _p_DERProgram, True),
+}
+
+_A_DERCurve = {
+    "href": ("href", _pstr),
+}
+_E_DERCurve = {
+    "{urn:ieee:std:2030.5:ns}mRID": ("mRID", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}description": ("description", lambda el: _pstr(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}version": ("version", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}autonomousVRefEnable": ("autonomousVRefEnable", lambda el: _pbool(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}autonomousVRefTimeConstant": ("autonomousVRefTimeConstant", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}creationTime": ("creationTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}CurveData": ("CurveData", _p_CurveData, True),
+    "{urn:ieee:std:2030.5:ns}curveType": ("curveType", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}openLoopTms": ("openLoopTms", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}rampDecTms": ("rampDecTms", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}rampIncTms": ("rampIncTms", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}rampPT1Tms": ("rampPT1Tms", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}vRef": ("vRef", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}xMultiplier": ("xMultiplier", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}yMultiplier": ("yMultiplier", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}yRefType": ("yRefType", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_CurveData = {
+}
+_E_CurveData = {
+    "{urn:ieee:std:2030.5:ns}excitation": ("excitation", lambda el: _pbool(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}xvalue": ("xvalue", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}yvalue": ("yvalue", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_DERCurveList = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+    "results": ("results", _pint),
+}
+_E_DERCurveList = {
+    "{urn:ieee:std:2030.5:ns}DERCurve": ("DERCurve", _p_DERCurve, True),
+}
+
+_A_MirrorUsagePoint = {
+    "href": ("href", _pstr),
+}
+_E_MirrorUsagePoint = {
+    "{urn:ieee:std:2030.5:ns}mRID": ("mRID", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}description": ("description", lambda el: _pstr(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}version": ("version", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}roleFlags": ("roleFlags", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}serviceCategoryKind": ("serviceCategoryKind", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}status": ("status", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}deviceLFDI": ("deviceLFDI", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}MirrorMeterReading": ("MirrorMeterReading", _p_MirrorMeterReading, True),
+    "{urn:ieee:std:2030.5:ns}postRate": ("postRate", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_MirrorMeterReading = {
+    "href": ("href", _pstr),
+}
+_E_MirrorMeterReading = {
+    "{urn:ieee:std:2030.5:ns}mRID": ("mRID", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}description": ("description", lambda el: _pstr(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}version": ("version", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}lastUpdateTime": ("lastUpdateTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}MirrorReadingSet": ("MirrorReadingSet", _p_MirrorReadingSet, True),
+    "{urn:ieee:std:2030.5:ns}nextUpdateTime": ("nextUpdateTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}Reading": ("Reading", _p_Reading, False),
+    "{urn:ieee:std:2030.5:ns}ReadingType": ("ReadingType", _p_ReadingType, False),
+}
+
+_A_MirrorReadingSet = {
+    "href": ("href", _pstr),
+}
+_E_MirrorReadingSet = {
+    "{urn:ieee:std:2030.5:ns}mRID": ("mRID", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}description": ("description", lambda el: _pstr(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}version": ("version", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}timePeriod": ("timePeriod", _p_DateTimeInterval, False),
+    "{urn:ieee:std:2030.5:ns}Reading": ("Reading", _p_Reading, True),
+}
+
+_A_Reading = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+}
+_E_Reading = {
+    "{urn:ieee:std:2030.5:ns}consumptionBlock": ("consumptionBlock", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}qualityFlags": ("qualityFlags", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}timePeriod": ("timePeriod", _p_DateTimeInterval, False),
+    "{urn:ieee:std:2030.5:ns}touTier": ("touTier", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}localID": ("localID", lambda el: _phex(_leaf_text(el)), False),
+}
+
+_A_ReadingType = {
+    "href": ("href", _pstr),
+}
+_E_ReadingType = {
+    "{urn:ieee:std:2030.5:ns}accumulationBehaviour": ("accumulationBehaviour", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}calorificValue": ("calorificValue", _p_UnitValueType, False),
+    "{urn:ieee:std:2030.5:ns}commodity": ("commodity", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}conversionFactor": ("conversionFactor", _p_UnitValueType, False),
+    "{urn:ieee:std:2030.5:ns}dataQualifier": ("dataQualifier", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}flowDirection": ("flowDirection", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}intervalLength": ("intervalLength", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}kind": ("kind", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}maxNumberOfIntervals": ("maxNumberOfIntervals", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}numberOfConsumptionBlocks": ("numberOfConsumptionBlocks", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}numberOfTouTiers": ("numberOfTouTiers", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}phase": ("phase", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}powerOfTenMultiplier": ("powerOfTenMultiplier", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}subIntervalLength": ("subIntervalLength", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}supplyLimit": ("supplyLimit", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}tieredConsumptionBlocks": ("tieredConsumptionBlocks", lambda el: _pbool(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}uom": ("uom", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_UnitValueType = {
+}
+_E_UnitValueType = {
+    "{urn:ieee:std:2030.5:ns}multiplier": ("multiplier", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}unit": ("unit", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}value": ("value", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_MirrorUsagePointList = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+    "results": ("results", _pint),
+    "pollRate": ("pollRate", _pint),
+}
+_E_MirrorUsagePointList = {
+    "{urn:ieee:std:2030.5:ns}MirrorUsagePoint": ("MirrorUsagePoint", _p_MirrorUsagePoint, True),
+}
+
+_A_MirrorMeterReadingList = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+    "results": ("results", _pint),
+}
+_E_MirrorMeterReadingList = {
+    "{urn:ieee:std:2030.5:ns}MirrorMeterReading": ("MirrorMeterReading", _p_MirrorMeterReading, True),
+}
+
+_A_ReadingList = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+    "all": ("all", _pint),
+    "results": ("results", _pint),
+}
+_E_ReadingList = {
+    "{urn:ieee:std:2030.5:ns}Reading": ("Reading", _p_Reading, True),
+}
+
+_A_ReadingSet = {
+    "href": ("href", _pstr),
+}
+_E_ReadingSet = {
+    "{urn:ieee:std:2030.5:ns}mRID": ("mRID", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}description": ("description", lambda el: _pstr(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}version": ("version", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}timePeriod": ("timePeriod", _p_DateTimeInterval, False),
+    "{urn:ieee:std:2030.5:ns}ReadingListLink": ("ReadingListLink", _p_ReadingListLink, False),
+}
+
+_A_ReadingListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_ReadingListLink = {
+}
+
+_A_ReadingSetList = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+    "all": ("all", _pint),
+    "results": ("results", _pint),
+}
+_E_ReadingSetList = {
+    "{urn:ieee:std:2030.5:ns}ReadingSet": ("ReadingSet", _p_ReadingSet, True),
+}
+
+_A_MeterReading = {
+    "href": ("href", _pstr),
+}
+_E_MeterReading = {
+    "{urn:ieee:std:2030.5:ns}mRID": ("mRID", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}description": ("description", lambda el: _pstr(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}version": ("version", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}RateComponentListLink": ("RateComponentListLink", _p_RateComponentListLink, False),
+    "{urn:ieee:std:2030.5:ns}ReadingLink": ("ReadingLink", _p_ReadingLink, False),
+    "{urn:ieee:std:2030.5:ns}ReadingSetListLink": ("ReadingSetListLink", _p_ReadingSetListLink, False),
+    "{urn:ieee:std:2030.5:ns}ReadingTypeLink": ("ReadingTypeLink", _p_ReadingTypeLink, False),
+}
+
+_A_RateComponentListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_RateComponentListLink = {
+}
+
+_A_ReadingLink = {
+    "href": ("href", _pstr),
+}
+_E_ReadingLink = {
+}
+
+_A_ReadingSetListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_ReadingSetListLink = {
+}
+
+_A_ReadingTypeLink = {
+    "href": ("href", _pstr),
+}
+_E_ReadingTypeLink = {
+}
+
+_A_MeterReadingList = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+    "all": ("all", _pint),
+    "results": ("results", _pint),
+}
+_E_MeterReadingList = {
+    "{urn:ieee:std:2030.5:ns}MeterReading": ("MeterReading", _p_MeterReading, True),
+}
+
+_A_UsagePoint = {
+    "href": ("href", _pstr),
+}
+_E_UsagePoint = {
+    "{urn:ieee:std:2030.5:ns}mRID": ("mRID", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}description": ("description", lambda el: _pstr(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}version": ("version", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}roleFlags": ("roleFlags", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}serviceCategoryKind": ("serviceCategoryKind", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}status": ("status", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}deviceLFDI": ("deviceLFDI", lambda el: _phex(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}MeterReadingListLink": ("MeterReadingListLink", _p_MeterReadingListLink, False),
+}
+
+_A_MeterReadingListLink = {
+    "href": ("href", _pstr),
+    "all": ("all", _pint),
+}
+_E_MeterReadingListLink = {
+}
+
+_A_UsagePointList = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+    "all": ("all", _pint),
+    "results": ("results", _pint),
+    "pollRate": ("pollRate", _pint),
+}
+_E_UsagePointList = {
+    "{urn:ieee:std:2030.5:ns}UsagePoint": ("UsagePoint", _p_UsagePoint, True),
+}
+
+_A_Time = {
+    "href": ("href", _pstr),
+    "pollRate": ("pollRate", _pint),
+}
+_E_Time = {
+    "{urn:ieee:std:2030.5:ns}currentTime": ("currentTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}dstEndTime": ("dstEndTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}dstOffset": ("dstOffset", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}dstStartTime": ("dstStartTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}localTime": ("localTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}quality": ("quality", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}tzOffset": ("tzOffset", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_LogEvent = {
+    "href": ("href", _pstr),
+}
+_E_LogEvent = {
+    "{urn:ieee:std:2030.5:ns}createdDateTime": ("createdDateTime", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}details": ("details", lambda el: _pstr(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}extendedData": ("extendedData", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}functionSet": ("functionSet", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}logEventCode": ("logEventCode", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}logEventID": ("logEventID", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}logEventPEN": ("logEventPEN", lambda el: _pint(_leaf_text(el)), False),
+    "{urn:ieee:std:2030.5:ns}profileID": ("profileID", lambda el: _pint(_leaf_text(el)), False),
+}
+
+_A_LogEventList = {
+    "href": ("href", _pstr),
+    "subscribable": ("subscribable", _pint),
+    "all": ("all", _pint),
+    "results": ("results", _pint),
+    "pollRate": ("pollRate", _pint),
+}
+_E_LogEventList = {
+    "{urn:ieee:std:2030.5:ns}LogEvent": ("LogEvent", _p_LogEvent, True),
+}
+
+RENDERERS: Dict[Type, tuple] = {
+    sep.DeviceCapability: ("DeviceCapability", _r_DeviceCapability),
+    sep.CustomerAccountListLink: ("CustomerAccountListLink", _r_CustomerAccountListLink),
+    sep.DemandResponseProgramListLink: ("DemandResponseProgramListLink", _r_DemandResponseProgramListLink),
+    sep.DERProgramListLink: ("DERProgramListLink", _r_DERProgramListLink),
+    sep.FileListLink: ("FileListLink", _r_FileListLink),
+    sep.MessagingProgramListLink: ("MessagingProgramListLink", _r_MessagingProgramListLink),
+    sep.PrepaymentListLink: ("PrepaymentListLink", _r_PrepaymentListLink),
+    sep.ResponseSetListLink: ("ResponseSetListLink", _r_ResponseSetListLink),
+    sep.TariffProfileListLink: ("TariffProfileListLink", _r_TariffProfileListLink),
+    sep.TimeLink: ("TimeLink", _r_TimeLink),
+    sep.UsagePointListLink: ("UsagePointListLink", _r_UsagePointListLink),
+    sep.EndDeviceListLink: ("EndDeviceListLink", _r_EndDeviceListLink),
+    sep.MirrorUsagePointListLink: ("MirrorUsagePointListLink", _r_MirrorUsagePointListLink),
+    sep.SelfDeviceLink: ("SelfDeviceLink", _r_SelfDeviceLink),
+    sep.EndDevice: ("EndDevice", _r_EndDevice),
+    sep.ConfigurationLink: ("ConfigurationLink", _r_ConfigurationLink),
+    sep.DERListLink: ("DERListLink", _r_DERListLink),
+    sep.DeviceInformationLink: ("DeviceInformationLink", _r_DeviceInformationLink),
+    sep.DeviceStatusLink: ("DeviceStatusLink", _r_DeviceStatusLink),
+    sep.FileStatusLink: ("FileStatusLink", _r_FileStatusLink),
+    sep.IPInterfaceListLink: ("IPInterfaceListLink", _r_IPInterfaceListLink),
+    sep.LoadShedAvailabilityListLink: ("LoadShedAvailabilityListLink", _r_LoadShedAvailabilityListLink),
+    sep.LogEventListLink: ("LogEventListLink", _r_LogEventListLink),
+    sep.PowerStatusLink: ("PowerStatusLink", _r_PowerStatusLink),
+    sep.FlowReservationRequestListLink: ("FlowReservationRequestListLink", _r_FlowReservationRequestListLink),
+    sep.FlowReservationResponseListLink: ("FlowReservationResponseListLink", _r_FlowReservationResponseListLink),
+    sep.FunctionSetAssignmentsListLink: ("FunctionSetAssignmentsListLink", _r_FunctionSetAssignmentsListLink),
+    sep.RegistrationLink: ("RegistrationLink", _r_RegistrationLink),
+    sep.SubscriptionListLink: ("SubscriptionListLink", _r_SubscriptionListLink),
+    sep.EndDeviceList: ("EndDeviceList", _r_EndDeviceList),
+    sep.Registration: ("Registration", _r_Registration),
+    sep.FunctionSetAssignments: ("FunctionSetAssignments", _r_FunctionSetAssignments),
+    sep.FunctionSetAssignmentsList: ("FunctionSetAssignmentsList", _r_FunctionSetAssignmentsList),
+    sep.DER: ("DER", _r_DER),
+    sep.AssociatedDERProgramListLink: ("AssociatedDERProgramListLink", _r_AssociatedDERProgramListLink),
+    sep.AssociatedUsagePointLink: ("AssociatedUsagePointLink", _r_AssociatedUsagePointLink),
+    sep.CurrentDERProgramLink: ("CurrentDERProgramLink", _r_CurrentDERProgramLink),
+    sep.DERAvailabilityLink: ("DERAvailabilityLink", _r_DERAvailabilityLink),
+    sep.DERCapabilityLink: ("DERCapabilityLink", _r_DERCapabilityLink),
+    sep.DERSettingsLink: ("DERSettingsLink", _r_DERSettingsLink),
+    sep.DERStatusLink: ("DERStatusLink", _r_DERStatusLink),
+    sep.DERList: ("DERList", _r_DERList),
+    sep.DERCapability: ("DERCapability", _r_DERCapability),
+    sep.CurrentRMS: ("CurrentRMS", _r_CurrentRMS),
+    sep.AmpereHour: ("AmpereHour", _r_AmpereHour),
+    sep.ApparentPower: ("ApparentPower", _r_ApparentPower),
+    sep.ActivePower: ("ActivePower", _r_ActivePower),
+    sep.VoltageRMS: ("VoltageRMS", _r_VoltageRMS),
+    sep.ReactivePower: ("ReactivePower", _r_ReactivePower),
+    sep.WattHour: ("WattHour", _r_WattHour),
+    sep.PowerFactor: ("PowerFactor", _r_PowerFactor),
+    sep.ReactiveSusceptance: ("ReactiveSusceptance", _r_ReactiveSusceptance),
+    sep.DERSettings: ("DERSettings", _r_DERSettings),
+    sep.DERStatus: ("DERStatus", _r_DERStatus),
+    sep.ConnectStatusType: ("ConnectStatusType", _r_ConnectStatusType),
+    sep.InverterStatusType: ("InverterStatusType", _r_InverterStatusType),
+    sep.LocalControlModeStatusType: ("LocalControlModeStatusType", _r_LocalControlModeStatusType),
+    sep.ManufacturerStatusType: ("ManufacturerStatusType", _r_ManufacturerStatusType),
+    sep.OperationalModeStatusType: ("OperationalModeStatusType", _r_OperationalModeStatusType),
+    sep.StateOfChargeStatusType: ("StateOfChargeStatusType", _r_StateOfChargeStatusType),
+    sep.StorageModeStatusType: ("StorageModeStatusType", _r_StorageModeStatusType),
+    sep.DERAvailability: ("DERAvailability", _r_DERAvailability),
+    sep.DERControl: ("DERControl", _r_DERControl),
+    sep.EventStatus: ("EventStatus", _r_EventStatus),
+    sep.DateTimeInterval: ("DateTimeInterval", _r_DateTimeInterval),
+    sep.DERControlBase: ("DERControlBase", _r_DERControlBase),
+    sep.PowerFactorWithExcitation: ("PowerFactorWithExcitation", _r_PowerFactorWithExcitation),
+    sep.FixedVar: ("FixedVar", _r_FixedVar),
+    sep.FreqDroopType: ("FreqDroopType", _r_FreqDroopType),
+    sep.DERCurveLink: ("DERCurveLink", _r_DERCurveLink),
+    sep.DERControlList: ("DERControlList", _r_DERControlList),
+    sep.DefaultDERControl: ("DefaultDERControl", _r_DefaultDERControl),
+    sep.DERProgram: ("DERProgram", _r_DERProgram),
+    sep.ActiveDERControlListLink: ("ActiveDERControlListLink", _r_ActiveDERControlListLink),
+    sep.DefaultDERControlLink: ("DefaultDERControlLink", _r_DefaultDERControlLink),
+    sep.DERControlListLink: ("DERControlListLink", _r_DERControlListLink),
+    sep.DERCurveListLink: ("DERCurveListLink", _r_DERCurveListLink),
+    sep.DERProgramList: ("DERProgramList", _r_DERProgramList),
+    sep.DERCurve: ("DERCurve", _r_DERCurve),
+    sep.CurveData: ("CurveData", _r_CurveData),
+    sep.DERCurveList: ("DERCurveList", _r_DERCurveList),
+    sep.MirrorUsagePoint: ("MirrorUsagePoint", _r_MirrorUsagePoint),
+    sep.MirrorMeterReading: ("MirrorMeterReading", _r_MirrorMeterReading),
+    sep.MirrorReadingSet: ("MirrorReadingSet", _r_MirrorReadingSet),
+    sep.Reading: ("Reading", _r_Reading),
+    sep.ReadingType: ("ReadingType", _r_ReadingType),
+    sep.UnitValueType: ("UnitValueType", _r_UnitValueType),
+    sep.MirrorUsagePointList: ("MirrorUsagePointList", _r_MirrorUsagePointList),
+    sep.MirrorMeterReadingList: ("MirrorMeterReadingList", _r_MirrorMeterReadingList),
+    sep.ReadingList: ("ReadingList", _r_ReadingList),
+    sep.ReadingSet: ("ReadingSet", _r_ReadingSet),
+    sep.ReadingListLink: ("ReadingListLink", _r_ReadingListLink),
+    sep.ReadingSetList: ("ReadingSetList", _r_ReadingSetList),
+    sep.MeterReading: ("MeterReading", _r_MeterReading),
+    sep.RateComponentListLink: ("RateComponentListLink", _r_RateComponentListLink),
+    sep.ReadingLink: ("ReadingLink", _r_ReadingLink),
+    sep.ReadingSetListLink: ("ReadingSetListLink", _r_ReadingSetListLink),
+    sep.ReadingTypeLink: ("ReadingTypeLink", _r_ReadingTypeLink),
+    sep.MeterReadingList: ("MeterReadingList", _r_MeterReadingList),
+    sep.UsagePoint: ("UsagePoint", _r_UsagePoint),
+    sep.MeterReadingListLink: ("MeterReadingListLink", _r_MeterReadingListLink),
+    sep.UsagePointList: ("UsagePointList", _r_UsagePointList),
+    sep.Time: ("Time", _r_Time),
+    sep.LogEvent: ("LogEvent", _r_LogEvent),
+    sep.LogEventList: ("LogEventList", _r_LogEventList),
+}
+
+PARSERS: Dict[str, tuple] = {
+    "{urn:ieee:std:2030.5:ns}DeviceCapability": (sep.DeviceCapability, _p_DeviceCapability),
+    "{urn:ieee:std:2030.5:ns}CustomerAccountListLink": (sep.CustomerAccountListLink, _p_CustomerAccountListLink),
+    "{urn:ieee:std:2030.5:ns}DemandResponseProgramListLink": (sep.DemandResponseProgramListLink, _p_DemandResponseProgramListLink),
+    "{urn:ieee:std:2030.5:ns}DERProgramListLink": (sep.DERProgramListLink, _p_DERProgramListLink),
+    "{urn:ieee:std:2030.5:ns}FileListLink": (sep.FileListLink, _p_FileListLink),
+    "{urn:ieee:std:2030.5:ns}MessagingProgramListLink": (sep.MessagingProgramListLink, _p_MessagingProgramListLink),
+    "{urn:ieee:std:2030.5:ns}PrepaymentListLink": (sep.PrepaymentListLink, _p_PrepaymentListLink),
+    "{urn:ieee:std:2030.5:ns}ResponseSetListLink": (sep.ResponseSetListLink, _p_ResponseSetListLink),
+    "{urn:ieee:std:2030.5:ns}TariffProfileListLink": (sep.TariffProfileListLink, _p_TariffProfileListLink),
+    "{urn:ieee:std:2030.5:ns}TimeLink": (sep.TimeLink, _p_TimeLink),
+    "{urn:ieee:std:2030.5:ns}UsagePointListLink": (sep.UsagePointListLink, _p_UsagePointListLink),
+    "{urn:ieee:std:2030.5:ns}EndDeviceListLink": (sep.EndDeviceListLink, _p_EndDeviceListLink),
+    "{urn:ieee:std:2030.5:ns}MirrorUsagePointListLink": (sep.MirrorUsagePointListLink, _p_MirrorUsagePointListLink),
+    "{urn:ieee:std:2030.5:ns}SelfDeviceLink": (sep.SelfDeviceLink, _p_SelfDeviceLink),
+    "{urn:ieee:std:2030.5:ns}EndDevice": (sep.EndDevice, _p_EndDevice),
+    "{urn:ieee:std:2030.5:ns}ConfigurationLink": (sep.ConfigurationLink, _p_ConfigurationLink),
+    "{urn:ieee:std:2030.5:ns}DERListLink": (sep.DERListLink, _p_DERListLink),
+    "{urn:ieee:std:2030.5:ns}DeviceInformationLink": (sep.DeviceInformationLink, _p_DeviceInformationLink),
+    "{urn:ieee:std:2030.5:ns}DeviceStatusLink": (sep.DeviceStatusLink, _p_DeviceStatusLink),
+    "{urn:ieee:std:2030.5:ns}FileStatusLink": (sep.FileStatusLink, _p_FileStatusLink),
+    "{urn:ieee:std:2030.5:ns}IPInterfaceListLink": (sep.IPInterfaceListLink, _p_IPInterfaceListLink),
+    "{urn:ieee:std:2030.5:ns}LoadShedAvailabilityListLink": (sep.LoadShedAvailabilityListLink, _p_LoadShedAvailabilityListLink),
+    "{urn:ieee:std:2030.5:ns}LogEventListLink": (sep.LogEventListLink, _p_LogEventListLink),
+    "{urn:ieee:std:2030.5:ns}PowerStatusLink": (sep.PowerStatusLink, _p_PowerStatusLink),
+    "{urn:ieee:std:2030.5:ns}FlowReservationRequestListLink": (sep.FlowReservationRequestListLink, _p_FlowReservationRequestListLink),
+    "{urn:ieee:std:2030.5:ns}FlowReservationResponseListLink": (sep.FlowReservationResponseListLink, _p_FlowReservationResponseListLink),
+    "{urn:ieee:std:2030.5:ns}FunctionSetAssignmentsListLink": (sep.FunctionSetAssignmentsListLink, _p_FunctionSetAssignmentsListLink),
+    "{urn:ieee:std:2030.5:ns}RegistrationLink": (sep.RegistrationLink, _p_RegistrationLink),
+    "{urn:ieee:std:2030.5:ns}SubscriptionListLink": (sep.SubscriptionListLink, _p_SubscriptionListLink),
+    "{urn:ieee:std:2030.5:ns}EndDeviceList": (sep.EndDeviceList, _p_EndDeviceList),
+    "{urn:ieee:std:2030.5:ns}Registration": (sep.Registration, _p_Registration),
+    "{urn:ieee:std:2030.5:ns}FunctionSetAssignments": (sep.FunctionSetAssignments, _p_FunctionSetAssignments),
+    "{urn:ieee:std:2030.5:ns}FunctionSetAssignmentsList": (sep.FunctionSetAssignmentsList, _p_FunctionSetAssignmentsList),
+    "{urn:ieee:std:2030.5:ns}DER": (sep.DER, _p_DER),
+    "{urn:ieee:std:2030.5:ns}AssociatedDERProgramListLink": (sep.AssociatedDERProgramListLink, _p_AssociatedDERProgramListLink),
+    "{urn:ieee:std:2030.5:ns}AssociatedUsagePointLink": (sep.AssociatedUsagePointLink, _p_AssociatedUsagePointLink),
+    "{urn:ieee:std:2030.5:ns}CurrentDERProgramLink": (sep.CurrentDERProgramLink, _p_CurrentDERProgramLink),
+    "{urn:ieee:std:2030.5:ns}DERAvailabilityLink": (sep.DERAvailabilityLink, _p_DERAvailabilityLink),
+    "{urn:ieee:std:2030.5:ns}DERCapabilityLink": (sep.DERCapabilityLink, _p_DERCapabilityLink),
+    "{urn:ieee:std:2030.5:ns}DERSettingsLink": (sep.DERSettingsLink, _p_DERSettingsLink),
+    "{urn:ieee:std:2030.5:ns}DERStatusLink": (sep.DERStatusLink, _p_DERStatusLink),
+    "{urn:ieee:std:2030.5:ns}DERList": (sep.DERList, _p_DERList),
+    "{urn:ieee:std:2030.5:ns}DERCapability": (sep.DERCapability, _p_DERCapability),
+    "{urn:ieee:std:2030.5:ns}CurrentRMS": (sep.CurrentRMS, _p_CurrentRMS),
+    "{urn:ieee:std:2030.5:ns}AmpereHour": (sep.AmpereHour, _p_AmpereHour),
+    "{urn:ieee:std:2030.5:ns}ApparentPower": (sep.ApparentPower, _p_ApparentPower),
+    "{urn:ieee:std:2030.5:ns}ActivePower": (sep.ActivePower, _p_ActivePower),
+    "{urn:ieee:std:2030.5:ns}VoltageRMS": (sep.VoltageRMS, _p_VoltageRMS),
+    "{urn:ieee:std:2030.5:ns}ReactivePower": (sep.ReactivePower, _p_ReactivePower),
+    "{urn:ieee:std:2030.5:ns}WattHour": (sep.WattHour, _p_WattHour),
+    "{urn:ieee:std:2030.5:ns}PowerFactor": (sep.PowerFactor, _p_PowerFactor),
+    "{urn:ieee:std:2030.5:ns}ReactiveSusceptance": (sep.ReactiveSusceptance, _p_ReactiveSusceptance),
+    "{urn:ieee:std:2030.5:ns}DERSettings": (sep.DERSettings, _p_DERSettings),
+    "{urn:ieee:std:2030.5:ns}DERStatus": (sep.DERStatus, _p_DERStatus),
+    "{urn:ieee:std:2030.5:ns}ConnectStatusType": (sep.ConnectStatusType, _p_ConnectStatusType),
+    "{urn:ieee:std:2030.5:ns}InverterStatusType": (sep.InverterStatusType, _p_InverterStatusType),
+    "{urn:ieee:std:2030.5:ns}LocalControlModeStatusType": (sep.LocalControlModeStatusType, _p_LocalControlModeStatusType),
+    "{urn:ieee:std:2030.5:ns}ManufacturerStatusType": (sep.ManufacturerStatusType, _p_ManufacturerStatusType),
+    "{urn:ieee:std:2030.5:ns}OperationalModeStatusType": (sep.OperationalModeStatusType, _p_OperationalModeStatusType),
+    "{urn:ieee:std:2030.5:ns}StateOfChargeStatusType": (sep.StateOfChargeStatusType, _p_StateOfChargeStatusType),
+    "{urn:ieee:std:2030.5:ns}StorageModeStatusType": (sep.StorageModeStatusType, _p_StorageModeStatusType),
+    "{urn:ieee:std:2030.5:ns}DERAvailability": (sep.DERAvailability, _p_DERAvailability),
+    "{urn:ieee:std:2030.5:ns}DERControl": (sep.DERControl, _p_DERControl),
+    "{urn:ieee:std:2030.5:ns}EventStatus": (sep.EventStatus, _p_EventStatus),
+    "{urn:ieee:std:2030.5:ns}DateTimeInterval": (sep.DateTimeInterval, _p_DateTimeInterval),
+    "{urn:ieee:std:2030.5:ns}DERControlBase": (sep.DERControlBase, _p_DERControlBase),
+    "{urn:ieee:std:2030.5:ns}PowerFactorWithExcitation": (sep.PowerFactorWithExcitation, _p_PowerFactorWithExcitation),
+    "{urn:ieee:std:2030.5:ns}FixedVar": (sep.FixedVar, _p_FixedVar),
+    "{urn:ieee:std:2030.5:ns}FreqDroopType": (sep.FreqDroopType, _p_FreqDroopType),
+    "{urn:ieee:std:2030.5:ns}DERCurveLink": (sep.DERCurveLink, _p_DERCurveLink),
+    "{urn:ieee:std:2030.5:ns}DERControlList": (sep.DERControlList, _p_DERControlList),
+    "{urn:ieee:std:2030.5:ns}DefaultDERControl": (sep.DefaultDERControl, _p_DefaultDERControl),
+    "{urn:ieee:std:2030.5:ns}DERProgram": (sep.DERProgram, _p_DERProgram),
+    "{urn:ieee:std:2030.5:ns}ActiveDERControlListLink": (sep.ActiveDERControlListLink, _p_ActiveDERControlListLink),
+    "{urn:ieee:std:2030.5:ns}DefaultDERControlLink": (sep.DefaultDERControlLink, _p_DefaultDERControlLink),
+    "{urn:ieee:std:2030.5:ns}DERControlListLink": (sep.DERControlListLink, _p_DERControlListLink),
+    "{urn:ieee:std:2030.5:ns}DERCurveListLink": (sep.DERCurveListLink, _p_DERCurveListLink),
+    "{urn:ieee:std:2030.5:ns}DERProgramList": (sep.DERProgramList, _p_DERProgramList),
+    "{urn:ieee:std:2030.5:ns}DERCurve": (sep.DERCurve, _p_DERCurve),
+    "{urn:ieee:std:2030.5:ns}CurveData": (sep.CurveData, _p_CurveData),
+    "{urn:ieee:std:2030.5:ns}DERCurveList": (sep.DERCurveList, _p_DERCurveList),
+    "{urn:ieee:std:2030.5:ns}MirrorUsagePoint": (sep.MirrorUsagePoint, _p_MirrorUsagePoint),
+    "{urn:ieee:std:2030.5:ns}MirrorMeterReading": (sep.MirrorMeterReading, _p_MirrorMeterReading),
+    "{urn:ieee:std:2030.5:ns}MirrorReadingSet": (sep.MirrorReadingSet, _p_MirrorReadingSet),
+    "{urn:ieee:std:2030.5:ns}Reading": (sep.Reading, _p_Reading),
+    "{urn:ieee:std:2030.5:ns}ReadingType": (sep.ReadingType, _p_ReadingType),
+    "{urn:ieee:std:2030.5:ns}UnitValueType": (sep.UnitValueType, _p_UnitValueType),
+    "{urn:ieee:std:2030.5:ns}MirrorUsagePointList": (sep.MirrorUsagePointList, _p_MirrorUsagePointList),
+    "{urn:ieee:std:2030.5:ns}MirrorMeterReadingList": (sep.MirrorMeterReadingList, _p_MirrorMeterReadingList),
+    "{urn:ieee:std:2030.5:ns}ReadingList": (sep.ReadingList, _p_ReadingList),
+    "{urn:ieee:std:2030.5:ns}ReadingSet": (sep.ReadingSet, _p_ReadingSet),
+    "{urn:ieee:std:2030.5:ns}ReadingListLink": (sep.ReadingListLink, _p_ReadingListLink),
+    "{urn:ieee:std:2030.5:ns}ReadingSetList": (sep.ReadingSetList, _p_ReadingSetList),
+    "{urn:ieee:std:2030.5:ns}MeterReading": (sep.MeterReading, _p_MeterReading),
+    "{urn:ieee:std:2030.5:ns}RateComponentListLink": (sep.RateComponentListLink, _p_RateComponentListLink),
+    "{urn:ieee:std:2030.5:ns}ReadingLink": (sep.ReadingLink, _p_ReadingLink),
+    "{urn:ieee:std:2030.5:ns}ReadingSetListLink": (sep.ReadingSetListLink, _p_ReadingSetListLink),
+    "{urn:ieee:std:2030.5:ns}ReadingTypeLink": (sep.ReadingTypeLink, _p_ReadingTypeLink),
+    "{urn:ieee:std:2030.5:ns}MeterReadingList": (sep.MeterReadingList, _p_MeterReadingList),
+    "{urn:ieee:std:2030.5:ns}UsagePoint": (sep.UsagePoint, _p_UsagePoint),
+    "{urn:ieee:std:2030.5:ns}MeterReadingListLink": (sep.MeterReadingListLink, _p_MeterReadingListLink),
+    "{urn:ieee:std:2030.5:ns}UsagePointList": (sep.UsagePointList, _p_UsagePointList),
+    "{urn:ieee:std:2030.5:ns}Time": (sep.Time, _p_Time),
+    "{urn:ieee:std:2030.5:ns}LogEvent": (sep.LogEvent, _p_LogEvent),
+    "{urn:ieee:std:2030.5:ns}LogEventList": (sep.LogEventList, _p_LogEventList),
+}
+
+def render(obj: Any, compact: bool = False) -> str:
+    """
+    The xml of obj, identical to xsdata's.  Raises Fallback when obj isn't generated.
+    """
+    renderer = RENDERERS.get(type(obj))
+    if renderer is None:
+        raise Fallback()
+    tag, fn = renderer
+    out: List[str] = []
+    fn(obj, tag, out, "", "" if compact else "\n", f' xmlns="{NAMESPACE}"')
+    return "".join(out)
+
+
+def parse(xml, clazz: Optional[Type] = None) -> Any:
+    """
+    The dataclass of the xml document, str or bytes.  Raises Fallback when the root isn't
+    generated or the document holds anything xsdata would parse differently.
+    """
+    try:
+        root = fromstring(xml)
+    except (ParseError, ValueError):
+        raise Fallback()
+    entry = PARSERS.get(root.tag)
+    if entry is None or (clazz is not None and entry[0] is not clazz):
+        raise Fallback()
+    return entry[1](root)
+
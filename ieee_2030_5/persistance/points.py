@@ -1,15 +1,230 @@
 """
 Provides a key/value store interface for setting retrieving points from a datastore.
 
-This implementation just uses pickledb for loading a json datastore.  After
-each set the data will be written to disk.
+The store used is pluggable.  The default FilesystemPointStore writes one file per
+key using simplekv.  The SQLitePointStore keeps all points in a single sqlite
+database in WAL mode, which allows batched transactions, prefix scans and a
+single file backup.  Use configure_point_store to select the store at startup.
 """
-import atexit
+from __future__ import annotations
+
+import logging
+import os
+from abc import ABC, abstractmethod
+import sqlite3
+import tarfile
+import threading
+from argparse import ArgumentParser
 from pathlib import Path
+from typing import Dict, Iterator, List, Literal, Optional, Union
 
 from simplekv.fs import FilesystemStore
 
-db = FilesystemStore(Path("~/.ieee_2030_5_data").expanduser().resolve())
+__all__: List[str] = [
+    "PointStore",
+    "FilesystemPointStore",
+    "SQLitePointStore",
+    "configure_point_store",
+    "set_point",
+    "set_points",
+    "get_point",
+    "get_hrefs",
+    "backup_points",
+    "migrate_filesystem_store"
+]
+
+_log = logging.getLogger(__name__)
+
+DEFAULT_FILESYSTEM_PATH = "~/.ieee_2030_5_data"
+DEFAULT_SQLITE_PATH = "~/.ieee_2030_5_data.sqlite"
+
+
+class PointStore(ABC):
+    """
+    Interface for the key/value stores used to persist points.
+
+    Keys are hrefs such as /edev_0_der_1 and values are bytes.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the value stored at key or None if the key doesn't exist.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def put(self, key: str, value: bytes):
+        raise NotImplementedError()
+
+    def put_many(self, items: Dict[str, bytes]):
+        """
+        Store all items.  Stores that support transactions write them atomically.
+        """
+        for key, value in items.items():
+            self.put(key, value)
+
+    @abstractmethod
+    def delete(self, key: str):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def keys(self, prefix: str = "") -> Iterator[str]:
+        """
+        Iterate over the keys that start with prefix.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def backup(self, path: Union[str, Path]):
+        """
+        Write a copy of the store to a single file at path.
+        """
+        raise NotImplementedError()
+
+    def close(self):
+        pass
+
+
+class FilesystemPointStore(PointStore):
+    """
+    One file per key using simplekv's FilesystemStore.  '/' is not allowed in a simplekv
+    key so it is escaped as '^^^^'.
+    """
+
+    def __init__(self, root: Union[str, Path] = DEFAULT_FILESYSTEM_PATH):
+        self.root = Path(root).expanduser().resolve()
+        self._store = FilesystemStore(self.root)
+
+    @staticmethod
+    def _escape(key: str) -> str:
+        return key.replace('/', '^^^^')
+
+    @staticmethod
+    def _unescape(key: str) -> str:
+        return key.replace('^^^^', '/')
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self._store.get(self._escape(key))
+        except KeyError:
+            return None
+
+    def put(self, key: str, value: bytes):
+        self._store.put(self._escape(key), value)
+
+    def delete(self, key: str):
+        self._store.delete(self._escape(key))
+
+    def keys(self, prefix: str = "") -> Iterator[str]:
+        if not self.root.exists():
+            return iter([])
+        return (k for k in map(self._unescape, self._store.keys()) if k.startswith(prefix))
+
+    def backup(self, path: Union[str, Path]):
+        with tarfile.open(Path(path).expanduser(), "w:gz") as tar:
+            tar.add(self.root, arcname=self.root.name)
+
+
+class SQLitePointStore(PointStore):
+    """
+    All points in a single sqlite database running in WAL mode.
+
+    A single connection is shared between threads and serialized with a lock.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_SQLITE_PATH):
+        self.path = Path(path).expanduser().resolve()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS points (key TEXT PRIMARY KEY, value BLOB) WITHOUT ROWID")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM points WHERE key = ?",
+                                     (key, )).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, value: bytes):
+        self.put_many({key: value})
+
+    def put_many(self, items: Dict[str, bytes]):
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO points (key, value) VALUES (?, ?)",
+                                   items.items())
+
+    def delete(self, key: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM points WHERE key = ?", (key, ))
+
+    def keys(self, prefix: str = "") -> Iterator[str]:
+        with self._lock:
+            if prefix:
+                # Range over the primary key rather than LIKE so the index is used.
+                upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+                rows = self._conn.execute(
+                    "SELECT key FROM points WHERE key >= ? AND key < ? ORDER BY key",
+                    (prefix, upper)).fetchall()
+            else:
+                rows = self._conn.execute("SELECT key FROM points ORDER BY key").fetchall()
+        return (row[0] for row in rows)
+
+    def backup(self, path: Union[str, Path]):
+        target = sqlite3.connect(str(Path(path).expanduser()))
+        try:
+            with self._lock:
+                self._conn.backup(target)
+        finally:
+            target.close()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def reopen(self) -> SQLitePointStore:
+        """
+        Return a new store with its own connection to the same database.
+        """
+        return SQLitePointStore(self.path)
+
+
+db: PointStore = FilesystemPointStore()
+
+
+def configure_point_store(backend: Literal["filesystem", "sqlite"] = "filesystem",
+                          path: Optional[str] = None) -> PointStore:
+    """
+    Replace the store used by set_point/get_point.
+    """
+    global db
+
+    if backend == "filesystem":
+        store = FilesystemPointStore(path or DEFAULT_FILESYSTEM_PATH)
+    elif backend == "sqlite":
+        store = SQLitePointStore(path or DEFAULT_SQLITE_PATH)
+    else:
+        raise ValueError(f"Unknown point store backend {backend}")
+
+    db.close()
+    db = store
+    _log.info(f"Using {type(store).__name__} point store")
+    return db
+
+
+def _reopen_in_child():
+    global db
+    # A sqlite connection must not be used across fork, the child gets its own.  The
+    # inherited connection is left alone as closing it could affect the parent.
+    if isinstance(db, SQLitePointStore):
+        db = db.reopen()
+
+
+os.register_at_fork(after_in_child=_reopen_in_child)
 
 
 def set_point(key: str, value: bytes):
@@ -20,20 +235,70 @@ def set_point(key: str, value: bytes):
         set_point("_e55a4c7a-c006-4596-b658-e23bc771b5cb.angle", -156.38295096513662)
         set_point("known_mrids": ["_4da919f1-762f-4755-b674-5faccf3faec6"])
     """
-    k = key.replace('/', '^^^^')
-    db.put(k, value)
+    db.put(key, value)
+
+
+def set_points(items: Dict[str, bytes]):
+    """
+    Set multiple points in one batch, atomically if the store supports it.
+    """
+    db.put_many(items)
 
 
 def get_point(key):
     """
     Retrieve a point from the key/value store.  If the key doesn't exist returns None.
     """
-    k = key.replace('/', '^^^^')
-    return db.get(k)
+    return db.get(key)
+
+
+def get_hrefs(prefix: str = "") -> Iterator[str]:
+    return db.keys(prefix)
+
+
+def backup_points(path: Union[str, Path]):
+    db.backup(path)
+
+
+def migrate_filesystem_store(source: Union[str, Path], target: PointStore,
+                             batch_size: int = 1000) -> int:
+    """
+    Import every point of a filesystem store into target.  Returns the number of points
+    copied.
+    """
+    fs_store = FilesystemPointStore(source)
+    batch: Dict[str, bytes] = {}
+    count = 0
+    for key in fs_store.keys():
+        batch[key] = fs_store.get(key)
+        if len(batch) >= batch_size:
+            target.put_many(batch)
+            count += len(batch)
+            batch = {}
+    if batch:
+        target.put_many(batch)
+        count += len(batch)
+    return count
+
 
+def _main():
+    parser = ArgumentParser(description="Import a filesystem point store into sqlite.")
+    parser.add_argument("--source",
+                        default=DEFAULT_FILESYSTEM_PATH,
+                        help="Directory of the filesystem store to import.")
+    parser.add_argument("--target",
+                        default=DEFAULT_SQLITE_PATH,
+                        help="Sqlite database to create or update.")
+    parser.add_argument("--backup", help="Write a backup of the target database to this file.")
+    opts = parser.parse_args()
 
-def get_hrefs():
-    return db.keys()
+    target = SQLitePointStore(opts.target)
+    count = migrate_filesystem_store(opts.source, target)
+    print(f"Imported {count} points from {opts.source} into {target.path}")
+    if opts.backup:
+        target.backup(opts.backup)
+        print(f"Backup written to {opts.backup}")
+    target.close()
 
 
 if __name__ == '__main__':
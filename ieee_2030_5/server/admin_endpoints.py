@@ -1,4 +1,5 @@
 import json
+from dataclasses import asdict
 from typing import Optional
 
 from flask import Flask, Response, render_template, request
@@ -6,13 +7,17 @@ from flask import Flask, Response, render_template, request
 import ieee_2030_5.hrefs as hrefs
 import ieee_2030_5.models as m
 from ieee_2030_5.adapters import Adapter
+from ieee_2030_5.adapters.curves import DERCurveEngine
 from ieee_2030_5.adapters.der import DERProgramAdapter
+from ieee_2030_5.adapters.dispatch import dispatch
 from ieee_2030_5.adapters.enddevices import EndDeviceAdapter
 from ieee_2030_5.adapters.fsa import FSAAdapter
+from ieee_2030_5.adapters.resolution import EffectiveControls
 from ieee_2030_5.certs import TLSRepository
 from ieee_2030_5.config import ServerConfiguration
 from ieee_2030_5.server.server_constructs import EndDevices
 from ieee_2030_5.utils import dataclass_to_xml, xml_to_dataclass
+from ieee_2030_5.utils.ingest import IngestError, parse_typed
 
 
 class AdminEndpoints:
@@ -36,6 +41,7 @@ class AdminEndpoints:
         app.add_url_rule("/admin/edev/<int:edevid>/der", view_func=self._admin_edev_ders)
         app.add_url_rule("/admin/edev/<int:edevid>/der/<int:derid>/current_derp", view_func=self._admin_edev_ders)
         app.add_url_rule("/admin/edev/<int:edevid>/der/<int:derid>", view_func=self._admin_edev_ders)
+        app.add_url_rule("/admin/edev/<int:edevid>/effective_control", view_func=self._admin_edev_effective_control)
         app.add_url_rule("/admin/edev", view_func=self._admin_edev)
         # END COMPLETE
         
@@ -44,6 +50,9 @@ class AdminEndpoints:
         app.add_url_rule("/admin/derp/<int:derp_index>/derca",  methods=['GET'], view_func=self._admin_derp_derca)
         app.add_url_rule("/admin/derp/<int:derp_index>/dderc",  methods=['GET', 'PUT'], view_func=self._admin_derp_derc)
         app.add_url_rule("/admin/derp",  methods=['GET', 'POST'], view_func=self._admin_derp)
+        app.add_url_rule("/admin/dispatch",  methods=['POST'], view_func=self._admin_dispatch)
+        app.add_url_rule("/admin/curve/<int:index>/evaluate",  methods=['GET'], view_func=self._admin_curve_evaluate)
+        app.add_url_rule("/admin/curves/evaluate",  methods=['POST'], view_func=self._admin_curves_evaluate)
         #app.add_url_rule("/admin/derp/<int:index>",  methods=['GET', 'POST'], view_func=self._derp)
         #app.add_url_rule("/admin/derp/<int:index>/derc", methods=['GET', 'POST'], view_func=self._derp_derc)
         
@@ -72,6 +81,21 @@ class AdminEndpoints:
         
         return Response(dataclass_to_xml(retval))
     
+    def _admin_edev_effective_control(self, edevid: int) -> Response:
+        """ The control in effect for the end device now, or at the time given as ?at=. """
+        at = request.args.get("at", type=int)
+        try:
+            edev = EndDeviceAdapter.fetch(edevid)
+        except KeyError:
+            return Response(f"End device {edevid} not found", status=404)
+        answer = EffectiveControls.for_end_device(edev, at)
+        if answer.control is None:
+            return Response(status=204)
+        headers = {"X-Effective-Program": answer.program.href}
+        if answer.valid_until is not None:
+            headers["X-Effective-Until"] = str(answer.valid_until)
+        return Response(dataclass_to_xml(answer.control), headers=headers)
+
     def _admin_edev_fsa(self, edevid: int, fsaid: int = -1) -> Response:
         if edevid > -1 and fsaid > -1:
             obj = EndDeviceAdapter.fetch_fsa(edev_index=edevid, fsa_index=fsaid)
@@ -187,6 +211,61 @@ class AdminEndpoints:
         return Response(dataclass_to_xml(results))
         
 
+    def _admin_dispatch(self) -> Response:
+        """
+        Dispatch one DERControl to many targets.  The body is json with control, the
+        DERControl xml, and any of programs (hrefs or indexes), lfdis, group_levels and groups.
+        """
+        body = request.get_json(force=True, silent=True)
+        if not isinstance(body, dict) or not isinstance(body.get("control"), str):
+            return Response("Expected json with a control", status=400)
+        try:
+            template = parse_typed(body["control"].encode('utf-8'), roots=(m.DERControl, ))
+        except IngestError as ex:
+            return Response(f"control must be a DERControl: {ex}", status=400)
+
+        report = dispatch(template,
+                          programs=body.get("programs", []),
+                          lfdis=body.get("lfdis", []),
+                          group_levels=body.get("group_levels", []),
+                          groups=body.get("groups", []))
+        # 200 when any target got its control, 404 when none did, including when none was given.
+        succeeded = any(result.status < 400 for result in report.results)
+        return Response(json.dumps(asdict(report)), status=200 if succeeded else 404,
+                        content_type="application/json")
+
+    def _admin_curve_evaluate(self, index: int) -> Response:
+        """ The response of a curve to the comma separated inputs given as ?x=. """
+        try:
+            x = [float(v) for v in request.args.get("x", "").split(",") if v.strip()]
+            compiled = DERCurveEngine.compiled(index)
+        except KeyError:
+            return Response(f"Curve {index} not found", status=404)
+        except ValueError as ex:
+            return Response(str(ex), status=400)
+        body = dict(href=compiled.href,
+                    version=compiled.version,
+                    curveType=compiled.curve_type.name if compiled.curve_type is not None else None,
+                    x=x,
+                    y=compiled.evaluate(x).tolist())
+        return Response(json.dumps(body), content_type="application/json")
+
+    def _admin_curves_evaluate(self) -> Response:
+        """
+        The response of many DERs.  The body is json with curves, the href or index of the
+        curve each DER follows, and x, the inputs shared by every DER or a list for each.
+        """
+        body = request.get_json(force=True, silent=True)
+        if not body or "curves" not in body or "x" not in body:
+            return Response("Expected json with curves and x", status=400)
+        try:
+            y = DERCurveEngine.evaluate_many(body["curves"], body["x"])
+        except KeyError as ex:
+            return Response(str(ex), status=404)
+        except ValueError as ex:
+            return Response(str(ex), status=400)
+        return Response(json.dumps(dict(y=y.tolist())), content_type="application/json")
+
     def _admin(self) -> Response:
         arg_path = request.args.get('path')
         device = request.args.get('device')
@@ -1,18 +1,24 @@
 from __future__ import annotations
 import logging
 from dataclasses import dataclass
-from typing import Dict, Callable, Optional
+from typing import Dict, Callable, Optional, Sequence, Type
 
 import werkzeug
 from flask import request, Response
+from werkzeug.http import is_resource_modified
 
 from ieee_2030_5.certs import TLSRepository
 from ieee_2030_5.config import ServerConfiguration
+from ieee_2030_5.data.versions import is_versioned, record_response, resource_version
 from ieee_2030_5.models import DeviceCategoryType
 import ieee_2030_5.server.server_endpoints as eps
 
 from ieee_2030_5.types_ import SEP_XML
-from ieee_2030_5.utils import dataclass_to_xml
+from ieee_2030_5.utils import dataclass_to_xml, xml_to_dataclass
+from ieee_2030_5.utils.encoding import (encode_body, negotiate_encoding, prefers_compact,
+                                        variant_name)
+from ieee_2030_5.utils.ingest import IngestError, parse_typed
+from ieee_2030_5.utils.response_cache import render_cached
 
 _log = logging.getLogger(__name__)
 
@@ -96,5 +102,58 @@ class RequestOp(ServerOperation):
 
         return pth
 
-    def build_response_from_dataclass(self, obj: dataclass) -> Response:
-        return Response(dataclass_to_xml(obj), headers=self._headers)
+    def parse_request_data(self, roots: Optional[Sequence[Type]] = None) -> dataclass:
+        """
+        The dataclass posted or put in the body of the request.  When roots is passed a body
+        holding any other type is a BadRequest, rejected before anything is built from it.
+        """
+        if roots is not None:
+            try:
+                return parse_typed(request.get_data(), roots)
+            except IngestError as ex:
+                raise werkzeug.exceptions.BadRequest(str(ex))
+        return xml_to_dataclass(request.get_data())
+
+    def build_response_from_dataclass(self, obj: dataclass, per_device: bool = False) -> Response:
+        """
+        The response to a request for obj.  per_device is True when the body served at the
+        path depends on the device asking.
+        """
+        config = self.server_config
+        compact = prefers_compact(request.headers.get('Prefer'), config.xml_compact)
+        encoding = negotiate_encoding(request.accept_encodings, config.compress_encodings)
+        headers = dict(self._headers, Vary='Accept-Encoding, Prefer')
+        if encoding:
+            headers['Content-Encoding'] = encoding
+
+        if (request.method not in ('GET', 'HEAD') or not is_versioned(request.path)
+                or not (config.conditional_get or config.response_cache)):
+            body = dataclass_to_xml(obj, compact=compact).encode('utf-8')
+            return Response(encode_body(body, encoding), headers=headers)
+
+        # Versions are kept by href, a body particular to the device or query of the request
+        # is kept under its own key.
+        variant_key = None
+        if per_device or request.query_string or getattr(obj, 'href', None) != request.path:
+            variant_key = f"{request.environ.get('ieee_2030_5_lfdi')}:{request.full_path}"
+        key, version, last_modified = resource_version(request.path, obj, variant_key)
+        variant = variant_name(compact, encoding)
+        # Each representation needs its own etag, the default one keeps the resource version.
+        etag = version if variant == variant_name(False, None) else f"{version}-{variant}"
+        conditional = config.conditional_get and ('HTTP_IF_NONE_MATCH' in request.environ
+                                                  or 'HTTP_IF_MODIFIED_SINCE' in request.environ)
+
+        if conditional and not is_resource_modified(
+                request.environ, etag=etag, last_modified=last_modified):
+            record_response(key, not_modified=True, conditional=True)
+            response = Response(status=304, headers={'Vary': headers['Vary']})
+        else:
+            response = Response(render_cached(key, version, obj, compact=compact,
+                                              encoding=encoding),
+                                headers=headers)
+            record_response(key, not_modified=False, conditional=conditional,
+                            size=response.content_length or 0)
+        if config.conditional_get:
+            response.set_etag(etag)
+            response.last_modified = last_modified
+        return response
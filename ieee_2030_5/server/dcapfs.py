@@ -15,4 +15,4 @@ class Dcap(RequestOp):
         #     raise werkzeug.exceptions.Unauthorized()
         dcap = adpt.DeviceCapabilityAdapter.get_by_lfdi(self.lfdi)
 
-        return self.build_response_from_dataclass(dcap)
\ No newline at end of file
+        return self.build_response_from_dataclass(dcap, per_device=True)
\ No newline at end of file
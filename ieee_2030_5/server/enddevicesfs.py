@@ -28,7 +28,7 @@ class EDevRequests(RequestOp):
     def put(self) -> Response:
         parsed = hrefs.EdevHref.parse(request.path)
         
-        mysubobj = xml_to_dataclass(request.data.decode('utf-8'))
+        mysubobj = self.parse_request_data()
         
         
         ed = EndDeviceAdapter.fetch(parsed.edev_index)
@@ -73,7 +73,7 @@ class EDevRequests(RequestOp):
         if not request.data:
             raise werkzeug.exceptions.Forbidden()
 
-        ed: m.EndDevice = xml_to_dataclass(request.data.decode('utf-8'))
+        ed: m.EndDevice = self.parse_request_data()
 
         if not isinstance(ed, m.EndDevice):
             raise werkzeug.exceptions.Forbidden()
@@ -109,7 +109,7 @@ class EDevRequests(RequestOp):
         edev_href = hrefs.EdevHref.parse(request.path)
         start = int(request.args.get("s", 0))
         limit = int(request.args.get("l", 1))
-        after = int(request.args.get("a", 0))
+        after = int(request.args["a"]) if "a" in request.args else None
         
 
         ed = EndDeviceAdapter.fetch_by_property('lFDI', self.lfdi)
@@ -172,7 +172,9 @@ class EDevRequests(RequestOp):
             # elif pth_split[2] == "der":
             #     retval = adpt.DERAdapter.fetch_list(edev_index=int(pth_split[1]))
             
-        return self.build_response_from_dataclass(retval)
+        # The list at /edev holds only the device asking.
+        per_device = edev_href.edev_subtype is hrefs.EDevSubType.None_Available
+        return self.build_response_from_dataclass(retval, per_device=per_device)
 
 
 class SDevRequests(RequestOp):
@@ -192,7 +194,7 @@ class SDevRequests(RequestOp):
 
         """
         end_device = self._end_devices.get_end_device_list(self.lfdi).EndDevice[0]
-        return self.build_response_from_dataclass(end_device)
+        return self.build_response_from_dataclass(end_device, per_device=True)
 
 class FSARequests(RequestOp):
     def __init__(self, **kwargs):
@@ -205,7 +207,13 @@ class FSARequests(RequestOp):
         fsa_href = hrefs.fsa_parse(request.path)
         
         if fsa_href.fsa_index == hrefs.NO_INDEX:
-            retval = FSAAdapter.fetch_all(m.FunctionSetAssignmentsList(), "FunctionSetAssignments")
+            start = int(request.args.get("s", 0))
+            limit = int(request.args.get("l", 1))
+            after = int(request.args["a"]) if "a" in request.args else None
+            retval = FSAAdapter.fetch_all(m.FunctionSetAssignmentsList(href=request.path),
+                                          start=start,
+                                          after=after,
+                                          limit=limit)
         elif fsa_href.fsa_sub == hrefs.FSASubType.DERProgram.value:
             fsa = FSAAdapter.fetch(fsa_href.fsa_index)
             retval = FSAAdapter.fetch_children(fsa, "fsa", m.DERProgramList())
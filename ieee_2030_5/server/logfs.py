@@ -22,7 +22,7 @@ class Log(RequestOp):
         server.
         """
         path = request.environ['PATH_INFO']
-        data: m.LogEvent = xml_to_dataclass(request.data.decode('utf-8'))
+        data: m.LogEvent = self.parse_request_data()
         data_type = type(data)
         if data_type not in (m.LogEvent):
             raise BAD_REQUEST()
@@ -17,6 +17,7 @@ from ieee_2030_5.data.indexer import get_href
 from ieee_2030_5.server.base_request import RequestOp
 from ieee_2030_5.server.uuid_handler import UUIDHandler
 from ieee_2030_5.utils import dataclass_to_xml, xml_to_dataclass
+from ieee_2030_5.utils.ingest import MIRROR_ROOTS
 
 
 class Error(Exception):
@@ -68,11 +69,8 @@ class MirrorUsagePointRequest(RequestOp):
         
 
     def post(self) -> Response:
-        xml = request.data.decode('utf-8')
-        data = xml_to_dataclass(request.data.decode('utf-8'))
+        data = self.parse_request_data(MIRROR_ROOTS)
         data_type = type(data)
-        if data_type not in (m.MirrorUsagePoint, m.MirrorReadingSet, m.MirrorMeterReading):
-            raise BadRequest()
 
         pth_info = request.path
         pths = pth_info.split(hrefs.SEP)
@@ -0,0 +1,206 @@
+"""
+Capture of the 2030.5 requests and responses exchanged with clients.
+
+Nothing is rendered unless capture is enabled with configure_capture.  When it is, requests
+are filtered by device (LFDI) and path prefix and sampled at sample_rate before the request
+and response bodies are decoded.  Captures are kept in a bounded ring buffer, the most recent
+are served by the /admin/protocol endpoint, and can be appended to a file as json lines by a
+background writer so disk writes never happen on the request path.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Deque, Dict, List, Optional
+
+from flask import Request, Response
+
+from ieee_2030_5.utils.encoding import decode_body
+
+__all__: List[str] = [
+    "Capture",
+    "ProtocolCapture",
+    "configure_capture",
+    "capture_exchange",
+    "get_captures",
+    "get_capture_stats"
+]
+
+_log = logging.getLogger(__name__)
+_log_protocol = logging.getLogger("protocol")
+
+
+@dataclass
+class Capture:
+    timestamp: float
+    lfdi: Optional[str]
+    method: str
+    path: str
+    query: str
+    status: int
+    request_body: str
+    response_headers: str
+    response_body: str
+
+
+class ProtocolCapture:
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.sample_rate: float = 1.0
+        self.devices: List[str] = []
+        self.path_prefixes: List[str] = []
+        self.__buffer__: Deque[Capture] = deque(maxlen=1000)
+        self.__lock__ = threading.Lock()
+        self.__file__: Optional[Path] = None
+        self.__queue__: queue.Queue = queue.Queue(maxsize=10000)
+        self.__writer__: Optional[threading.Thread] = None
+        self.captured = 0
+        self.skipped = 0
+        self.dropped = 0
+        self.written = 0
+
+    def configure(self,
+                  enabled: bool,
+                  sample_rate: float = 1.0,
+                  devices: Optional[List[str]] = None,
+                  path_prefixes: Optional[List[str]] = None,
+                  buffer_size: int = 1000,
+                  capture_file: Optional[str] = None):
+        with self.__lock__:
+            self.sample_rate = sample_rate
+            self.devices = list(devices or [])
+            self.path_prefixes = list(path_prefixes or [])
+            if buffer_size != self.__buffer__.maxlen:
+                self.__buffer__ = deque(self.__buffer__, maxlen=buffer_size)
+            self.__file__ = Path(capture_file).expanduser() if capture_file else None
+            self.enabled = enabled
+        if enabled and self.__file__ is not None:
+            self._start_writer()
+
+    def should_capture(self, lfdi: Optional[str], path: str) -> bool:
+        if self.devices and lfdi not in self.devices:
+            return False
+        if self.path_prefixes and not any(path.startswith(p) for p in self.path_prefixes):
+            return False
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def capture(self, request: Request, response: Response):
+        lfdi = request.environ.get("ieee_2030_5_lfdi")
+        if not self.should_capture(lfdi, request.path):
+            self.skipped += 1
+            return
+
+        # Streamed responses can only be read once, they are captured without the body.
+        response_body = "" if response.is_streamed else decode_body(
+            response.get_data(), response.headers.get('Content-Encoding')).decode(
+                'utf-8', errors='replace')
+        capture = Capture(timestamp=time.time(),
+                          lfdi=lfdi,
+                          method=request.method,
+                          path=request.path,
+                          query=request.query_string.decode('utf-8', errors='replace'),
+                          status=response.status_code,
+                          request_body=request.get_data().decode('utf-8', errors='replace'),
+                          response_headers=str(response.headers).strip(),
+                          response_body=response_body)
+        with self.__lock__:
+            self.__buffer__.append(capture)
+            self.captured += 1
+
+        if self.__file__ is not None:
+            try:
+                self.__queue__.put_nowait(capture)
+            except queue.Full:
+                self.dropped += 1
+
+        if _log_protocol.isEnabledFor(logging.DEBUG):
+            _log_protocol.debug("\nREQ: %s\nRESP HEADER: %s\nRESP: %s", capture.path,
+                                capture.response_headers, capture.response_body)
+
+    def get(self, limit: int = 100, lfdi: Optional[str] = None,
+            path_prefix: Optional[str] = None) -> List[Capture]:
+        """
+        The most recent captures, newest first.
+        """
+        with self.__lock__:
+            captures = list(self.__buffer__)
+        selected = []
+        for capture in reversed(captures):
+            if lfdi and capture.lfdi != lfdi:
+                continue
+            if path_prefix and not capture.path.startswith(path_prefix):
+                continue
+            selected.append(capture)
+            if len(selected) >= limit:
+                break
+        return selected
+
+    def stats(self) -> Dict:
+        return dict(enabled=self.enabled,
+                    sample_rate=self.sample_rate,
+                    buffered=len(self.__buffer__),
+                    buffer_size=self.__buffer__.maxlen,
+                    captured=self.captured,
+                    skipped=self.skipped,
+                    written=self.written,
+                    dropped=self.dropped,
+                    pending_writes=self.__queue__.qsize())
+
+    def _start_writer(self):
+        if self.__writer__ is not None and self.__writer__.is_alive():
+            return
+        self.__writer__ = threading.Thread(target=self._run_writer,
+                                           name="protocol-capture-writer",
+                                           daemon=True)
+        self.__writer__.start()
+
+    def _run_writer(self):
+        while True:
+            batch = [self.__queue__.get()]
+            # Write whatever else is waiting with one open and flush.
+            while len(batch) < 1000:
+                try:
+                    batch.append(self.__queue__.get_nowait())
+                except queue.Empty:
+                    break
+            path = self.__file__
+            if path is None:
+                continue
+            try:
+                with path.open("a") as fp:
+                    for capture in batch:
+                        fp.write(json.dumps(asdict(capture)) + "\n")
+                self.written += len(batch)
+            except OSError as ex:
+                self.dropped += len(batch)
+                _log.error(f"Unable to write protocol captures to {path} {ex}")
+
+
+__capture__ = ProtocolCapture()
+
+
+def configure_capture(enabled: bool, **kwargs):
+    __capture__.configure(enabled, **kwargs)
+
+
+def capture_exchange(request: Request, response: Response):
+    if __capture__.enabled:
+        __capture__.capture(request, response)
+
+
+def get_captures(limit: int = 100,
+                 lfdi: Optional[str] = None,
+                 path_prefix: Optional[str] = None) -> List[Capture]:
+    return __capture__.get(limit, lfdi=lfdi, path_prefix=path_prefix)
+
+
+def get_capture_stats() -> Dict:
+    return __capture__.stats()
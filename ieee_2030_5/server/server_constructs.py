@@ -131,17 +131,18 @@ def get_groups() -> Dict[GroupLevel, Group]:
     return groups
 
 
-def initialize_2030_5(config: ServerConfiguration, tlsrepo: TLSRepository):
+def initialize_2030_5(config: ServerConfiguration, tlsrepo: TLSRepository, warm: bool = False):
     """Initialize the 2030.5 server.  
     
     This method initializes the adapters from the configuration objects into
-    the persistence adapters.
+    the persistence adapters.  When warm is True the adapters have already been
+    restored from a snapshot and are not rebuilt from the configuration.
     """
     _log.debug("Initializing 2030.5")
     _log.debug("Adding server level urls to cache")
 
     # start intializing the system
-    BaseAdapter.initialize(config, tlsrepo)
+    BaseAdapter.initialize(config, tlsrepo, send_ready=not warm)
 
     # # DERControlAdapter.initialize_from_storage()
     # add_href(hrefs.get_time_href(), m.TimeLink(href=hrefs.get_time_href()))
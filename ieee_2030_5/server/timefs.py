@@ -4,6 +4,7 @@ import pytz
 import tzlocal
 
 from ieee_2030_5.server.base_request import RequestOp
+import ieee_2030_5.clock as clock
 import ieee_2030_5.models as m
 from ieee_2030_5.types_ import TimeOffsetType, format_time
 
@@ -18,10 +19,11 @@ class TimeRequest(RequestOp):
         # local_tz = datetime.now().astimezone().tzinfo
         # now_local = datetime.now().replace(tzinfo=local_tz)
 
-        now_utc = datetime.utcnow().replace(tzinfo=pytz.utc)
+        # From the server clock, which may be accelerated or simulated.
+        now_utc = clock.utcnow()
         # now_utc = pytz.utc.localize(datetime.utcnow())
         local_tz = pytz.timezone(tzlocal.get_localzone().zone)
-        now_local = datetime.now().replace(tzinfo=local_tz)
+        now_local = now_utc.astimezone(local_tz)
 
         start_dst_utc, end_dst_utc = [
             dt for dt in local_tz._utc_transition_times if dt.year == now_local.year
@@ -29,7 +31,7 @@ class TimeRequest(RequestOp):
 
         utc_offset = local_tz.utcoffset(start_dst_utc - timedelta(days=1))
         dst_offset = local_tz.utcoffset(start_dst_utc + timedelta(days=1)) - utc_offset
-        local_but_utc = datetime.now().replace(tzinfo=pytz.utc)
+        local_but_utc = now_local.replace(tzinfo=pytz.utc)
 
         tm = m.Time(currentTime=format_time(now_utc),
                     dstEndTime=format_time(end_dst_utc.replace(tzinfo=pytz.utc)),
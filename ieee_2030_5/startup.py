@@ -0,0 +1,175 @@
+"""
+Work done before the server starts answering requests, and a report of where startup time
+goes.
+
+Without it, the first request for each type of resource builds the xsdata metadata of the
+classes it renders (and the generated render functions are loaded then too), so the first
+poll of every function set is many times slower than the rest.  prewarm does that work at
+startup for the classes in ROUTED_FUNCTION_SETS.
+
+The report runs the server imports under ``python -X importtime`` in a fresh interpreter,
+then times loading the configuration and the prewarm.  With --budget-ms it exits non-zero
+when startup takes longer, so it can be run in CI:
+
+    2030_5_startup config.yml --budget-ms 2500
+"""
+from __future__ import annotations
+
+import logging
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Tuple, Type
+
+_log = logging.getLogger(__name__)
+
+__all__: List[str] = [
+    "ROUTED_FUNCTION_SETS",
+    "routed_types",
+    "prewarm",
+    "ImportTime",
+    "measure_imports"
+]
+
+# The classes rendered or parsed by each function set routed in
+# ieee_2030_5.server.server_endpoints, the classes they contain are built with them.
+ROUTED_FUNCTION_SETS: Dict[str, Tuple[str, ...]] = {
+    "dcap": ("DeviceCapability",),
+    "tm": ("Time",),
+    "sdev": ("SelfDevice",),
+    "edev": ("EndDevice", "EndDeviceList", "Registration", "DeviceInformation", "DeviceStatus",
+             "PowerStatus"),
+    "fsa": ("FunctionSetAssignments", "FunctionSetAssignmentsList"),
+    "derp": ("DERProgram", "DERProgramList", "DERControl", "DERControlList", "DefaultDERControl"),
+    "der": ("DER", "DERList", "DERCapability", "DERSettings", "DERStatus", "DERAvailability"),
+    "curve": ("DERCurve", "DERCurveList"),
+    "mup": ("MirrorUsagePoint", "MirrorUsagePointList", "MirrorMeterReading",
+            "MirrorMeterReadingList", "MirrorReadingSet"),
+    "upt": ("UsagePoint", "UsagePointList", "MeterReading", "MeterReadingList", "ReadingSet",
+            "ReadingSetList", "Reading", "ReadingList", "ReadingType"),
+    "log": ("LogEvent", "LogEventList")
+}
+
+SERVER_MODULE = "ieee_2030_5.__main__"
+
+
+def routed_types() -> List[Type]:
+    import ieee_2030_5.models as m
+
+    return [getattr(m, name) for names in ROUTED_FUNCTION_SETS.values() for name in names]
+
+
+def prewarm() -> Dict[str, float]:
+    """
+    Build the xsdata metadata of the routed classes.  Returns the seconds each step took.
+    """
+    from ieee_2030_5.utils import prewarm_xml_context
+
+    timings = {}
+    start = time.perf_counter()
+    built = prewarm_xml_context(routed_types())
+    timings["xml_context"] = time.perf_counter() - start
+    _log.info(f"Prewarmed xml metadata of {built} classes in "
+              f"{sum(timings.values()) * 1000:.0f}ms")
+    return timings
+
+
+@dataclass
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+    children: List[ImportTime] = field(default_factory=list)
+
+
+def measure_imports(module: str = SERVER_MODULE) -> ImportTime:
+    """
+    The import tree of module as reported by -X importtime in a fresh interpreter.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True,
+                            text=True,
+                            check=True)
+    # Children are listed before their parent, so keep them until a shallower import
+    # claims them.
+    pending: List[ImportTime] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entry = ImportTime(name.strip(), int(self_us), int(cumulative_us), depth)
+        while pending and pending[-1].depth > depth:
+            entry.children.insert(0, pending.pop())
+        pending.append(entry)
+    return ImportTime(module, 0, sum(entry.cumulative_us for entry in pending), -1, pending)
+
+
+def _print_imports(root: ImportTime, top: int, threshold_us: int):
+    print(f"{'cumulative ms':>14}{'self ms':>10}  module")
+
+    def walk(entry: ImportTime):
+        if entry.cumulative_us < threshold_us:
+            return
+        print(f"{entry.cumulative_us / 1000:>14.1f}{entry.self_us / 1000:>10.1f}  "
+              f"{'  ' * entry.depth}{entry.module}")
+        for child in sorted(entry.children, key=lambda c: c.cumulative_us, reverse=True)[:top]:
+            walk(child)
+
+    for entry in sorted(root.children, key=lambda c: c.cumulative_us, reverse=True):
+        walk(entry)
+
+
+def _main():
+    parser = ArgumentParser(description="Report where the startup time of the server goes.")
+    parser.add_argument(dest="config", nargs="?", help="Configuration file for the server.")
+    parser.add_argument("--budget-ms",
+                        type=float,
+                        help="Exit with status 1 when startup takes longer than this.")
+    parser.add_argument("--top",
+                        type=int,
+                        default=5,
+                        help="Number of the slowest imports shown under each module.")
+    parser.add_argument("--threshold-ms",
+                        type=float,
+                        default=5.0,
+                        help="Imports faster than this aren't shown.")
+    opts = parser.parse_args()
+
+    phases: Dict[str, float] = {}
+    imports = measure_imports()
+    phases["imports"] = imports.cumulative_us / 1e6
+    _print_imports(imports, opts.top, int(opts.threshold_ms * 1000))
+
+    __import__(SERVER_MODULE)
+
+    if opts.config:
+        import yaml
+
+        from ieee_2030_5.config import ServerConfiguration
+
+        start = time.perf_counter()
+        cfg_dict = yaml.safe_load(Path(opts.config).expanduser().resolve(strict=True).read_text())
+        ServerConfiguration(**cfg_dict)
+        phases["config"] = time.perf_counter() - start
+
+    for step, seconds in prewarm().items():
+        phases[f"prewarm {step}"] = seconds
+
+    total = sum(phases.values())
+    print()
+    for phase, seconds in phases.items():
+        print(f"{phase:<28}{seconds * 1000:>10.1f}ms")
+    print(f"{'total':<28}{total * 1000:>10.1f}ms")
+
+    if opts.budget_ms is not None and total * 1000 > opts.budget_ms:
+        print(f"Startup took {total * 1000:.0f}ms, over the budget of {opts.budget_ms:.0f}ms")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    _main()
@@ -1,7 +1,7 @@
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Type
+from typing import Iterable, Optional, Type, Union
 
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.parsers.config import ParserConfig
@@ -14,30 +14,74 @@ __parser_config__ = ParserConfig(fail_on_unknown_attributes=False,
                                  fail_on_unknown_properties=False)
 __xml_parser__ = XmlParser(config=__parser_config__, context=__xml_context__)
 __config__ = SerializerConfig(xml_declaration=False, pretty_print=True)
-__serializer__ = XmlSerializer(config=__config__)
+__serializer__ = XmlSerializer(config=__config__, context=__xml_context__)
+__compact_config__ = SerializerConfig(xml_declaration=False, pretty_print=False)
+__compact_serializer__ = XmlSerializer(config=__compact_config__, context=__xml_context__)
 __ns_map__ = {None: "urn:ieee:std:2030.5:ns"}
+__fast__ = None
 
 import ieee_2030_5.types_ as t
 import ieee_2030_5.utils.tls_wrapper as tls
 
 
-def serialize_dataclass(obj: dataclass) -> str:
+def _fast():
+    # Imported on first use, the generated module imports all of the models.
+    global __fast__
+    if __fast__ is None:
+        import ieee_2030_5.models.sep_fast as fast
+        __fast__ = fast
+    return __fast__
+
+
+def serialize_dataclass(obj: dataclass, compact: bool = False) -> str:
     """
     Serializes a dataclass that was created via xsdata to an xml string for
-    returning to a client.
+    returning to a client.  The xml is pretty printed unless compact is True.
+
+    The hot classes are rendered by the functions generated in ieee_2030_5.models.sep_fast,
+    everything else by xsdata.
     """
-    return __serializer__.render(obj, ns_map=__ns_map__)
+    fast = _fast()
+    try:
+        return fast.render(obj, compact)
+    except fast.Fallback:
+        pass
+    serializer = __compact_serializer__ if compact else __serializer__
+    return serializer.render(obj, ns_map=__ns_map__)
 
 
-def xml_to_dataclass(xml: str, type: Optional[Type] = None) -> dataclass:
+def xml_to_dataclass(xml: Union[str, bytes], type: Optional[Type] = None) -> dataclass:
     """
     Parse the xml passed and return result from loaded classes.
     """
+    fast = _fast()
+    try:
+        return fast.parse(xml, type)
+    except fast.Fallback:
+        pass
+    if isinstance(xml, bytes):
+        return __xml_parser__.from_bytes(xml, type)
     return __xml_parser__.from_string(xml, type)
 
 
-def dataclass_to_xml(dc: dataclass) -> str:
-    return serialize_dataclass(dc)
+def dataclass_to_xml(dc: dataclass, compact: bool = False) -> str:
+    return serialize_dataclass(dc, compact=compact)
+
+
+def prewarm_xml_context(classes: Iterable[Type]) -> int:
+    """
+    Build the xsdata metadata of classes, and of every class they contain, that is otherwise
+    built by the first request to render or parse each of them.  Returns the number of
+    classes built.
+    """
+    _fast()
+    before = len(__xml_context__.cache)
+    for clazz in classes:
+        __xml_context__.build_recursive(clazz)
+    # The index of classes by xsi:type that parsing a document of unknown type needs.  It is
+    # rebuilt when more modules have been imported since, so this is done last.
+    __xml_context__.build_xsi_cache()
+    return len(__xml_context__.cache) - before
 
 
 def get_lfdi_from_cert(path: Path) -> t.Lfdi:
@@ -0,0 +1,524 @@
+"""
+Generator of the specialized xml render and parse functions in ieee_2030_5.models.sep_fast.
+
+xsdata renders and parses by walking the XmlContext metadata of each class for every
+element of every document.  For the resources the server renders on each poll and parses on
+each post the generator writes a function per class with the attributes and elements,
+their order and how each value is converted spelled out, so only the values are looked at
+when a document is rendered or parsed.
+
+The generated functions produce the same xml as xsdata, byte for byte, for the documents
+they handle and raise Fallback for anything else (a class that wasn't generated, a subclass
+needing xsi:type, a value xsdata would convert differently), in which case
+ieee_2030_5.utils renders or parses the document with xsdata.
+
+Regenerate after the models change and check the generated code against xsdata with:
+
+    python -m ieee_2030_5.utils.codegen
+    python -m ieee_2030_5.utils.codegen --check
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import inspect
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Type
+
+from xsdata.formats.dataclass.context import XmlContext
+
+__all__: List[str] = ["HOT_TYPES", "generate", "check"]
+
+SEP_NAMESPACE = "urn:ieee:std:2030.5:ns"
+GENERATED_PATH = Path(__file__).parent.parent / "models" / "sep_fast.py"
+
+# Roots of the generated classes, every class they contain is generated as well.
+HOT_TYPES = ("DeviceCapability", "EndDevice", "EndDeviceList", "Registration",
+             "FunctionSetAssignments", "FunctionSetAssignmentsList", "DER", "DERList",
+             "DERCapability", "DERSettings", "DERStatus", "DERAvailability", "DERControl",
+             "DERControlList", "DefaultDERControl", "DERProgram", "DERProgramList", "DERCurve",
+             "DERCurveList", "MirrorUsagePoint", "MirrorUsagePointList", "MirrorMeterReading",
+             "MirrorMeterReadingList", "MirrorReadingSet", "Reading", "ReadingList",
+             "ReadingSet", "ReadingSetList", "ReadingType", "MeterReading", "MeterReadingList",
+             "UsagePoint", "UsagePointList", "Time", "LogEvent", "LogEventList")
+
+_RUNTIME = '''"""
+Specialized xml render and parse functions for the hot 2030.5 classes.
+
+Generated by ieee_2030_5.utils.codegen, do not edit.
+"""
+from __future__ import annotations
+
+import binascii
+import re
+from enum import Enum
+from typing import Any, Dict, List, Optional, Type
+from xml.etree.ElementTree import ParseError, fromstring
+from xml.sax.saxutils import escape, quoteattr
+
+import ieee_2030_5.models.sep as sep
+
+__all__: List[str] = ["Fallback", "RENDERERS", "PARSERS", "render", "parse"]
+
+
+class Fallback(Exception):
+    """ Raised when a document must be rendered or parsed by xsdata. """
+
+
+_ATTR_ENTITIES = {"\\n": "&#10;", "\\r": "&#13;", "\\t": "&#9;"}
+_HEX = re.compile(r"^[0-9a-fA-F]*$")
+_XSI = "{http://www.w3.org/2001/XMLSchema-instance}"
+
+
+def _value(v: Any, base16: bool) -> str:
+    if isinstance(v, bool):
+        return "true" if v else "false"
+    if isinstance(v, Enum):
+        return _value(v.value, base16)
+    if isinstance(v, int):
+        return str(int(v))
+    if isinstance(v, str):
+        return str(v)
+    if isinstance(v, bytes) and base16:
+        return v.hex().upper()
+    raise Fallback()
+
+
+def _int(v: Any) -> str:
+    return str(v) if type(v) is int else _value(v, False)
+
+
+def _str(v: Any) -> str:
+    return v if type(v) is str else _value(v, False)
+
+
+def _bool(v: Any) -> str:
+    if v is True:
+        return "true"
+    if v is False:
+        return "false"
+    return _value(v, False)
+
+
+def _hex(v: Any) -> str:
+    return v.hex().upper() if type(v) is bytes else _value(v, True)
+
+
+def _leaf(out: List[str], ind: str, tag: str, text: str, nl: str):
+    if text:
+        out.append(f"{ind}<{tag}>{escape(text)}</{tag}>{nl}")
+    else:
+        out.append(f"{ind}<{tag}/>{nl}")
+
+
+def _attr(name: str, text: str) -> str:
+    return f" {name}={quoteattr(text, _ATTR_ENTITIES)}"
+
+
+def _close(out: List[str], start: int, head: str, ind: str, tag: str, nl: str):
+    if len(out) == start + 1:
+        out[start] = f"{head}/>{nl}"
+    else:
+        out[start] = f"{head}>{nl}"
+        out.append(f"{ind}</{tag}>{nl}")
+
+
+def _pint(text: Optional[str]) -> int:
+    try:
+        return int(text)
+    except (TypeError, ValueError):
+        raise Fallback()
+
+
+def _pstr(text: Optional[str]) -> str:
+    return "" if text is None else text
+
+
+def _pbool(text: Optional[str]) -> bool:
+    if text == "true" or text == "1":
+        return True
+    if text == "false" or text == "0":
+        return False
+    raise Fallback()
+
+
+def _phex(text: Optional[str]) -> bytes:
+    if text is None:
+        return b""
+    if not _HEX.match(text) or len(text) % 2:
+        raise Fallback()
+    return binascii.unhexlify(text)
+
+
+def _leaf_text(el) -> Optional[str]:
+    if len(el) or el.attrib:
+        raise Fallback()
+    return el.text
+
+
+def _parse_children(el, kw: Dict[str, Any], elements: Dict[str, tuple]):
+    for child in el:
+        entry = elements.get(child.tag)
+        if entry is None:
+            raise Fallback()
+        name, convert, many = entry
+        value = convert(child)
+        if many:
+            kw.setdefault(name, []).append(value)
+        elif name in kw:
+            raise Fallback()
+        else:
+            kw[name] = value
+
+
+def _parse_attributes(el, kw: Dict[str, Any], attributes: Dict[str, tuple]):
+    for key, text in el.attrib.items():
+        entry = attributes.get(key)
+        if entry is None:
+            if key.startswith(_XSI):
+                raise Fallback()
+            continue
+        name, convert = entry
+        kw[name] = convert(text)
+'''
+
+_FOOTER = '''
+
+def render(obj: Any, compact: bool = False) -> str:
+    """
+    The xml of obj, identical to xsdata's.  Raises Fallback when obj isn't generated.
+    """
+    renderer = RENDERERS.get(type(obj))
+    if renderer is None:
+        raise Fallback()
+    tag, fn = renderer
+    out: List[str] = []
+    fn(obj, tag, out, "", "" if compact else "\\n", f' xmlns="{NAMESPACE}"')
+    return "".join(out)
+
+
+def parse(xml, clazz: Optional[Type] = None) -> Any:
+    """
+    The dataclass of the xml document, str or bytes.  Raises Fallback when the root isn't
+    generated or the document holds anything xsdata would parse differently.
+    """
+    try:
+        root = fromstring(xml)
+    except (ParseError, ValueError):
+        raise Fallback()
+    entry = PARSERS.get(root.tag)
+    if entry is None or (clazz is not None and entry[0] is not clazz):
+        raise Fallback()
+    return entry[1](root)
+'''
+
+
+def _split(qname: str):
+    if qname.startswith("{"):
+        uri, local = qname[1:].split("}", 1)
+        return uri, local
+    return "", qname
+
+
+class _Generator:
+
+    def __init__(self):
+        import ieee_2030_5.models.sep as sep
+
+        self.context = XmlContext()
+        self.classes: Dict[str, Type] = {
+            name: value
+            for name, value in vars(sep).items()
+            if inspect.isclass(value) and dataclasses.is_dataclass(value)
+            and value.__module__ == sep.__name__
+        }
+
+    def closure(self, roots) -> List[Type]:
+        seen: Set[Type] = set()
+        order: List[Type] = []
+
+        def visit(clazz: Type):
+            if clazz in seen or not self.supported(clazz):
+                return
+            seen.add(clazz)
+            order.append(clazz)
+            for var in self.context.build(clazz).get_all_vars():
+                if var.clazz is not None:
+                    visit(var.clazz)
+
+        for name in roots:
+            visit(self.classes[name])
+        return order
+
+    def supported(self, clazz: Type) -> bool:
+        meta = self.context.build(clazz)
+        if _split(meta.qname)[0] != SEP_NAMESPACE:
+            return False
+        for var in meta.get_all_vars():
+            if not (var.is_attribute or var.is_element) or var.tokens or var.wrapper:
+                return False
+            if var.clazz is None and var.types[0] not in (int, str, bool, bytes):
+                return False
+            if var.types[0] is bytes and var.format != "base16":
+                return False
+        return True
+
+    def source(self, classes: List[Type]) -> str:
+        lines = [_RUNTIME, f'NAMESPACE = "{SEP_NAMESPACE}"', ""]
+        generated = set(classes)
+        for clazz in classes:
+            lines.extend(self.render_function(clazz, generated))
+        tables = []
+        for clazz in classes:
+            table, function = self.parse_function(clazz, generated)
+            tables.extend(table)
+            lines.extend(function)
+        # The tables name the parse functions so they come after all of them.
+        lines.extend(tables)
+        lines.append("")
+        lines.append("RENDERERS: Dict[Type, tuple] = {")
+        for clazz in classes:
+            tag = _split(self.context.build(clazz).qname)[1]
+            lines.append(f'    sep.{clazz.__name__}: ("{tag}", _r_{clazz.__name__}),')
+        lines.append("}")
+        lines.append("")
+        lines.append("PARSERS: Dict[str, tuple] = {")
+        for clazz in classes:
+            qname = self.context.build(clazz).qname
+            lines.append(f'    "{qname}": (sep.{clazz.__name__}, _p_{clazz.__name__}),')
+        lines.append("}")
+        return "\n".join(lines) + _FOOTER
+
+    @staticmethod
+    def _text_fn(var) -> str:
+        kind = var.types[0]
+        return {int: "_int", str: "_str", bool: "_bool", bytes: "_hex"}[kind]
+
+    @staticmethod
+    def _parse_fn(var) -> str:
+        kind = var.types[0]
+        return {int: "_pint", str: "_pstr", bool: "_pbool", bytes: "_phex"}[kind]
+
+    def render_function(self, clazz: Type, generated: Set[Type]) -> List[str]:
+        name = clazz.__name__
+        meta = self.context.build(clazz)
+        lines = ["", "", f"def _r_{name}(o, tag, out, ind, nl, ns):",
+                 "    head = f\"{ind}<{tag}{ns}\""]
+        variables = meta.get_all_vars()
+        for var in variables:
+            if var.is_attribute:
+                lines.extend([f"    v = o.{var.name}",
+                              "    if v is not None:",
+                              f"        head += _attr(\"{var.local_name}\", {self._text_fn(var)}(v))"])
+        elements = [var for var in variables if var.is_element]
+        if not elements:
+            lines.append("    out.append(f\"{head}/>{nl}\")")
+            return lines
+        lines.extend(["    start = len(out)",
+                      "    out.append(head)",
+                      "    inner = ind + \"  \" if nl else \"\""])
+        for var in elements:
+            tag = var.local_name
+            if var.clazz is not None:
+                child = var.clazz.__name__
+                if var.clazz in generated:
+                    call = [f"        if type(v) is not sep.{child}:",
+                            "            raise Fallback()",
+                            f"        _r_{child}(v, \"{tag}\", out, inner, nl, \"\")"]
+                else:
+                    call = ["        raise Fallback()"]
+            else:
+                call = [f"        _leaf(out, inner, \"{tag}\", {self._text_fn(var)}(v), nl)"]
+            if var.list_element:
+                lines.append(f"    for v in o.{var.name} or ():")
+                lines.append("        if v is None:")
+                lines.append("            continue")
+                lines.extend(call)
+            else:
+                lines.append(f"    v = o.{var.name}")
+                lines.append("    if v is not None:")
+                lines.extend([line for line in call])
+        lines.append("    _close(out, start, head, ind, tag, nl)")
+        return lines
+
+    def parse_function(self, clazz: Type, generated: Set[Type]) -> Tuple[List[str], List[str]]:
+        name = clazz.__name__
+        meta = self.context.build(clazz)
+        attributes, elements = [], []
+        for var in meta.get_all_vars():
+            if var.is_attribute:
+                attributes.append(f'    "{var.qname}": ("{var.name}", {self._parse_fn(var)}),')
+            elif var.clazz is not None:
+                if var.clazz not in generated:
+                    continue
+                elements.append(f'    "{var.qname}": ("{var.name}", _p_{var.clazz.__name__}, '
+                                f'{var.list_element}),')
+            else:
+                elements.append(f'    "{var.qname}": ("{var.name}", '
+                                f'lambda el: {self._parse_fn(var)}(_leaf_text(el)), '
+                                f'{var.list_element}),')
+        table = ["", f"_A_{name} = {{", *attributes, "}", f"_E_{name} = {{", *elements, "}"]
+        function = ["", "", f"def _p_{name}(el):",
+                    "    kw = {}",
+                    f"    _parse_attributes(el, kw, _A_{name})",
+                    f"    _parse_children(el, kw, _E_{name})",
+                    f"    return sep.{name}(**kw)"]
+        return table, function
+
+
+def generate(path: Path = GENERATED_PATH, roots=HOT_TYPES) -> List[Type]:
+    """
+    Write the render and parse functions of roots, and the classes they contain, to path.
+    """
+    generator = _Generator()
+    classes = generator.closure(roots)
+    path.write_text(generator.source(classes) + "\n")
+    return classes
+
+
+def _sample(clazz: Type, depth: int, full: bool, context: XmlContext, seed: List[int]):
+    """ An instance of clazz with every field set (when full) to values that exercise the
+    conversions and escaping of the generated code. """
+    values = {}
+    for var in context.build(clazz).get_all_vars():
+        if not full and var.is_element:
+            continue
+        seed[0] += 1
+        n = seed[0]
+        if var.clazz is not None:
+            if depth <= 0:
+                continue
+            value = _sample(var.clazz, depth - 1, full, context, seed)
+        elif var.types[0] is int:
+            value = -n if n % 3 == 0 else n
+        elif var.types[0] is bool:
+            value = n % 2 == 0
+        elif var.types[0] is bytes:
+            value = bytes([n % 256, 0xAB])
+        else:
+            value = ["", "plain", "a&b<c>d\"e'f", " spaced\n\ttext "][n % 4]
+        values[var.name] = [value, value] if var.list_element else value
+    return clazz(**values)
+
+
+def check(verbose: bool = False) -> int:
+    """
+    Differential check of the generated functions against xsdata over every model class,
+    returns the number of mismatches.  The generated module differing from what generate
+    would write counts as one.
+    """
+    import warnings
+
+    import ieee_2030_5.models.sep_fast as fast
+    import ieee_2030_5.utils as utils
+    from ieee_2030_5.models import sep
+
+    failures = rendered = parsed = 0
+    generator = _Generator()
+    if GENERATED_PATH.read_text() != generator.source(generator.closure(HOT_TYPES)) + "\n":
+        failures += 1
+        print(f"{GENERATED_PATH} is out of date, run ieee_2030_5.utils.codegen without --check")
+
+    context = XmlContext()
+    classes = [
+        value for value in vars(sep).values()
+        if inspect.isclass(value) and dataclasses.is_dataclass(value)
+        and value.__module__ == sep.__name__
+    ]
+    seed = [0]
+    warnings.simplefilter("ignore")
+    for clazz in classes:
+        for full in (False, True):
+            obj = _sample(clazz, 3, full, context, seed)
+            for compact in (False, True):
+                expected = utils.__compact_serializer__.render(obj, ns_map=utils.__ns_map__) \
+                    if compact else utils.__serializer__.render(obj, ns_map=utils.__ns_map__)
+                try:
+                    actual = fast.render(obj, compact)
+                    rendered += 1
+                except fast.Fallback:
+                    actual = expected
+                if actual != expected:
+                    failures += 1
+                    print(f"render mismatch {clazz.__name__} compact={compact}")
+                    if verbose:
+                        print(expected)
+                        print(actual)
+                expected_obj = utils.__xml_parser__.from_string(expected, clazz)
+                try:
+                    actual_obj = fast.parse(expected, clazz)
+                    parsed += 1
+                except fast.Fallback:
+                    actual_obj = expected_obj
+                if actual_obj != expected_obj:
+                    failures += 1
+                    print(f"parse mismatch {clazz.__name__} compact={compact}")
+                    if verbose:
+                        print(expected_obj)
+                        print(actual_obj)
+    print(f"{len(classes)} classes, {rendered} documents rendered and {parsed} parsed by the "
+          f"generated code, {failures} mismatches")
+    return failures
+
+
+def _benchmark():
+    import time
+
+    import ieee_2030_5.models as m
+    import ieee_2030_5.models.sep_fast as fast
+    import ieee_2030_5.utils as utils
+
+    count = 50
+    samples = [
+        m.EndDeviceList(href="/edev", all=count, results=count, EndDevice=[
+            m.EndDevice(href=f"/edev_{i}", lFDI=f"{i:040X}", sFDI=i, changedTime=1700000000,
+                        DERListLink=m.DERListLink(href=f"/edev_{i}_der", all=1),
+                        RegistrationLink=m.RegistrationLink(href=f"/edev_{i}_rg"),
+                        FunctionSetAssignmentsListLink=m.FunctionSetAssignmentsListLink(
+                            href=f"/edev_{i}_fsa", all=1)) for i in range(count)
+        ]),
+        m.DERControlList(href="/derp_0_derc", all=count, results=count, DERControl=[
+            m.DERControl(href=f"/derp_0_derc_{i}", mRID=f"{i:032X}", creationTime=1700000000,
+                         EventStatus=m.EventStatus(currentStatus=0, dateTime=1700000000,
+                                                   potentiallySuperseded=False),
+                         interval=m.DateTimeInterval(duration=900, start=1700000000 + i * 900),
+                         DERControlBase=m.DERControlBase(opModConnect=True, opModFixedW=50))
+            for i in range(count)
+        ]),
+        m.MirrorMeterReading(mRID="0A" * 16, description="Real Power", MirrorReadingSet=[
+            m.MirrorReadingSet(mRID=f"{i:032X}", timePeriod=m.DateTimeInterval(duration=60,
+                                                                              start=i * 60),
+                               Reading=[m.Reading(value=i * 10 + r) for r in range(10)])
+            for i in range(10)
+        ])
+    ]
+    repeat = 50
+    print(f"{'resource':<20}{'xsdata render':>15}{'generated':>11}{'xsdata parse':>14}"
+          f"{'generated':>11}  (us)")
+    for sample in samples:
+        xml = utils.__serializer__.render(sample, ns_map=utils.__ns_map__)
+        timings = []
+        for fn, arg in ((lambda o: utils.__serializer__.render(o, ns_map=utils.__ns_map__),
+                         sample), (fast.render, sample),
+                        (lambda x: utils.__xml_parser__.from_string(x, type(sample)), xml),
+                        (lambda x: fast.parse(x, type(sample)), xml)):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                fn(arg)
+            timings.append((time.perf_counter() - start) / repeat * 1e6)
+        print(f"{type(sample).__name__:<20}{timings[0]:>15.0f}{timings[1]:>11.0f}"
+              f"{timings[2]:>14.0f}{timings[3]:>11.0f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--check", action="store_true",
+                        help="Compare the generated code with xsdata and benchmark it.")
+    parser.add_argument("--verbose", action="store_true")
+    opts = parser.parse_args()
+    if opts.check:
+        mismatches = check(opts.verbose)
+        _benchmark()
+        raise SystemExit(1 if mismatches else 0)
+    classes = generate()
+    print(f"Generated {len(classes)} classes in {GENERATED_PATH}")
@@ -0,0 +1,127 @@
+"""
+Wire format of response bodies: compact or pretty printed xml and gzip or deflate content
+encoding negotiated from the Accept-Encoding of the request.
+
+Pretty printing adds the indentation of every element to the body, for list resources that
+is a third or more of the bytes sent.  Constrained clients can ask for compact xml with a
+"Prefer: compact" header, or the server can default to it with xml_compact, and a
+"Prefer: pretty" header asks for pretty printed xml either way.
+"""
+from __future__ import annotations
+
+import gzip
+import zlib
+from typing import Callable, Dict, List, Optional, Sequence
+
+from werkzeug.datastructures import Accept
+
+__all__: List[str] = [
+    "ENCODERS",
+    "negotiate_encoding",
+    "encode_body",
+    "decode_body",
+    "prefers_compact",
+    "variant_name"
+]
+
+# Encoded with fixed settings (and no gzip timestamp) so the same body always encodes to
+# the same bytes and can be cached.
+ENCODERS: Dict[str, Callable[[bytes], bytes]] = {
+    "gzip": lambda body: gzip.compress(body, compresslevel=6, mtime=0),
+    "deflate": lambda body: zlib.compress(body, 6)
+}
+
+
+def negotiate_encoding(accept_encodings: Accept, allowed: Sequence[str]) -> Optional[str]:
+    """
+    The content encoding, of those allowed, the client prefers.  None when the body should be
+    sent as is.
+    """
+    allowed = [encoding for encoding in allowed if encoding in ENCODERS]
+    if not allowed or not accept_encodings:
+        return None
+    return accept_encodings.best_match(allowed)
+
+
+def encode_body(body: bytes, encoding: Optional[str]) -> bytes:
+    if encoding is None:
+        return body
+    return ENCODERS[encoding](body)
+
+
+def decode_body(body: bytes, encoding: Optional[str]) -> bytes:
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        return zlib.decompress(body)
+    return body
+
+
+def prefers_compact(prefer: Optional[str], default: bool) -> bool:
+    """
+    Whether xml should be compact given the Prefer header of a request.
+    """
+    if prefer:
+        preferences = {p.strip().lower() for p in prefer.split(",")}
+        if "compact" in preferences:
+            return True
+        if "pretty" in preferences:
+            return False
+    return default
+
+
+def variant_name(compact: bool, encoding: Optional[str]) -> str:
+    """
+    Name of a representation of a resource, used to key cached bodies and to keep the ETags of
+    each representation distinct.
+    """
+    name = "compact" if compact else "pretty"
+    return f"{name}-{encoding}" if encoding else name
+
+
+if __name__ == '__main__':
+    import time
+
+    import ieee_2030_5.models as m
+    from ieee_2030_5.utils import dataclass_to_xml
+
+    count = 50
+    edevs = m.EndDeviceList(href="/edev", all=count, results=count, EndDevice=[
+        m.EndDevice(href=f"/edev_{i}", lFDI=f"{i:040X}".encode(), sFDI=i, changedTime=1700000000,
+                    DERListLink=m.DERListLink(href=f"/edev_{i}_der", all=1),
+                    RegistrationLink=m.RegistrationLink(href=f"/edev_{i}_rg"),
+                    FunctionSetAssignmentsListLink=m.FunctionSetAssignmentsListLink(
+                        href=f"/edev_{i}_fsa", all=1)) for i in range(count)
+    ])
+    programs = m.DERProgramList(href="/derp", all=count, results=count, DERProgram=[
+        m.DERProgram(href=f"/derp_{i}", mRID=f"{i:032X}", description=f"Program {i}", primacy=i,
+                     DefaultDERControlLink=m.DefaultDERControlLink(href=f"/derp_{i}_dderc"),
+                     DERControlListLink=m.DERControlListLink(href=f"/derp_{i}_derc", all=1),
+                     DERCurveListLink=m.DERCurveListLink(href=f"/derp_{i}_dc", all=1))
+        for i in range(count)
+    ])
+    mirrors = m.MirrorUsagePointList(href="/mup", all=count, results=count, MirrorUsagePoint=[
+        m.MirrorUsagePoint(href=f"/mup_{i}", mRID=f"{i:032X}", description=f"Meter {i}",
+                           roleFlags=b"\x00\x49", serviceCategoryKind=0, status=1,
+                           deviceLFDI=f"{i:040X}".encode(), postRate=60,
+                           MirrorMeterReading=[
+                               m.MirrorMeterReading(mRID=f"{i:030X}{r:02X}",
+                                                    description=f"Reading {r}",
+                                                    Reading=m.Reading(value=1000 + r,
+                                                                      qualityFlags=b"\x00\x01"))
+                               for r in range(3)
+                           ]) for i in range(count)
+    ])
+
+    requests = 100
+    print(f"{'resource':<22}{'format':<18}{'bytes':>8}{'us/request':>12}")
+    for resource in (edevs, programs, mirrors):
+        for compact in (False, True):
+            for encoding in (None, "gzip", "deflate"):
+                start = time.perf_counter()
+                for _ in range(requests):
+                    body = encode_body(dataclass_to_xml(resource, compact=compact).encode('utf-8'),
+                                       encoding)
+                elapsed = (time.perf_counter() - start) / requests * 1e6
+                print(f"{type(resource).__name__:<22}{variant_name(compact, encoding):<18}"
+                      f"{len(body):>8}{elapsed:>12.0f}")
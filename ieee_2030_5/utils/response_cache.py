@@ -0,0 +1,201 @@
+"""
+Cache of rendered response bodies keyed by href, resource version and representation.
+
+Rendering a dataclass with xsdata is the most expensive part of answering a GET, and most
+polls are for resources that haven't changed, many of them (programs, curves, default
+controls) the same for every device.  Bodies are cached by the href and the version from
+ieee_2030_5.data.versions, so a resource is rendered once per change rather than once per
+poll and a stale body can never be served.  Each representation (compact or pretty
+printed, gzip or deflate encoded, see ieee_2030_5.utils.encoding) is cached separately.
+The entries for an href are dropped as soon as the resource is changed through the indexer
+or an Adapter and the least recently used entries are evicted once max_bytes is reached.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from ieee_2030_5.data.versions import resource_changed, resources_changed
+from ieee_2030_5.utils import dataclass_to_xml
+from ieee_2030_5.utils.encoding import encode_body, variant_name
+
+__all__: List[str] = [
+    "ResponseCache",
+    "configure_response_cache",
+    "render_cached",
+    "invalidate_response",
+    "get_response_cache_stats"
+]
+
+_log = logging.getLogger(__name__)
+
+
+class ResponseCache:
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.enabled: bool = True
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.__entries__: OrderedDict[Tuple[str, str, str], bytes] = OrderedDict()
+        self.__versions__: Dict[str, Set[Tuple[str, str]]] = {}
+        self.__lock__ = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def configure(self, enabled: bool, max_bytes: Optional[int] = None):
+        with self.__lock__:
+            self.enabled = enabled
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            if not enabled:
+                self._clear()
+            self._evict()
+
+    def get_or_render(self, href: str, version: str, render: Callable[[], bytes],
+                      variant: str = "") -> bytes:
+        if not self.enabled:
+            return render()
+
+        key = (href, version, variant)
+        with self.__lock__:
+            body = self.__entries__.get(key)
+            if body is not None:
+                self.__entries__.move_to_end(key)
+                self.hits += 1
+                return body
+            self.misses += 1
+
+        # Rendered outside of the lock, two threads missing on the same key render the same
+        # bytes.
+        body = render()
+        if len(body) > self.max_bytes:
+            return body
+
+        with self.__lock__:
+            if key not in self.__entries__:
+                self.__entries__[key] = body
+                self.__versions__.setdefault(href, set()).add((version, variant))
+                self.size_bytes += len(body)
+                self._evict()
+        return body
+
+    def invalidate(self, href: str):
+        with self.__lock__:
+            self._invalidate(href)
+
+    def invalidate_all(self, hrefs: List[str]):
+        with self.__lock__:
+            for href in hrefs:
+                self._invalidate(href)
+
+    def _invalidate(self, href: str):
+        versions = self.__versions__.pop(href, None)
+        if not versions:
+            return
+        for version, variant in versions:
+            self.size_bytes -= len(self.__entries__.pop((href, version, variant)))
+        self.invalidations += 1
+
+    def clear(self):
+        with self.__lock__:
+            self._clear()
+
+    def stats(self) -> Dict:
+        with self.__lock__:
+            lookups = self.hits + self.misses
+            return dict(enabled=self.enabled,
+                        entries=len(self.__entries__),
+                        size_bytes=self.size_bytes,
+                        max_bytes=self.max_bytes,
+                        hits=self.hits,
+                        misses=self.misses,
+                        evictions=self.evictions,
+                        invalidations=self.invalidations,
+                        hit_rate=self.hits / lookups if lookups else 0.0)
+
+    def _clear(self):
+        self.__entries__.clear()
+        self.__versions__.clear()
+        self.size_bytes = 0
+
+    def _evict(self):
+        while self.size_bytes > self.max_bytes and self.__entries__:
+            (href, version, variant), body = self.__entries__.popitem(last=False)
+            self.size_bytes -= len(body)
+            versions = self.__versions__[href]
+            versions.discard((version, variant))
+            if not versions:
+                del self.__versions__[href]
+            self.evictions += 1
+
+
+__cache__ = ResponseCache()
+
+
+def _on_resource_changed(href: str, **kwargs):
+    __cache__.invalidate(href)
+
+
+def _on_resources_changed(sender, keys: List[str], **kwargs):
+    __cache__.invalidate_all(keys)
+
+
+resource_changed.connect(_on_resource_changed)
+resources_changed.connect(_on_resources_changed)
+
+
+def configure_response_cache(enabled: bool, max_bytes: Optional[int] = None):
+    __cache__.configure(enabled, max_bytes)
+
+
+def render_cached(href: str,
+                  version: str,
+                  obj: dataclass,
+                  compact: bool = False,
+                  encoding: Optional[str] = None) -> bytes:
+    """
+    The xml of obj, the version of obj served at href, rendered and encoded only if it isn't
+    cached.
+    """
+    return __cache__.get_or_render(
+        href, version,
+        lambda: encode_body(dataclass_to_xml(obj, compact=compact).encode('utf-8'), encoding),
+        variant=variant_name(compact, encoding))
+
+
+def invalidate_response(href: str):
+    __cache__.invalidate(href)
+
+
+def get_response_cache_stats() -> Dict:
+    return __cache__.stats()
+
+
+if __name__ == '__main__':
+    import time
+
+    import ieee_2030_5.models as m
+    from ieee_2030_5.data.versions import digest
+
+    curve = m.DERCurve(href="/derp_0_dc_0", mRID="CURVE", description="Volt-Var", curveType=11,
+                       CurveData=[m.CurveData(xvalue=x, yvalue=100 - x) for x in range(10)])
+    polls = 1000
+
+    start = time.perf_counter()
+    for _ in range(polls):
+        dataclass_to_xml(curve).encode('utf-8')
+    rendered = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(polls):
+        render_cached(curve.href, digest(curve), curve)
+    cached = time.perf_counter() - start
+
+    print(f"{polls} polls of {curve.href} rendered each time {rendered * 1000:.1f}ms, "
+          f"cached {cached * 1000:.1f}ms")
+    print(get_response_cache_stats())
@@ -1,6 +1,20 @@
+import datetime
 import subprocess
 from pathlib import Path
 
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+
+def _subject_name(common_name: str) -> str:
+    subject_name = common_name.split(":")[0]  # JUNE 28, CAUSING ISSUES W/ IPV6 ADDR AS HOSTNAME
+
+    if (subject_name == "fd99"):    # ADDED!!! JUNE 28
+        subject_name = "fd99:d694:f603:27ad:400b:22ff:fe42:a1f2"   # ADDED!!! JUNE 28
+    return subject_name
+
 
 class TLSWrap:
 
@@ -136,10 +150,7 @@ class OpensslWrapper(TLSWrap):
     @staticmethod
     def tls_create_csr(common_name: str, private_key_file: Path, server_csr_file: Path):
         OpensslWrapper.__set_cnf_from_cert_path___(private_key_file)
-        subject_name = common_name.split(":")[0]  # JUNE 28, CAUSING ISSUES W/ IPV6 ADDR AS HOSTNAME
-
-        if (subject_name == "fd99"):    # ADDED!!! JUNE 28
-            subject_name = "fd99:d694:f603:27ad:400b:22ff:fe42:a1f2"   # ADDED!!! JUNE 28
+        subject_name = _subject_name(common_name)
 
         # openssl req -new -key server.key -out server.csr -sha256
         cmd = [
@@ -158,10 +169,7 @@ class OpensslWrapper(TLSWrap):
                                       cert_file: Path,
                                       as_server: bool = False):
         OpensslWrapper.__set_cnf_from_cert_path___(cert_file)
-        subject_name = common_name.split(":")[0]     # JUNE 28, CAUSING ISSUES W/ IPV6 ADDR AS HOSTNAME
-       
-        if (subject_name == "fd99"):    # ADDED!!! JUNE 28
-            subject_name = "fd99:d694:f603:27ad:400b:22ff:fe42:a1f2"   # ADDED!!! JUNE 28
+        subject_name = _subject_name(common_name)
 
         csr_file = Path(f"/tmp/{common_name}")
         OpensslWrapper.tls_create_csr(common_name, private_key_file, csr_file)
@@ -244,3 +252,110 @@ class OpensslWrapper(TLSWrap):
                     fp.write(f"{line}\n")
                     if "END" in line:
                         in_between = False
+
+
+class CryptographyWrapper(TLSWrap):
+    """
+    In process implementation of TLSWrap using the cryptography package.
+
+    Produces the same files as OpensslWrapper: prime256v1 keys, a self signed v3_ca
+    certificate, certificates signed with sha256 for 365 days and a combined pem holding the
+    certificate followed by the unencrypted private key.  No temporary files are used so
+    certificates can be created from several processes at once.  Serial numbers are random
+    rather than taken from the openssl ca serial file and index.txt is not updated.
+    """
+
+    def __init__(self, opensslconf: Path = None):
+        pass
+
+    @staticmethod
+    def _name(common_name: str) -> x509.Name:
+        return x509.Name([
+            x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
+            x509.NameAttribute(NameOID.COMMON_NAME, common_name)
+        ])
+
+    @staticmethod
+    def _load_key(private_key_file: Path):
+        return serialization.load_pem_private_key(Path(private_key_file).read_bytes(), password=None)
+
+    @staticmethod
+    def _load_cert(cert_file: Path) -> x509.Certificate:
+        return x509.load_pem_x509_certificate(Path(cert_file).read_bytes())
+
+    @staticmethod
+    def tls_create_private_key(file_path: Path):
+        key = ec.generate_private_key(ec.SECP256R1())
+        Path(file_path).write_bytes(
+            key.private_bytes(serialization.Encoding.PEM,
+                              serialization.PrivateFormat.TraditionalOpenSSL,
+                              serialization.NoEncryption()))
+
+    @staticmethod
+    def tls_create_ca_certificate(common_name: str, private_key_file: Path, ca_cert_file: Path):
+        key = CryptographyWrapper._load_key(private_key_file)
+        name = CryptographyWrapper._name(common_name)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        ski = x509.SubjectKeyIdentifier.from_public_key(key.public_key())
+        cert = (x509.CertificateBuilder()
+                .subject_name(name)
+                .issuer_name(name)
+                .public_key(key.public_key())
+                .serial_number(x509.random_serial_number())
+                .not_valid_before(now)
+                .not_valid_after(now + datetime.timedelta(days=3650))
+                .add_extension(ski, critical=False)
+                .add_extension(x509.AuthorityKeyIdentifier.from_issuer_subject_key_identifier(ski),
+                               critical=False)
+                .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+                .sign(key, hashes.SHA256()))
+        Path(ca_cert_file).write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+
+    @staticmethod
+    def tls_create_signed_certificate(common_name: str,
+                                      ca_key_file: Path,
+                                      ca_cert_file: Path,
+                                      private_key_file: Path,
+                                      cert_file: Path,
+                                      as_server: bool = False):
+        ca_key = CryptographyWrapper._load_key(ca_key_file)
+        ca_cert = CryptographyWrapper._load_cert(ca_cert_file)
+        key = CryptographyWrapper._load_key(private_key_file)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        cert = (x509.CertificateBuilder()
+                .subject_name(CryptographyWrapper._name(_subject_name(common_name)))
+                .issuer_name(ca_cert.subject)
+                .public_key(key.public_key())
+                .serial_number(x509.random_serial_number())
+                .not_valid_before(now)
+                .not_valid_after(now + datetime.timedelta(days=365))
+                .sign(ca_key, hashes.SHA256()))
+        Path(cert_file).write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+
+    @staticmethod
+    def tls_get_fingerprint_from_cert(cert_file: Path, algorithm: str = "sha256"):
+        if algorithm != "sha256":
+            raise NotImplementedError()
+        digest = CryptographyWrapper._load_cert(cert_file).fingerprint(hashes.SHA256())
+        # Same format as openssl x509 -fingerprint
+        return ":".join(f"{b:02X}" for b in digest)
+
+    @staticmethod
+    def tls_create_pkcs23_pem_and_cert(private_key_file: Path, cert_file: Path,
+                                       combined_file: Path):
+        # Byte for byte what OpensslWrapper writes, the lfdi is a hash of this file when
+        # IEEE_2030_5_CERT_FROM_COMBINED_FILE is set: the certificate of the key, the other
+        # certificates of cert_file in order, then the key as unencrypted PKCS8.
+        key = CryptographyWrapper._load_key(private_key_file)
+        certs = x509.load_pem_x509_certificates(Path(cert_file).read_bytes())
+        spki = key.public_key().public_bytes(serialization.Encoding.DER,
+                                             serialization.PublicFormat.SubjectPublicKeyInfo)
+        certs.sort(key=lambda cert: cert.public_key().public_bytes(
+            serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo) != spki)
+        Path(combined_file).write_bytes(
+            b"".join(cert.public_bytes(serialization.Encoding.PEM) for cert in certs) +
+            key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                              serialization.NoEncryption()))
+
+
+TLS_BACKENDS = {"openssl": OpensslWrapper, "cryptography": CryptographyWrapper}
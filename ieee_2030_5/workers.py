@@ -0,0 +1,570 @@
+"""
+Multi-process production serving of the 2030.5 server.
+
+run_workers forks worker processes once the server state has been initialized so every
+worker starts from the same adapters and hrefs.  All workers accept mutual TLS connections
+on one listening socket created by the supervisor (the parent process).
+
+The supervisor holds the state and is the only process that changes it.  Requests that
+can change state (POST, PUT and DELETE) are sent by the worker that received them to the
+supervisor, which applies each one once and returns the response.  Requests are applied by
+several threads, those of a device always by the same one in the order received.
+The supervisor is also the only process running the clock, so control transitions happen
+once as well.  Handlers aren't deterministic (mRIDs and times are generated while handling
+a request) so the workers never apply requests themselves, they install the state the
+supervisor publishes after every change: the hrefs added to its indexer, the records of
+registered state (ieee_2030_5.data.state) and the resource versions (ieee_2030_5.data.versions)
+changed since the previous update, so every worker answers with the same etags.
+A worker answers a request it sent to the supervisor once it has installed the state
+including it, so a client always reads its own writes.
+
+Read requests are served by the receiving worker from its copy of the state, concurrently,
+also while a published change is installed: installing only stashes the changed records,
+each is loaded under the lock of its own state the first time it is read.  The supervisor
+writes to the point store and a worker that exits is replaced by forking the supervisor,
+which holds the current state.
+"""
+from __future__ import annotations
+
+import io
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import OpenSSL
+
+from ieee_2030_5.certs import TLSRepository
+from ieee_2030_5.config import ServerConfiguration
+from ieee_2030_5.data.indexer import add_href_listener, configure_persistence, install_href
+from ieee_2030_5.data.state import (configure_snapshots, dump_changes, generation,
+                                    restore_changes)
+from ieee_2030_5.data.versions import (get_version, record_version, resource_changed,
+                                       resources_changed)
+from ieee_2030_5.flask_server import build_app, build_server
+
+__all__: List[str] = ["ReplicatedApp", "Supervisor", "run_workers"]
+
+_log = logging.getLogger(__name__)
+
+MUTATING_METHODS = ("POST", "PUT", "DELETE")
+# Seconds a worker waits for its own request to be applied and published by the supervisor.
+REPLICATION_TIMEOUT = 30.0
+# Seconds between the supervisor's checks for changes made by something other than a
+# request, e.g. the control scheduler.
+PUBLISH_INTERVAL = 0.05
+# Threads applying the requests sent to the supervisor.
+APPLIERS = 4
+
+_PEERCERT = "ieee_2030_5_peercert"
+_PEERCERT_PEM = "ieee_2030_5_peercert_pem"
+
+Result = Tuple[str, List[Tuple[str, str]], bytes]
+
+
+@dataclass
+class Mutation:
+    """
+    A state changing request sent by a worker to the supervisor.
+    """
+    origin: int
+    request_id: int
+    environ: Dict[str, Any]
+    body: bytes
+
+
+@dataclass
+class Reply:
+    """
+    The response to a Mutation, seq is its position in the order the supervisor applied them.
+    """
+    request_id: int
+    seq: int
+    result: Result
+
+
+@dataclass
+class Update:
+    """
+    State published by the supervisor.  applied is the seq of the last request applied,
+    records the pickled records of registered state by (name, key), hrefs the (href, pickled
+    item, etag, version time) of the hrefs and versions the (key, etag, version time) of the
+    resource versions (ieee_2030_5.data.versions), all those changed since the previous
+    update.
+    """
+    version: int
+    applied: int
+    records: Dict[Tuple[str, str], bytes] = field(default_factory=dict)
+    hrefs: List[Tuple[str, bytes, str, datetime]] = field(default_factory=list)
+    versions: List[Tuple[str, str, datetime]] = field(default_factory=list)
+
+
+def _call(app: Callable, environ: Dict[str, Any]) -> Result:
+    """
+    Run a WSGI app and return the status, headers and the complete body.
+    """
+    response: Dict[str, Any] = {}
+    body: List[bytes] = []
+
+    def start_response(status, headers, exc_info=None):
+        response["status"] = status
+        response["headers"] = headers
+        return body.append
+
+    result = app(environ, start_response)
+    try:
+        body.extend(result)
+    finally:
+        if hasattr(result, "close"):
+            result.close()
+    return response["status"], response["headers"], b"".join(body)
+
+
+def _read_body(environ: Dict[str, Any]) -> bytes:
+    stream = environ["wsgi.input"]
+    if environ.get("wsgi.input_terminated"):
+        return stream.read()
+    length = int(environ.get("CONTENT_LENGTH") or 0)
+    return stream.read(length) if length > 0 else b""
+
+
+def _portable_environ(environ: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The part of a WSGI environ that can be sent to another process.
+    """
+    portable = {
+        k: v
+        for k, v in environ.items()
+        if isinstance(v, (str, int, float, bool, bytes)) and not k.startswith("wsgi.")
+    }
+    portable["wsgi.url_scheme"] = environ.get("wsgi.url_scheme", "https")
+    portable.pop("HTTP_TRANSFER_ENCODING", None)
+    peercert = environ.get(_PEERCERT)
+    if peercert is not None:
+        portable[_PEERCERT_PEM] = OpenSSL.crypto.dump_certificate(OpenSSL.crypto.FILETYPE_PEM,
+                                                                  peercert)
+    return portable
+
+
+def _replay_environ(mutation: Mutation) -> Dict[str, Any]:
+    environ = dict(mutation.environ)
+    pem = environ.pop(_PEERCERT_PEM, None)
+    if pem is not None:
+        environ[_PEERCERT] = OpenSSL.crypto.load_certificate(OpenSSL.crypto.FILETYPE_PEM, pem)
+    environ.update({
+        "wsgi.version": (1, 0),
+        "wsgi.input": io.BytesIO(mutation.body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+        "CONTENT_LENGTH": str(len(mutation.body))
+    })
+    return environ
+
+
+class ReplicatedApp:
+    """
+    WSGI middleware run in each worker.  Reads are served from the local state, mutations
+    are sent to the supervisor and the state it publishes is installed.
+
+    version and applied are those of the supervisor's state when the worker was forked,
+    updates that aren't newer are already part of the worker's state.
+    """
+
+    def __init__(self, app: Callable, conn: Connection, worker_index: int, version: int = 0,
+                 applied: int = 0):
+        self._app = app
+        self._conn = conn
+        self._worker_index = worker_index
+        self._send_lock = threading.Lock()
+        self._request_ids = itertools.count()
+        self._pending: Dict[int, List] = {}
+        self._version = version
+        self._applied = applied
+        self._installed = threading.Condition()
+        self._receiver = threading.Thread(target=self._run_receiver,
+                                          name="replica-receiver",
+                                          daemon=True)
+
+    def start(self):
+        self._receiver.start()
+
+    def __call__(self, environ, start_response):
+        if environ["REQUEST_METHOD"] in MUTATING_METHODS:
+            status, headers, body = self._replicate(environ)
+        else:
+            status, headers, body = _call(self._app, environ)
+        start_response(status, headers)
+        return [body]
+
+    def _replicate(self, environ) -> Result:
+        deadline = time.monotonic() + REPLICATION_TIMEOUT
+        request_id = next(self._request_ids)
+        done = threading.Event()
+        self._pending[request_id] = [done, None]
+        mutation = Mutation(origin=self._worker_index,
+                            request_id=request_id,
+                            environ=_portable_environ(environ),
+                            body=_read_body(environ))
+        with self._send_lock:
+            self._conn.send(mutation)
+
+        if not done.wait(REPLICATION_TIMEOUT):
+            self._pending.pop(request_id, None)
+            _log.error(f"Request {request_id} wasn't applied within {REPLICATION_TIMEOUT}s")
+            return "503 SERVICE UNAVAILABLE", [("Content-Length", "0")], b""
+        reply: Reply = self._pending.pop(request_id)[1]
+
+        # Answer once the change is readable from this worker.
+        with self._installed:
+            if not self._installed.wait_for(lambda: self._applied >= reply.seq,
+                                            max(deadline - time.monotonic(), 0)):
+                _log.warning(f"Request {reply.seq} answered before its state was installed")
+        return reply.result
+
+    def _run_receiver(self):
+        while True:
+            try:
+                message = self._conn.recv()
+            except EOFError:
+                _log.error("Supervisor went away, worker exiting")
+                os._exit(1)
+            if isinstance(message, Reply):
+                pending = self._pending.get(message.request_id)
+                if pending is not None:
+                    pending[1] = message
+                    pending[0].set()
+            elif message.version > self._version:
+                self._install(message)
+
+    def _install(self, update: Update):
+        try:
+            for href, snapshot, etag, modified in update.hrefs:
+                install_href(href, snapshot, etag, modified)
+            if update.records:
+                restore_changes(update.records)
+            # Last, a version is never current before what it is the version of.
+            for key, etag, modified in update.versions:
+                record_version(key, etag, modified)
+        except Exception as ex:
+            _log.exception(f"Installing update {update.version} failed {ex}")
+        with self._installed:
+            self._version = update.version
+            self._applied = update.applied
+            self._installed.notify_all()
+
+
+def _worker_main(worker_index: int, config: ServerConfiguration, tlsrepo: TLSRepository,
+                 app: Callable, listen_fd: int, conn: Connection, close: List[Connection],
+                 version: int, applied: int):
+    for other in close:
+        other.close()
+    # The supervisor persists state, every worker is a replica.
+    configure_persistence(False)
+    configure_snapshots(False)
+
+    replicated = ReplicatedApp(app, conn, worker_index, version, applied)
+    replicated.start()
+    server = build_server(config, tlsrepo, app=replicated, threaded=True, fd=listen_fd)
+    # Workers compete for connections, one that loses the race must not block in accept.
+    server.socket.setblocking(False)
+    _log.info(f"Worker {worker_index} (pid {os.getpid()}) serving")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+class Supervisor:
+    """
+    Forks the workers, applies their mutations, publishes the state to them and replaces
+    workers that exit.
+
+    Each request is given the next seq when an applier starts on it, applied is the highest
+    seq up to which every request was applied.  An update is cut after applied is read, so
+    it holds every change those requests made.  Updates are cut and workers are forked under the
+    supervisor's lock, so a worker forked after an update was cut has everything in it and
+    one forked before is sent it.
+    """
+
+    def __init__(self, config: ServerConfiguration, tlsrepo: TLSRepository, workers: int,
+                 appliers: int = APPLIERS):
+        self._config = config
+        self._tlsrepo = tlsrepo
+        self._worker_count = workers
+        self._app = build_app(config, tlsrepo)
+        self._context = multiprocessing.get_context("fork")
+        # A queue per applier thread, the requests of a device are always put on the same one.
+        self._mutations: List[queue.Queue] = [queue.Queue() for _ in range(max(appliers, 1))]
+        self._seq = 0
+        self._applied = 0
+        # Seqs applied after one that is still being applied.
+        self._done: Set[int] = set()
+        self._seq_lock = threading.Lock()
+        self._version = 0
+        self._published_generation = generation()
+        self._published_applied = 0
+        self._hrefs: List[Tuple[str, bytes, str, datetime]] = []
+        self._versions: List[Tuple[str, str, datetime]] = []
+        self._hrefs_lock = threading.Lock()
+        self._changed = threading.Event()
+        self._processes: Dict[int, multiprocessing.Process] = {}
+        self._conns: Dict[int, Connection] = {}
+        self._send_locks: Dict[int, threading.Lock] = {}
+        self._listener: Optional[socket.socket] = None
+        self._lock = threading.Lock()
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    def start(self, host: str, port: int):
+        self._listener = socket.create_server((host, port), reuse_port=False, backlog=1024)
+        add_href_listener(self._href_changed)
+        resource_changed.connect(self._version_changed)
+        resources_changed.connect(self._versions_changed)
+        for index, mutations in enumerate(self._mutations):
+            threading.Thread(target=self._run_applier, args=(mutations, ),
+                             name=f"supervisor-applier-{index}", daemon=True).start()
+        threading.Thread(target=self._run_publisher, name="supervisor-publisher",
+                         daemon=True).start()
+        for index in range(self._worker_count):
+            self._spawn(index)
+        _log.info(f"Serving on {host}:{port} with {self._worker_count} worker processes")
+
+    def _spawn(self, index: int):
+        parent_conn, child_conn = self._context.Pipe()
+        with self._lock:
+            process = self._context.Process(target=_worker_main,
+                                            args=(index, self._config, self._tlsrepo,
+                                                  self._app, self._listener.fileno(),
+                                                  child_conn, list(self._conns.values()),
+                                                  self._version, self._applied),
+                                            name=f"2030_5-worker-{index}",
+                                            daemon=True)
+            process.start()
+            self._processes[index] = process
+            self._conns[index] = parent_conn
+            self._send_locks[index] = threading.Lock()
+        child_conn.close()
+        threading.Thread(target=self._run_receiver, args=(index, parent_conn),
+                         name=f"receiver-{index}", daemon=True).start()
+
+    def _send(self, index: int, message: Any):
+        conn, lock = self._conns.get(index), self._send_locks.get(index)
+        if conn is None:
+            return
+        try:
+            with lock:
+                conn.send(message)
+        except (BrokenPipeError, OSError):
+            _log.warning(f"Worker {index} missed {type(message).__name__}")
+
+    def _href_changed(self, href: str, snapshot: bytes, etag: str, modified: datetime):
+        with self._hrefs_lock:
+            self._hrefs.append((href, snapshot, etag, modified))
+
+    def _version_changed(self, key: str, etag: Optional[str] = None,
+                         modified: Optional[datetime] = None, **kwargs):
+        if etag and modified:
+            with self._hrefs_lock:
+                self._versions.append((key, etag, modified))
+
+    def _versions_changed(self, sender: Any, keys: List[str], **kwargs):
+        versions = [(key, ) + version for key in keys if (version := get_version(key))]
+        with self._hrefs_lock:
+            self._versions.extend(versions)
+
+    def _run_receiver(self, index: int, conn: Connection):
+        while True:
+            try:
+                self._route(conn.recv())
+            except (EOFError, OSError):
+                return
+
+    def _route(self, mutation: Mutation):
+        # Requests without a device, e.g. those of the admin endpoints, by worker.
+        device = mutation.environ.get("ieee_2030_5_lfdi") or str(mutation.origin)
+        self._mutations[hash(device) % len(self._mutations)].put(mutation)
+
+    def _run_applier(self, mutations: queue.Queue):
+        while True:
+            mutation: Mutation = mutations.get()
+            with self._seq_lock:
+                self._seq += 1
+                seq = self._seq
+            try:
+                result = _call(self._app, _replay_environ(mutation))
+            except Exception as ex:
+                _log.exception(f"Applying mutation {seq} failed {ex}")
+                result = ("500 INTERNAL SERVER ERROR", [("Content-Length", "0")], b"")
+            self._completed(seq)
+            self._send(mutation.origin, Reply(mutation.request_id, seq, result))
+            self._changed.set()
+
+    def _completed(self, seq: int):
+        with self._seq_lock:
+            self._done.add(seq)
+            while self._applied + 1 in self._done:
+                self._applied += 1
+                self._done.remove(self._applied)
+
+    def _run_publisher(self):
+        while True:
+            self._changed.wait(PUBLISH_INTERVAL)
+            self._changed.clear()
+            try:
+                self.publish()
+            except Exception as ex:
+                _log.exception(f"Publishing state failed {ex}")
+
+    def publish(self) -> Optional[Update]:
+        """
+        Send the workers what changed since the last update, returns the update sent.
+        """
+        with self._lock:
+            # Read first, every change of the requests applied so far is then in the update.
+            # A version is recorded after the record or href it is the version of changed, so
+            # the records dumped after the versions are read hold every change versioned.
+            applied = self._applied
+            with self._hrefs_lock:
+                changed_versions, self._versions = self._versions, []
+                changed_hrefs, self._hrefs = self._hrefs, []
+            if (generation() == self._published_generation and not changed_hrefs
+                    and not changed_versions and applied == self._published_applied):
+                return None
+            try:
+                current, records = dump_changes(self._published_generation)
+            except Exception:
+                with self._hrefs_lock:
+                    self._versions[:0] = changed_versions
+                    self._hrefs[:0] = changed_hrefs
+                raise
+            self._version += 1
+            update = Update(self._version, applied, records, changed_hrefs, changed_versions)
+            self._published_generation = current
+            self._published_applied = applied
+            indexes = list(self._conns)
+        for index in indexes:
+            self._send(index, update)
+        return update
+
+    def check_workers(self):
+        """
+        Replace workers that have exited.
+        """
+        for index, process in list(self._processes.items()):
+            if not process.is_alive():
+                _log.error(f"Worker {index} exited with {process.exitcode}, replacing it")
+                with self._lock:
+                    self._send_locks.pop(index, None)
+                    self._conns.pop(index).close()
+                self._spawn(index)
+
+    def stop(self):
+        for process in self._processes.values():
+            process.terminate()
+        for process in self._processes.values():
+            process.join(5)
+        if self._listener is not None:
+            self._listener.close()
+
+
+def run_workers(config: ServerConfiguration, tlsrepo: TLSRepository, workers: Optional[int] = None,
+                should_stop: Callable[[], bool] = lambda: False):
+    """
+    Serve the 2030.5 app from workers processes, os.cpu_count() by default, until should_stop
+    returns True or the process is interrupted.
+    """
+    workers = workers or os.cpu_count() or 1
+    try:
+        host, port = config.server_hostname.split(":")
+    except ValueError:
+        host, port = config.server, config.https_port
+
+    supervisor = Supervisor(config, tlsrepo, workers)
+    supervisor.start(host, int(port))
+    try:
+        while not should_stop():
+            time.sleep(0.5)
+            supervisor.check_workers()
+    except KeyboardInterrupt:
+        _log.info("Shutting down workers")
+    finally:
+        supervisor.stop()
+
+
+if __name__ == '__main__':
+    import http.client
+    import ssl
+    import subprocess
+    from argparse import ArgumentParser
+    from concurrent.futures import ThreadPoolExecutor
+    from pathlib import Path
+
+    import yaml
+
+    # Throughput of the default development server against production mode.  Starts the
+    # server for each mode from the configuration file and measures GET requests made with
+    # the first device's certificate by concurrent clients.
+    parser = ArgumentParser()
+    parser.add_argument("config")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--path", default="/dcap")
+    opts = parser.parse_args()
+
+    cfg = ServerConfiguration(**yaml.safe_load(Path(opts.config).read_text()))
+    repo = Path(cfg.tls_repository).expanduser()
+    device_id = cfg.devices[0].id
+    ctx = ssl.create_default_context(cafile=str(repo / "certs" / "ca.pem"))
+    ctx.check_hostname = False
+    ctx.load_cert_chain(str(repo / "certs" / f"{device_id}.pem"),
+                        str(repo / "private" / f"{device_id}.pem"))
+
+    def fetch(_):
+        conn = http.client.HTTPSConnection(cfg.server, cfg.https_port, context=ctx, timeout=30)
+        conn.request("GET", opts.path)
+        status = conn.getresponse().status
+        conn.close()
+        return status
+
+    for label, extra in (("development", []),
+                         (f"production {opts.workers} workers",
+                          ["--production", "--workers", str(opts.workers)])):
+        proc = subprocess.Popen([sys.executable, "-m", "ieee_2030_5", opts.config, "--no-validate",
+                                 "--no-create-certs"] + extra,
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL,
+                                start_new_session=True)
+        try:
+            deadline = time.monotonic() + 60
+            while True:
+                try:
+                    fetch(None)
+                    break
+                except OSError:
+                    if time.monotonic() > deadline:
+                        raise
+                    time.sleep(0.5)
+            start = time.perf_counter()
+            with ThreadPoolExecutor(opts.concurrency) as pool:
+                statuses = list(pool.map(fetch, range(opts.requests)))
+            elapsed = time.perf_counter() - start
+            ok = sum(1 for s in statuses if s == 200)
+            print(f"{label}: {opts.requests / elapsed:.1f} requests/s "
+                  f"({ok}/{opts.requests} ok, concurrency {opts.concurrency})")
+        finally:
+            os.killpg(proc.pid, 15)
+            proc.wait()
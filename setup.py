@@ -28,6 +28,7 @@ install_requires = \
  'gridappsd-cim-lab[gridappsd-python]>=0.11.230210,<0.12.0',
  'gridappsd-python>=2.7.230209,<3.0.0',
  'nicegui>=1.2.1,<2.0.0',
+ 'numpy>=1.22',
  'pickleDB>=0.9.2,<0.10.0',
  'pvlib>=0.9.0,<0.10.0',
  'pyOpenSSL>=22.0.0,<23.0.0',
@@ -40,9 +41,11 @@ entry_points = \
 {'console_scripts': ['2030_5_cert = ieee_2030_5.certs:_main',
                      '2030_5_ctl = ieee_2030_5.control:_main',
                      '2030_5_gridappsd = ieee_2030_5.config_setup:_main',
+                     '2030_5_migrate_store = ieee_2030_5.persistance.points:_main',
                      '2030_5_proxy = ieee_2030_5.basic_proxy:_main',
                      '2030_5_server = ieee_2030_5.__main__:_main',
-                     '2030_5_shutdown = ieee_2030_5.__main__:_shutdown']}
+                     '2030_5_shutdown = ieee_2030_5.__main__:_shutdown',
+                     '2030_5_startup = ieee_2030_5.startup:_main']}
 
 setup_kwargs = {
     'name': 'gridappsd-2030-5',
@@ -0,0 +1,54 @@
+import itertools
+from types import SimpleNamespace
+from typing import Dict, Optional
+
+import pytest
+from flask import Flask, Response
+
+from ieee_2030_5.config import ServerConfiguration
+from ieee_2030_5.persistance import points
+
+_prefixes = itertools.count()
+
+
+@pytest.fixture(autouse=True)
+def point_store(tmp_path, monkeypatch) -> points.PointStore:
+    """ Everything a test persists goes to a store of its own rather than the configured one. """
+    store = points.FilesystemPointStore(tmp_path / "points")
+    monkeypatch.setattr(points, "db", store)
+    return store
+
+
+@pytest.fixture
+def prefix() -> str:
+    """ An href prefix no other test uses, adapters are registered by prefix. """
+    return f"/t{next(_prefixes)}"
+
+
+def server_config(**options) -> ServerConfiguration:
+    return ServerConfiguration(openssl_cnf="openssl.cnf", devices=[], tls_repository="tls",
+                               server="localhost", https_port=8443, **options)
+
+
+@pytest.fixture
+def respond():
+    """
+    The response RequestOp.build_response_from_dataclass sends for obj to a GET of path (the
+    href of obj by default) with headers, from a device with lfdi, under a configuration with
+    options.
+    """
+    # Imported as the server does, base_request and server_endpoints import each other.
+    import ieee_2030_5.server.server_endpoints  # noqa: F401
+    from ieee_2030_5.server.base_request import RequestOp
+
+    app = Flask(__name__)
+
+    def respond(obj, path: Optional[str] = None, headers: Optional[Dict[str, str]] = None,
+                lfdi: str = "0" * 40, method: str = "GET", **options) -> Response:
+        environ = {"ieee_2030_5_peercert": "peercert", "ieee_2030_5_lfdi": lfdi}
+        with app.test_request_context(path or obj.href, method=method, headers=headers or {},
+                                      environ_base=environ):
+            op = RequestOp(SimpleNamespace(tls_repo=None, config=server_config(**options)))
+            return op.build_response_from_dataclass(obj)
+
+    return respond
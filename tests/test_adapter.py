@@ -0,0 +1,106 @@
+import pickle
+
+import pytest
+
+import ieee_2030_5.hrefs as hrefs
+import ieee_2030_5.models as m
+from ieee_2030_5.adapters import Adapter
+
+
+@pytest.fixture
+def programs(prefix) -> Adapter[m.DERProgram]:
+    adapter = Adapter[m.DERProgram](f"{prefix}/derp", generic_type=m.DERProgram)
+    for i in range(5):
+        adapter.add(m.DERProgram(mRID=f"{i:032X}", primacy=i))
+    return adapter
+
+
+def test_lookups_by_indexed_property(programs, prefix):
+    assert programs.fetch(2).href == f"{prefix}/derp_2"
+    assert programs.fetch_by_property("href", f"{prefix}/derp_3") is programs.fetch(3)
+    assert programs.fetch_by_mrid(f"{4:032X}") is programs.fetch(4)
+    assert programs.fetch_by_property("mRID", "missing") is None
+    with pytest.raises(KeyError):
+        programs.fetch_by_mrid("missing")
+
+
+def test_lookups_of_properties_that_arent_indexed(programs):
+    assert programs.fetch_by_property("primacy", 3) is programs.fetch(3)
+    assert programs.fetch_index(m.DERProgram(primacy=1), using_prop="primacy") == 1
+
+
+def test_fetch_index_by_identity_and_equality(programs):
+    program = programs.fetch(1)
+    assert programs.fetch_index(program) == 1
+    assert programs.fetch_index(pickle.loads(pickle.dumps(program))) == 1
+    with pytest.raises(KeyError):
+        programs.fetch_index(m.DERProgram(mRID="missing"))
+
+
+def test_reindex_after_an_in_place_change(programs):
+    program = programs.fetch(2)
+    old = program.mRID
+    program.mRID = "A" * 32
+    programs.reindex(program)
+
+    assert programs.fetch_by_mrid("A" * 32) is program
+    assert programs.fetch_by_property("mRID", old) is None
+    assert programs._indexed_values[2] == [("href", program.href), ("mRID", "A" * 32)]
+    # Only the entries of the item reindexed were touched.
+    assert all(programs.fetch_by_mrid(f"{i:032X}") is programs.fetch(i) for i in (0, 1, 3, 4))
+
+
+def test_in_place_changes_are_found_without_reindex(programs):
+    program = programs.fetch(3)
+    program.mRID = "B" * 32
+
+    assert programs.fetch_by_mrid("B" * 32) is program
+    # The index was repaired by the lookup, and reindex drops the repaired entry.
+    assert programs._property_index["mRID"]["B" * 32] == 3
+    program.mRID = "C" * 32
+    programs.reindex(program)
+    assert "B" * 32 not in programs._property_index["mRID"]
+    assert programs.fetch_by_mrid("C" * 32) is program
+
+
+def test_duplicate_values_keep_the_first_item(programs):
+    duplicate = m.DERProgram(mRID=f"{1:032X}")
+    programs.add(duplicate)
+    assert programs.fetch_by_mrid(f"{1:032X}") is programs.fetch(1)
+
+    # The duplicate didn't hold the entry, reindexing it leaves the first item indexed.
+    programs.reindex(duplicate)
+    assert programs._property_index["mRID"][f"{1:032X}"] == 1
+    programs.fetch(1).mRID = "D" * 32
+    programs.reindex(programs.fetch(1))
+    assert programs.fetch_by_mrid(f"{1:032X}") is duplicate
+
+
+def test_indexes_are_rebuilt_when_unpickled(programs):
+    copy = pickle.loads(pickle.dumps(programs))
+    assert copy is programs
+    assert programs.fetch_by_mrid(f"{2:032X}") is programs.fetch(2)
+    assert sorted(programs._indexed_values) == list(range(5))
+
+
+def test_children_by_href_and_mrid(programs):
+    program = programs.fetch(0)
+    for i in range(3):
+        programs.add_replace_child(program, hrefs.DERC, m.DERControl(mRID=f"C{i}"))
+
+    controls = programs.fetch_children(program, hrefs.DERC)
+    assert [c.href for c in controls] == [hrefs.SEP.join([program.href, hrefs.DERC, str(i)])
+                                          for i in range(3)]
+    assert programs.fetch_child_index_by_mrid(program, hrefs.DERC, "C2") == 2
+    assert programs.has_child(program, hrefs.DERC, controls[1])
+    assert not programs.has_child(program, hrefs.DERC, m.DERControl(href=controls[1].href))
+
+    replacement = m.DERControl(href=controls[1].href, mRID="R1")
+    programs.add_replace_child(program, hrefs.DERC, replacement)
+    assert programs.size_children(program, hrefs.DERC) == 3
+    assert programs.fetch_child_index_by_mrid(program, hrefs.DERC, "R1") == 1
+    with pytest.raises(KeyError):
+        programs.fetch_child_index_by_mrid(program, hrefs.DERC, "C1")
+
+    programs.remove_child_by_mrid(program, hrefs.DERC, "C0")
+    assert programs.fetch_child_index_by_mrid(program, hrefs.DERC, "C2") == 1
@@ -0,0 +1,163 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives.serialization import Encoding
+
+from ieee_2030_5.certs import (PeerIdentity, PeerIdentityCache, TLSRepository,
+                               lfdi_from_fingerprint, sfdi_from_lfdi)
+from ieee_2030_5.flask_server import PeerCertWSGIRequestHandler
+
+OPENSSL_CNF = Path(__file__).parent.parent.joinpath("openssl.cnf")
+
+
+def _repo(repo_dir: Path, **kwargs) -> TLSRepository:
+    return TLSRepository(repo_dir, OPENSSL_CNF.as_posix(), "server", tls_backend="cryptography",
+                         **kwargs)
+
+
+@pytest.fixture
+def tls_repo(tmp_path) -> TLSRepository:
+    repo = _repo(tmp_path.joinpath("tls"), clear=True, refresh_interval=60)
+    repo.create_certs(["dev1", "dev2"], max_workers=1)
+    return repo
+
+
+def _fingerprints(repo: TLSRepository, monkeypatch) -> list:
+    """ Device ids fingerprinted by repo from here on. """
+    fingerprinted = []
+    fingerprint = repo.fingerprint
+
+    def counted(device_id, without_colan=True):
+        fingerprinted.append(device_id)
+        return fingerprint(device_id, without_colan)
+
+    monkeypatch.setattr(repo, "fingerprint", counted)
+    return fingerprinted
+
+
+def test_identities_are_looked_up_in_the_index(tls_repo, monkeypatch):
+    fingerprinted = _fingerprints(tls_repo, monkeypatch)
+    lfdi = tls_repo.lfdi("dev1")
+    sfdi = tls_repo.sfdi("dev1")
+
+    assert lfdi == lfdi_from_fingerprint(tls_repo._tls.tls_get_fingerprint_from_cert(
+        tls_repo.get_file_pair("dev1")[0]).replace(":", ""))
+    assert sfdi == sfdi_from_lfdi(lfdi)
+    assert tls_repo.find_device_id_from_sfdi(sfdi) == "dev1"
+    assert tls_repo.find_device_id_from_lfdi(tls_repo.lfdi("dev2")) == "dev2"
+    assert fingerprinted == []
+
+
+def test_refresh_only_fingerprints_changed_certificates(tls_repo, monkeypatch):
+    fingerprinted = _fingerprints(tls_repo, monkeypatch)
+    version = tls_repo.version
+    assert tls_repo.refresh() == 0
+    assert fingerprinted == [] and tls_repo.version == version
+
+    # Added by another process.
+    _repo(tls_repo._repo_dir).create_cert("dev3")
+    sfdi = tls_repo.sfdi("dev2")
+    tls_repo._certs_dir.joinpath("dev2.pem").unlink()
+    assert tls_repo.refresh() == 2
+    assert fingerprinted == ["dev3"] and tls_repo.version == version + 2
+    assert tls_repo.find_device_id_from_lfdi(tls_repo.lfdi("dev3")) == "dev3"
+    assert tls_repo._sfdi_index.get(sfdi) is None
+    with pytest.raises(FileNotFoundError):
+        tls_repo.sfdi("dev2")
+
+
+def test_misses_refresh_at_most_once_per_interval(tmp_path, monkeypatch):
+    repo = _repo(tmp_path.joinpath("tls"), clear=True, refresh_interval=60)
+    other = _repo(repo._repo_dir)
+    other.create_cert("dev1")
+    refreshes = []
+    refresh = repo.refresh
+    monkeypatch.setattr(repo, "refresh", lambda: refreshes.append(1) or refresh())
+
+    sfdi = other.sfdi("dev1")
+    # The repository was refreshed when it was created.
+    assert repo.find_device_id_from_sfdi(sfdi) is None
+    assert refreshes == []
+
+    monkeypatch.setattr(repo, "_refresh_interval", 0)
+    assert repo.find_device_id_from_sfdi(sfdi) == "dev1"
+    assert repo.find_device_id_from_sfdi(1) is None
+    assert len(refreshes) == 2
+
+
+def _identity(device_id: str) -> PeerIdentity:
+    return PeerIdentity(x509=None, serial_number=1, lfdi=device_id, sfdi=1, device_id=device_id)
+
+
+def test_identity_cache_is_least_recently_used(tls_repo):
+    cache = PeerIdentityCache(tls_repo, maxsize=2)
+    assert cache.get(b"a") is None
+    cache.put(b"a", _identity("a"))
+    cache.put(b"b", _identity("b"))
+    assert cache.get(b"a").device_id == "a"
+    cache.put(b"c", _identity("c"))
+
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") is not None and cache.get(b"c") is not None
+    stats = cache.stats()
+    assert (stats["size"], stats["hits"], stats["misses"]) == (2, 3, 2)
+    assert stats["hit_rate"] == pytest.approx(3 / 5)
+
+
+def test_identity_cache_is_cleared_when_certificates_change(tls_repo):
+    cache = PeerIdentityCache(tls_repo)
+    cache.put(b"a", _identity("a"))
+    tls_repo.create_cert("dev3")
+
+    assert cache.get(b"a") is None
+    assert cache.version == tls_repo.version
+    assert cache.stats()["invalidations"] == 1
+
+
+class _Connection:
+
+    def __init__(self, der: bytes):
+        self.der = der
+
+    def getpeercert(self, binary_form=False):
+        return self.der
+
+
+@pytest.fixture
+def handler(tls_repo, monkeypatch):
+    """ Makes a request handler for a connection from device_id. """
+    monkeypatch.setattr(PeerCertWSGIRequestHandler, "tlsrepo", tls_repo, raising=False)
+    monkeypatch.setattr(PeerCertWSGIRequestHandler, "identity_cache",
+                        PeerIdentityCache(tls_repo), raising=False)
+    monkeypatch.setattr(PeerCertWSGIRequestHandler, "config",
+                        SimpleNamespace(lfdi_mode="lfdi_mode_from_cert_fingerprint"),
+                        raising=False)
+
+    def make(device_id: str) -> PeerCertWSGIRequestHandler:
+        pem = Path(tls_repo.get_file_pair(device_id)[0]).read_bytes()
+        handler = PeerCertWSGIRequestHandler.__new__(PeerCertWSGIRequestHandler)
+        handler.connection = _Connection(
+            x509.load_pem_x509_certificate(pem).public_bytes(Encoding.DER))
+        return handler
+
+    return make
+
+
+def test_peer_identity_is_resolved_once(handler, tls_repo):
+    first = handler("dev1")
+    identity = first._peer_identity()
+    assert (identity.device_id, identity.lfdi) == ("dev1", tls_repo.lfdi("dev1"))
+    assert first._peer_identity() is identity
+
+    # A new connection from the same client uses the cached identity.
+    assert handler("dev1")._peer_identity() is identity
+    assert handler("dev2")._peer_identity().device_id == "dev2"
+    stats = PeerCertWSGIRequestHandler.identity_cache.stats()
+    assert (stats["connection_hits"], stats["hits"], stats["misses"]) == (1, 1, 2)
+
+    tls_repo.create_cert("dev3")
+    renewed = first._peer_identity()
+    assert renewed is not identity
+    assert (renewed.lfdi, renewed.device_id) == (identity.lfdi, identity.device_id)
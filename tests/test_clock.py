@@ -0,0 +1,116 @@
+import threading
+import time
+
+import pytest
+
+import ieee_2030_5.clock as clock
+from ieee_2030_5.adapters.timeadapter import TimeAdapter, replay_until
+from ieee_2030_5.clock import AcceleratedClock, DiscreteEventClock, RealTimeClock, create_clock
+
+
+@pytest.fixture
+def events(monkeypatch):
+    """ Due timestamps of an event source that is the only one registered. """
+    due = []
+    monkeypatch.setattr(clock, "__event_sources__", [])
+    clock.add_event_source(lambda: min(due) if due else None)
+    return due
+
+
+@pytest.fixture
+def discrete():
+    """ A DiscreteEventClock used by the server for the test. """
+    discrete = DiscreteEventClock(1000, idle_wait=0.01)
+    previous = clock.set_clock(discrete)
+    yield discrete
+    clock.set_clock(previous)
+
+
+def test_create_clock():
+    assert isinstance(create_clock(), RealTimeClock)
+    accelerated = create_clock("accelerated", speed=10, start="2024-01-01T00:00:00")
+    assert isinstance(accelerated, AcceleratedClock) and accelerated.speed == 10
+    assert create_clock("discrete", start="2024-01-01T01:00:00+01:00").timestamp() == 1704067200
+    assert create_clock("discrete", start=5).timestamp() == 5
+    with pytest.raises(ValueError):
+        create_clock("sideways")
+    with pytest.raises(ValueError):
+        create_clock("accelerated", speed=0)
+
+
+def test_accelerated_clock_runs_faster():
+    accelerated = AcceleratedClock(3600, start=0, min_interval=0.01)
+    begin = time.monotonic()
+    last = accelerated.timestamp()
+    following = accelerated.wait(last)
+    elapsed = time.monotonic() - begin
+
+    assert following > last
+    assert accelerated.now() == pytest.approx((time.monotonic() - begin) * 3600, abs=36)
+    assert elapsed < 0.5
+
+
+def test_discrete_clock_only_moves_when_advanced(events):
+    discrete = DiscreteEventClock(1000, idle_wait=0.01)
+    assert discrete.wait(1000) == 1000
+    assert discrete.utcnow().timestamp() == 1000
+
+    discrete.advance(10)
+    assert discrete.timestamp() == 1010
+    with pytest.raises(ValueError):
+        discrete.advance_to(1000)
+
+    events.extend([1500, 1200])
+    assert discrete.next_event() == 1200
+    assert discrete.wait(1010) == 1200
+    # Due now, not next, until the tick at now handles it.
+    assert discrete.next_event() is None
+    events.remove(1200)
+    assert discrete.next_event() == 1500
+
+
+def test_wake_ends_a_wait():
+    realtime = RealTimeClock()
+    woken = []
+    waiter = threading.Thread(target=lambda: woken.append(realtime.wait(0)))
+    begin = time.monotonic()
+    waiter.start()
+    time.sleep(0.05)
+    realtime.wake()
+    waiter.join(2)
+    assert woken and time.monotonic() - begin < 0.9
+
+
+def test_module_functions_read_the_clock_set(discrete):
+    assert clock.get_clock() is discrete
+    assert clock.timestamp() == 1000 and clock.now() == 1000.0
+    assert clock.utcnow().timestamp() == 1000
+
+
+def test_replay_until_jumps_between_events(discrete, events):
+    ticks = []
+
+    def tick(timestamp):
+        ticks.append(timestamp)
+        # Each tick handles what is due, as the control scheduler does.
+        while events and min(events) <= timestamp:
+            events.remove(min(events))
+
+    events.extend([1200, 5000, 1100])
+    TimeAdapter.tick.connect(tick)
+    try:
+        assert replay_until(3000) == 4
+    finally:
+        TimeAdapter.tick.disconnect(tick)
+
+    assert ticks == [1000, 1100, 1200, 3000]
+    assert discrete.timestamp() == 3000 and events == [5000]
+
+
+def test_replay_until_needs_a_discrete_clock():
+    previous = clock.set_clock(RealTimeClock())
+    try:
+        with pytest.raises(ValueError):
+            replay_until(0)
+    finally:
+        clock.set_clock(previous)
@@ -0,0 +1,38 @@
+import pytest
+
+import ieee_2030_5.models as m
+import ieee_2030_5.models.sep_fast as fast
+import ieee_2030_5.utils as utils
+from ieee_2030_5.utils import codegen
+
+
+def test_generated_module_is_current(tmp_path):
+    generated = tmp_path / "sep_fast.py"
+    codegen.generate(generated)
+    assert generated.read_text() == codegen.GENERATED_PATH.read_text()
+
+
+def test_generated_code_matches_xsdata(capsys):
+    assert codegen.check() == 0
+    summary = capsys.readouterr().out.splitlines()[-1]
+    assert summary.endswith(" 0 mismatches")
+
+
+@pytest.mark.parametrize("obj", [
+    m.EndDevice(href="/edev_0", lFDI=b"\x55\x09", sFDI=97, changedTime=0, enabled=True),
+    m.DERCurve(href="/dc_0", mRID=b"\x01\x02", description="a&b <curve>", curveType=11,
+               CurveData=[m.CurveData(xvalue=1, yvalue=-2), m.CurveData(xvalue=3, yvalue=4)],
+               xMultiplier=0, yMultiplier=0, yRefType=2),
+])
+@pytest.mark.parametrize("compact", [False, True])
+def test_hot_types_are_generated(obj, compact):
+    serializer = utils.__compact_serializer__ if compact else utils.__serializer__
+    expected = serializer.render(obj, ns_map=utils.__ns_map__)
+
+    assert fast.render(obj, compact) == expected
+    assert fast.parse(expected, type(obj)) == obj
+
+
+def test_other_types_fall_back():
+    with pytest.raises(fast.Fallback):
+        fast.render(m.FlowReservationRequest(href="/frq_0"))
@@ -0,0 +1,62 @@
+import pickle
+
+import pytest
+
+import ieee_2030_5.models.compact as compact_models
+import ieee_2030_5.models.sep as sep
+from ieee_2030_5.models.compact import COMPACT_TYPES, compact, expand
+from ieee_2030_5.utils import dataclass_to_xml, xml_to_dataclass
+
+
+def _mirror_meter_reading() -> sep.MirrorMeterReading:
+    return sep.MirrorMeterReading(
+        mRID=b"\x55\x09" * 8,
+        description="Real Power(W) Set",
+        ReadingType=sep.ReadingType(kind=37, uom=38, powerOfTenMultiplier=0),
+        MirrorReadingSet=[
+            sep.MirrorReadingSet(mRID=b"\x01" * 16,
+                                 timePeriod=sep.DateTimeInterval(duration=300, start=1700000000),
+                                 Reading=[sep.Reading(value=v) for v in range(3)])
+        ])
+
+
+def test_compact_is_compact_all_the_way_down():
+    small = compact(_mirror_meter_reading())
+    reading_set = small.MirrorReadingSet[0]
+    assert type(small) is compact_models.MirrorMeterReading
+    assert type(small.ReadingType) is compact_models.ReadingType
+    assert type(reading_set.timePeriod) is compact_models.DateTimeInterval
+    assert all(type(reading) is compact_models.Reading for reading in reading_set.Reading)
+    if compact_models._SLOTS:
+        assert not hasattr(reading_set.Reading[0], "__dict__")
+
+
+def test_compact_round_trips():
+    mmr = _mirror_meter_reading()
+    small = compact(mmr)
+    assert expand(small) == mmr
+    assert type(expand(small).MirrorReadingSet[0].Reading[0]) is sep.Reading
+    assert pickle.loads(pickle.dumps(small)) == small
+
+    xml = dataclass_to_xml(mmr)
+    assert dataclass_to_xml(small) == xml
+    assert xml_to_dataclass(xml, compact_models.MirrorMeterReading) == small
+
+
+@pytest.mark.parametrize("obj", [
+    sep.DERControlBase(opModConnect=True, opModTargetW=sep.ActivePower(multiplier=0, value=5000)),
+    sep.EventStatus(currentStatus=1, dateTime=1700000000, potentiallySuperseded=False),
+    sep.DateTimeInterval(duration=300, start=1700000000),
+])
+def test_compact_renders_like_the_generated_class(obj):
+    small = compact(obj)
+    assert type(small) is COMPACT_TYPES[type(obj)]
+    assert dataclass_to_xml(small) == dataclass_to_xml(obj)
+    assert expand(small) == obj
+
+
+def test_other_objects_are_returned_as_they_are():
+    end_device = sep.EndDevice(href="/edev_0", sFDI=1)
+    assert compact(end_device) is end_device
+    assert expand(end_device) is end_device
+    assert compact(None) is None
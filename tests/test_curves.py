@@ -0,0 +1,135 @@
+import numpy as np
+import pytest
+
+import ieee_2030_5.data.versions as versions
+import ieee_2030_5.models as m
+from ieee_2030_5.adapters import Adapter
+from ieee_2030_5.adapters.curves import CurveEngine, compile_curve
+from ieee_2030_5.models.enums import CurveType
+
+
+def _volt_var(href: str, deadband: int = 2, **kwargs) -> m.DERCurve:
+    return m.DERCurve(href=href, curveType=CurveType.opModVoltVar, yMultiplier=-2,
+                      CurveData=[m.CurveData(xvalue=x, yvalue=y) for x, y in
+                                 ((92, 4400), (100 - deadband, 0), (100 + deadband, 0),
+                                  (108, -4400))],
+                      **kwargs)
+
+
+@pytest.fixture
+def adapter(prefix) -> Adapter[m.DERCurve]:
+    return Adapter[m.DERCurve](f"{prefix}/dc", generic_type=m.DERCurve)
+
+
+@pytest.fixture
+def engine(adapter) -> CurveEngine:
+    return CurveEngine(adapter)
+
+
+def test_interpolates_and_clamps_at_the_ends(adapter, engine):
+    curve = _volt_var("/vv")
+    adapter.add(curve)
+
+    assert engine.evaluate(curve.href, [80, 92, 95, 100, 105, 108, 120]).tolist() == \
+        [44.0, 44.0, 22.0, 0.0, -22.0, -44.0, -44.0]
+    assert engine.evaluate(0, 105).tolist() == -22.0
+    assert engine.evaluate(curve, [100]).tolist() == [0.0]
+
+
+def test_multipliers_and_point_order(adapter, engine):
+    curve = m.DERCurve(href="/fw", curveType=CurveType.opModFreqWatt, xMultiplier=-2,
+                       CurveData=[m.CurveData(xvalue=6200, yvalue=0),
+                                  m.CurveData(xvalue=6036, yvalue=100)])
+    adapter.add(curve)
+
+    compiled = engine.compiled("/fw")
+    assert compiled.curve_type is CurveType.opModFreqWatt
+    assert compiled.x.tolist() == pytest.approx([60.36, 62.0])
+    assert compiled.y.tolist() == [100.0, 0.0]
+    assert engine.evaluate("/fw", [60.0, 61.18, 63.0]).round(6).tolist() == [100.0, 50.0, 0.0]
+
+
+def test_curves_from_the_configuration():
+    curve = m.DERCurve(href="/cfg", curveType="opModVoltVar",
+                       CurveData=[{"xvalue": 10, "yvalue": 1}, {"xvalue": 0, "yvalue": 0}])
+    compiled = compile_curve(curve)
+
+    assert compiled.curve_type is CurveType.opModVoltVar
+    assert compiled.evaluate([-1, 5, 11]).tolist() == [0.0, 0.5, 1.0]
+
+
+@pytest.mark.parametrize("data", [None, [], [m.CurveData(xvalue=1)]])
+def test_curves_that_cant_be_compiled(data):
+    with pytest.raises(ValueError):
+        compile_curve(m.DERCurve(href="/bad", CurveData=data))
+
+
+def test_unknown_curve(engine):
+    with pytest.raises(KeyError):
+        engine.compiled("/missing")
+
+
+def test_evaluate_many_shapes(adapter, engine):
+    for deadband, name in ((1, "a"), (3, "b")):
+        adapter.add(_volt_var(f"/{name}", deadband))
+    refs = ["/a", "/b", "/a"]
+
+    one_each = engine.evaluate_many(refs, [95, 96, 97])
+    assert one_each.shape == (3, )
+    assert one_each.tolist() == [engine.evaluate(ref, v).item()
+                                 for ref, v in zip(refs, [95, 96, 97])]
+
+    shared = engine.evaluate_many(refs[:2], [92, 95, 100, 108])
+    assert shared.shape == (2, 4)
+    assert np.array_equal(shared[1], engine.evaluate("/b", [92, 95, 100, 108]))
+
+    own = np.array([[92, 95], [96, 97], [100, 108]])
+    result = engine.evaluate_many(refs, own)
+    assert result.shape == (3, 2)
+    for row, ref in enumerate(refs):
+        assert np.array_equal(result[row], engine.evaluate(ref, own[row]))
+
+    with pytest.raises(ValueError):
+        engine.evaluate_many(refs, np.zeros((2, 2)))
+    assert engine.compiles == 2
+
+
+def test_compiled_curves_are_kept_until_the_curve_changes(adapter, engine):
+    adapter.add(_volt_var("/v", version=1))
+    first = engine.compiled("/v")
+    assert engine.compiled("/v") is first
+
+    # Changed in place, a versioned curve is kept until its version changes.
+    adapter.fetch(0).CurveData[0].yvalue = 5000
+    assert engine.evaluate("/v", 80).item() == 44.0
+    adapter.fetch(0).version = 2
+    assert engine.evaluate("/v", 80).item() == 50.0
+
+    adapter.fetch(0).CurveData[0].yvalue = 6000
+    engine.invalidate("/v")
+    assert engine.evaluate("/v", 80).item() == 60.0
+    assert engine.compiles == 3
+
+
+def test_curves_without_a_version_are_compared_by_digest(adapter, engine):
+    adapter.add(_volt_var("/d"))
+    first = engine.compiled("/d")
+    assert first.version == versions.digest(adapter.fetch(0))
+    assert engine.compiled("/d") is first
+
+    adapter.fetch(0).CurveData[0].yvalue = 5000
+    assert engine.evaluate("/d", 80).item() == 50.0
+    assert engine.compiles == 2
+
+
+def test_change_signals_drop_compiled_curves(adapter, engine):
+    adapter.add(_volt_var("/s", version=1))
+    first = engine.compiled("/s")
+
+    versions.resource_changed.send("/s", etag="")
+    second = engine.compiled("/s")
+    assert second is not first
+
+    versions.resources_changed.send(adapter, keys=["/s"])
+    assert engine.compiled("/s") is not second
+    assert engine.compiles == 3
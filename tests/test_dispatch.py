@@ -0,0 +1,174 @@
+import json
+from typing import List
+
+import pytest
+from flask import Flask
+
+import ieee_2030_5.hrefs as hrefs
+import ieee_2030_5.models as m
+from ieee_2030_5.adapters.der import DERProgramAdapter
+from ieee_2030_5.adapters.dispatch import _control_mrid, dispatch
+from ieee_2030_5.adapters.enddevices import EndDeviceAdapter
+from ieee_2030_5.adapters.fsa import FSAAdapter
+from ieee_2030_5.adapters.resolution import EffectiveControls
+from ieee_2030_5.server.admin_endpoints import AdminEndpoints
+from ieee_2030_5.utils import dataclass_to_xml
+
+from conftest import server_config
+
+T0 = 1700000000
+
+
+def _template(mrid="5509D69F8B35359500000000000091A2") -> m.DERControl:
+    return m.DERControl(mRID=mrid, description="Curtail",
+                        interval=m.DateTimeInterval(start=T0 + 60, duration=900),
+                        DERControlBase=m.DERControlBase(opModMaxLimW=5000))
+
+
+def _program(href: str, primacy: int) -> m.DERProgram:
+    program = m.DERProgram(href=href, primacy=primacy)
+    DERProgramAdapter.add(program)
+    return program
+
+
+def _device(prefix: str, name: str, programs: List[m.DERProgram]) -> m.EndDevice:
+    """ An end device following programs through an FSA of its own. """
+    fsa = m.FunctionSetAssignments(href=f"{prefix}/fsa_{name}")
+    FSAAdapter.add(fsa)
+    for program in programs:
+        FSAAdapter.add_replace_child(fsa, hrefs.FSA, program)
+    end_device = m.EndDevice(href=f"{prefix}/edev_{name}", lFDI=f"{prefix}_{name}".encode().hex())
+    EndDeviceAdapter.add(end_device)
+    EndDeviceAdapter.add_replace_child(end_device, hrefs.FSA, fsa)
+    return end_device
+
+
+def _controls(program: m.DERProgram) -> List[m.DERControl]:
+    return DERProgramAdapter.fetch_children(program, hrefs.DERC)
+
+
+def test_creates_then_updates_a_control_per_program(prefix):
+    programs = [_program(f"{prefix}/derp_{i}", i) for i in range(3)]
+    template = _template()
+
+    report = dispatch(template, programs=[p.href for p in programs], flush=False)
+    assert (report.created, report.updated, report.failed) == (3, 0, 0)
+    assert [r.status for r in report.results] == [201] * 3
+    for program, result in zip(programs, report.results):
+        [control] = _controls(program)
+        assert result.program == program.href and result.control == control.href
+        assert control.mRID == _control_mrid(template.mRID, program)
+        assert control.DERControlBase.opModMaxLimW == 5000
+        assert control.creationTime is not None
+
+    template.DERControlBase.opModMaxLimW = 3000
+    again = dispatch(template, programs=[p.href for p in programs], flush=False)
+    assert (again.created, again.updated, again.failed) == (0, 3, 0)
+    assert [r.status for r in again.results] == [204] * 3
+    for program in programs:
+        [control] = _controls(program)
+        assert control.DERControlBase.opModMaxLimW == 3000
+
+
+def test_controls_are_copies_of_the_template(prefix):
+    program = _program(f"{prefix}/derp", 1)
+    template = _template()
+    dispatch(template, programs=[program.href], flush=False)
+
+    template.interval.duration = 60
+    [control] = _controls(program)
+    assert control.interval.duration == 900
+    assert control.interval is not template.interval
+    assert template.href is None
+
+
+def test_devices_get_their_lowest_primacy_program(prefix):
+    low, high = _program(f"{prefix}/derp_low", 5), _program(f"{prefix}/derp_high", 50)
+    end_device = _device(prefix, "a", [high, low])
+
+    report = dispatch(_template(), lfdis=[end_device.lFDI], flush=False)
+    assert [(r.target, r.status, r.program) for r in report.results] == \
+        [(end_device.lFDI, 201, low.href)]
+    assert _controls(high) == []
+    assert EffectiveControls.for_lfdi(end_device.lFDI, T0 + 100).control.href == \
+        report.results[0].control
+
+
+def test_devices_sharing_a_program_share_its_control(prefix):
+    shared = _program(f"{prefix}/derp", 1)
+    lfdis = [_device(prefix, name, [shared]).lFDI for name in "abc"]
+
+    report = dispatch(_template(), lfdis=lfdis, flush=False)
+    assert report.created == 1 and report.updated == 0
+    assert len(report.results) == 3
+    assert len({r.control for r in report.results}) == 1
+    assert len(_controls(shared)) == 1
+
+
+def test_unknown_targets_fail(prefix):
+    program = _program(f"{prefix}/derp", 1)
+    orphan = _device(prefix, "orphan", [])
+
+    report = dispatch(_template(), programs=[program.href, f"{prefix}/missing"],
+                      lfdis=["FF" * 20, orphan.lFDI], flush=False)
+    assert report.created == 1 and report.failed == 3
+    assert [(r.target, r.status) for r in report.results] == [
+        (program.href, 201), (f"{prefix}/missing", 404), ("FF" * 20, 404), (orphan.lFDI, 404)
+    ]
+    assert [r.message for r in report.results[1:]] == \
+        ["Program not found", "End device not found", "No program assigned"]
+
+
+@pytest.mark.parametrize("mrid, dispatch_id", [(b"\x55\x09\xd6", "5509D6"), (None, None)])
+def test_dispatch_ids(prefix, mrid, dispatch_id):
+    program = _program(f"{prefix}/derp", 1)
+
+    report = dispatch(_template(mrid), programs=[program.href], flush=False)
+    if dispatch_id is None:
+        assert len(report.dispatch_id) == 32
+    else:
+        assert report.dispatch_id == dispatch_id
+    [control] = _controls(program)
+    assert control.mRID == _control_mrid(report.dispatch_id, program)
+
+
+@pytest.fixture
+def admin():
+    app = Flask(__name__)
+    AdminEndpoints(app, tls_repo=None, config=server_config())
+    return app.test_client()
+
+
+def test_admin_dispatch(admin, prefix):
+    program = _program(f"{prefix}/derp", 1)
+    control = dataclass_to_xml(_template())
+
+    response = admin.post("/admin/dispatch", json={"control": control, "programs": [program.href]})
+    assert response.status_code == 200
+    assert response.get_json()["created"] == 1
+
+    # Any target getting its control is a success.
+    response = admin.post("/admin/dispatch", json={"control": control,
+                                                   "programs": [program.href, f"{prefix}/missing"]})
+    assert response.status_code == 200
+    assert [r["status"] for r in response.get_json()["results"]] == [204, 404]
+
+    response = admin.post("/admin/dispatch", json={"control": control,
+                                                   "programs": [f"{prefix}/missing"]})
+    assert response.status_code == 404
+    assert response.get_json()["failed"] == 1
+    assert admin.post("/admin/dispatch", json={"control": control}).status_code == 404
+
+
+@pytest.mark.parametrize("body", [
+    None,
+    {"programs": ["/derp_0"]},
+    {"control": 5},
+    {"control": "not xml"},
+    {"control": '<DERControl xmlns="urn:ieee:std:2030.5:ns"><mRID>01</mRID>'},
+    {"control": dataclass_to_xml(m.DERProgram(href="/derp_0"))},
+])
+def test_admin_dispatch_rejects_bad_controls(admin, body):
+    response = admin.post("/admin/dispatch", data=json.dumps(body),
+                          content_type="application/json")
+    assert response.status_code == 400
@@ -0,0 +1,75 @@
+import pytest
+from werkzeug.http import parse_accept_header
+
+import ieee_2030_5.models as m
+from ieee_2030_5.utils import dataclass_to_xml, xml_to_dataclass
+from ieee_2030_5.utils.encoding import (decode_body, encode_body, negotiate_encoding,
+                                        prefers_compact, variant_name)
+
+
+def _accept(value: str):
+    return parse_accept_header(value)
+
+
+@pytest.mark.parametrize("accept, allowed, expected", [
+    ("gzip, deflate", ["gzip", "deflate"], "gzip"),
+    ("deflate;q=1.0, gzip;q=0.5", ["gzip", "deflate"], "deflate"),
+    ("gzip", ["deflate"], None),
+    ("br", ["gzip", "deflate"], None),
+    ("", ["gzip"], None),
+    ("gzip", [], None),
+    ("gzip", ["zstd", "gzip"], "gzip"),
+])
+def test_negotiate_encoding(accept, allowed, expected):
+    assert negotiate_encoding(_accept(accept), allowed) == expected
+
+
+@pytest.mark.parametrize("encoding", [None, "gzip", "deflate"])
+def test_encoded_bodies_are_stable(encoding):
+    body = dataclass_to_xml(m.EndDevice(href="/edev_0", sFDI=1)).encode('utf-8')
+    encoded = encode_body(body, encoding)
+    # The same bytes every time, so the encoded body can be cached.
+    assert encode_body(body, encoding) == encoded
+    assert decode_body(encoded, encoding) == body
+
+
+@pytest.mark.parametrize("prefer, default, expected", [
+    (None, False, False),
+    (None, True, True),
+    ("compact", False, True),
+    ("Compact, respond-async", False, True),
+    ("pretty", True, False),
+    ("respond-async", True, True),
+])
+def test_prefers_compact(prefer, default, expected):
+    assert prefers_compact(prefer, default) is expected
+
+
+def test_variant_names_are_distinct():
+    names = {variant_name(compact, encoding) for compact in (False, True)
+             for encoding in (None, "gzip", "deflate")}
+    assert len(names) == 6
+
+
+def test_responses_are_encoded_as_asked(prefix, respond):
+    end_device = m.EndDevice(href=f"{prefix}/edev_0", sFDI=1)
+    plain = respond(end_device)
+    assert plain.headers.get("Content-Encoding") is None
+    assert plain.headers["Vary"] == "Accept-Encoding, Prefer"
+
+    gzipped = respond(end_device, headers={"Accept-Encoding": "gzip"})
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert decode_body(gzipped.data, "gzip") == plain.data
+
+    compact = respond(end_device, headers={"Prefer": "compact"})
+    assert len(compact.data) < len(plain.data)
+    assert xml_to_dataclass(compact.data.decode('utf-8')) == end_device
+
+    # Each representation has an etag of its own.
+    etags = {response.get_etag()[0] for response in (plain, gzipped, compact)}
+    assert len(etags) == 3
+
+    pretty = respond(end_device, headers={"Prefer": "pretty"}, xml_compact=True)
+    assert pretty.data == plain.data
+    assert respond(end_device, compress_encodings=[],
+                   headers={"Accept-Encoding": "gzip"}).headers.get("Content-Encoding") is None
@@ -0,0 +1,145 @@
+import pickle
+import time
+
+import ieee_2030_5.models as m
+from ieee_2030_5.data.indexer import Indexer
+from ieee_2030_5.data.versions import digest_bytes
+
+
+def _edev(href: str, sfdi: int = 0) -> m.EndDevice:
+    return m.EndDevice(href=href, sFDI=sfdi)
+
+
+def _evicted(indexer: Indexer, href: str) -> bool:
+    return indexer.__items__[href].evicted
+
+
+def test_add_writes_through_to_the_point_store(prefix, point_store):
+    indexer = Indexer()
+    item = _edev(f"{prefix}/edev", 1)
+    indexer.add(item.href, item)
+
+    stored = pickle.loads(point_store.get(item.href))
+    assert stored.item == item
+    assert stored.last_hash == digest_bytes(pickle.dumps(item))
+
+
+def test_write_behind_coalesces_changes(prefix, point_store):
+    indexer = Indexer()
+    indexer.configure(write_behind=True, flush_interval=3600)
+    href = f"{prefix}/edev"
+    for sfdi in range(5):
+        indexer.add(href, _edev(href, sfdi))
+    indexer.flush()
+
+    stats = indexer.stats
+    assert stats.flushes == 1 and stats.items_flushed == 1
+    assert pickle.loads(point_store.get(href)).item.sFDI == 4
+    indexer.configure(write_behind=False)
+
+
+def test_writer_flushes_in_the_background(prefix, point_store):
+    indexer = Indexer()
+    indexer.configure(write_behind=True, flush_interval=0.01)
+    href = f"{prefix}/edev"
+    indexer.add(href, _edev(href, 1))
+
+    deadline = time.monotonic() + 5
+    while point_store.get(href) is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert pickle.loads(point_store.get(href)).item.sFDI == 1
+    indexer.configure(write_behind=False)
+
+
+def test_get_returns_a_copy(prefix):
+    indexer = Indexer()
+    item = _edev(f"{prefix}/edev", 1)
+    indexer.add(item.href, item)
+
+    item.sFDI = 2
+    first = indexer.get(item.href)
+    first.sFDI = 3
+
+    assert indexer.get(item.href).sFDI == 1
+    assert indexer.get(f"{prefix}/missing") is None
+
+
+def test_least_recently_used_items_are_evicted(prefix):
+    indexer = Indexer(max_resident=2)
+    a, b, c = (f"{prefix}/{name}" for name in "abc")
+    for sfdi, href in enumerate((a, b, c)):
+        indexer.add(href, _edev(href, sfdi))
+
+    assert _evicted(indexer, a)
+    assert not _evicted(indexer, b) and not _evicted(indexer, c)
+    assert indexer.names(prefix) == [a, b, c]
+
+    # Read back from the point store, which makes it the most recently used.
+    assert indexer.get(a) == _edev(a, 0)
+    assert not _evicted(indexer, a)
+    assert _evicted(indexer, b)
+
+
+def test_reads_keep_items_resident(prefix):
+    indexer = Indexer(max_resident=2)
+    a, b, c = (f"{prefix}/{name}" for name in "abc")
+    indexer.add(a, _edev(a))
+    indexer.add(b, _edev(b))
+    indexer.get(a)
+    indexer.add(c, _edev(c))
+
+    assert _evicted(indexer, b)
+    assert not _evicted(indexer, a)
+
+
+def test_unwritten_items_are_not_evicted(prefix, point_store):
+    indexer = Indexer(max_resident=1)
+    indexer.configure(write_behind=True, flush_interval=3600)
+    hrefs = [f"{prefix}/{i}" for i in range(3)]
+    for href in hrefs:
+        indexer.add(href, _edev(href))
+
+    assert not any(_evicted(indexer, href) for href in hrefs)
+    assert point_store.get(hrefs[0]) is None
+    assert indexer.stats.queue_depth == 3
+
+    indexer.configure(write_behind=False)
+    assert indexer.stats.queue_depth == 0
+    assert all(point_store.get(href) is not None for href in hrefs)
+    indexer.set_max_resident(1)
+    assert [_evicted(indexer, href) for href in hrefs] == [True, True, False]
+
+
+def test_nothing_is_persisted_or_evicted_without_persistence(prefix, point_store):
+    indexer = Indexer(max_resident=1, persist=False)
+    hrefs = [f"{prefix}/{i}" for i in range(2)]
+    for href in hrefs:
+        indexer.add(href, _edev(href))
+
+    assert not any(_evicted(indexer, href) for href in hrefs)
+    assert list(point_store.keys(prefix)) == []
+
+
+def test_names_and_count_by_prefix(prefix):
+    indexer = Indexer()
+    for href in (f"{prefix}/b", f"{prefix}/a_1", f"{prefix}/a_10", f"{prefix}/a_2", "/other"):
+        indexer.add(href, _edev(href))
+
+    assert indexer.names(f"{prefix}/a") == [f"{prefix}/a_1", f"{prefix}/a_10", f"{prefix}/a_2"]
+    assert indexer.names(f"{prefix}/a", start=1, limit=1) == [f"{prefix}/a_10"]
+    assert indexer.count(f"{prefix}/") == 4
+    assert indexer.count(f"{prefix}/z") == 0
+
+
+def test_rehydrate_loads_items_on_first_use(prefix):
+    writer = Indexer()
+    hrefs = [f"{prefix}/{i}" for i in range(3)]
+    for sfdi, href in enumerate(hrefs):
+        writer.add(href, _edev(href, sfdi))
+
+    reader = Indexer()
+    assert reader.rehydrate() == 3
+    assert reader.names(prefix) == hrefs
+    assert all(_evicted(reader, href) for href in hrefs)
+    assert reader.get(hrefs[1]).sFDI == 1
+    assert not _evicted(reader, hrefs[1])
@@ -0,0 +1,145 @@
+from types import SimpleNamespace
+
+import pytest
+from xsdata.formats.dataclass.parsers import XmlParser
+
+import ieee_2030_5.models as m
+import ieee_2030_5.utils.ingest as ingest
+from ieee_2030_5.utils import dataclass_to_xml
+from ieee_2030_5.utils.ingest import IngestError, parse_typed
+
+
+def _meter_reading(sets: int, readings: int) -> m.MirrorMeterReading:
+    return m.MirrorMeterReading(
+        mRID="5509D69F8B3535950000000000009182",
+        description="Real Power(W) Set",
+        lastUpdateTime=1700000000,
+        ReadingType=m.ReadingType(accumulationBehaviour=12, commodity=1, kind=37, uom=38),
+        MirrorReadingSet=[
+            m.MirrorReadingSet(
+                mRID=f"5509D69F8B3535950000000000009{s:03X}",
+                description=f"Set {s}",
+                timePeriod=m.DateTimeInterval(duration=300, start=1700000000 + s * 300),
+                Reading=[
+                    m.Reading(value=1000 + r, qualityFlags=b"\x00\x01",
+                              timePeriod=m.DateTimeInterval(duration=3, start=1700000000 + r * 3),
+                              localID=bytes([r % 256, r // 256]))
+                    for r in range(readings)
+                ]) for s in range(sets)
+        ])
+
+
+def _body(obj) -> bytes:
+    return dataclass_to_xml(obj).encode('utf-8')
+
+
+def _xsdata(body: bytes, clazz=m.MirrorMeterReading):
+    # Without the type xsdata may pick the ieee_2030_5.models.compact class of the same name.
+    return XmlParser().from_bytes(body, clazz)
+
+
+DOCUMENTS = {
+    "usage point": m.MirrorUsagePoint(mRID="5509D69F8B3535950000000000009182",
+                                      description="Meter", roleFlags=b"\x00\x49",
+                                      serviceCategoryKind=0, status=1,
+                                      deviceLFDI=b"\x55\x09\xd6\x9f\x8b\x35\x35\x95\x00\x00",
+                                      MirrorMeterReading=[_meter_reading(1, 1) for _ in range(2)]),
+    "meter reading": _meter_reading(1, 12),
+    "reading set": _meter_reading(1, 30).MirrorReadingSet[0]
+}
+
+
+@pytest.mark.parametrize("name", DOCUMENTS)
+def test_parses_as_xsdata_does(name):
+    body = _body(DOCUMENTS[name])
+    assert len(body) <= ingest.FEED_SIZE
+
+    assert parse_typed(body) == _xsdata(body, type(DOCUMENTS[name]))
+
+
+def test_streams_large_bodies(monkeypatch):
+    body = _body(_meter_reading(10, 100))
+    assert len(body) > ingest.FEED_SIZE
+
+    def whole(*args):
+        raise AssertionError("A large body was parsed in one call")
+
+    expected = _xsdata(body)
+    monkeypatch.setattr(ingest, "fromstring", whole)
+    assert parse_typed(body) == expected
+    assert parse_typed(body, batch_size=7) == expected
+    assert parse_typed(memoryview(body), batch_size=1) == expected
+
+
+@pytest.mark.parametrize("root", [m.EndDevice(href="/edev_0"), m.DERProgram(href="/derp_0")])
+def test_rejects_other_roots_before_parsing(monkeypatch, root):
+    def parse(*args):
+        raise AssertionError("The body was parsed")
+
+    monkeypatch.setattr(ingest, "fromstring", parse)
+    monkeypatch.setattr(ingest, "xml_to_dataclass", parse)
+    with pytest.raises(IngestError):
+        parse_typed(_body(root))
+
+
+def test_rejects_roots_not_asked_for():
+    body = _body(DOCUMENTS["reading set"])
+    with pytest.raises(IngestError):
+        parse_typed(body, roots=(m.MirrorUsagePoint, m.MirrorMeterReading))
+    assert parse_typed(body, roots=(m.MirrorReadingSet, )) == _xsdata(body, m.MirrorReadingSet)
+
+
+@pytest.mark.parametrize("body", [
+    b"",
+    b"not xml",
+    b'<MirrorReadingSet xmlns="urn:example"><mRID>01</mRID></MirrorReadingSet>',
+    b'<MirrorReadingSet xmlns="urn:ieee:std:2030.5:ns"><mRID>01</mRID>',
+    b'<MirrorReadingSet xmlns="urn:ieee:std:2030.5:ns"><mRID>01</MirrorReadingSet>',
+])
+def test_rejects_malformed_bodies(body):
+    with pytest.raises(IngestError):
+        parse_typed(body)
+
+
+def test_rejects_truncated_streams():
+    body = _body(_meter_reading(10, 100))
+    with pytest.raises(IngestError):
+        parse_typed(body[:len(body) - 100])
+
+
+def test_prolog_before_the_root():
+    body = _body(DOCUMENTS["reading set"])
+    declared = b'\xef\xbb\xbf<?xml version="1.0" encoding="utf-8"?>\n<!-- meter 7 -->\n' + \
+        body.split(b"?>", 1)[-1].lstrip()
+    assert parse_typed(declared) == _xsdata(body, m.MirrorReadingSet)
+
+
+@pytest.mark.parametrize("size", [(1, 12), (10, 100)])
+def test_falls_back_without_generated_parsers(monkeypatch, size):
+    class Fallback(Exception):
+        pass
+
+    stub = SimpleNamespace(PARSERS={}, Fallback=Fallback)
+    monkeypatch.setattr(ingest, "_fast", lambda: stub)
+    body = _body(_meter_reading(*size))
+
+    assert parse_typed(body) == _xsdata(body)
+
+
+def test_falls_back_when_a_generated_parser_gives_up(monkeypatch):
+    fast = ingest._fast()
+
+    class Fallback(Exception):
+        pass
+
+    def give_up(el):
+        raise Fallback()
+
+    parsers = dict(fast.PARSERS)
+    parsers[ingest._READING] = (parsers[ingest._READING][0], give_up)
+    stub = SimpleNamespace(PARSERS=parsers, Fallback=Fallback)
+    monkeypatch.setattr(ingest, "_fast", lambda: stub)
+    body = _body(_meter_reading(10, 100))
+
+    assert parse_typed(body, batch_size=7) == _xsdata(body)
+
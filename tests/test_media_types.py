@@ -0,0 +1,51 @@
+import pytest
+
+import ieee_2030_5.models as m
+from ieee_2030_5.types_ import SEP_XML
+from ieee_2030_5.utils import dataclass_to_xml, xml_to_dataclass
+
+
+def _samples(prefix: str):
+    return {
+        "DeviceCapability": m.DeviceCapability(
+            href=f"{prefix}/dcap", pollRate=900,
+            EndDeviceListLink=m.EndDeviceListLink(href=f"{prefix}/edev", all=2),
+            TimeLink=m.TimeLink(href="/tm")),
+        "DERCurve": m.DERCurve(
+            href=f"{prefix}/dc_0", mRID=bytes.fromhex("B1" * 16), description="Volt-Var",
+            curveType=11, yMultiplier=-2,
+            CurveData=[m.CurveData(xvalue=x, yvalue=100 - x) for x in range(0, 100, 10)]),
+        "EndDeviceList": m.EndDeviceList(
+            href=f"{prefix}/edev", all=2, results=2,
+            EndDevice=[m.EndDevice(href=f"{prefix}/edev_{i}", lFDI=bytes([i]) * 20, sFDI=i,
+                                   changedTime=1700000000,
+                                   FunctionSetAssignmentsListLink=m.FunctionSetAssignmentsListLink(
+                                       href=f"{prefix}/edev_{i}_fsa", all=1))
+                       for i in range(2)]),
+        "MirrorUsagePoint": m.MirrorUsagePoint(
+            href=f"{prefix}/mup_0", mRID=bytes.fromhex("C2" * 16), description="Meter",
+            roleFlags=b"\x00\x49", serviceCategoryKind=0, status=1,
+            deviceLFDI=b"\x55" * 20, postRate=60,
+            MirrorMeterReading=[m.MirrorMeterReading(
+                mRID=bytes.fromhex(f"{r:032X}"), description=f"Reading {r}",
+                Reading=m.Reading(value=1000 + r, qualityFlags=b"\x00\x01"))
+                for r in range(3)])
+    }
+
+
+@pytest.mark.parametrize("name", ["DeviceCapability", "DERCurve", "EndDeviceList", "MirrorUsagePoint"])
+@pytest.mark.parametrize("compact", [False, True])
+def test_xml_round_trip(prefix, name, compact):
+    obj = _samples(prefix)[name]
+    assert xml_to_dataclass(dataclass_to_xml(obj, compact=compact)) == obj
+
+
+@pytest.mark.parametrize("accept", ["application/sep-exi", "application/sep-exi, application/sep+xml;q=0.5",
+                                    "application/x-sep-compact", "*/*"])
+def test_every_client_is_answered_with_xml(prefix, respond, accept):
+    obj = _samples(prefix)["DERCurve"]
+
+    response = respond(obj, headers={"Accept": accept})
+    assert response.status_code == 200
+    assert response.mimetype == SEP_XML
+    assert xml_to_dataclass(response.get_data()) == obj
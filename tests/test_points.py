@@ -0,0 +1,96 @@
+import pytest
+
+from ieee_2030_5.persistance import points
+from ieee_2030_5.persistance.points import (FilesystemPointStore, PointStore, SQLitePointStore,
+                                            migrate_filesystem_store)
+
+
+@pytest.fixture
+def store(tmp_path) -> SQLitePointStore:
+    store = SQLitePointStore(tmp_path / "points.sqlite")
+    yield store
+    store.close()
+
+
+def test_put_get_and_delete(store):
+    assert store.get("/edev_0") is None
+    store.put("/edev_0", b"\x00\x01")
+    store.put("/edev_0", b"\x02")
+    assert store.get("/edev_0") == b"\x02"
+
+    store.delete("/edev_0")
+    assert store.get("/edev_0") is None
+    store.delete("/edev_0")
+
+
+def test_keys_by_prefix(store):
+    store.put_many({key: key.encode() for key in
+                    ("/edev_1", "/edev_10", "/edev_2", "/edev_1_der_0", "/edev0", "/derp_1", "__state__")})
+
+    assert list(store.keys("/edev_")) == ["/edev_1", "/edev_10", "/edev_1_der_0", "/edev_2"]
+    assert list(store.keys("/edev_1")) == ["/edev_1", "/edev_10", "/edev_1_der_0"]
+    assert list(store.keys("/derp")) == ["/derp_1"]
+    assert list(store.keys("/x")) == []
+    assert list(store.keys()) == sorted(["/edev_1", "/edev_10", "/edev_2", "/edev_1_der_0",
+                                         "/edev0", "/derp_1", "__state__"])
+
+
+def test_reopened_and_new_connections_see_writes(store):
+    store.put_many({"/a": b"1", "/b": b"2"})
+
+    other = store.reopen()
+    try:
+        assert other.path == store.path
+        assert other.get("/a") == b"1"
+        other.put("/c", b"3")
+        assert store.get("/c") == b"3"
+    finally:
+        other.close()
+
+    store.close()
+    again = SQLitePointStore(store.path)
+    assert list(again.keys()) == ["/a", "/b", "/c"]
+    again.close()
+
+
+def test_backup(store, tmp_path):
+    store.put_many({f"/edev_{i}": bytes([i]) for i in range(10)})
+    store.backup(tmp_path / "backup.sqlite")
+    store.put("/edev_10", b"\x0a")
+
+    backup = SQLitePointStore(tmp_path / "backup.sqlite")
+    try:
+        assert len(list(backup.keys("/edev_"))) == 10
+        assert backup.get("/edev_9") == b"\x09"
+    finally:
+        backup.close()
+
+
+def test_migrate_a_filesystem_store(store, tmp_path):
+    source = FilesystemPointStore(tmp_path / "fs")
+    values = {"/edev_0": b"\x00", "/edev_0_der_1": b"\x01", "/derp_0/derc": b"\x02", "__state__": b"\x03"}
+    for key, value in values.items():
+        source.put(key, value)
+
+    assert migrate_filesystem_store(tmp_path / "fs", store, batch_size=3) == len(values)
+    assert {key: store.get(key) for key in store.keys()} == values
+
+
+def test_module_helpers_use_the_configured_store(tmp_path):
+    store = points.configure_point_store("sqlite", str(tmp_path / "configured.sqlite"))
+    assert isinstance(store, SQLitePointStore) and points.db is store
+
+    points.set_point("/edev_0", b"\x00")
+    points.set_points({"/edev_1": b"\x01", "/derp_0": b"\x02"})
+    assert points.get_point("/edev_1") == b"\x01"
+    assert list(points.get_hrefs("/edev")) == ["/edev_0", "/edev_1"]
+
+    with pytest.raises(ValueError):
+        points.configure_point_store("redis")
+    assert points.db is store
+    store.close()
+
+
+def test_point_stores_are_abstract():
+    with pytest.raises(TypeError):
+        PointStore()
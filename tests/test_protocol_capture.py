@@ -0,0 +1,80 @@
+import json
+import time
+
+import pytest
+from flask import Request, Response
+from werkzeug.test import EnvironBuilder
+
+import ieee_2030_5.server.protocol_capture as protocol_capture
+from ieee_2030_5.server.protocol_capture import ProtocolCapture
+from ieee_2030_5.utils.encoding import encode_body
+
+
+def _exchange(capture: ProtocolCapture, path: str = "/edev", lfdi: str = "A" * 40,
+              body: bytes = b"<EndDevice/>", encoding: str = None):
+    request = Request(EnvironBuilder(path=path, method="PUT", data=b"<request/>",
+                                     environ_base={"ieee_2030_5_lfdi": lfdi}).get_environ())
+    response = Response(encode_body(body, encoding), status=200)
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    capture.capture(request, response)
+
+
+def test_requests_are_filtered_by_device_and_path():
+    capture = ProtocolCapture()
+    capture.configure(True, devices=["A" * 40], path_prefixes=["/edev", "/mup"])
+    _exchange(capture)
+    _exchange(capture, path="/mup_1")
+    _exchange(capture, path="/dcap")
+    _exchange(capture, lfdi="B" * 40)
+
+    assert [c.path for c in capture.get()] == ["/mup_1", "/edev"]
+    assert (capture.captured, capture.skipped) == (2, 2)
+
+
+def test_requests_are_sampled(monkeypatch):
+    capture = ProtocolCapture()
+    capture.configure(True, sample_rate=0.25)
+    draws = iter([0.1, 0.5, 0.24, 0.9])
+    monkeypatch.setattr(protocol_capture.random, "random", lambda: next(draws))
+    for _ in range(4):
+        _exchange(capture)
+    assert (capture.captured, capture.skipped) == (2, 2)
+
+
+def test_captures_are_decoded_and_bounded():
+    capture = ProtocolCapture()
+    capture.configure(True, buffer_size=3)
+    for index in range(5):
+        _exchange(capture, path=f"/edev_{index}", lfdi=str(index % 2) * 40, encoding="gzip")
+
+    captured = capture.get()
+    assert [c.path for c in captured] == ["/edev_4", "/edev_3", "/edev_2"]
+    assert captured[0].response_body == "<EndDevice/>"
+    assert captured[0].request_body == "<request/>"
+    assert [c.path for c in capture.get(lfdi="0" * 40)] == ["/edev_4", "/edev_2"]
+    assert [c.path for c in capture.get(limit=1, path_prefix="/edev_3")] == ["/edev_3"]
+    assert capture.stats()["buffered"] == 3
+
+
+def test_captures_are_written_in_the_background(tmp_path):
+    capture_file = tmp_path / "captures.jsonl"
+    capture = ProtocolCapture()
+    capture.configure(True, capture_file=capture_file.as_posix())
+    for index in range(3):
+        _exchange(capture, path=f"/edev_{index}")
+
+    deadline = time.monotonic() + 5
+    while capture.written < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    lines = capture_file.read_text().splitlines()
+    assert [json.loads(line)["path"] for line in lines] == ["/edev_0", "/edev_1", "/edev_2"]
+
+
+def test_nothing_is_captured_unless_enabled(monkeypatch):
+    capture = ProtocolCapture()
+    monkeypatch.setattr(protocol_capture, "__capture__", capture)
+    monkeypatch.setattr(capture, "capture",
+                        lambda *args: pytest.fail("captured while capture is disabled"))
+    protocol_capture.capture_exchange(None, None)
+    assert protocol_capture.get_capture_stats()["captured"] == 0
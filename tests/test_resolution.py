@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+from typing import List, Optional
+
+import pytest
+
+import ieee_2030_5.hrefs as hrefs
+import ieee_2030_5.models as m
+from ieee_2030_5.adapters import Adapter
+from ieee_2030_5.adapters.resolution import ControlResolver
+
+T0 = 1700000000
+
+
+def _control(name: str, start: int, duration: int, created: int = 0) -> m.DERControl:
+    return m.DERControl(mRID=name, creationTime=created,
+                        interval=m.DateTimeInterval(start=T0 + start, duration=duration))
+
+
+@pytest.fixture
+def setup(prefix) -> SimpleNamespace:
+    """
+    Two programs, the first with the lower primacy and a default control:
+
+        program 0   default D0, "high" 50 to 70
+        program 1   "low" 0 to 100, "newer" 80 to 120 created after it
+    """
+    programs = Adapter[m.DERProgram](f"{prefix}/derp", generic_type=m.DERProgram)
+    devices = Adapter[m.EndDevice](f"{prefix}/edev", generic_type=m.EndDevice)
+    fsas = Adapter[m.FunctionSetAssignments](f"{prefix}/fsa", generic_type=m.FunctionSetAssignments)
+    items = [m.DERProgram(href=f"{prefix}/derp/0", mRID="A0" * 16, primacy=10),
+             m.DERProgram(href=f"{prefix}/derp/1", mRID="A1" * 16, primacy=20)]
+    for program in items:
+        programs.add(program)
+    programs.add_replace_child(items[0], hrefs.DDERC, m.DefaultDERControl(mRID="D0"))
+    programs.add_replace_child(items[1], hrefs.DERC, _control("low", 0, 100))
+    programs.add_replace_child(items[0], hrefs.DERC, _control("high", 50, 20))
+    programs.add_replace_child(items[1], hrefs.DERC, _control("newer", 80, 40, created=5))
+    return SimpleNamespace(programs=programs, devices=devices, fsas=fsas, items=items,
+                           resolver=ControlResolver(programs, devices, fsas))
+
+
+def _winners(setup: SimpleNamespace, offsets: List[int]) -> List[Optional[str]]:
+    answers = [setup.resolver.resolve(setup.items, T0 + at) for at in offsets]
+    return [answer.control.mRID if answer.control else None for answer in answers]
+
+
+def test_lowest_primacy_then_newest_wins(setup):
+    assert _winners(setup, [1, 50, 51, 69, 70, 71, 80, 81, 100, 119]) == \
+        ["low", "low", "high", "high", "low", "low", "low", "newer", "newer", "newer"]
+
+
+def test_default_when_no_control_is_active(setup):
+    for at in (-10, 0, 120, 500):
+        answer = setup.resolver.resolve(setup.items, T0 + at)
+        assert answer.default
+        assert answer.control.mRID == "D0"
+        assert answer.program is setup.items[0]
+
+
+def test_no_control_and_no_default(setup):
+    answer = setup.resolver.resolve(setup.items[1:], T0 + 200)
+    assert answer.control is None and answer.program is None and not answer.default
+
+
+def test_valid_until_the_next_transition(setup):
+    answer = setup.resolver.resolve(setup.items, T0 + 55)
+    assert answer.control.mRID == "high"
+    assert answer.program is setup.items[0]
+    assert answer.valid_until == T0 + 70
+    assert setup.resolver.resolve(setup.items, T0 + 200).valid_until is None
+
+
+def test_cancelled_controls_are_excluded(setup):
+    cancelled = _control("high", 50, 20)
+    cancelled.EventStatus = m.EventStatus(currentStatus=2, dateTime=T0, potentiallySuperseded=False)
+    setup.programs.replace_child(setup.items[0], hrefs.DERC, 0, cancelled)
+
+    assert _winners(setup, [60]) == ["low"]
+
+
+def test_new_controls_are_seen(setup):
+    assert _winners(setup, [300]) == ["D0"]
+    setup.programs.add_replace_child(setup.items[1], hrefs.DERC, _control("later", 290, 20))
+    assert _winners(setup, [300]) == ["later"]
+
+
+def test_end_devices_resolve_through_their_assignments(setup):
+    edev = m.EndDevice(lFDI=b"\x01" * 20)
+    setup.devices.add(edev)
+    fsa = m.FunctionSetAssignments()
+    setup.fsas.add(fsa)
+    for program in setup.items:
+        setup.fsas.add_replace_child(fsa, hrefs.FSA, program)
+    setup.devices.add_replace_child(edev, hrefs.FSA, setup.fsas)
+
+    assert setup.resolver.programs_of(edev) == setup.items
+    assert setup.resolver.for_lfdi(edev.lFDI, T0 + 90).control.mRID == "newer"
+    assert setup.resolver.for_end_device(edev, T0 + 60).control.mRID == "high"
+    with pytest.raises(KeyError):
+        setup.resolver.for_lfdi(b"\x02" * 20, T0)
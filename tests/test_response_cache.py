@@ -0,0 +1,90 @@
+import ieee_2030_5.models as m
+from ieee_2030_5.adapters import Adapter
+from ieee_2030_5.data.versions import get_version
+from ieee_2030_5.utils.response_cache import ResponseCache, get_response_cache_stats
+
+
+class _Renders:
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, body: bytes = b"<body/>"):
+        def render():
+            self.count += 1
+            return body
+
+        return render
+
+
+def test_bodies_are_rendered_once_per_version():
+    cache, renders = ResponseCache(), _Renders()
+    assert cache.get_or_render("/a", "1", renders()) == b"<body/>"
+    assert cache.get_or_render("/a", "1", renders()) == b"<body/>"
+    assert renders.count == 1
+
+    cache.get_or_render("/a", "2", renders())
+    cache.get_or_render("/a", "1", renders(), variant="compact-gzip")
+    assert renders.count == 3
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 3
+
+
+def test_least_recently_used_bodies_are_evicted():
+    cache, renders = ResponseCache(max_bytes=20), _Renders()
+    for href in ("/a", "/b"):
+        cache.get_or_render(href, "1", renders(b"x" * 10))
+    cache.get_or_render("/a", "1", renders())
+    cache.get_or_render("/c", "1", renders(b"x" * 10))
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1 and stats["size_bytes"] == 20
+    cache.get_or_render("/a", "1", renders())
+    assert renders.count == 3
+    cache.get_or_render("/b", "1", renders(b"x" * 10))
+    assert renders.count == 4
+
+    # Bodies larger than the cache aren't kept.
+    cache.get_or_render("/d", "1", renders(b"x" * 21))
+    assert cache.stats()["entries"] == 2
+
+
+def test_invalidate_drops_every_representation():
+    cache, renders = ResponseCache(), _Renders()
+    for variant in ("pretty", "compact", "pretty-gzip"):
+        cache.get_or_render("/a", "1", renders(), variant=variant)
+    cache.get_or_render("/b", "1", renders())
+    cache.invalidate("/a")
+
+    stats = cache.stats()
+    assert stats["entries"] == 1 and stats["invalidations"] == 1
+    assert stats["size_bytes"] == len(b"<body/>")
+    cache.get_or_render("/a", "1", renders(), variant="compact")
+    assert renders.count == 5
+
+
+def test_disabled_cache_renders_every_time():
+    cache, renders = ResponseCache(), _Renders()
+    cache.get_or_render("/a", "1", renders())
+    cache.configure(enabled=False)
+    assert cache.stats()["entries"] == 0
+
+    cache.get_or_render("/a", "1", renders())
+    cache.get_or_render("/a", "1", renders())
+    assert renders.count == 3
+
+
+def test_changed_resources_are_invalidated(prefix, respond):
+    programs = Adapter[m.DERProgram](f"{prefix}/derp", generic_type=m.DERProgram)
+    program = m.DERProgram(mRID="01" * 16, primacy=1)
+    programs.add(program)
+
+    before = get_response_cache_stats()
+    respond(program)
+    respond(program)
+    assert get_response_cache_stats()["hits"] == before["hits"] + 1
+    entries = get_response_cache_stats()["entries"]
+
+    program.primacy = 2
+    programs.item_changed(program)
+    assert get_response_cache_stats()["entries"] == entries - 1
+    assert b"<primacy>2</primacy>" in respond(program).data
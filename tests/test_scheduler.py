@@ -0,0 +1,104 @@
+import pytest
+
+import ieee_2030_5.hrefs as hrefs
+import ieee_2030_5.models as m
+from ieee_2030_5.adapters import Adapter
+from ieee_2030_5.adapters.der import ControlScheduler
+
+
+def _control(start: int, duration: int, mrid: str = "01") -> m.DERControl:
+    return m.DERControl(mRID=mrid * 16, interval=m.DateTimeInterval(start=start, duration=duration),
+                        DERControlBase=m.DERControlBase(opModMaxLimW=5000))
+
+
+@pytest.fixture
+def programs(prefix) -> Adapter[m.DERProgram]:
+    programs = Adapter[m.DERProgram](f"{prefix}/derp", generic_type=m.DERProgram)
+    programs.add(m.DERProgram(mRID="0F" * 16))
+    return programs
+
+
+def _active(programs: Adapter[m.DERProgram]):
+    return programs.fetch_children(programs.fetch(0), hrefs.DER_CONTROL_ACTIVE)
+
+
+def test_controls_move_through_their_interval(programs):
+    program = programs.fetch(0)
+    ctrl = _control(100, 50)
+    programs.add_replace_child(program, hrefs.DERC, ctrl)
+    scheduler = ControlScheduler(programs)
+
+    scheduler.tick(90)
+    assert ctrl.EventStatus.currentStatus == 0
+    assert scheduler.next_transition() == 101
+
+    scheduler.tick(101)
+    assert ctrl.EventStatus.currentStatus == 1
+    assert _active(programs) == [ctrl]
+    assert scheduler.next_transition() == 151
+
+    scheduler.tick(151)
+    assert ctrl.EventStatus.currentStatus == -1
+    assert _active(programs) == []
+    assert scheduler.next_transition() is None
+
+
+def test_controls_are_queued_by_their_next_transition(programs):
+    program = programs.fetch(0)
+    controls = [_control(start, 10, f"{i:02X}") for i, start in enumerate((300, 100, 200))]
+    for ctrl in controls:
+        programs.add_replace_child(program, hrefs.DERC, ctrl)
+    scheduler = ControlScheduler(programs)
+    scheduler.tick(0)
+
+    assert len(scheduler) == 3
+    transitions = []
+    while (when := scheduler.next_transition()) is not None:
+        transitions.append(when)
+        scheduler.tick(when)
+    assert transitions == [101, 111, 201, 211, 301, 311]
+
+
+def test_ticks_with_nothing_due_evaluate_nothing(programs, monkeypatch):
+    programs.add_replace_child(programs.fetch(0), hrefs.DERC, _control(1000, 10))
+    scheduler = ControlScheduler(programs)
+    scheduler.tick(0)
+
+    evaluated = []
+    monkeypatch.setattr(scheduler, "_evaluate", lambda *args, **kwargs: evaluated.append(args))
+    for timestamp in range(1, 1000):
+        scheduler.tick(timestamp)
+    assert evaluated == []
+    scheduler.tick(1001)
+    assert len(evaluated) == 1
+
+
+def test_controls_added_later_are_picked_up(programs, monkeypatch):
+    scheduler = ControlScheduler(programs)
+    scheduler.tick(0)
+    assert scheduler.next_transition() is None
+
+    program = programs.fetch(0)
+    ctrl = _control(100, 10)
+    programs.add_replace_child(program, hrefs.DERC, ctrl)
+    monkeypatch.setattr("ieee_2030_5.clock.timestamp", lambda: 50)
+    assert scheduler.next_transition() == 101
+
+    with programs.batch():
+        for i in range(2, 4):
+            programs.add_replace_child(program, hrefs.DERC, _control(100 * i, 10, f"{i:02X}"))
+    scheduler.tick(60)
+    assert len(scheduler) == 3
+
+
+def test_removed_controls_are_dropped_when_due(programs):
+    program = programs.fetch(0)
+    ctrl = _control(100, 10)
+    programs.add_replace_child(program, hrefs.DERC, ctrl)
+    scheduler = ControlScheduler(programs)
+    scheduler.tick(0)
+
+    programs.remove_child(program, hrefs.DERC, ctrl)
+    scheduler.tick(101)
+    assert ctrl.EventStatus.currentStatus == 0
+    assert len(scheduler) == 0
@@ -0,0 +1,171 @@
+import threading
+from collections import OrderedDict
+
+import pytest
+
+import ieee_2030_5.data.state as state
+import ieee_2030_5.hrefs as hrefs
+import ieee_2030_5.models as m
+from ieee_2030_5.adapters import Adapter, BaseAdapter, __adapters__
+from ieee_2030_5.adapters.mupupt import MirrorUsagePointAdapter, UsagePointContainer
+from ieee_2030_5.data.state import (dump_changes, generation, has_snapshot, load_state,
+                                    restore_changes, store_state)
+
+from conftest import server_config
+
+
+@pytest.fixture(autouse=True)
+def changes(monkeypatch):
+    """ Only the records changed by the test are written. """
+    monkeypatch.setattr(state, "__changes__", OrderedDict())
+    monkeypatch.setattr(state, "__persisted__", generation())
+
+
+def _programs(prefix: str, count: int = 3) -> Adapter[m.DERProgram]:
+    programs = Adapter[m.DERProgram](f"{prefix}/derp", generic_type=m.DERProgram)
+    for i in range(count):
+        program = m.DERProgram(mRID=f"{i:032X}", primacy=i)
+        programs.add(program)
+        programs.add_replace_child(program, hrefs.DERC, m.DERControl(mRID=f"{i:032X}"))
+    return programs
+
+
+def _fsas(prefix: str, programs: Adapter[m.DERProgram]) -> Adapter[m.FunctionSetAssignments]:
+    fsas = Adapter[m.FunctionSetAssignments](f"{prefix}/fsa", generic_type=m.FunctionSetAssignments)
+    fsa = m.FunctionSetAssignments()
+    fsas.add(fsa)
+    fsas.add_replace_child(fsa, hrefs.FSA, programs.fetch(1))
+    fsas.add_replace_child(fsa, "adapter", programs)
+    return fsas
+
+
+def _replica(adapter: Adapter) -> Adapter:
+    # Registered in place of adapter, as the adapter of a process that hasn't loaded anything.
+    return Adapter(adapter.href_prefix, generic_type=adapter._generic_type)
+
+
+def _dump_from(adapters, since: int):
+    # dump_changes in the process holding adapters rather than their replicas.
+    replicas = {adapter.href_prefix: __adapters__[adapter.href_prefix] for adapter in adapters}
+    __adapters__.update({adapter.href_prefix: adapter for adapter in adapters})
+    try:
+        return dump_changes(since)
+    finally:
+        __adapters__.update(replicas)
+
+
+def test_records_are_read_on_first_use(prefix, point_store):
+    programs = _programs(prefix)
+    store_state()
+    assert has_snapshot()
+    assert sorted(point_store.keys(f"{state.STATE_KEY}.adapters.{prefix}")) == [
+        f"{state.STATE_KEY}.adapters.{prefix}/derp",
+        *(f"{state.STATE_KEY}.adapters.{prefix}/derp#{i}" for i in range(3))
+    ]
+
+    loaded = _replica(programs)
+    assert load_state()
+    assert loaded.size() == 3 and loaded._item_list == {}
+
+    program = loaded.fetch(2)
+    assert program == programs.fetch(2)
+    assert list(loaded._item_list) == [2]
+    assert loaded.fetch_children(program, hrefs.DERC)[0].mRID == f"{2:032X}"
+
+    # A lookup by property needs every item.
+    assert loaded.fetch_by_mrid(f"{0:032X}").primacy == 0
+    assert sorted(loaded._item_list) == [0, 1, 2]
+    assert loaded.fetch_all() == programs.fetch_all()
+
+
+def test_records_refer_to_the_items_of_other_adapters(prefix):
+    programs = _programs(prefix)
+    fsas = _fsas(prefix, programs)
+    _, records = dump_changes()
+
+    loaded_programs, loaded_fsas = _replica(programs), _replica(fsas)
+    restore_changes(records)
+
+    fsa = loaded_fsas.fetch(0)
+    [program] = loaded_fsas.fetch_children(fsa, hrefs.FSA)
+    assert program is loaded_programs.fetch(1)
+    assert loaded_fsas.fetch_children(fsa, "adapter") == [loaded_programs]
+
+
+def test_only_changed_records_are_dumped(prefix):
+    programs = _programs(prefix)
+    since, _ = dump_changes()
+
+    program = programs.fetch(1)
+    program.primacy = 10
+    programs.item_changed(program)
+    programs.add_replace_child(programs.fetch(2), hrefs.DERC, m.DERControl(mRID="AB"))
+
+    current, records = dump_changes(since)
+    assert current == generation()
+    assert list(records) == [("adapters", f"{prefix}/derp#1"), ("adapters", f"{prefix}/derp#2")]
+    assert dump_changes(current)[1] == {}
+
+
+def test_installed_records_update_loaded_items_in_place(prefix):
+    programs = _programs(prefix)
+    fsas = _fsas(prefix, programs)
+    since, records = dump_changes()
+    loaded_programs, loaded_fsas = _replica(programs), _replica(fsas)
+    restore_changes(records)
+    replica = loaded_programs.fetch(1)
+    [child] = loaded_fsas.fetch_children(loaded_fsas.fetch(0), hrefs.FSA)
+
+    program = programs.fetch(1)
+    program.primacy = 10
+    programs.item_changed(program)
+    programs.add_replace_child(program, hrefs.DERC, m.DERControl(mRID="AB"))
+    restore_changes(_dump_from((programs, fsas), since)[1])
+
+    assert loaded_programs.fetch(1) is replica is child
+    assert replica.primacy == 10
+    assert len(loaded_programs.fetch_children(replica, hrefs.DERC)) == 2
+    assert loaded_programs.fetch_by_property("primacy", 10) is replica
+
+
+def test_adapters_are_locked_on_their_own(prefix):
+    programs, other = _programs(prefix), _programs(f"{prefix}/other")
+    held, release = threading.Event(), threading.Event()
+
+    def hold():
+        with programs.write_lock():
+            held.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    held.wait(5)
+    try:
+        adder = threading.Thread(target=other.add, args=(m.DERProgram(), ))
+        adder.start()
+        adder.join(5)
+        assert not adder.is_alive()
+        assert other.size() == 4
+    finally:
+        release.set()
+        holder.join()
+
+
+def test_mirror_usage_points_are_read_on_first_use(monkeypatch, point_store):
+    monkeypatch.setattr(BaseAdapter, "__server_configuration__", server_config(), raising=False)
+    monkeypatch.setattr(UsagePointContainer, "_usage_points", [])
+    monkeypatch.setattr(MirrorUsagePointAdapter, "_mirror_usage_points", [])
+    mup = m.MirrorUsagePoint(mRID="5509D69F8B3535950000000000009182", description="Meter",
+                             roleFlags=b"\x00\x49", serviceCategoryKind=0, status=1,
+                             deviceLFDI=b"\x55\x09")
+    MirrorUsagePointAdapter.create(mup)
+    store_state()
+
+    monkeypatch.setattr(UsagePointContainer, "_usage_points", [])
+    monkeypatch.setattr(MirrorUsagePointAdapter, "_mirror_usage_points", [])
+    assert load_state()
+    assert MirrorUsagePointAdapter._mirror_usage_points == []
+
+    [loaded] = MirrorUsagePointAdapter.__mirror_usage_points__
+    assert loaded == mup
+    assert UsagePointContainer.fetch_by_mRID(mup.mRID).href == "/upt_0"
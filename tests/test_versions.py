@@ -0,0 +1,124 @@
+import ieee_2030_5.data.versions as versions
+import ieee_2030_5.hrefs as hrefs
+import ieee_2030_5.models as m
+from ieee_2030_5.adapters import Adapter
+from ieee_2030_5.data.indexer import Indexer
+from ieee_2030_5.data.versions import get_version
+
+
+def _not_digested(monkeypatch):
+    def digest(obj):
+        raise AssertionError(f"{obj} was digested")
+
+    monkeypatch.setattr(versions, "digest", digest)
+
+
+def _programs(prefix: str) -> Adapter[m.DERProgram]:
+    programs = Adapter[m.DERProgram](f"{prefix}/derp", generic_type=m.DERProgram)
+    program = m.DERProgram(mRID="01" * 16, primacy=1)
+    programs.add(program)
+    programs.add_replace_child(program, hrefs.DERC, m.DERControl(mRID="02" * 16))
+    return programs
+
+
+def test_adapter_changes_are_counted(prefix, monkeypatch, respond):
+    programs = _programs(prefix)
+    program = programs.fetch(0)
+    _not_digested(monkeypatch)
+
+    first = respond(program)
+    assert first.status_code == 200
+    etag = first.get_etag()[0]
+    assert etag == get_version(program.href)[0]
+    assert etag.startswith(f"{versions.__epoch__}-")
+    assert respond(program, headers={"If-None-Match": f'"{etag}"'}).status_code == 304
+
+    programs.add_replace_child(program, hrefs.DERC, m.DERControl(mRID="03" * 16))
+    second = respond(program, headers={"If-None-Match": f'"{etag}"'})
+    assert second.status_code == 200
+    assert second.get_etag()[0] != etag
+
+
+def test_changes_in_place_reach_the_lists_holding_the_item(prefix, monkeypatch):
+    programs = _programs(prefix)
+    fsas = Adapter[m.FunctionSetAssignments](f"{prefix}/fsa", generic_type=m.FunctionSetAssignments)
+    fsa = m.FunctionSetAssignments()
+    fsas.add(fsa)
+    program = programs.fetch(0)
+    fsas.add_replace_child(fsa, hrefs.FSA, program)
+    _not_digested(monkeypatch)
+
+    keys = [program.href, f"{program.href}_{hrefs.DERC}", programs.href_prefix,
+            f"{fsa.href}_{hrefs.FSA}"]
+    before = [get_version(key)[0] for key in keys]
+    [control] = programs.fetch_children(program, hrefs.DERC)
+    control.EventStatus = m.EventStatus(currentStatus=1)
+    programs.item_changed(program)
+
+    after = [get_version(key)[0] for key in keys]
+    assert all(a != b for a, b in zip(after, before))
+    assert get_version(control.href)[0] != get_version(fsa.href)[0]
+
+
+def test_batches_record_versions_once(prefix):
+    programs = _programs(prefix)
+    program = programs.fetch(0)
+    sent = []
+
+    def changed(sender, keys, **kwargs):
+        sent.append(set(keys))
+
+    versions.resources_changed.connect(changed)
+    try:
+        with programs.batch():
+            for i in range(3):
+                programs.add_replace_child(program, hrefs.DERC, m.DERControl(mRID=f"{i:032X}"))
+    finally:
+        versions.resources_changed.disconnect(changed)
+
+    assert len(sent) == 1
+    assert {program.href, f"{program.href}_{hrefs.DERC}", programs.href_prefix} <= sent[0]
+
+
+def test_indexer_counts_changed_items_only(prefix):
+    indexer = Indexer()
+    href = f"{prefix}/edev"
+    indexer.add(href, m.EndDevice(href=href, sFDI=1))
+    etag = get_version(href)[0]
+
+    indexer.add(href, m.EndDevice(href=href, sFDI=1))
+    assert get_version(href)[0] == etag
+    indexer.add(href, m.EndDevice(href=href, sFDI=2))
+    assert get_version(href)[0] != etag
+
+
+def test_bodies_of_a_request_are_kept_apart(prefix, monkeypatch, respond):
+    program = _programs(prefix).fetch(0)
+    _not_digested(monkeypatch)
+    shared = respond(program)
+    paged = respond(program, path=f"{program.href}?s=0&l=1")
+    other_device = respond(program, path=f"{program.href}?s=0&l=1", lfdi="1" * 40)
+
+    # The version of the href, kept under a key of their own.
+    assert shared.get_etag() == paged.get_etag() == other_device.get_etag()
+    assert get_version(f"{'0' * 40}:{program.href}?s=0&l=1") == get_version(program.href)
+
+
+def test_untracked_bodies_are_digested(prefix, respond):
+    end_device = m.EndDevice(href=f"{prefix}/sdev", sFDI=1)
+    first = respond(end_device)
+    assert first.get_etag()[0] == versions.digest(end_device)
+    assert respond(end_device,
+                   headers={"If-None-Match": first.headers["ETag"]}).status_code == 304
+
+    end_device.sFDI = 2
+    assert respond(end_device,
+                   headers={"If-None-Match": first.headers["ETag"]}).status_code == 200
+
+
+def test_installed_versions_are_kept(prefix):
+    href = f"{prefix}/edev"
+    etag, modified = versions.next_version()
+    assert versions.record_version(href, etag, modified) == (etag, modified)
+    assert versions.record_version(href, etag) == (etag, modified)
+    assert get_version(href) == (etag, modified)
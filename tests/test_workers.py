@@ -0,0 +1,162 @@
+import threading
+import time
+from collections import OrderedDict
+
+import pytest
+
+import ieee_2030_5.data.indexer as indexer
+import ieee_2030_5.data.state as state
+import ieee_2030_5.hrefs as hrefs
+import ieee_2030_5.models as m
+import ieee_2030_5.workers as workers
+from ieee_2030_5.adapters import Adapter
+from ieee_2030_5.data.indexer import add_href
+from ieee_2030_5.data.versions import get_version, next_version
+from ieee_2030_5.workers import Mutation, Reply, ReplicatedApp, Supervisor, Update
+
+from conftest import server_config
+
+
+class _Conn:
+    """ The supervisor's end of a worker's pipe, keeps what is sent. """
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(message)
+
+
+def _mutation(request_id: int, lfdi: str) -> Mutation:
+    return Mutation(origin=0, request_id=request_id, body=b"",
+                    environ={"REQUEST_METHOD": "POST", "PATH_INFO": f"/{lfdi}",
+                             "ieee_2030_5_lfdi": lfdi})
+
+
+@pytest.fixture
+def supervisor():
+    """ A supervisor without workers that publishes only when the test calls publish. """
+    supervisor = Supervisor(server_config(), None, workers=0, appliers=4)
+    supervisor._conns[0] = _Conn()
+    supervisor._send_locks[0] = threading.Lock()
+    supervisor._run_publisher = lambda: None
+    supervisor.start("127.0.0.1", 0)
+    yield supervisor
+    supervisor.stop()
+    indexer.__indexer__.__listeners__.remove(supervisor._href_changed)
+    workers.resource_changed.disconnect(supervisor._version_changed)
+    workers.resources_changed.disconnect(supervisor._versions_changed)
+
+
+def _replies(supervisor: Supervisor, count: int, timeout: float = 5):
+    conn = supervisor._conns[0]
+    deadline = time.monotonic() + timeout
+    while len(conn.sent) < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return {reply.request_id: reply for reply in conn.sent if isinstance(reply, Reply)}
+
+
+def test_devices_are_applied_concurrently_in_order(supervisor):
+    started, release = threading.Event(), threading.Event()
+    applied = []
+
+    def app(environ, start_response):
+        if environ["PATH_INFO"] == "/slow":
+            started.set()
+            release.wait(5)
+        applied.append(environ["PATH_INFO"])
+        start_response("200 OK", [])
+        return [environ["PATH_INFO"].encode()]
+
+    supervisor._app = app
+    queues = supervisor._mutations
+    # Two devices applied by different threads.
+    devices = {hash(device) % len(queues): device for device in (f"d{i}" for i in range(50))}
+    other = next(device for index, device in devices.items()
+                 if index != hash("slow") % len(queues))
+
+    supervisor._route(_mutation(0, "slow"))
+    assert started.wait(5)
+    for request_id in range(1, 4):
+        supervisor._route(_mutation(request_id, other))
+    replies = _replies(supervisor, 3)
+
+    assert sorted(replies) == [1, 2, 3]
+    assert [replies[i].seq for i in (1, 2, 3)] == sorted(replies[i].seq for i in (1, 2, 3))
+    # Nothing is published as applied past the request still being applied.
+    assert supervisor._applied < min(reply.seq for reply in replies.values())
+
+    release.set()
+    replies = _replies(supervisor, 4)
+    assert replies[0].result[2] == b"/slow"
+    assert supervisor._applied == supervisor.seq == 4
+    assert applied[-1] == "/slow"
+
+
+@pytest.fixture
+def changes(monkeypatch):
+    monkeypatch.setattr(state, "__changes__", OrderedDict())
+    monkeypatch.setattr(state, "__persisted__", state.generation())
+
+
+def test_publish_sends_what_changed(prefix, supervisor, changes):
+    supervisor._published_generation = state.generation()
+    assert supervisor.publish() is None
+
+    programs = Adapter[m.DERProgram](f"{prefix}/derp", generic_type=m.DERProgram)
+    program = m.DERProgram(mRID="01" * 16)
+    programs.add(program)
+    add_href(f"{prefix}/edev", m.EndDevice(href=f"{prefix}/edev", sFDI=1))
+    update = supervisor.publish()
+
+    assert set(update.records) == {("adapters", f"{prefix}/derp"),
+                                   ("adapters", f"{prefix}/derp#0")}
+    assert [href for href, *_ in update.hrefs] == [f"{prefix}/edev"]
+    sent = {key: (etag, modified) for key, etag, modified in update.versions}
+    assert sent[program.href] == get_version(program.href)
+    assert sent[f"{prefix}/edev"] == get_version(f"{prefix}/edev")
+    assert supervisor._conns[0].sent == [update]
+
+    programs.item_changed(program)
+    update = supervisor.publish()
+    assert set(update.records) == {("adapters", f"{prefix}/derp#0")}
+    assert update.hrefs == []
+    assert supervisor.publish() is None
+
+
+def test_install_doesnt_block_reads(prefix, monkeypatch, changes):
+    programs = Adapter[m.DERProgram](f"{prefix}/derp", generic_type=m.DERProgram)
+    program = m.DERProgram(mRID="01" * 16)
+    programs.add(program)
+    programs.add_replace_child(program, hrefs.DERC, m.DERControl(mRID="02" * 16))
+    _, records = state.dump_changes()
+    replica = Adapter(programs.href_prefix, generic_type=m.DERProgram)
+
+    installing, release = threading.Event(), threading.Event()
+
+    def restore(records):
+        installing.set()
+        release.wait(5)
+        state.restore_changes(records)
+
+    def app(environ, start_response):
+        start_response("200 OK", [])
+        return [b"read"]
+
+    monkeypatch.setattr(workers, "restore_changes", restore)
+    worker = ReplicatedApp(app, conn=None, worker_index=0)
+    etag, modified = next_version()
+    update = Update(1, 3, records, versions=[(program.href, etag, modified)])
+    installer = threading.Thread(target=worker._install, args=(update, ))
+    installer.start()
+    try:
+        assert installing.wait(5)
+        assert worker(dict(REQUEST_METHOD="GET"), lambda status, headers: None) == [b"read"]
+    finally:
+        release.set()
+        installer.join(5)
+
+    assert (worker._version, worker._applied) == (1, 3)
+    assert replica.fetch(0) == program
+    assert len(replica.fetch_children(replica.fetch(0), hrefs.DERC)) == 1
+    assert get_version(program.href) == (etag, modified)